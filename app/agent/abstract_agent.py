@@ -6,7 +6,8 @@ using the Google Gemini API.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Callable
+from typing import Any, Optional, Callable, Tuple
+import asyncio
 import json
 import time
 import random
@@ -14,6 +15,12 @@ import logging
 import google.generativeai as genai
 from pydantic import BaseModel, Field
 from ..exceptions import TransientError, PermanentError, APIError, APIRateLimitError
+from .response_cache import AbstractResponseCache, get_default_response_cache, make_cache_key
+from .rate_limiter import get_async_request_limiter, get_rate_limiter, estimate_tokens
+
+
+# Default for AbstractAgent(response_cache=...): use the shared process-wide cache
+_SHARED_CACHE = object()
 
 
 class AgentConfig(BaseModel):
@@ -46,22 +53,37 @@ class AbstractAgent(ABC):
     This design follows the Interface Segregation Principle - agents only
     depend on the methods they need (execute and helper methods).
     
+    Every agent gets a response cache for free: _call_gemini_api() answers
+    repeated prompts (same model, temperature and prompt text) from the
+    cache instead of calling the API again.
+    
     Attributes:
         _config (AgentConfig): Agent configuration (private, encapsulated)
         _client (genai.GenerativeModel): Gemini API client (private, encapsulated)
+        _response_cache (Optional[AbstractResponseCache]): LLM response cache
     """
     
-    def __init__(self, config: AgentConfig):
+    def __init__(
+        self,
+        config: AgentConfig,
+        response_cache: Optional[AbstractResponseCache] = _SHARED_CACHE
+    ):
         """
         Initialize the agent with Gemini API configuration.
         
         Args:
             config: Agent configuration including API key and model settings
+            response_cache: Response cache to use (defaults to the shared
+                            process-wide cache; None disables caching for
+                            this agent)
             
         Raises:
             AgentException: If initialization fails
         """
         self._config = config
+        self._response_cache = (
+            get_default_response_cache() if response_cache is _SHARED_CACHE else response_cache
+        )
         try:
             genai.configure(api_key=config.api_key)
             self._model = genai.GenerativeModel(config.model_name)
@@ -88,6 +110,26 @@ class AbstractAgent(ABC):
         """
         return self._config.temperature
     
+    @property
+    def response_cache(self) -> Optional[AbstractResponseCache]:
+        """
+        Get the response cache used by this agent.
+        
+        Returns:
+            The response cache, or None if caching is disabled
+        """
+        return self._response_cache
+    
+    @response_cache.setter
+    def response_cache(self, cache: Optional[AbstractResponseCache]) -> None:
+        """
+        Replace the response cache (None disables caching for this agent).
+        
+        Args:
+            cache: Response cache to use
+        """
+        self._response_cache = cache
+    
     @abstractmethod
     def execute(self, input_data: Any) -> Any:
         """
@@ -108,6 +150,25 @@ class AbstractAgent(ABC):
         """
         pass
     
+    async def execute_async(self, input_data: Any) -> Any:
+        """
+        Execute the agent's processing logic without blocking the event loop.
+        
+        The default runs execute() in a worker thread. Agents with a native
+        async path override this to call _call_gemini_api_async(), which
+        goes through the shared concurrency and rate limiter.
+        
+        Args:
+            input_data: Input data to process (type varies by agent)
+            
+        Returns:
+            Processed output (type varies by agent)
+            
+        Raises:
+            AgentException: If processing fails
+        """
+        return await asyncio.to_thread(self.execute, input_data)
+    
     def execute_with_fallback(
         self,
         input_data: Any,
@@ -208,12 +269,94 @@ class AbstractAgent(ABC):
             f"All execution attempts and fallback strategies failed for {self.__class__.__name__}"
         )
     
+    async def execute_with_fallback_async(
+        self,
+        input_data: Any,
+        fallback_strategies: Optional[list] = None,
+        max_retries: int = 3,
+        base_delay: float = 1.0
+    ) -> Any:
+        """
+        Async counterpart of execute_with_fallback().
+        
+        Same retry and fallback policy, but awaits execute_async() and backs
+        off with asyncio.sleep(), so a task waiting out a rate limit does
+        not hold up the other requests in flight.
+        
+        Args:
+            input_data: Input data to process
+            fallback_strategies: List of fallback functions to try if main execution fails
+            max_retries: Maximum number of retry attempts
+            base_delay: Base delay between retries in seconds
+            
+        Returns:
+            Processed output
+            
+        Raises:
+            TransientError: If all retries and fallbacks are exhausted
+        """
+        logger = logging.getLogger(__name__)
+        
+        for attempt in range(max_retries + 1):
+            try:
+                return await self.execute_async(input_data)
+                
+            except PermanentError:
+                logger.error(f"Permanent error in {self.__class__.__name__}, not retrying")
+                break
+                
+            except APIRateLimitError as e:
+                if attempt == max_retries:
+                    logger.error(f"Rate limit exceeded, all retries exhausted")
+                    break
+                
+                delay = e.retry_after or base_delay * (2 ** attempt)
+                delay = min(delay + random.uniform(0, 1), 300)  # Max 5 minutes
+                
+                logger.warning(
+                    f"Rate limit hit in {self.__class__.__name__} "
+                    f"(attempt {attempt + 1}/{max_retries + 1}). "
+                    f"Retrying in {delay:.1f} seconds"
+                )
+                await asyncio.sleep(delay)
+                
+            except Exception as e:
+                if attempt == max_retries:
+                    logger.error(f"Error in {self.__class__.__name__}, all retries exhausted: {str(e)}")
+                    break
+                
+                delay = min(base_delay * (2 ** attempt) + random.uniform(0, 1), 60)
+                
+                logger.warning(
+                    f"Error in {self.__class__.__name__} "
+                    f"(attempt {attempt + 1}/{max_retries + 1}): {str(e)}. "
+                    f"Retrying in {delay:.1f} seconds"
+                )
+                await asyncio.sleep(delay)
+        
+        if fallback_strategies:
+            logger.info(f"Trying {len(fallback_strategies)} fallback strategies")
+            
+            for i, fallback in enumerate(fallback_strategies):
+                try:
+                    return fallback(input_data)
+                except Exception as e:
+                    logger.warning(f"Fallback strategy {i + 1} failed: {str(e)}")
+        
+        raise TransientError(
+            f"All execution attempts and fallback strategies failed for {self.__class__.__name__}"
+        )
+    
     def _call_gemini_api(self, prompt: str) -> str:
         """
         Common method to call Gemini API with comprehensive error handling.
         
         Provides consistent API interaction across all agents with proper
-        error classification and retry logic.
+        error classification and retry logic. Responses are served from and
+        stored in the response cache; agents that reject a response should
+        call _discard_cached_response() so a retry reaches the API again.
+        Every call waits on the shared RPM/TPM rate limiter, so all agents
+        draw from one Gemini quota.
         Private method (prefixed with _) for internal use only.
         
         Args:
@@ -227,48 +370,240 @@ class AbstractAgent(ABC):
             PermanentError: For authentication or quota errors
             TransientError: For temporary API issues
         """
-        logger = logging.getLogger(__name__)
+        cache_key, cached = self._lookup_cached_response(prompt)
+        if cached is not None:
+            return cached
+        
+        rate_limiter = get_rate_limiter()
+        estimated_tokens = estimate_tokens(prompt)
+        rate_limiter.acquire(estimated_tokens, self.__class__.__name__)
         
         try:
             self._log_api_call(len(prompt))
             
             response = self._model.generate_content(
                 prompt,
-                generation_config={
-                    "temperature": self._config.temperature,
-                    "max_output_tokens": self._config.max_tokens,
-                }
+                generation_config=self._generation_config()
             )
             
             # Handle blocked or empty responses
             if not response.text:
                 raise TransientError("Gemini API returned empty response")
             
-            return response.text
+            text = response.text
             
         except Exception as e:
-            error_msg = str(e).lower()
+            raise self._handle_api_error(e)
+        
+        rate_limiter.record_usage(
+            estimated_tokens, self._count_tokens(response, prompt, text)
+        )
+        self._store_cached_response(cache_key, text)
+        return text
+    
+    async def _call_gemini_api_async(self, prompt: str) -> str:
+        """
+        Async counterpart of _call_gemini_api().
+        
+        Waits on the per-loop concurrency semaphore and the shared RPM/TPM
+        rate limiter before calling the model, so many calls can be in
+        flight without exceeding the Gemini quota. Uses the same response
+        cache and error classification as the sync path.
+        
+        Args:
+            prompt: The prompt to send to Gemini
+            
+        Returns:
+            API response text
+            
+        Raises:
+            APIRateLimitError: If rate limit is exceeded
+            PermanentError: For authentication or quota errors
+            TransientError: For temporary API issues
+        """
+        cache_key, cached = self._lookup_cached_response(prompt)
+        if cached is not None:
+            return cached
+        
+        estimated_tokens = estimate_tokens(prompt)
+        
+        try:
+            async with get_async_request_limiter().request(
+                estimated_tokens, self.__class__.__name__
+            ):
+                self._log_api_call(len(prompt))
+                
+                response = await self._model.generate_content_async(
+                    prompt,
+                    generation_config=self._generation_config()
+                )
+            
+            # Handle blocked or empty responses
+            if not response.text:
+                raise TransientError("Gemini API returned empty response")
+            
+            text = response.text
+            
+        except Exception as e:
+            raise self._handle_api_error(e)
+        
+        get_rate_limiter().record_usage(
+            estimated_tokens, self._count_tokens(response, prompt, text)
+        )
+        self._store_cached_response(cache_key, text)
+        return text
+    
+    def _generation_config(self) -> dict:
+        """
+        Build the Gemini generation config from the agent configuration.
+        
+        Returns:
+            Generation config dictionary
+        """
+        return {
+            "temperature": self._config.temperature,
+            "max_output_tokens": self._config.max_tokens,
+        }
+    
+    def _handle_api_error(self, error: Exception) -> Exception:
+        """
+        Classify an API error and let the shared rate limiter react to it.
+        
+        A rate-limit error pushes every agent back (by the server's
+        retry-after, or one minute), so they don't all retry into the
+        same exhausted quota.
+        
+        Args:
+            error: Exception raised by the Gemini client
             
-            # Classify errors for appropriate handling
-            if "rate limit" in error_msg or "quota" in error_msg:
-                if "exceeded" in error_msg and "daily" in error_msg:
-                    raise PermanentError(f"Daily API quota exceeded: {str(e)}", cause=e)
-                else:
-                    # Extract retry-after if available
-                    retry_after = self._extract_retry_after(str(e))
-                    raise APIRateLimitError(
-                        f"API rate limit exceeded: {str(e)}", 
-                        retry_after=retry_after,
-                        cause=e
-                    )
-            elif "authentication" in error_msg or "api key" in error_msg:
-                raise PermanentError(f"API authentication failed: {str(e)}", cause=e)
-            elif "timeout" in error_msg or "connection" in error_msg:
-                raise TransientError(f"API connection failed: {str(e)}", cause=e)
+        Returns:
+            Classified exception to raise
+        """
+        classified = self._classify_api_error(error)
+        
+        if isinstance(classified, APIRateLimitError):
+            get_rate_limiter().penalize(classified.retry_after or 60)
+        
+        return classified
+    
+    def _count_tokens(self, response: Any, prompt: str, text: str) -> int:
+        """
+        Get the tokens a call used, preferring the API's own usage count.
+        
+        Args:
+            response: Gemini response object
+            prompt: Prompt sent
+            text: Response text received
+            
+        Returns:
+            Total tokens (prompt + response)
+        """
+        usage = getattr(response, "usage_metadata", None)
+        total = getattr(usage, "total_token_count", None) if usage is not None else None
+        
+        if isinstance(total, int) and total > 0:
+            return total
+        return estimate_tokens(prompt) + estimate_tokens(text)
+    
+    def _classify_api_error(self, error: Exception) -> Exception:
+        """
+        Map a raw Gemini client error to the system exception hierarchy.
+        
+        Args:
+            error: Exception raised by the Gemini client
+            
+        Returns:
+            PermanentError, APIRateLimitError or TransientError to raise
+        """
+        logger = logging.getLogger(__name__)
+        error_msg = str(error).lower()
+        
+        # Classify errors for appropriate handling
+        if "rate limit" in error_msg or "quota" in error_msg:
+            if "exceeded" in error_msg and "daily" in error_msg:
+                return PermanentError(f"Daily API quota exceeded: {str(error)}", cause=error)
             else:
-                # Default to transient for unknown API errors
-                logger.warning(f"Unknown API error, treating as transient: {str(e)}")
-                raise TransientError(f"Gemini API call failed: {str(e)}", cause=e)
+                # Extract retry-after if available
+                retry_after = self._extract_retry_after(str(error))
+                return APIRateLimitError(
+                    f"API rate limit exceeded: {str(error)}", 
+                    retry_after=retry_after,
+                    cause=error
+                )
+        elif "authentication" in error_msg or "api key" in error_msg:
+            return PermanentError(f"API authentication failed: {str(error)}", cause=error)
+        elif "timeout" in error_msg or "connection" in error_msg:
+            return TransientError(f"API connection failed: {str(error)}", cause=error)
+        else:
+            # Default to transient for unknown API errors
+            logger.warning(f"Unknown API error, treating as transient: {str(error)}")
+            return TransientError(f"Gemini API call failed: {str(error)}", cause=error)
+    
+    def _lookup_cached_response(self, prompt: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Look up a prompt in the response cache.
+        
+        Args:
+            prompt: The prompt text
+            
+        Returns:
+            Tuple of (cache key or None if caching is disabled, cached response or None)
+        """
+        if self._response_cache is None:
+            return None, None
+        
+        cache_key = self._cache_key(prompt)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            logging.getLogger(__name__).debug(
+                f"{self.__class__.__name__} response cache hit"
+            )
+        return cache_key, cached
+    
+    def _store_cached_response(self, cache_key: Optional[str], response: str) -> None:
+        """
+        Store a response in the cache (cache failures are logged, not raised).
+        
+        Args:
+            cache_key: Key from _lookup_cached_response() (None = caching disabled)
+            response: Response text
+        """
+        if cache_key is None:
+            return
+        
+        try:
+            self._response_cache.set(cache_key, response)
+        except Exception as e:
+            logging.getLogger(__name__).warning(
+                f"Failed to cache Gemini response: {str(e)}"
+            )
+    
+    def _cache_key(self, prompt: str) -> str:
+        """
+        Build the response cache key for a prompt with this agent's settings.
+        
+        Args:
+            prompt: The prompt text
+            
+        Returns:
+            Cache key
+        """
+        return make_cache_key(
+            self._config.model_name, self._config.temperature, prompt
+        )
+    
+    def _discard_cached_response(self, prompt: str) -> None:
+        """
+        Drop the cached response for a prompt.
+        
+        Called when a response fails parsing or validation, so retries and
+        later runs ask the model again instead of replaying the bad answer.
+        
+        Args:
+            prompt: The prompt whose response was rejected
+        """
+        if self._response_cache is not None:
+            self._response_cache.delete(self._cache_key(prompt))
     
     def _extract_retry_after(self, error_message: str) -> Optional[int]:
         """
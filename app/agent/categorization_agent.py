@@ -5,9 +5,18 @@ This module implements the CategorizationAgent that classifies articles
 into exam-relevant categories using the Google Gemini API.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+import logging
 from pydantic import BaseModel, Field, field_validator
+from app.config import (
+    CONTENT_BUDGET_CATEGORIZATION_BATCH_TOKENS,
+    CONTENT_BUDGET_CATEGORIZATION_TOKENS
+)
 from app.agent.abstract_agent import AbstractAgent, AgentConfig, AgentException
+from app.agent.content_preparation import ContentPreparer
+
+
+logger = logging.getLogger(__name__)
 
 
 class CategoryResult(BaseModel):
@@ -44,10 +53,14 @@ class CategorizationAgent(AbstractAgent):
     
     The agent assigns one primary category and up to two secondary categories
     to each article based on its content and relevance to competitive exams.
+    Article content is cleaned and cut down to its most informative
+    sentences within a token budget (see ContentPreparer) before it goes
+    into the prompt; batched prompts use a smaller per-article budget.
     
     Attributes:
         _config (AgentConfig): Agent configuration (inherited, private)
         _client (genai.Client): Gemini API client (inherited, private)
+        _content_preparer (ContentPreparer): Fits content into the token budget
     """
     
     # Class constant: Exam-relevant categories
@@ -62,17 +75,32 @@ class CategorizationAgent(AbstractAgent):
         "Social Issues"
     ]
     
-    def __init__(self, config: AgentConfig):
+    # Articles packed into a single prompt by execute_batch()
+    DEFAULT_BATCH_SIZE = 10
+    
+    # Per-article content budget inside a batched prompt (estimated tokens)
+    BATCH_CONTENT_TOKENS = CONTENT_BUDGET_CATEGORIZATION_BATCH_TOKENS
+    
+    def __init__(
+        self,
+        config: AgentConfig,
+        content_preparer: Optional[ContentPreparer] = None
+    ):
         """
         Initialize the categorization agent.
         
         Args:
             config: Agent configuration including API key
+            content_preparer: Content preparation for prompts (default:
+                              CONTENT_BUDGET_CATEGORIZATION_TOKENS budget)
             
         Raises:
             AgentException: If initialization fails
         """
         super().__init__(config)
+        self._content_preparer = content_preparer or ContentPreparer(
+            "categorization", CONTENT_BUDGET_CATEGORIZATION_TOKENS
+        )
         self._log_execution_start("initialization")
         self._log_execution_complete("initialization")
     
@@ -98,6 +126,145 @@ class CategorizationAgent(AbstractAgent):
         """
         self._log_execution_start("categorization")
         
+        prompt = self._prepare_prompt(input_data)
+        response = self._call_gemini_api(prompt)
+        result = self._result_from_response(prompt, response)
+        
+        self._log_execution_complete("categorization")
+        return result
+    
+    async def execute_async(self, input_data: dict) -> CategoryResult:
+        """
+        Categorize an article without blocking the event loop.
+        
+        Same contract as execute(), but the API call goes through
+        _call_gemini_api_async() and the shared request limiter.
+        
+        Args:
+            input_data: Same dictionary as execute()
+                
+        Returns:
+            CategoryResult with primary and secondary categories
+            
+        Raises:
+            AgentException: If categorization fails
+        """
+        self._log_execution_start("categorization")
+        
+        prompt = self._prepare_prompt(input_data)
+        response = await self._call_gemini_api_async(prompt)
+        result = self._result_from_response(prompt, response)
+        
+        self._log_execution_complete("categorization")
+        return result
+    
+    def execute_batch(
+        self,
+        articles: List[dict],
+        max_retries: int = 1
+    ) -> Dict[Any, CategoryResult]:
+        """
+        Categorize several articles with a single Gemini call.
+        
+        Packs all articles into one prompt (the category list and
+        instructions are sent once) and asks for a JSON array of results
+        keyed by article id. Each entry is validated on its own; articles
+        whose entry is missing or invalid are retried together in a smaller
+        follow-up prompt, up to max_retries times.
+        
+        Args:
+            articles: List of dictionaries with keys:
+                - id: Article identifier echoed back by the model
+                - title (str): Article title
+                - content (str): Article content
+                - source_type (str, optional): Source type for context
+            max_retries: Follow-up calls for articles that failed validation
+                
+        Returns:
+            Dictionary mapping article id to CategoryResult. Articles that
+            could not be categorized are absent from the result.
+            
+        Raises:
+            AgentException: If input is not a list
+            APIRateLimitError, TransientError, PermanentError: If the API call fails
+        """
+        self._log_execution_start(f"batch categorization of {len(articles)} articles")
+        
+        pending = self._pending_batch_items(articles)
+        results: Dict[Any, CategoryResult] = {}
+        
+        for attempt in range(max_retries + 1):
+            if not pending:
+                break
+            
+            if attempt > 0:
+                logger.info(f"Retrying categorization for {len(pending)} articles")
+            
+            prompt = self._build_batch_categorization_prompt(list(pending.values()))
+            self._log_api_call(len(prompt))
+            
+            response = self._call_gemini_api(prompt)
+            self._collect_batch_results(prompt, response, pending, results)
+        
+        self._log_batch_complete(len(articles), pending, results)
+        return results
+    
+    async def execute_batch_async(
+        self,
+        articles: List[dict],
+        max_retries: int = 1
+    ) -> Dict[Any, CategoryResult]:
+        """
+        Categorize several articles with one call, without blocking the event loop.
+        
+        Same contract as execute_batch(), but API calls go through
+        _call_gemini_api_async() and the shared request limiter.
+        
+        Args:
+            articles: Same list as execute_batch()
+            max_retries: Follow-up calls for articles that failed validation
+                
+        Returns:
+            Dictionary mapping article id to CategoryResult
+            
+        Raises:
+            AgentException: If input is not a list
+            APIRateLimitError, TransientError, PermanentError: If the API call fails
+        """
+        self._log_execution_start(f"batch categorization of {len(articles)} articles")
+        
+        pending = self._pending_batch_items(articles)
+        results: Dict[Any, CategoryResult] = {}
+        
+        for attempt in range(max_retries + 1):
+            if not pending:
+                break
+            
+            if attempt > 0:
+                logger.info(f"Retrying categorization for {len(pending)} articles")
+            
+            prompt = self._build_batch_categorization_prompt(list(pending.values()))
+            self._log_api_call(len(prompt))
+            
+            response = await self._call_gemini_api_async(prompt)
+            self._collect_batch_results(prompt, response, pending, results)
+        
+        self._log_batch_complete(len(articles), pending, results)
+        return results
+    
+    def _prepare_prompt(self, input_data: dict) -> str:
+        """
+        Validate agent input and build the categorization prompt.
+        
+        Args:
+            input_data: Agent input dictionary (see execute())
+            
+        Returns:
+            Prompt text
+            
+        Raises:
+            AgentException: If the input is invalid
+        """
         # Validate input
         if not isinstance(input_data, dict):
             raise AgentException("Input must be a dictionary")
@@ -109,18 +276,142 @@ class CategorizationAgent(AbstractAgent):
         if not title or not content:
             raise AgentException("Title and content are required")
         
-        # Build prompt and call API
         prompt = self._build_categorization_prompt(title, content, source_type)
         self._log_api_call(len(prompt))
+        return prompt
+    
+    def _result_from_response(self, prompt: str, response: str) -> CategoryResult:
+        """
+        Parse and validate an API response.
         
-        response = self._call_gemini_api(prompt)
-        result_dict = self._parse_json_response(response)
+        Discards the cached response if it cannot be used.
         
-        # Validate and create result
-        result = self._validate_and_create_result(result_dict)
+        Args:
+            prompt: Prompt the response answers
+            response: Raw API response text
+            
+        Returns:
+            Validated CategoryResult
+            
+        Raises:
+            AgentException: If the response is invalid
+        """
+        try:
+            result_dict = self._parse_json_response(response)
+            
+            # Validate and create result
+            return self._validate_and_create_result(result_dict)
+        except AgentException:
+            self._discard_cached_response(prompt)
+            raise
+    
+    def _pending_batch_items(self, articles: List[dict]) -> Dict[str, dict]:
+        """
+        Validate batch input and key usable articles by id.
         
-        self._log_execution_complete("categorization")
-        return result
+        Articles are keyed by the string form of their id, which is what
+        the model echoes back.
+        
+        Args:
+            articles: Batch input (see execute_batch())
+            
+        Returns:
+            Dictionary mapping str(id) to article input
+            
+        Raises:
+            AgentException: If input is not a list
+        """
+        if not isinstance(articles, list):
+            raise AgentException("Input must be a list of dictionaries")
+        
+        pending: Dict[str, dict] = {}
+        for item in articles:
+            if not isinstance(item, dict) or item.get('id') is None:
+                logger.warning("Skipping batch item without an id")
+                continue
+            if not item.get('title') or not item.get('content'):
+                logger.warning(f"Skipping article {item['id']}: title and content are required")
+                continue
+            pending[str(item['id'])] = item
+        
+        return pending
+    
+    def _collect_batch_results(
+        self,
+        prompt: str,
+        response: str,
+        pending: Dict[str, dict],
+        results: Dict[Any, CategoryResult]
+    ) -> None:
+        """
+        Move articles answered validly in a batch response from pending to results.
+        
+        Discards the cached response if any article is left uncategorized,
+        so it is not replayed on the next run.
+        
+        Args:
+            prompt: Batch prompt the response answers
+            response: Raw API response text
+            pending: Articles still to categorize (updated in place)
+            results: Collected results by article id (updated in place)
+        """
+        try:
+            entries = self._parse_json_response(response)
+        except AgentException as e:
+            logger.warning(f"Unparseable batch categorization response: {str(e)}")
+            self._discard_cached_response(prompt)
+            return
+        
+        if isinstance(entries, dict):
+            entries = entries.get('results', [entries])
+        
+        if not isinstance(entries, list):
+            logger.warning(
+                f"Batch categorization response is not a list: {type(entries).__name__}"
+            )
+            self._discard_cached_response(prompt)
+            return
+        
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            
+            key = str(entry.get('article_id'))
+            if key not in pending:
+                continue
+            
+            try:
+                result = self._validate_and_create_result(entry)
+            except AgentException as e:
+                logger.debug(f"Invalid categorization for article {key}: {str(e)}")
+                continue
+            
+            results[pending.pop(key)['id']] = result
+        
+        # Don't replay a response that left articles uncategorized
+        if pending:
+            self._discard_cached_response(prompt)
+    
+    def _log_batch_complete(
+        self,
+        total: int,
+        pending: Dict[str, dict],
+        results: Dict[Any, CategoryResult]
+    ) -> None:
+        """
+        Log the outcome of a batch categorization.
+        
+        Args:
+            total: Number of articles submitted
+            pending: Articles left uncategorized
+            results: Collected results
+        """
+        if pending:
+            logger.warning(
+                f"Could not categorize {len(pending)} of {total} articles in batch"
+            )
+        
+        self._log_execution_complete(f"batch categorization ({len(results)} categorized)")
     
     def _build_categorization_prompt(
         self, 
@@ -142,8 +433,8 @@ class CategorizationAgent(AbstractAgent):
         Returns:
             Formatted prompt string
         """
-        # Truncate content if too long (keep first 3000 chars)
-        truncated_content = content[:3000] if len(content) > 3000 else content
+        # Strip filler and keep the most informative sentences within budget
+        prepared_content = self._content_preparer.prepare(content, title=title)
         
         categories_list = "\n".join([f"- {cat}" for cat in self.EXAM_CATEGORIES])
         
@@ -156,7 +447,7 @@ Analyze the following article and categorize it for exam preparation purposes.
 **Source Type:** {source_type}
 
 **Article Content:**
-{truncated_content}
+{prepared_content}
 
 **Available Categories:**
 {categories_list}
@@ -182,6 +473,72 @@ Analyze the following article and categorize it for exam preparation purposes.
 - Use exact category names from the list
 - Secondary categories array can be empty or have 1-2 items
 - All categories must be distinct
+"""
+        return prompt
+    
+    def _build_batch_categorization_prompt(self, articles: List[dict]) -> str:
+        """
+        Build a prompt that categorizes several articles at once.
+        
+        Content gets a smaller token budget than in the single-article
+        prompt so that a full batch stays within a reasonable prompt size.
+        
+        Args:
+            articles: Article dictionaries (id, title, content, source_type)
+            
+        Returns:
+            Formatted prompt string
+        """
+        categories_list = "\n".join([f"- {cat}" for cat in self.EXAM_CATEGORIES])
+        
+        article_blocks = []
+        for item in articles:
+            content = self._content_preparer.prepare(
+                item['content'], title=item['title'], token_budget=self.BATCH_CONTENT_TOKENS
+            )
+            article_blocks.append(
+                f"### Article ID: {item['id']}\n"
+                f"**Title:** {item['title']}\n"
+                f"**Source Type:** {item.get('source_type', 'unknown')}\n"
+                f"**Content:**\n{content}"
+            )
+        articles_text = "\n\n".join(article_blocks)
+        
+        prompt = f"""You are an expert in Indian competitive exams (UPSC, SSC, Banking, etc.).
+
+Categorize EACH of the following {len(articles)} articles for exam preparation purposes.
+
+**Available Categories:**
+{categories_list}
+
+**Articles:**
+
+{articles_text}
+
+**Task (for every article):**
+1. Assign ONE primary category that best fits the article
+2. Assign UP TO TWO secondary categories (can be 0, 1, or 2)
+3. Ensure all categories are from the available list above
+4. Ensure primary and secondary categories are distinct (no duplicates)
+5. Provide a confidence score (0.0 to 1.0) for your categorization
+6. Explain your reasoning briefly
+
+**Output Format (JSON array only, no markdown, one object per article):**
+[
+    {{
+        "article_id": "Article ID exactly as given",
+        "primary_category": "Category Name",
+        "secondary_categories": ["Category Name 1", "Category Name 2"],
+        "confidence": 0.85,
+        "reasoning": "Brief explanation of why these categories were chosen"
+    }}
+]
+
+**Important:**
+- Return ONLY a valid JSON array with exactly {len(articles)} objects
+- Use exact category names from the list
+- Secondary categories array can be empty or have 1-2 items
+- All categories must be distinct
 """
         return prompt
     
@@ -272,6 +629,24 @@ Analyze the following article and categorize it for exam preparation purposes.
                 f"Found duplicates in: {all_categories}"
             )
     
+    def result_from_dict(self, result_dict: dict) -> CategoryResult:
+        """
+        Validate a parsed categorization and create a CategoryResult.
+        
+        Lets agents that categorize as part of a larger response (see
+        CategorizeSummarizeAgent) apply the same validation.
+        
+        Args:
+            result_dict: Categorization fields of a parsed response
+            
+        Returns:
+            Validated CategoryResult
+            
+        Raises:
+            AgentException: If validation fails
+        """
+        return self._validate_and_create_result(result_dict)
+    
     def get_available_categories(self) -> List[str]:
         """
         Get the list of available exam categories.
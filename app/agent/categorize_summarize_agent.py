@@ -0,0 +1,333 @@
+"""
+Categorize-Summarize Agent for one-call article analysis.
+
+This module implements the CategorizeSummarizeAgent that categorizes an
+article and writes its exam-focused summary in a single Google Gemini
+call, instead of one CategorizationAgent call followed by one
+SummarizationAgent call that both re-send the same title and content.
+"""
+
+from typing import Optional, Tuple
+import logging
+from pydantic import BaseModel
+from app.config import CONTENT_BUDGET_SUMMARIZATION_TOKENS
+from app.agent.abstract_agent import AbstractAgent, AgentConfig, AgentException
+from app.agent.categorization_agent import CategorizationAgent, CategoryResult
+from app.agent.content_preparation import ContentPreparer
+from app.agent.summarization_agent import SummarizationAgent, SummaryResult
+
+
+logger = logging.getLogger(__name__)
+
+
+class CategorizeSummarizeResult(BaseModel):
+    """
+    Result of a fused categorization and summarization.
+
+    Attributes:
+        category: Categorization of the article
+        summary: Exam-focused summary of the article
+    """
+    category: CategoryResult
+    summary: SummaryResult
+
+
+class CategorizeSummarizeAgent(AbstractAgent):
+    """
+    Agent that categorizes and summarizes an article in one API call.
+
+    The prompt carries the title and the prepared content once and asks
+    for a JSON object with a "categorization" and a "summary" section;
+    the call requests a JSON response (response_mime_type), and each
+    section goes through the validation of the agent it replaces, so the
+    results are interchangeable with those of CategorizationAgent and
+    SummarizationAgent.
+
+    Content too long for one prompt (see SummarizationAgent.needs_map_reduce)
+    is handed to the two agents instead - categorization first, then the
+    map-reduce summarization with the category found - so long transcripts
+    are not cut down to a single prompt's budget.
+
+    Attributes:
+        _config (AgentConfig): Agent configuration (inherited, private)
+        _client (genai.Client): Gemini API client (inherited, private)
+        _categorization_agent (CategorizationAgent): Category validation and
+                                                     fallback categorization
+        _summarization_agent (SummarizationAgent): Summary validation and
+                                                   fallback summarization
+        _content_preparer (ContentPreparer): Fits content into the token budget
+    """
+
+    def __init__(
+        self,
+        config: AgentConfig,
+        categorization_agent: CategorizationAgent,
+        summarization_agent: SummarizationAgent,
+        content_preparer: Optional[ContentPreparer] = None
+    ):
+        """
+        Initialize the categorize-summarize agent.
+
+        Args:
+            config: Agent configuration including API key
+            categorization_agent: Agent whose categories and validation are used
+            summarization_agent: Agent whose validation is used
+            content_preparer: Content preparation for prompts (default:
+                              CONTENT_BUDGET_SUMMARIZATION_TOKENS budget)
+
+        Raises:
+            AgentException: If initialization fails
+        """
+        super().__init__(config)
+        self._categorization_agent = categorization_agent
+        self._summarization_agent = summarization_agent
+        self._content_preparer = content_preparer or ContentPreparer(
+            "categorize_summarize", CONTENT_BUDGET_SUMMARIZATION_TOKENS
+        )
+        self._log_execution_start("initialization")
+        self._log_execution_complete("initialization")
+
+    def execute(self, input_data: dict) -> CategorizeSummarizeResult:
+        """
+        Categorize and summarize an article.
+
+        Args:
+            input_data: Dictionary with keys:
+                - title (str): Article title
+                - content (str): Article content
+                - source_type (str, optional): Source type for context
+
+        Returns:
+            CategorizeSummarizeResult with both results
+
+        Raises:
+            AgentException: If the response is invalid
+        """
+        self._log_execution_start("categorize-summarize")
+
+        title, content, source_type = self._read_input(input_data)
+        if self._summarization_agent.needs_map_reduce(content):
+            category = self._categorization_agent.execute(input_data)
+            summary = self._summarization_agent.execute(
+                self._summary_input(title, content, source_type, category)
+            )
+            result = CategorizeSummarizeResult(category=category, summary=summary)
+        else:
+            prompt = self._build_prompt(title, content, source_type)
+            response = self._call_gemini_api(prompt)
+            result = self._result_from_response(prompt, response)
+
+        self._log_execution_complete("categorize-summarize")
+        return result
+
+    async def execute_async(self, input_data: dict) -> CategorizeSummarizeResult:
+        """
+        Categorize and summarize an article without blocking the event loop.
+
+        Same contract as execute(), but the API calls go through
+        _call_gemini_api_async() and the shared request limiter.
+
+        Args:
+            input_data: Same dictionary as execute()
+
+        Returns:
+            CategorizeSummarizeResult with both results
+
+        Raises:
+            AgentException: If the response is invalid
+        """
+        self._log_execution_start("categorize-summarize")
+
+        title, content, source_type = self._read_input(input_data)
+        if self._summarization_agent.needs_map_reduce(content):
+            category = await self._categorization_agent.execute_async(input_data)
+            summary = await self._summarization_agent.execute_async(
+                self._summary_input(title, content, source_type, category)
+            )
+            result = CategorizeSummarizeResult(category=category, summary=summary)
+        else:
+            prompt = self._build_prompt(title, content, source_type)
+            response = await self._call_gemini_api_async(prompt)
+            result = self._result_from_response(prompt, response)
+
+        self._log_execution_complete("categorize-summarize")
+        return result
+
+    def _generation_config(self) -> dict:
+        """
+        Build the generation config, requesting a JSON response.
+
+        Returns:
+            Generation config dictionary
+        """
+        generation_config = super()._generation_config()
+        generation_config["response_mime_type"] = "application/json"
+        return generation_config
+
+    def _read_input(self, input_data: dict) -> Tuple[str, str, str]:
+        """
+        Validate agent input.
+
+        Args:
+            input_data: Agent input dictionary (see execute())
+
+        Returns:
+            (title, content, source_type) tuple
+
+        Raises:
+            AgentException: If the input is invalid
+        """
+        if not isinstance(input_data, dict):
+            raise AgentException("Input must be a dictionary")
+
+        title = input_data.get('title', '')
+        content = input_data.get('content', '')
+        source_type = input_data.get('source_type', 'unknown')
+
+        if not title or not content:
+            raise AgentException("Title and content are required")
+
+        return title, content, source_type
+
+    def _summary_input(
+        self,
+        title: str,
+        content: str,
+        source_type: str,
+        category: CategoryResult
+    ) -> dict:
+        """
+        Build the SummarizationAgent input for the fallback path.
+
+        Args:
+            title: Article title
+            content: Article content
+            source_type: Source type
+            category: Categorization of the article
+
+        Returns:
+            SummarizationAgent input dictionary
+        """
+        return {
+            'title': title,
+            'content': content,
+            'category': category.primary_category,
+            'source_type': source_type
+        }
+
+    def _result_from_response(self, prompt: str, response: str) -> CategorizeSummarizeResult:
+        """
+        Parse and validate an API response.
+
+        Discards the cached response if it cannot be used.
+
+        Args:
+            prompt: Prompt the response answers
+            response: Raw API response text
+
+        Returns:
+            Validated CategorizeSummarizeResult
+
+        Raises:
+            AgentException: If the response is invalid
+        """
+        try:
+            result_dict = self._parse_json_response(response)
+            if not isinstance(result_dict, dict):
+                raise AgentException("Response is not a JSON object")
+
+            return CategorizeSummarizeResult(
+                category=self._categorization_agent.result_from_dict(
+                    result_dict.get('categorization') or {}
+                ),
+                summary=self._summarization_agent.result_from_dict(
+                    result_dict.get('summary') or {}
+                )
+            )
+        except AgentException:
+            self._discard_cached_response(prompt)
+            raise
+
+    def _build_prompt(self, title: str, content: str, source_type: str) -> str:
+        """
+        Build the combined categorization and summarization prompt.
+
+        Args:
+            title: Article title
+            content: Article content
+            source_type: Source type (youtube, pib, government_schemes)
+
+        Returns:
+            Formatted prompt string
+        """
+        # Strip filler and keep the most informative sentences within budget
+        prepared_content = self._content_preparer.prepare(content, title=title)
+
+        categories_list = "\n".join(
+            [f"- {cat}" for cat in self._categorization_agent.get_available_categories()]
+        )
+
+        prompt = f"""You are an expert in Indian competitive exams (UPSC, SSC, Banking, etc.).
+
+Analyze the following article: categorize it, then create an exam-focused summary.
+
+**Article Title:** {title}
+
+**Source Type:** {source_type}
+
+**Article Content:**
+{prepared_content}
+
+**Available Categories:**
+{categories_list}
+
+**Task 1 - Categorization:**
+1. Assign ONE primary category that best fits the article
+2. Assign UP TO TWO secondary categories (can be 0, 1, or 2)
+3. Ensure all categories are from the available list above
+4. Ensure primary and secondary categories are distinct (no duplicates)
+5. Provide a confidence score (0.0 to 1.0) for your categorization
+6. Explain your reasoning briefly
+
+**Task 2 - Summary** (written for the primary category):
+1. **Main Summary** (200-300 words): key points and developments, with
+   facts, figures and specific examples from the content
+2. **Why Important for Exams**: syllabus topics and current affairs relevance
+3. **Prelims Relevance**: key facts and MCQ angles for objective questions
+4. **Mains Relevance**: essay/answer writing angles and analytical perspectives
+5. **Possible Questions** (minimum 3): a mix of prelims and mains style questions
+6. **Key Facts** (3-5): dates, numbers, names, schemes to memorize
+
+**Output Format (JSON only, no markdown):**
+{{
+    "categorization": {{
+        "primary_category": "Category Name",
+        "secondary_categories": ["Category Name 1", "Category Name 2"],
+        "confidence": 0.85,
+        "reasoning": "Brief explanation of why these categories were chosen"
+    }},
+    "summary": {{
+        "main_summary": "200-300 word summary with specific facts from the article...",
+        "why_important": "Explanation of exam relevance...",
+        "prelims_relevance": "How this appears in objective questions...",
+        "mains_relevance": "How this appears in descriptive questions...",
+        "possible_questions": [
+            "Question 1 (Prelims style)",
+            "Question 2 (Mains style)",
+            "Question 3 (Mixed)"
+        ],
+        "key_facts": [
+            "Fact 1 with specific detail",
+            "Fact 2 with specific detail",
+            "Fact 3 with specific detail"
+        ]
+    }}
+}}
+
+**Important:**
+- Return ONLY valid JSON
+- Use exact category names from the list; all categories must be distinct
+- Main summary must be 200-300 words
+- Include at least 3 possible questions
+"""
+        return prompt
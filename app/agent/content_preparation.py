@@ -0,0 +1,436 @@
+"""
+Token-budgeted content preparation for agent prompts.
+
+Article content used to go into prompts as-is, cut off after a fixed
+number of characters. YouTube transcripts run to tens of thousands of
+characters of unpunctuated captions, so most of the prompt was filler and
+the cut-off kept only the introduction. ContentPreparer instead:
+
+1. strips caption cues ([Music], >>), filler words and channel boilerplate
+2. collapses immediately repeated phrases (caption overlap), leaving figures
+   untouched
+3. splits the text into sentences (fixed-size word windows when captions
+   carry no punctuation) and drops repeated sentences
+4. if the result still exceeds the token budget, keeps the most salient
+   sentences - TF-IDF weight within the article, boosted for title terms
+   and figures - in their original order
+
+For content too long to summarize in one call, split_chunks() splits the
+cleaned sentences into overlapping chunks for map-reduce summarization.
+
+Every preparer records how many tokens it saved; get_content_stats()
+reports the totals per agent since the last reset_content_stats().
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import math
+import re
+import threading
+
+from app.agent.rate_limiter import estimate_tokens
+from app.services.ranking.keyword_matcher import tokenize
+
+
+# Caption cues, speaker markers, filler words and channel boilerplate
+_FILLER_PATTERNS = [
+    re.compile(r"\[[^\]]{0,40}\]"),
+    re.compile(r"\((?:music|applause|laughter|laughs|inaudible)\)", re.IGNORECASE),
+    re.compile(r">>+"),
+    re.compile(r"\b(?:u+m+|u+h+|e+r+m+|h+m+|a+h+)\b[,.]?", re.IGNORECASE),
+    re.compile(r"\b(?:you know|i mean|okay so|so guys)\b,?", re.IGNORECASE),
+    re.compile(
+        r"\b(?:hello|hi) (?:everyone|friends|guys)\b[,.!]?|"
+        r"\bwelcome (?:back )?to (?:my|our|the) channel\b[,.!]?|"
+        r"\b(?:please )?(?:like,? share and subscribe|like and subscribe|subscribe to "
+        r"(?:my|our|the) channel)\b[,.!]?|"
+        r"\b(?:hit|press) the bell icon\b[,.!]?",
+        re.IGNORECASE
+    ),
+]
+
+# A phrase of up to six words repeated back to back ("in this video in this video").
+# Only letter words separated by whitespace count, so figures ("4.4", "10,000",
+# "20-20") are never collapsed
+_REPEATED_PHRASE = re.compile(
+    r"\b((?:[^\W\d_]+\W+){0,5}?[^\W\d_]+)(?:\s+\1\b)+", re.IGNORECASE
+)
+
+_SENTENCE_END = re.compile(r"(?<=[.!?।])\s+")
+_WHITESPACE = re.compile(r"\s+")
+_NUMBER = re.compile(r"\d")
+
+# Words that carry no topic information when scoring sentences
+_STOPWORDS = frozenset(
+    "a an and are be been but by for from ha have he her hi i in into is it "
+    "its of on or our she so that the their them there these they thi to wa we "
+    "were what when which who will with you your not can do doe all also about "
+    "very just now then than more one two".split()
+)
+
+
+@dataclass
+class ContentPreparationStats:
+    """
+    Token accounting of a content preparer.
+
+    Attributes:
+        articles: Contents prepared
+        shortened: Contents cut down to their budget by sentence selection
+        original_tokens: Estimated tokens of the raw contents
+        prepared_tokens: Estimated tokens of the prepared contents
+    """
+    articles: int = 0
+    shortened: int = 0
+    original_tokens: int = 0
+    prepared_tokens: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        """Estimated tokens removed from the contents."""
+        return self.original_tokens - self.prepared_tokens
+
+    def to_dict(self) -> Dict[str, int]:
+        """
+        Convert to a plain dictionary for logging and reporting.
+
+        Returns:
+            Dictionary of the counters and tokens_saved
+        """
+        return {
+            'articles': self.articles,
+            'shortened': self.shortened,
+            'original_tokens': self.original_tokens,
+            'prepared_tokens': self.prepared_tokens,
+            'tokens_saved': self.tokens_saved
+        }
+
+
+_stats: Dict[str, ContentPreparationStats] = {}
+_stats_lock = threading.Lock()
+
+
+def get_content_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get the token accounting of all preparers since the last reset.
+
+    Returns:
+        Dictionary mapping preparer name to ContentPreparationStats.to_dict()
+    """
+    with _stats_lock:
+        return {name: stats.to_dict() for name, stats in _stats.items()}
+
+
+def reset_content_stats() -> None:
+    """Reset the token accounting of all preparers (e.g. at the start of a run)."""
+    with _stats_lock:
+        _stats.clear()
+
+
+class ContentPreparer:
+    """
+    Cleans article content and fits it into a token budget.
+
+    Thread-safe: preparers hold no per-call state, and the token
+    accounting is shared under a lock, so one preparer can serve an
+    agent's concurrent calls.
+
+    Example:
+        ```python
+        preparer = ContentPreparer("summarization", token_budget=2000)
+        content = preparer.prepare(article.content, title=article.title)
+        prompt = f"...**Article Content:**\\n{content}..."
+        print(get_content_stats()["summarization"]["tokens_saved"])
+        ```
+
+    Attributes:
+        _name (str): Name the token accounting is recorded under
+        _token_budget (int): Default content budget in estimated tokens
+        _max_sentence_words (int): Longer sentences are split into windows
+        REDUNDANCY_OVERLAP (float): Word overlap (Jaccard) above which a
+            sentence counts as a repeat of a selected one
+    """
+
+    REDUNDANCY_OVERLAP = 0.7
+
+    def __init__(
+        self,
+        name: str,
+        token_budget: int,
+        max_sentence_words: int = 40
+    ):
+        """
+        Initialize the preparer.
+
+        Args:
+            name: Name for the token accounting (usually the agent's task)
+            token_budget: Default content budget in estimated tokens
+            max_sentence_words: Sentences with more words (typically
+                                unpunctuated captions) are split into
+                                windows of half this size
+
+        Raises:
+            ValueError: If the budget is not positive
+        """
+        if token_budget < 1:
+            raise ValueError(f"token_budget must be at least 1, got {token_budget}")
+
+        self._name = name
+        self._token_budget = token_budget
+        self._max_sentence_words = max(2, max_sentence_words)
+
+    @property
+    def token_budget(self) -> int:
+        """Get the default content budget in estimated tokens."""
+        return self._token_budget
+
+    def prepare(
+        self,
+        content: str,
+        title: str = "",
+        token_budget: Optional[int] = None
+    ) -> str:
+        """
+        Clean content and cut it down to the token budget.
+
+        Args:
+            content: Raw article content
+            title: Article title (its terms mark salient sentences)
+            token_budget: Budget for this call (default: the preparer's)
+
+        Returns:
+            Prepared content, at most the budget in estimated tokens
+        """
+        budget = token_budget or self._token_budget
+        sentences = self._split_sentences(self._clean(content))
+        prepared = " ".join(sentences)
+
+        shortened = estimate_tokens(prepared) > budget
+        if shortened:
+            prepared = " ".join(self._select_sentences(sentences, title, budget))
+        elif not prepared:
+            # Nothing but filler: fall back to the raw content
+            prepared = content[:(budget - 1) * 4]
+
+        self._record(estimate_tokens(content), estimate_tokens(prepared), shortened)
+        return prepared
+
+    def cleaned_tokens(self, content: str) -> int:
+        """
+        Estimate the tokens of content after cleaning, before any selection.
+
+        Args:
+            content: Raw article content
+
+        Returns:
+            Estimated tokens of the cleaned content
+        """
+        return estimate_tokens(" ".join(self._split_sentences(self._clean(content))))
+
+    def split_chunks(
+        self,
+        content: str,
+        chunk_tokens: int,
+        overlap_tokens: int = 0,
+        max_chunks: Optional[int] = None,
+        title: str = ""
+    ) -> List[str]:
+        """
+        Clean content and split it into overlapping chunks of whole sentences.
+
+        Each chunk after the first starts with the last sentences of the
+        previous one (up to overlap_tokens), so facts spanning a chunk
+        boundary stay intact in one of them. If the cleaned content would
+        need more than max_chunks chunks, its most salient sentences are
+        selected first so that it fits.
+
+        Args:
+            content: Raw article content
+            chunk_tokens: Budget per chunk in estimated tokens
+            overlap_tokens: Tokens repeated from the end of the previous chunk
+            max_chunks: Maximum number of chunks (optional)
+            title: Article title (its terms mark salient sentences)
+
+        Returns:
+            Chunks in text order (at least one for non-empty content)
+        """
+        sentences = self._split_sentences(self._clean(content))
+        overlap_tokens = min(overlap_tokens, chunk_tokens // 2)
+
+        shortened = False
+        if max_chunks is not None:
+            budget = max_chunks * (chunk_tokens - overlap_tokens)
+            shortened = estimate_tokens(" ".join(sentences)) > budget
+            if shortened:
+                sentences = self._select_sentences(sentences, title, budget)
+
+        char_limit = (chunk_tokens - 1) * 4
+        overlap_chars = overlap_tokens * 4
+        chunks = []
+        current: List[str] = []
+        size = 0
+        for sentence in sentences:
+            sentence = sentence[:char_limit]
+            if current and size + len(sentence) + 1 > char_limit:
+                chunks.append(" ".join(current))
+                # Carry the tail of the finished chunk into the next one
+                tail: List[str] = []
+                tail_size = 0
+                for previous in reversed(current):
+                    if tail_size + len(previous) + 1 > overlap_chars:
+                        break
+                    tail.insert(0, previous)
+                    tail_size += len(previous) + 1
+                current, size = tail, tail_size
+            current.append(sentence)
+            size += len(sentence) + 1
+        if current:
+            chunks.append(" ".join(current))
+
+        self._record(
+            estimate_tokens(content),
+            sum(estimate_tokens(chunk) for chunk in chunks),
+            shortened
+        )
+        return chunks
+
+    def _clean(self, content: str) -> str:
+        """
+        Strip filler and repeated phrases and normalize whitespace.
+
+        Args:
+            content: Raw content
+
+        Returns:
+            Cleaned content
+        """
+        text = content or ""
+        for pattern in _FILLER_PATTERNS:
+            text = pattern.sub(" ", text)
+        text = _WHITESPACE.sub(" ", text)
+        return _REPEATED_PHRASE.sub(r"\1", text).strip()
+
+    def _split_sentences(self, text: str) -> List[str]:
+        """
+        Split text into sentences without repeats.
+
+        Sentences longer than max_sentence_words are split into windows of
+        half that many words, so unpunctuated captions become selectable
+        units too.
+
+        Args:
+            text: Cleaned text
+
+        Returns:
+            Sentences in text order, each first occurrence only
+        """
+        window = self._max_sentence_words // 2
+        sentences = []
+        seen = set()
+
+        for sentence in _SENTENCE_END.split(text):
+            words = sentence.split()
+            if len(words) > self._max_sentence_words:
+                parts = [
+                    " ".join(words[start:start + window])
+                    for start in range(0, len(words), window)
+                ]
+            else:
+                parts = [sentence]
+
+            for part in parts:
+                key = " ".join(tokenize(part))
+                if part and key not in seen:
+                    seen.add(key)
+                    sentences.append(part)
+
+        return sentences
+
+    def _select_sentences(self, sentences: List[str], title: str, budget: int) -> List[str]:
+        """
+        Keep the most salient sentences that fit the budget.
+
+        A sentence scores the IDF weights of its distinct content words
+        (rare words within the article carry the topic), doubled for title
+        words, plus a bonus per figure, normalized by the square root of
+        its length so long windows do not win on length alone. The first
+        sentence gets a lead bonus. Sentences are taken best first while
+        they fit and returned in their original order; sentences that
+        mostly repeat the words of one already taken are skipped.
+
+        Args:
+            sentences: Candidate sentences in text order
+            title: Article title
+            budget: Budget in estimated tokens
+
+        Returns:
+            Selected sentences in text order
+        """
+        sentence_terms = [
+            [token for token in tokenize(sentence) if token not in _STOPWORDS]
+            for sentence in sentences
+        ]
+        document_frequency: Dict[str, int] = {}
+        for terms in sentence_terms:
+            for term in set(terms):
+                document_frequency[term] = document_frequency.get(term, 0) + 1
+
+        count = len(sentences)
+        title_terms = set(tokenize(title)) - _STOPWORDS
+        scores = []
+        for index, (sentence, terms) in enumerate(zip(sentences, sentence_terms)):
+            salience = sum(
+                (math.log(count / document_frequency[term]) + 1.0)
+                * (2.0 if term in title_terms else 1.0)
+                for term in set(terms)
+            )
+            salience += 1.5 * len(_NUMBER.findall(sentence))
+            score = salience / math.sqrt(max(len(terms), 1))
+            if index == 0:
+                score *= 1.5
+            scores.append(score)
+
+        # estimate_tokens() counts characters, so budget characters directly
+        char_budget = (budget - 1) * 4
+        selected = []
+        selected_terms = []
+        used = 0
+        for index in sorted(range(count), key=lambda i: scores[i], reverse=True):
+            cost = len(sentences[index]) + (1 if selected else 0)
+            if used + cost > char_budget:
+                continue
+
+            # Skip near-repeats of a sentence already taken
+            terms = set(sentence_terms[index])
+            if any(
+                len(terms & other) >= self.REDUNDANCY_OVERLAP * len(terms | other)
+                for other in selected_terms if terms
+            ):
+                continue
+
+            selected.append(index)
+            selected_terms.append(terms)
+            used += cost
+
+        if not selected:
+            # Not even the best sentence fits: keep its beginning
+            best = max(range(count), key=lambda i: scores[i])
+            return [sentences[best][:char_budget]]
+
+        return [sentences[index] for index in sorted(selected)]
+
+    def _record(self, original_tokens: int, prepared_tokens: int, shortened: bool) -> None:
+        """
+        Add one prepared content to the shared token accounting.
+
+        Args:
+            original_tokens: Estimated tokens of the raw content
+            prepared_tokens: Estimated tokens of the prepared content
+            shortened: Whether sentence selection was needed
+        """
+        with _stats_lock:
+            stats = _stats.setdefault(self._name, ContentPreparationStats())
+            stats.articles += 1
+            stats.shortened += int(shortened)
+            stats.original_tokens += original_tokens
+            stats.prepared_tokens += prepared_tokens
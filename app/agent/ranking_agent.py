@@ -198,7 +198,11 @@ class RankingAgent(AbstractAgent):
             self._log_api_call(len(prompt))
             
             response = self._call_gemini_api(prompt)
-            enhancement_dict = self._parse_json_response(response)
+            try:
+                enhancement_dict = self._parse_json_response(response)
+            except AgentException:
+                self._discard_cached_response(prompt)
+                raise
             
             # Extract AI-suggested adjustments
             ai_score_adjustment = enhancement_dict.get('score_adjustment', 0.0)
@@ -0,0 +1,749 @@
+"""
+Rate limiting for Gemini API calls.
+
+Every AbstractAgent call goes through one GeminiRateLimiter, which enforces
+both the requests-per-minute (RPM) and tokens-per-minute (TPM) quota with
+token buckets. Categorization, summarization, ranking enhancement and
+digest calls therefore share the quota instead of competing for it and
+backing off independently.
+
+Bucket state lives in a pluggable store:
+- InProcessBucketStore: per-process (default)
+- FileBucketStore: JSON file guarded by an exclusive file lock, shared by
+  pipeline processes on one host
+- PostgresBucketStore: row-locked table, shared by processes on any host
+
+Wait times are recorded in the global PerformanceTracker and exposed via
+GeminiRateLimiter.stats.
+"""
+
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional, Tuple
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+
+from app.config import (
+    GEMINI_REQUESTS_PER_MINUTE,
+    GEMINI_TOKENS_PER_MINUTE,
+    GEMINI_MAX_CONCURRENCY,
+    RATE_LIMIT_BACKEND,
+    RATE_LIMIT_STATE_PATH
+)
+from app.exceptions import ConfigurationError
+from app.monitoring.performance import get_global_tracker
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+# Waits longer than this are logged at warning level
+SLOW_WAIT_SECONDS = 5.0
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the Gemini token count of a text (~4 chars per token).
+
+    Args:
+        text: Prompt or response text
+
+    Returns:
+        Estimated token count (at least 1)
+    """
+    return len(text) // 4 + 1
+
+
+def _refill_and_take(
+    balance: float,
+    updated_at: float,
+    tokens: float,
+    rate: float,
+    capacity: float,
+    now: float
+) -> Tuple[float, float]:
+    """
+    Apply one token-bucket reservation.
+
+    The balance may go negative: the caller is then told how long to wait,
+    and later callers queue up behind it.
+
+    Args:
+        balance: Current token balance
+        updated_at: Time the balance was last updated (epoch seconds)
+        tokens: Tokens to take
+        rate: Refill rate in tokens per second
+        capacity: Maximum balance
+        now: Current time (epoch seconds)
+
+    Returns:
+        Tuple of (new balance, seconds to wait)
+    """
+    balance = min(capacity, balance + max(0.0, now - updated_at) * rate)
+    balance -= tokens
+    delay = -balance / rate if balance < 0 else 0.0
+    return balance, delay
+
+
+class BucketStore(ABC):
+    """
+    Storage for token-bucket state.
+
+    reserve() must be atomic with respect to every other caller sharing
+    the store (threads, and processes for the shared backends).
+
+    Attributes:
+        blocking (bool): reserve() does I/O (file lock, database round trip),
+            so async callers run it in a worker thread instead of on the
+            event loop
+    """
+
+    blocking = False
+
+    @abstractmethod
+    def reserve(self, name: str, tokens: float, rate: float, capacity: float) -> float:
+        """
+        Take tokens from the named bucket.
+
+        A bucket that does not exist yet starts full.
+
+        Args:
+            name: Bucket name
+            tokens: Tokens to take
+            rate: Refill rate in tokens per second
+            capacity: Maximum balance
+
+        Returns:
+            Seconds the caller must wait before proceeding
+        """
+        pass
+
+
+class InProcessBucketStore(BucketStore):
+    """
+    Bucket state held in memory, shared by the threads of one process.
+
+    Attributes:
+        _buckets (Dict[str, Tuple[float, float]]): name -> (balance, updated_at)
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, name: str, tokens: float, rate: float, capacity: float) -> float:
+        """Take tokens from the named bucket."""
+        with self._lock:
+            now = time.time()
+            balance, updated_at = self._buckets.get(name, (capacity, now))
+            balance, delay = _refill_and_take(balance, updated_at, tokens, rate, capacity, now)
+            self._buckets[name] = (balance, now)
+            return delay
+
+
+class FileBucketStore(BucketStore):
+    """
+    Bucket state in a JSON file, shared by processes on one host.
+
+    Each reservation is a read-modify-write under an exclusive flock(), so
+    concurrent pipeline processes draw from the same buckets.
+
+    Attributes:
+        _path (str): State file path
+    """
+
+    blocking = True
+
+    def __init__(self, path: str):
+        """
+        Initialize the store, creating the state file's directory if needed.
+
+        Args:
+            path: State file path
+
+        Raises:
+            ConfigurationError: If file locking is not available on this platform
+        """
+        if fcntl is None:
+            raise ConfigurationError("File-backed rate limiting requires fcntl (POSIX only)")
+
+        self._path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def reserve(self, name: str, tokens: float, rate: float, capacity: float) -> float:
+        """Take tokens from the named bucket."""
+        with self._lock, open(self._path, "a+", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or "{}")
+                except json.JSONDecodeError:
+                    state = {}
+
+                now = time.time()
+                balance, updated_at = state.get(name, (capacity, now))
+                balance, delay = _refill_and_take(
+                    balance, updated_at, tokens, rate, capacity, now
+                )
+                state[name] = (balance, now)
+
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+                return delay
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class PostgresBucketStore(BucketStore):
+    """
+    Bucket state in a PostgreSQL table, shared by processes on any host.
+
+    Each reservation locks the bucket row with SELECT ... FOR UPDATE.
+
+    Attributes:
+        _engine: SQLAlchemy engine
+    """
+
+    TABLE_NAME = "rate_limit_buckets"
+    blocking = True
+
+    def __init__(self, engine=None):
+        """
+        Initialize the store, creating the bucket table if needed.
+
+        Args:
+            engine: SQLAlchemy engine (defaults to the application engine)
+        """
+        from sqlalchemy import text
+
+        if engine is None:
+            from app.database.connection import get_engine
+            engine = get_engine()
+
+        self._engine = engine
+        self._text = text
+
+        with self._engine.begin() as conn:
+            conn.execute(text(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                    name VARCHAR(100) PRIMARY KEY,
+                    tokens DOUBLE PRECISION NOT NULL,
+                    updated_at DOUBLE PRECISION NOT NULL
+                )
+                """
+            ))
+
+    def reserve(self, name: str, tokens: float, rate: float, capacity: float) -> float:
+        """Take tokens from the named bucket."""
+        text = self._text
+
+        with self._engine.begin() as conn:
+            now = time.time()
+            conn.execute(
+                text(
+                    f"INSERT INTO {self.TABLE_NAME} (name, tokens, updated_at) "
+                    f"VALUES (:name, :tokens, :now) ON CONFLICT (name) DO NOTHING"
+                ),
+                {"name": name, "tokens": capacity, "now": now}
+            )
+            row = conn.execute(
+                text(
+                    f"SELECT tokens, updated_at FROM {self.TABLE_NAME} "
+                    f"WHERE name = :name FOR UPDATE"
+                ),
+                {"name": name}
+            ).one()
+
+            now = time.time()
+            balance, delay = _refill_and_take(
+                row.tokens, row.updated_at, tokens, rate, capacity, now
+            )
+            conn.execute(
+                text(
+                    f"UPDATE {self.TABLE_NAME} SET tokens = :tokens, updated_at = :now "
+                    f"WHERE name = :name"
+                ),
+                {"name": name, "tokens": balance, "now": now}
+            )
+            return delay
+
+
+class FallbackBucketStore(BucketStore):
+    """
+    Shared bucket store that degrades to in-process limiting on errors.
+
+    A shared backend failing at runtime (database restart, state file
+    removed) would otherwise fail every Gemini call. The first failure is
+    logged once and every later reservation goes to an in-process store,
+    so the pipeline keeps running with per-process limits.
+
+    Attributes:
+        _store (BucketStore): Shared backend used until it fails
+        _fallback (InProcessBucketStore): Store used after the first failure
+        _degraded (bool): Whether the shared backend has failed
+    """
+
+    def __init__(self, store: BucketStore):
+        """
+        Initialize the store.
+
+        Args:
+            store: Shared backend to use while it works
+        """
+        self._store = store
+        self._fallback = InProcessBucketStore()
+        self._degraded = False
+        self._lock = threading.Lock()
+
+    @property
+    def blocking(self) -> bool:
+        """Whether reserve() currently goes to the blocking shared backend."""
+        return not self._degraded and self._store.blocking
+
+    def reserve(self, name: str, tokens: float, rate: float, capacity: float) -> float:
+        """Take tokens from the named bucket."""
+        if not self._degraded:
+            try:
+                return self._store.reserve(name, tokens, rate, capacity)
+            except Exception as e:
+                with self._lock:
+                    if not self._degraded:
+                        self._degraded = True
+                        logger.warning(
+                            f"{type(self._store).__name__} failed, "
+                            f"limiting per process only: {str(e)}"
+                        )
+        return self._fallback.reserve(name, tokens, rate, capacity)
+
+
+class TokenBucket:
+    """
+    Token bucket backed by a BucketStore.
+
+    reserve() takes tokens immediately and returns how long the caller must
+    wait before using them. Because reserve() never sleeps itself, the same
+    bucket serves both threads (time.sleep) and asyncio tasks
+    (asyncio.sleep).
+
+    Attributes:
+        _name (str): Bucket name in the store
+        _rate (float): Tokens added per second
+        _capacity (float): Maximum stored tokens (burst size)
+        _store (BucketStore): Where the bucket state lives
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: Optional[float] = None,
+        name: str = "default",
+        store: Optional[BucketStore] = None
+    ):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate_per_minute: Tokens added per minute (0 or less disables limiting)
+            capacity: Burst size (defaults to one second's worth, at least 1)
+            name: Bucket name in the store
+            store: Bucket state store (defaults to a private in-process store)
+        """
+        self._name = name
+        self._rate = rate_per_minute / 60.0 if rate_per_minute > 0 else 0.0
+        self._capacity = capacity if capacity is not None else max(1.0, self._rate)
+        self._store = store or InProcessBucketStore()
+
+    @property
+    def rate_per_minute(self) -> float:
+        """
+        Get the refill rate.
+
+        Returns:
+            Tokens added per minute
+        """
+        return self._rate * 60.0
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds the caller must wait before proceeding
+        """
+        if self._rate <= 0 or tokens <= 0:
+            return 0.0
+        return self._store.reserve(self._name, tokens, self._rate, self._capacity)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, blocking the current thread until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, suspending the current task until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self._store.blocking:
+            delay = await asyncio.to_thread(self.reserve, tokens)
+        else:
+            delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+@dataclass
+class RateLimiterStats:
+    """
+    Wait-time counters for a rate limiter.
+
+    Attributes:
+        requests: Requests admitted
+        waited_requests: Requests that had to wait
+        total_wait_seconds: Sum of all waits
+        max_wait_seconds: Longest single wait
+        tokens_reserved: Estimated plus corrected tokens charged to the TPM bucket
+        penalties: Times the limiter was pushed back after an API rate-limit error
+    """
+    requests: int = 0
+    waited_requests: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    tokens_reserved: int = 0
+    penalties: int = 0
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        """Average wait per admitted request."""
+        return self.total_wait_seconds / self.requests if self.requests else 0.0
+
+
+class GeminiRateLimiter:
+    """
+    Central RPM + TPM limiter for all Gemini calls.
+
+    Each call reserves one request and its estimated prompt tokens up
+    front; once the response arrives, record_usage() charges any tokens
+    beyond the estimate. When the API still answers with a rate-limit
+    error, penalize() pushes every caller back together instead of each
+    agent backing off on its own.
+
+    Attributes:
+        _store (BucketStore): State store shared by both buckets
+        _requests (TokenBucket): Requests-per-minute bucket
+        _tokens (TokenBucket): Tokens-per-minute bucket
+        _stats (RateLimiterStats): Wait-time counters
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        store: Optional[BucketStore] = None
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: RPM quota (0 disables request limiting)
+            tokens_per_minute: TPM quota (0 disables token limiting)
+            store: Bucket state store (defaults to in-process)
+        """
+        store = store or InProcessBucketStore()
+        self._store = store
+        self._requests = TokenBucket(requests_per_minute, name="gemini_requests", store=store)
+        self._tokens = TokenBucket(
+            tokens_per_minute,
+            capacity=max(1.0, tokens_per_minute / 60.0),
+            name="gemini_tokens",
+            store=store
+        )
+        self._stats = RateLimiterStats()
+        self._stats_lock = threading.Lock()
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """
+        Get the wait-time counters.
+
+        Returns:
+            RateLimiterStats for this limiter
+        """
+        return self._stats
+
+    def reserve(self, estimated_tokens: int = 0) -> float:
+        """
+        Reserve one request and its estimated tokens.
+
+        Args:
+            estimated_tokens: Estimated prompt tokens
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        return max(
+            self._requests.reserve(1),
+            self._tokens.reserve(estimated_tokens)
+        )
+
+    def acquire(self, estimated_tokens: int = 0, caller: str = "") -> float:
+        """
+        Block the current thread until a request may be sent.
+
+        Args:
+            estimated_tokens: Estimated prompt tokens
+            caller: Name recorded with the wait metric (e.g. agent class)
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve(estimated_tokens)
+        if delay > 0:
+            time.sleep(delay)
+        self._record_wait(delay, estimated_tokens, caller)
+        return delay
+
+    async def acquire_async(self, estimated_tokens: int = 0, caller: str = "") -> float:
+        """
+        Suspend the current task until a request may be sent.
+
+        Args:
+            estimated_tokens: Estimated prompt tokens
+            caller: Name recorded with the wait metric (e.g. agent class)
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self._store.blocking:
+            # Keep file locks and database round trips off the event loop
+            delay = await asyncio.to_thread(self.reserve, estimated_tokens)
+        else:
+            delay = self.reserve(estimated_tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._record_wait(delay, estimated_tokens, caller)
+        return delay
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """
+        Charge tokens used beyond the up-front estimate.
+
+        The extra tokens are taken without waiting; they delay later
+        callers instead.
+
+        Args:
+            estimated_tokens: Tokens reserved before the call
+            actual_tokens: Tokens the call actually used (prompt + response)
+        """
+        extra = actual_tokens - estimated_tokens
+        if extra > 0:
+            self._tokens.reserve(extra)
+            with self._stats_lock:
+                self._stats.tokens_reserved += extra
+
+    def penalize(self, seconds: float) -> None:
+        """
+        Push all callers back after the API reported a rate-limit error.
+
+        Args:
+            seconds: How long the API asked us to back off
+        """
+        if seconds <= 0 or self._requests.rate_per_minute <= 0:
+            return
+
+        self._requests.reserve(self._requests.rate_per_minute / 60.0 * seconds)
+        with self._stats_lock:
+            self._stats.penalties += 1
+        logger.warning(f"Gemini rate limit hit, holding all agents back {seconds:.1f}s")
+
+    def _record_wait(self, delay: float, estimated_tokens: int, caller: str) -> None:
+        """
+        Update counters and emit the wait-time metric.
+
+        Args:
+            delay: Seconds waited
+            estimated_tokens: Tokens reserved
+            caller: Name of the waiting caller
+        """
+        with self._stats_lock:
+            self._stats.requests += 1
+            self._stats.tokens_reserved += estimated_tokens
+            self._stats.total_wait_seconds += delay
+            if delay > 0:
+                self._stats.waited_requests += 1
+                self._stats.max_wait_seconds = max(self._stats.max_wait_seconds, delay)
+
+        get_global_tracker().record_operation(
+            "gemini_rate_limit_wait",
+            delay,
+            metadata={"caller": caller, "estimated_tokens": estimated_tokens}
+        )
+
+        if delay >= SLOW_WAIT_SECONDS:
+            logger.warning(f"{caller or 'Gemini call'} waited {delay:.1f}s for rate limit")
+        elif delay > 0:
+            logger.debug(f"{caller or 'Gemini call'} waited {delay:.2f}s for rate limit")
+
+
+class AsyncRequestLimiter:
+    """
+    Bounds in-flight Gemini requests on one event loop.
+
+    request() waits for a free concurrency slot, then for the shared
+    GeminiRateLimiter. The semaphore belongs to one event loop; the rate
+    limiter is shared process-wide.
+
+    Example:
+        ```python
+        async with limiter.request(estimated_tokens, "SummarizationAgent"):
+            response = await model.generate_content_async(prompt)
+        ```
+
+    Attributes:
+        _rate_limiter (GeminiRateLimiter): Shared RPM/TPM limiter
+        _semaphore (asyncio.Semaphore): Concurrency limit
+    """
+
+    def __init__(self, rate_limiter: GeminiRateLimiter, max_concurrency: int):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate_limiter: Shared RPM/TPM limiter
+            max_concurrency: Maximum requests in flight at once
+        """
+        self._rate_limiter = rate_limiter
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    @asynccontextmanager
+    async def request(self, estimated_tokens: int = 0, caller: str = "") -> AsyncIterator[None]:
+        """
+        Hold a concurrency slot for one rate-limited request.
+
+        Args:
+            estimated_tokens: Estimated prompt tokens
+            caller: Name recorded with the wait metric
+        """
+        async with self._semaphore:
+            await self._rate_limiter.acquire_async(estimated_tokens, caller)
+            yield
+
+
+_rate_limiter: Optional[GeminiRateLimiter] = None
+_async_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncRequestLimiter]" = (
+    weakref.WeakKeyDictionary()
+)
+_limiter_lock = threading.Lock()
+
+
+def _create_bucket_store() -> BucketStore:
+    """
+    Build the bucket store selected by RATE_LIMIT_BACKEND.
+
+    Falls back to the in-process store if the shared backend cannot be
+    set up or fails later on (see FallbackBucketStore), so the limiter
+    never stops the pipeline.
+
+    Returns:
+        BucketStore instance
+    """
+    backend = RATE_LIMIT_BACKEND.lower()
+
+    try:
+        if backend == "file":
+            return FallbackBucketStore(FileBucketStore(RATE_LIMIT_STATE_PATH))
+        if backend == "postgres":
+            return FallbackBucketStore(PostgresBucketStore())
+    except Exception as e:
+        logger.warning(
+            f"Could not set up '{backend}' rate limit backend, "
+            f"limiting per process only: {str(e)}"
+        )
+        return InProcessBucketStore()
+
+    if backend != "memory":
+        logger.warning(f"Unknown RATE_LIMIT_BACKEND '{backend}', limiting per process only")
+    return InProcessBucketStore()
+
+
+def get_rate_limiter() -> GeminiRateLimiter:
+    """
+    Get the process-wide Gemini rate limiter shared by all agents.
+
+    Returns:
+        GeminiRateLimiter sized to GEMINI_REQUESTS_PER_MINUTE and
+        GEMINI_TOKENS_PER_MINUTE
+    """
+    global _rate_limiter
+
+    with _limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = GeminiRateLimiter(
+                GEMINI_REQUESTS_PER_MINUTE,
+                GEMINI_TOKENS_PER_MINUTE,
+                store=_create_bucket_store()
+            )
+        return _rate_limiter
+
+
+def get_async_request_limiter() -> AsyncRequestLimiter:
+    """
+    Get the request limiter for the running event loop.
+
+    Each event loop gets its own semaphore (asyncio primitives cannot be
+    shared between loops), but all of them go through the same
+    GeminiRateLimiter, so the quota holds across loops and threads.
+
+    Returns:
+        AsyncRequestLimiter for the current loop
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    rate_limiter = get_rate_limiter()
+
+    with _limiter_lock:
+        limiter = _async_limiters.get(loop)
+        if limiter is None:
+            limiter = AsyncRequestLimiter(rate_limiter, GEMINI_MAX_CONCURRENCY)
+            _async_limiters[loop] = limiter
+        return limiter
@@ -0,0 +1,433 @@
+"""
+Response cache for Gemini API calls.
+
+This module provides a pluggable cache for LLM responses, keyed on the
+model name, temperature and a hash of the prompt. Re-running a failed
+pipeline, re-categorizing articles or seeing the same release twice then
+costs nothing for prompts that were already answered.
+
+Backends:
+- InMemoryLRUCache: bounded per-process LRU
+- SQLiteResponseCache: persistent on-disk cache shared across runs
+- TieredResponseCache: in-memory LRU in front of a persistent backend
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from app.config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL_SECONDS,
+    LLM_CACHE_MEMORY_ENTRIES,
+    LLM_CACHE_DISK_ENTRIES
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(model_name: str, temperature: float, prompt: str) -> str:
+    """
+    Build a cache key for a prompt.
+
+    Args:
+        model_name: Gemini model name
+        temperature: Sampling temperature
+        prompt: Full prompt text
+
+    Returns:
+        Hex digest identifying (model_name, temperature, prompt)
+    """
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    return hashlib.sha256(
+        f"{model_name}|{temperature:.4f}|{prompt_hash}".encode("utf-8")
+    ).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """
+    Hit/miss counters for a response cache.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups not found (or expired)
+        evictions: Entries removed to respect the size limit
+        expirations: Entries removed because their TTL passed
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class AbstractResponseCache(ABC):
+    """
+    Interface for LLM response caches.
+
+    Implementations must be thread-safe; agents may share one cache across
+    worker threads.
+
+    Attributes:
+        _ttl_seconds (Optional[float]): Entry lifetime (None = no expiry)
+        _stats (CacheStats): Hit/miss counters
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Entry lifetime in seconds (None or 0 = no expiry)
+        """
+        self._ttl_seconds = ttl_seconds or None
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Get the cache counters.
+
+        Returns:
+            CacheStats for this cache
+        """
+        return self._stats
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            Cached response text, or None on miss
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, response: str) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from make_cache_key()
+            response: Response text to cache
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Remove a response (e.g. one that failed validation).
+
+        Args:
+            key: Cache key from make_cache_key()
+        """
+        pass
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        """
+        Check whether an entry created at created_at has outlived the TTL.
+
+        Args:
+            created_at: Entry creation time (epoch seconds)
+            now: Current time (epoch seconds)
+
+        Returns:
+            True if the entry is expired
+        """
+        return self._ttl_seconds is not None and now - created_at > self._ttl_seconds
+
+
+class InMemoryLRUCache(AbstractResponseCache):
+    """
+    Bounded in-memory LRU response cache.
+
+    Attributes:
+        _max_entries (int): Maximum number of cached responses
+        _entries (OrderedDict): key -> (created_at, response), LRU order
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the in-memory cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            ttl_seconds: Entry lifetime in seconds (None = no expiry)
+        """
+        super().__init__(ttl_seconds)
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached response, refreshing its LRU position."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and self._is_expired(entry[0], time.time()):
+                del self._entries[key]
+                self._stats.expirations += 1
+                entry = None
+
+            if entry is None:
+                self._stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry[1]
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (time.time(), response)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """Remove a response if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class SQLiteResponseCache(AbstractResponseCache):
+    """
+    Persistent response cache stored in a local SQLite file.
+
+    Survives process restarts, so a re-run of a failed pipeline reuses the
+    responses of the previous run. Least recently used entries are evicted
+    once max_entries is exceeded.
+
+    Attributes:
+        _path (str): Database file path
+        _max_entries (int): Maximum number of cached responses
+        _conn (sqlite3.Connection): Shared connection (guarded by _lock)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 50000,
+        ttl_seconds: Optional[float] = None
+    ):
+        """
+        Initialize the SQLite cache, creating the file and table if needed.
+
+        Args:
+            path: Database file path
+            max_entries: Maximum number of cached responses
+            ttl_seconds: Entry lifetime in seconds (None = no expiry)
+        """
+        super().__init__(ttl_seconds)
+        self._path = path
+        self._max_entries = max_entries
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_access "
+            "ON llm_responses (last_access)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached response, refreshing its access time."""
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_responses WHERE cache_key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is not None and self._is_expired(row[1], now):
+                self._conn.execute(
+                    "DELETE FROM llm_responses WHERE cache_key = ?", (key,)
+                )
+                self._conn.commit()
+                self._stats.expirations += 1
+                row = None
+
+            if row is None:
+                self._stats.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_responses SET last_access = ? WHERE cache_key = ?",
+                (now, key)
+            )
+            self._conn.commit()
+            self._stats.hits += 1
+            return row[0]
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response, evicting the least recently used entries."""
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(cache_key, response, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, response, now, now)
+            )
+
+            count = self._conn.execute(
+                "SELECT COUNT(*) FROM llm_responses"
+            ).fetchone()[0]
+            overflow = count - self._max_entries
+
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM llm_responses WHERE cache_key IN ("
+                    "SELECT cache_key FROM llm_responses ORDER BY last_access ASC LIMIT ?)",
+                    (overflow,)
+                )
+                self._stats.evictions += overflow
+
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        """Remove a response if present."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (key,))
+            self._conn.commit()
+
+
+class TieredResponseCache(AbstractResponseCache):
+    """
+    In-memory LRU front in front of a persistent backend.
+
+    Lookups hit the front first; backend hits are promoted into the front.
+    Writes and deletes go to both tiers.
+
+    Attributes:
+        _front (AbstractResponseCache): Fast in-process cache
+        _back (AbstractResponseCache): Persistent cache
+    """
+
+    def __init__(self, front: AbstractResponseCache, back: AbstractResponseCache):
+        """
+        Initialize the tiered cache.
+
+        Args:
+            front: Fast in-process cache
+            back: Persistent cache
+        """
+        super().__init__()
+        self._front = front
+        self._back = back
+
+    @property
+    def front(self) -> AbstractResponseCache:
+        """Get the in-process tier."""
+        return self._front
+
+    @property
+    def back(self) -> AbstractResponseCache:
+        """Get the persistent tier."""
+        return self._back
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a response in the front, then the backend."""
+        response = self._front.get(key)
+
+        if response is None:
+            response = self._back.get(key)
+            if response is not None:
+                self._front.set(key, response)
+
+        with self._lock:
+            if response is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+
+        return response
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response in both tiers."""
+        self._front.set(key, response)
+        self._back.set(key, response)
+
+    def delete(self, key: str) -> None:
+        """Remove a response from both tiers."""
+        self._front.delete(key)
+        self._back.delete(key)
+
+
+_default_cache: Optional[AbstractResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_response_cache() -> Optional[AbstractResponseCache]:
+    """
+    Get the process-wide response cache shared by all agents.
+
+    Built lazily from configuration: an in-memory LRU in front of the
+    SQLite cache at LLM_CACHE_PATH. Falls back to memory only if the
+    SQLite file cannot be opened.
+
+    Returns:
+        The shared cache, or None if LLM_CACHE_ENABLED is False
+    """
+    global _default_cache
+
+    if not LLM_CACHE_ENABLED:
+        return None
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            front = InMemoryLRUCache(
+                max_entries=LLM_CACHE_MEMORY_ENTRIES,
+                ttl_seconds=LLM_CACHE_TTL_SECONDS
+            )
+            try:
+                back = SQLiteResponseCache(
+                    LLM_CACHE_PATH,
+                    max_entries=LLM_CACHE_DISK_ENTRIES,
+                    ttl_seconds=LLM_CACHE_TTL_SECONDS
+                )
+                _default_cache = TieredResponseCache(front, back)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(
+                    f"Could not open LLM response cache at {LLM_CACHE_PATH}, "
+                    f"using memory only: {str(e)}"
+                )
+                _default_cache = front
+
+        return _default_cache
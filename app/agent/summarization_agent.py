@@ -3,11 +3,29 @@ Summarization Agent for exam-focused content summaries.
 
 This module implements the SummarizationAgent that generates exam-focused
 summaries with prelims/mains relevance using the Google Gemini API.
+Content too long for one prompt is summarized map-reduce style: overlapping
+chunks are condensed into notes concurrently, then the notes are summarized.
 """
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+import asyncio
+import logging
 from pydantic import BaseModel, Field, field_validator
+from app.config import (
+    CONTENT_BUDGET_SUMMARIZATION_TOKENS,
+    SUMMARY_CHUNK_OVERLAP_TOKENS,
+    SUMMARY_CHUNK_TOKENS,
+    SUMMARY_MAP_CONCURRENCY,
+    SUMMARY_MAP_REDUCE_MIN_TOKENS,
+    SUMMARY_MAX_CHUNKS
+)
 from app.agent.abstract_agent import AbstractAgent, AgentConfig, AgentException
+from app.agent.content_preparation import ContentPreparer
+from app.agent.rate_limiter import estimate_tokens
+
+
+logger = logging.getLogger(__name__)
 
 
 class SummaryResult(BaseModel):
@@ -53,6 +71,18 @@ class SummaryResult(BaseModel):
         return v
 
 
+class ChunkNotes(BaseModel):
+    """
+    Notes on one chunk of a long article (map step of map-reduce).
+    
+    Attributes:
+        key_points: Developments, decisions and arguments in the chunk
+        key_facts: Dates, numbers, names and schemes in the chunk
+    """
+    key_points: list[str] = Field(..., min_length=1)
+    key_facts: list[str] = Field(default_factory=list)
+
+
 class SummarizationAgent(AbstractAgent):
     """
     Agent for generating exam-focused summaries of articles.
@@ -68,22 +98,63 @@ class SummarizationAgent(AbstractAgent):
     - Possible exam questions
     - Key facts to remember
     
+    Article content is cleaned and cut down to its most informative
+    sentences within a token budget (see ContentPreparer) before it goes
+    into the prompt. Content that stays above map_reduce_min_tokens after
+    cleaning is summarized map-reduce style instead: it is split into
+    overlapping chunks, every chunk is condensed into ChunkNotes with up to
+    map_concurrency calls in flight, and the notes of all chunks go into
+    the usual summarization prompt, so the result passes the same
+    SummaryResult validation. Chunks whose notes are invalid are skipped
+    as long as at least half of the chunks succeed.
+    
     Attributes:
         _config (AgentConfig): Agent configuration (inherited, private)
         _client (genai.Client): Gemini API client (inherited, private)
+        _content_preparer (ContentPreparer): Fits content into the token budget
+        _map_reduce_min_tokens (int): Cleaned tokens that trigger map-reduce
+        _chunk_tokens (int): Content tokens per chunk
+        _chunk_overlap_tokens (int): Tokens repeated between chunks
+        _max_chunks (int): Maximum number of chunks per article
+        _map_concurrency (int): Chunk calls in flight per article
     """
     
-    def __init__(self, config: AgentConfig):
+    def __init__(
+        self,
+        config: AgentConfig,
+        content_preparer: Optional[ContentPreparer] = None,
+        map_reduce_min_tokens: int = SUMMARY_MAP_REDUCE_MIN_TOKENS,
+        chunk_tokens: int = SUMMARY_CHUNK_TOKENS,
+        chunk_overlap_tokens: int = SUMMARY_CHUNK_OVERLAP_TOKENS,
+        max_chunks: int = SUMMARY_MAX_CHUNKS,
+        map_concurrency: int = SUMMARY_MAP_CONCURRENCY
+    ):
         """
         Initialize the summarization agent.
         
         Args:
             config: Agent configuration including API key
+            content_preparer: Content preparation for prompts (default:
+                              CONTENT_BUDGET_SUMMARIZATION_TOKENS budget)
+            map_reduce_min_tokens: Cleaned content tokens above which
+                                   map-reduce summarization is used
+            chunk_tokens: Content tokens per map-reduce chunk
+            chunk_overlap_tokens: Tokens repeated at the start of each chunk
+            max_chunks: Maximum number of chunks per article
+            map_concurrency: Maximum chunk calls in flight per article
             
         Raises:
             AgentException: If initialization fails
         """
         super().__init__(config)
+        self._content_preparer = content_preparer or ContentPreparer(
+            "summarization", CONTENT_BUDGET_SUMMARIZATION_TOKENS
+        )
+        self._map_reduce_min_tokens = map_reduce_min_tokens
+        self._chunk_tokens = chunk_tokens
+        self._chunk_overlap_tokens = chunk_overlap_tokens
+        self._max_chunks = max(1, max_chunks)
+        self._map_concurrency = max(1, map_concurrency)
         self._log_execution_start("initialization")
         self._log_execution_complete("initialization")
     
@@ -110,6 +181,71 @@ class SummarizationAgent(AbstractAgent):
         """
         self._log_execution_start("summarization")
         
+        title, content, category, source_type = self._read_input(input_data)
+        chunks = self._split_long_content(title, content)
+        if chunks is None:
+            prompt = self._build_summarization_prompt(
+                title, content, category, source_type
+            )
+        else:
+            notes = self._map_chunks(title, category, chunks)
+            prompt = self._build_reduce_prompt(title, category, source_type, notes)
+        
+        self._log_api_call(len(prompt))
+        response = self._call_gemini_api(prompt)
+        result = self._result_from_response(prompt, response)
+        
+        self._log_execution_complete("summarization")
+        return result
+    
+    async def execute_async(self, input_data: dict) -> SummaryResult:
+        """
+        Generate an exam-focused summary without blocking the event loop.
+        
+        Same contract as execute(), but the API call goes through
+        _call_gemini_api_async() and the shared request limiter.
+        
+        Args:
+            input_data: Same dictionary as execute()
+                
+        Returns:
+            SummaryResult with all required sections
+            
+        Raises:
+            AgentException: If summarization fails
+        """
+        self._log_execution_start("summarization")
+        
+        title, content, category, source_type = self._read_input(input_data)
+        chunks = self._split_long_content(title, content)
+        if chunks is None:
+            prompt = self._build_summarization_prompt(
+                title, content, category, source_type
+            )
+        else:
+            notes = await self._map_chunks_async(title, category, chunks)
+            prompt = self._build_reduce_prompt(title, category, source_type, notes)
+        
+        self._log_api_call(len(prompt))
+        response = await self._call_gemini_api_async(prompt)
+        result = self._result_from_response(prompt, response)
+        
+        self._log_execution_complete("summarization")
+        return result
+    
+    def _read_input(self, input_data: dict) -> Tuple[str, str, str, str]:
+        """
+        Validate agent input.
+        
+        Args:
+            input_data: Agent input dictionary (see execute())
+            
+        Returns:
+            (title, content, category, source_type) tuple
+            
+        Raises:
+            AgentException: If the input is invalid
+        """
         # Validate input
         if not isinstance(input_data, dict):
             raise AgentException("Input must be a dictionary")
@@ -122,20 +258,202 @@ class SummarizationAgent(AbstractAgent):
         if not title or not content:
             raise AgentException("Title and content are required")
         
-        # Build prompt and call API
-        prompt = self._build_summarization_prompt(
-            title, content, category, source_type
+        return title, content, category, source_type
+    
+    def needs_map_reduce(self, content: str) -> bool:
+        """
+        Check whether content is too long to summarize in one prompt.
+        
+        Args:
+            content: Article content
+            
+        Returns:
+            True if the cleaned content exceeds map_reduce_min_tokens
+        """
+        # Cleaning only removes text, so short raw content never needs chunks
+        if estimate_tokens(content) <= self._map_reduce_min_tokens:
+            return False
+        return self._content_preparer.cleaned_tokens(content) > self._map_reduce_min_tokens
+    
+    def result_from_dict(self, result_dict: dict) -> SummaryResult:
+        """
+        Validate a parsed summary and create a SummaryResult.
+        
+        Lets agents that summarize as part of a larger response (see
+        CategorizeSummarizeAgent) apply the same validation.
+        
+        Args:
+            result_dict: Summary fields of a parsed response
+            
+        Returns:
+            Validated SummaryResult
+            
+        Raises:
+            AgentException: If validation fails
+        """
+        return self._validate_and_create_result(result_dict)
+    
+    def _split_long_content(self, title: str, content: str) -> Optional[List[str]]:
+        """
+        Split content into map-reduce chunks if it is too long for one prompt.
+        
+        Args:
+            title: Article title
+            content: Article content
+            
+        Returns:
+            Overlapping chunks, or None if the content fits one prompt
+        """
+        if not self.needs_map_reduce(content):
+            return None
+        
+        chunks = self._content_preparer.split_chunks(
+            content,
+            chunk_tokens=self._chunk_tokens,
+            overlap_tokens=self._chunk_overlap_tokens,
+            max_chunks=self._max_chunks,
+            title=title
         )
-        self._log_api_call(len(prompt))
+        logger.info(f"Summarizing '{title[:60]}' from {len(chunks)} chunks")
+        return chunks
+    
+    def _map_chunks(self, title: str, category: str, chunks: List[str]) -> List[ChunkNotes]:
+        """
+        Condense chunks into notes with concurrent API calls.
         
-        response = self._call_gemini_api(prompt)
-        result_dict = self._parse_json_response(response)
+        Args:
+            title: Article title
+            category: Primary category
+            chunks: Chunks from _split_long_content()
+            
+        Returns:
+            Notes of the chunks that produced valid notes, in chunk order
+            
+        Raises:
+            AgentException: If fewer than half of the chunks produced notes
+            APIRateLimitError, TransientError, PermanentError: If an API
+                call fails (notes of finished chunks stay cached for the retry)
+        """
+        prompts = self._build_chunk_prompts(title, category, chunks)
         
-        # Validate and create result
-        result = self._validate_and_create_result(result_dict)
+        def notes_for(prompt: str) -> Optional[ChunkNotes]:
+            return self._notes_from_response(prompt, self._call_gemini_api(prompt))
         
-        self._log_execution_complete("summarization")
-        return result
+        with ThreadPoolExecutor(
+            max_workers=min(len(prompts), self._map_concurrency),
+            thread_name_prefix="summary-map"
+        ) as executor:
+            notes = list(executor.map(notes_for, prompts))
+        
+        return self._collect_notes(notes)
+    
+    async def _map_chunks_async(
+        self,
+        title: str,
+        category: str,
+        chunks: List[str]
+    ) -> List[ChunkNotes]:
+        """
+        Async counterpart of _map_chunks().
+        
+        Args:
+            title: Article title
+            category: Primary category
+            chunks: Chunks from _split_long_content()
+            
+        Returns:
+            Notes of the chunks that produced valid notes, in chunk order
+            
+        Raises:
+            AgentException: If fewer than half of the chunks produced notes
+            APIRateLimitError, TransientError, PermanentError: If an API call fails
+        """
+        prompts = self._build_chunk_prompts(title, category, chunks)
+        semaphore = asyncio.Semaphore(self._map_concurrency)
+        
+        async def notes_for(prompt: str) -> Optional[ChunkNotes]:
+            async with semaphore:
+                response = await self._call_gemini_api_async(prompt)
+            return self._notes_from_response(prompt, response)
+        
+        # Let every chunk finish (and be cached) before surfacing an error
+        outcomes = await asyncio.gather(
+            *(notes_for(prompt) for prompt in prompts), return_exceptions=True
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        
+        return self._collect_notes(outcomes)
+    
+    def _notes_from_response(self, prompt: str, response: str) -> Optional[ChunkNotes]:
+        """
+        Parse and validate the API response for one chunk.
+        
+        Discards the cached response if it cannot be used.
+        
+        Args:
+            prompt: Chunk prompt the response answers
+            response: Raw API response text
+            
+        Returns:
+            Validated ChunkNotes, or None if the response is invalid
+        """
+        try:
+            result_dict = self._parse_json_response(response)
+            return ChunkNotes(
+                key_points=result_dict.get('key_points', []),
+                key_facts=result_dict.get('key_facts', [])
+            )
+        except Exception as e:
+            self._discard_cached_response(prompt)
+            logger.warning(f"Skipping chunk with invalid notes: {str(e)}")
+            return None
+    
+    def _collect_notes(self, notes: List[Optional[ChunkNotes]]) -> List[ChunkNotes]:
+        """
+        Keep the valid chunk notes if enough chunks produced them.
+        
+        Args:
+            notes: Notes per chunk (None for invalid responses)
+            
+        Returns:
+            Valid notes in chunk order
+            
+        Raises:
+            AgentException: If fewer than half of the chunks produced notes
+        """
+        valid = [chunk_notes for chunk_notes in notes if chunk_notes is not None]
+        if len(valid) * 2 < len(notes):
+            raise AgentException(
+                f"Only {len(valid)} of {len(notes)} chunks produced valid notes"
+            )
+        return valid
+    
+    def _result_from_response(self, prompt: str, response: str) -> SummaryResult:
+        """
+        Parse and validate an API response.
+        
+        Discards the cached response if it cannot be used.
+        
+        Args:
+            prompt: Prompt the response answers
+            response: Raw API response text
+            
+        Returns:
+            Validated SummaryResult
+            
+        Raises:
+            AgentException: If the response is invalid
+        """
+        try:
+            result_dict = self._parse_json_response(response)
+            
+            # Validate and create result
+            return self._validate_and_create_result(result_dict)
+        except AgentException:
+            self._discard_cached_response(prompt)
+            raise
     
     def _build_summarization_prompt(
         self,
@@ -159,9 +477,112 @@ class SummarizationAgent(AbstractAgent):
         Returns:
             Formatted prompt string
         """
-        # Truncate content if too long (keep first 4000 chars)
-        truncated_content = content[:4000] if len(content) > 4000 else content
+        # Strip filler and keep the most informative sentences within budget
+        prepared_content = self._content_preparer.prepare(content, title=title)
+        
+        return self._summary_prompt(
+            title, category, source_type, "Article Content", prepared_content
+        )
+    
+    def _build_chunk_prompts(self, title: str, category: str, chunks: List[str]) -> List[str]:
+        """
+        Build the map prompts that condense each chunk into notes.
         
+        Args:
+            title: Article title
+            category: Primary category
+            chunks: Chunks in text order
+            
+        Returns:
+            One prompt per chunk
+        """
+        total = len(chunks)
+        return [
+            f"""You are an expert in Indian competitive exams (UPSC, SSC, Banking, etc.).
+
+The article below is too long to summarize at once. Take notes on part {index} of {total}; they will be combined with the notes on the other parts into one exam-focused summary.
+
+**Article Title:** {title}
+
+**Category:** {category}
+
+**Article Content (part {index} of {total}):**
+{chunk}
+
+**Task:**
+1. **Key Points** (3-8): developments, decisions and arguments in this part, one sentence each
+2. **Key Facts**: dates, numbers, names, schemes and institutions, exactly as stated
+
+**Output Format (JSON only, no markdown):**
+{{
+    "key_points": ["Point 1", "Point 2", "Point 3"],
+    "key_facts": ["Fact 1", "Fact 2"]
+}}
+
+**Important:**
+- Return ONLY valid JSON
+- Only use information from this part of the article
+"""
+            for index, chunk in enumerate(chunks, 1)
+        ]
+    
+    def _build_reduce_prompt(
+        self,
+        title: str,
+        category: str,
+        source_type: str,
+        notes: List[ChunkNotes]
+    ) -> str:
+        """
+        Build the reduce prompt that summarizes the notes of all chunks.
+        
+        Args:
+            title: Article title
+            category: Primary category
+            source_type: Source type (youtube, pib, government_schemes)
+            notes: Valid chunk notes in text order
+            
+        Returns:
+            Formatted prompt string
+        """
+        sections = []
+        for index, chunk_notes in enumerate(notes, 1):
+            lines = [f"Part {index}:"]
+            lines.extend(f"- {point}" for point in chunk_notes.key_points)
+            if chunk_notes.key_facts:
+                lines.append("Facts:")
+                lines.extend(f"- {fact}" for fact in chunk_notes.key_facts)
+            sections.append("\n".join(lines))
+        
+        return self._summary_prompt(
+            title,
+            category,
+            source_type,
+            "Notes on Consecutive Parts of the Article",
+            "\n\n".join(sections)
+        )
+    
+    def _summary_prompt(
+        self,
+        title: str,
+        category: str,
+        source_type: str,
+        content_heading: str,
+        content: str
+    ) -> str:
+        """
+        Fill in the summarization prompt template.
+        
+        Args:
+            title: Article title
+            category: Primary category
+            source_type: Source type (youtube, pib, government_schemes)
+            content_heading: Heading of the content section
+            content: Prepared article content or chunk notes
+            
+        Returns:
+            Formatted prompt string
+        """
         prompt = f"""You are an expert in Indian competitive exams (UPSC, SSC, Banking, etc.).
 
 Analyze the following article and create an exam-focused summary.
@@ -172,8 +593,8 @@ Analyze the following article and create an exam-focused summary.
 
 **Source Type:** {source_type}
 
-**Article Content:**
-{truncated_content}
+**{content_heading}:**
+{content}
 
 **Task:**
 Create a comprehensive exam-focused summary with the following sections:
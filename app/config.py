@@ -123,6 +123,48 @@ GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
 GEMINI_MODEL: str = "gemini-1.5-flash"
 GEMINI_TEMPERATURE: float = 0.7
 GEMINI_MAX_TOKENS: int = 2048
+CATEGORIZATION_BATCH_SIZE: int = 10  # Articles per categorization API call
+GEMINI_REQUESTS_PER_MINUTE: int = int(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "60"))  # RPM quota
+GEMINI_TOKENS_PER_MINUTE: int = int(os.getenv("GEMINI_TOKENS_PER_MINUTE", "1000000"))  # TPM quota
+GEMINI_MAX_CONCURRENCY: int = 8     # Max in-flight requests on the async path
+
+# Content preparation: article content is cleaned (caption filler, repeated
+# phrases) and cut down to its most informative sentences before it goes
+# into a prompt. Budgets are estimated tokens of article content per prompt.
+CONTENT_BUDGET_CATEGORIZATION_TOKENS: int = 750        # Single-article categorization
+CONTENT_BUDGET_CATEGORIZATION_BATCH_TOKENS: int = 375  # Per article in a batched prompt
+CONTENT_BUDGET_SUMMARIZATION_TOKENS: int = 2000        # Summarization
+
+# Map-reduce summarization: content still above SUMMARY_MAP_REDUCE_MIN_TOKENS
+# after cleaning is split into overlapping chunks, each chunk is condensed into
+# notes concurrently (map), and the notes are summarized in one call (reduce).
+SUMMARY_MAP_REDUCE_MIN_TOKENS: int = 4000     # Cleaned tokens that trigger map-reduce
+SUMMARY_CHUNK_TOKENS: int = 2000              # Content tokens per chunk
+SUMMARY_CHUNK_OVERLAP_TOKENS: int = 200       # Tokens repeated between chunks
+SUMMARY_MAX_CHUNKS: int = 8                   # Longer content is cut to its salient sentences
+SUMMARY_MAP_CONCURRENCY: int = 4              # Chunks summarized in parallel per article
+
+# Local pre-categorization: a TF-IDF + logistic regression model trained on
+# the Gemini-assigned categories (scripts/train_local_classifier.py) answers
+# the articles it is confident about; the others still go to Gemini.
+LOCAL_CLASSIFIER_ENABLED: bool = os.getenv("LOCAL_CLASSIFIER_ENABLED", "true").lower() == "true"
+LOCAL_CLASSIFIER_MODEL_PATH: str = os.getenv("LOCAL_CLASSIFIER_MODEL_PATH", ".cache/local_classifier.npz")
+LOCAL_CLASSIFIER_TARGET_PRECISION: float = 0.95  # Agreement with Gemini required above the threshold
+LOCAL_CLASSIFIER_HOLDOUT_FRACTION: float = 0.2   # Labeled articles held out for calibration
+LOCAL_CLASSIFIER_MAX_FEATURES: int = 20000       # Vocabulary size (unigrams and bigrams)
+LOCAL_CLASSIFIER_MIN_DF: int = 2                 # Articles a vocabulary term must occur in
+
+# Where rate-limit state lives: "memory" (per process), "file" (per host)
+# or "postgres" (shared by every process using DATABASE_URL)
+RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_STATE_PATH: str = os.getenv("RATE_LIMIT_STATE_PATH", ".cache/rate_limits.json")
+
+# LLM response cache (keyed on model, temperature and prompt hash)
+LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", ".cache/llm_responses.sqlite3")
+LLM_CACHE_TTL_SECONDS: int = 7 * 24 * 3600  # Entry lifetime (0 = never expire)
+LLM_CACHE_MEMORY_ENTRIES: int = 1024        # In-memory LRU front size
+LLM_CACHE_DISK_ENTRIES: int = 50000         # Max entries kept on disk
 
 
 # ============================================================================
@@ -130,6 +172,12 @@ GEMINI_MAX_TOKENS: int = 2048
 # ============================================================================
 
 DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+DB_POOL_SIZE: int = int(os.getenv("DATABASE_POOL_SIZE", "5"))          # Persistent pooled connections
+DB_MAX_OVERFLOW: int = int(os.getenv("DATABASE_MAX_OVERFLOW", "10"))   # Extra connections under load
+DB_POOL_TIMEOUT: int = int(os.getenv("DATABASE_POOL_TIMEOUT", "30"))   # Seconds to wait for a connection
+DB_POOL_RECYCLE: int = int(os.getenv("DATABASE_POOL_RECYCLE", "3600"))  # Recycle connections after N seconds
+DB_FLUSH_BATCH_SIZE: int = 100  # Pending writes per flush inside a unit of work
+DB_ITER_BATCH_SIZE: int = 200   # Rows per page when streaming large result sets
 
 
 # ============================================================================
@@ -139,6 +187,42 @@ DATABASE_URL: str = os.getenv("DATABASE_URL", "")
 DEFAULT_SCRAPE_HOURS: int = 24  # Default lookback period
 DEFAULT_TOP_N: int = 10         # Default number of top articles to select
 SCRAPER_TIMEOUT: int = 30       # Request timeout in seconds
+SCRAPER_MAX_WORKERS: int = 4    # Sources scraped in parallel (1 = sequential)
+SCRAPER_SOURCE_TIMEOUT: int = 300  # Wall-clock budget per source in seconds
+YOUTUBE_MAX_WORKERS: int = 8    # Concurrent YouTube feed/transcript fetches
+YOUTUBE_REQUESTS_PER_SECOND: float = 5.0  # Per-host request rate limit
+
+# Near-duplicate detection at ingestion (MinHash LSH over word shingles);
+# duplicates are linked to their canonical article and skip the LLM stages
+NEAR_DUP_ENABLED: bool = True
+NEAR_DUP_NUM_PERM: int = 128       # MinHash signature length
+NEAR_DUP_BANDS: int = 32           # LSH bands (must divide NEAR_DUP_NUM_PERM)
+NEAR_DUP_SHINGLE_SIZE: int = 3     # Words per shingle
+NEAR_DUP_THRESHOLD: float = 0.6    # Estimated Jaccard similarity of a duplicate
+NEAR_DUP_LOOKBACK_DAYS: int = 14   # Only match articles published this recently (0 = all)
+
+
+# ============================================================================
+# PIPELINE CONFIGURATION
+# ============================================================================
+
+PIPELINE_STREAM_BATCH_SIZE: int = 20  # Articles per batch handed between streaming stages
+PIPELINE_QUEUE_SIZE: int = 4          # Batches buffered between two streaming stages
+PIPELINE_STAGE_WORKERS: Dict[str, int] = {  # Worker threads per streaming stage
+    "categorize": 2,
+    "summarize": 4,
+    "rank": 1
+}
+
+# Pre-ranking: articles are scored with the ranking heuristics before
+# summarization and only the best candidates per exam type are summarized
+PRERANK_TOP_K: int = 30  # Candidates per exam type to summarize (0 = summarize all)
+
+# Database-backed work queue (scripts/run_worker.py)
+WORK_QUEUE_BATCH_SIZE: int = 20        # Items claimed per batch
+WORK_QUEUE_LEASE_SECONDS: int = 600    # Claim lifetime before items are handed out again
+WORK_QUEUE_MAX_ATTEMPTS: int = 3       # Claims per item before it is marked failed
+WORK_QUEUE_POLL_SECONDS: float = 10.0  # Idle wait when the queue is empty
 
 
 # ============================================================================
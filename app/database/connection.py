@@ -1,10 +1,15 @@
 import os
+import threading
+from typing import Dict, Optional
 from urllib.parse import quote_plus
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool
 from dotenv import load_dotenv
 
+from app.config import DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE
+
 load_dotenv()
 
 def get_database_url() -> str:
@@ -16,51 +21,160 @@ def get_database_url() -> str:
     database_url = os.getenv("DATABASE_URL")
     if database_url:
         return database_url
-    
+
     # Fall back to individual components (local development)
     user = os.getenv("POSTGRES_USER", "postgres")
     password = os.getenv("POSTGRES_PASSWORD", "postgres")
     host = os.getenv("POSTGRES_HOST", "localhost")
     port = os.getenv("POSTGRES_PORT", "5432")
     db = os.getenv("POSTGRES_DB", "ai_news_aggregator")
-    
+
     # For Windows, explicitly use 127.0.0.1 instead of localhost to avoid socket issues
     if host == "localhost":
         host = "127.0.0.1"
-    
+
     # URL-encode the password to handle special characters like @
     password_encoded = quote_plus(password)
-    
+
     return f"postgresql://{user}:{password_encoded}@{host}:{port}/{db}"
 
-def get_engine():
+def create_db_engine(database_url: Optional[str] = None) -> Engine:
     """
-    Create SQLAlchemy engine with connection pooling for production.
+    Create a new SQLAlchemy engine with connection pooling for production.
+
+    Most code should use the shared engine from get_engine(); every engine
+    created here owns a separate pool of up to DB_POOL_SIZE + DB_MAX_OVERFLOW
+    connections.
     """
-    database_url = get_database_url()
-    
+    database_url = database_url or get_database_url()
+
     # Connection pool settings for production reliability
     # For Windows, add connect_args to force TCP/IP connection
     connect_args = {}
     if os.name == 'nt':  # Windows
         connect_args = {'host': '127.0.0.1'}
-    
+
     return create_engine(
         database_url,
         poolclass=QueuePool,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
         pool_pre_ping=True,  # Verify connections before using
-        pool_recycle=3600,   # Recycle connections after 1 hour
+        pool_recycle=DB_POOL_RECYCLE,
         echo=False,
         connect_args=connect_args
     )
 
-# Global engine and session factory
-engine = get_engine()
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Process-wide engine and session factory, created on first use
+_engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker] = None
+_engine_lock = threading.Lock()
+
+# Pool counters for get_pool_stats(), updated by pool events
+_pool_counters: Dict[str, int] = {}
+
+def _reset_pool_counters() -> None:
+    _pool_counters.update({
+        "total_checkouts": 0,
+        "peak_checked_out": 0,
+        "peak_overflow": 0,
+        "connections_created": 0
+    })
+
+def _track_pool(engine: Engine) -> None:
+    """Register pool event listeners that feed get_pool_stats()."""
+    pool = engine.pool
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        _pool_counters["connections_created"] += 1
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        _pool_counters["total_checkouts"] += 1
+        _pool_counters["peak_checked_out"] = max(
+            _pool_counters["peak_checked_out"], pool.checkedout()
+        )
+        _pool_counters["peak_overflow"] = max(
+            _pool_counters["peak_overflow"], pool.overflow()
+        )
+
+def get_engine() -> Engine:
+    """
+    Get the process-wide SQLAlchemy engine, creating it on first use.
+    """
+    global _engine
+
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = create_db_engine()
+                _reset_pool_counters()
+                _track_pool(engine)
+                _engine = engine
+
+    return _engine
+
+def get_session_factory() -> sessionmaker:
+    """
+    Get the process-wide session factory bound to the shared engine.
+
+    Sessions keep loaded attributes after commit (expire_on_commit=False),
+    so entities returned by repositories stay readable once their session
+    has closed. Autoflush stays off as before: queries don't flush pending
+    writes, which are flushed explicitly (repositories, UnitOfWork).
+    """
+    global _session_factory
+
+    if _session_factory is None:
+        engine = get_engine()
+        with _engine_lock:
+            if _session_factory is None:
+                _session_factory = sessionmaker(
+                    bind=engine, autoflush=False, expire_on_commit=False
+                )
+
+    return _session_factory
 
 def get_session():
     """Get a new database session."""
-    return SessionLocal()
+    return get_session_factory()()
+
+def get_pool_stats() -> Dict[str, int]:
+    """
+    Get connection pool statistics for the shared engine.
+
+    Returns pool size, current checked-in/checked-out/overflow connections
+    and counters accumulated since the engine was created (total checkouts,
+    peak concurrent checkouts, peak overflow, connections opened). Empty
+    if the engine has not been created yet.
+    """
+    if _engine is None:
+        return {}
+
+    pool = _engine.pool
+    stats = {
+        "pool_size": pool.size(),
+        "max_overflow": DB_MAX_OVERFLOW,
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(0, pool.overflow())
+    }
+    stats.update(_pool_counters)
+    return stats
+
+def dispose_engine() -> None:
+    """
+    Close all pooled connections and drop the shared engine.
+
+    The next get_engine() call creates a fresh engine. Call this in a
+    child process after fork, or at shutdown.
+    """
+    global _engine, _session_factory
 
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+        _engine = None
+        _session_factory = None
@@ -4,9 +4,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from app.database.models import Base
-from app.database.connection import engine
+from app.database.connection import get_engine
 
 if __name__ == "__main__":
-    Base.metadata.create_all(engine)
+    Base.metadata.create_all(get_engine())
     print("Tables created successfully")
 
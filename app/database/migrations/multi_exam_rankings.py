@@ -0,0 +1,279 @@
+"""
+Database migration: Store one ranking per article and exam type
+
+Rankings used to be unique per article, so ranking an article for a second
+exam type overwrote its first ranking. This migration relaxes the
+uniqueness to (article_id, exam_type) and replaces the single-column
+exam_type index with a composite (exam_type, score DESC, article_id) index
+that serves "top N for an exam" queries directly.
+
+Migration: 002_multi_exam_rankings
+Created: 2026-10-18
+"""
+
+import logging
+from sqlalchemy import create_engine, text
+
+
+logger = logging.getLogger(__name__)
+
+
+MIGRATION_NAME = '002_multi_exam_rankings'
+
+
+class MultiExamRankingsMigration:
+    """
+    Migration handler for multi-exam ranking storage.
+
+    Handles forward migration, rollback, and verification procedures.
+    Requires PostgreSQL (constraints are looked up in pg_constraint).
+    """
+
+    def __init__(self, database_url: str):
+        """
+        Initialize migration handler.
+
+        Args:
+            database_url: Database connection URL
+        """
+        self.database_url = database_url
+        self.engine = create_engine(database_url)
+
+    def execute_migration(self) -> bool:
+        """
+        Execute the migration.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        logger.info(f"Starting database migration: {MIGRATION_NAME}")
+
+        try:
+            with self.engine.begin() as conn:
+                # Allow one ranking per (article, exam type)
+                for name in self._unique_constraints(conn, ['article_id']):
+                    logger.info(f"Dropping constraint {name}")
+                    conn.execute(text(f'ALTER TABLE rankings DROP CONSTRAINT "{name}"'))
+
+                if not self._unique_constraints(conn, ['article_id', 'exam_type']):
+                    conn.execute(text("""
+                        ALTER TABLE rankings
+                        ADD CONSTRAINT uq_rankings_article_exam UNIQUE (article_id, exam_type)
+                    """))
+
+                # Composite index for top-N per exam type
+                conn.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_rankings_exam_type_score
+                    ON rankings (exam_type, score DESC, article_id)
+                """))
+
+                # Covered by the composite index's leading column
+                conn.execute(text("DROP INDEX IF EXISTS idx_rankings_exam_type"))
+
+                self._record_migration(conn)
+
+            logger.info("Migration completed successfully")
+            return True
+
+        except Exception as e:
+            logger.error(f"Migration failed: {str(e)}", exc_info=True)
+            return False
+
+    def rollback_migration(self) -> bool:
+        """
+        Rollback the migration changes.
+
+        Refuses to run while any article has rankings for more than one
+        exam type, since the old per-article constraint would reject them.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        logger.info(f"Starting migration rollback: {MIGRATION_NAME}")
+
+        try:
+            with self.engine.begin() as conn:
+                duplicates = conn.execute(text("""
+                    SELECT COUNT(*) FROM (
+                        SELECT article_id FROM rankings
+                        GROUP BY article_id HAVING COUNT(*) > 1
+                    ) AS multi
+                """)).scalar()
+
+                if duplicates:
+                    logger.error(
+                        f"{duplicates} articles have rankings for several exam types; "
+                        "delete the extra rankings before rolling back"
+                    )
+                    return False
+
+                conn.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_rankings_exam_type ON rankings (exam_type)
+                """))
+                conn.execute(text("DROP INDEX IF EXISTS idx_rankings_exam_type_score"))
+
+                if not self._unique_constraints(conn, ['article_id']):
+                    conn.execute(text("""
+                        ALTER TABLE rankings
+                        ADD CONSTRAINT rankings_article_id_key UNIQUE (article_id)
+                    """))
+
+                self._remove_migration_record(conn)
+
+            logger.info("Migration rollback completed successfully")
+            return True
+
+        except Exception as e:
+            logger.error(f"Migration rollback failed: {str(e)}", exc_info=True)
+            return False
+
+    def verify_migration(self) -> bool:
+        """
+        Verify migration was applied correctly.
+
+        Returns:
+            True if verification passes, False otherwise
+        """
+        logger.info(f"Verifying migration: {MIGRATION_NAME}")
+
+        try:
+            with self.engine.connect() as conn:
+                if self._unique_constraints(conn, ['article_id']):
+                    logger.error("Unique constraint on rankings.article_id still exists")
+                    return False
+
+                if not self._unique_constraints(conn, ['article_id', 'exam_type']):
+                    logger.error("Unique constraint on (article_id, exam_type) missing")
+                    return False
+
+                result = conn.execute(text("""
+                    SELECT 1 FROM pg_indexes
+                    WHERE tablename = 'rankings'
+                    AND indexname = 'idx_rankings_exam_type_score'
+                """))
+                if not result.fetchone():
+                    logger.error("Index idx_rankings_exam_type_score missing")
+                    return False
+
+            logger.info("Migration verification passed")
+            return True
+
+        except Exception as e:
+            logger.error(f"Migration verification failed: {str(e)}", exc_info=True)
+            return False
+
+    def _unique_constraints(self, conn, columns: list) -> list:
+        """
+        Find unique constraints on rankings covering exactly the given columns.
+
+        Args:
+            conn: Database connection
+            columns: Column names, in any order
+
+        Returns:
+            Names of matching constraints
+        """
+        result = conn.execute(text("""
+            SELECT con.conname,
+                   array_agg(att.attname::text ORDER BY att.attname) AS cols
+            FROM pg_constraint con
+            JOIN pg_attribute att
+              ON att.attrelid = con.conrelid AND att.attnum = ANY(con.conkey)
+            WHERE con.conrelid = 'rankings'::regclass AND con.contype = 'u'
+            GROUP BY con.conname
+        """))
+        wanted = sorted(columns)
+        return [row.conname for row in result if sorted(row.cols) == wanted]
+
+    def _record_migration(self, conn) -> None:
+        """Record migration in migrations table."""
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS migrations (
+                id SERIAL PRIMARY KEY,
+                migration_name VARCHAR(255) NOT NULL UNIQUE,
+                applied_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                rollback_sql TEXT
+            )
+        """))
+        conn.execute(text("""
+            INSERT INTO migrations (migration_name, rollback_sql)
+            VALUES (:name, 'See multi_exam_rankings.py rollback_migration()')
+            ON CONFLICT (migration_name) DO NOTHING
+        """), {'name': MIGRATION_NAME})
+
+    def _remove_migration_record(self, conn) -> None:
+        """Remove migration record."""
+        conn.execute(
+            text("DELETE FROM migrations WHERE migration_name = :name"),
+            {'name': MIGRATION_NAME}
+        )
+
+
+def run_migration(database_url: str) -> bool:
+    """
+    Run the multi-exam rankings migration.
+
+    Args:
+        database_url: Database connection URL
+
+    Returns:
+        True if successful, False otherwise
+    """
+    migration = MultiExamRankingsMigration(database_url)
+
+    if migration.execute_migration():
+        if migration.verify_migration():
+            logger.info("Migration completed and verified successfully")
+            return True
+        else:
+            logger.error("Migration verification failed")
+            return False
+    else:
+        logger.error("Migration execution failed")
+        return False
+
+
+def rollback_migration(database_url: str) -> bool:
+    """
+    Rollback the multi-exam rankings migration.
+
+    Args:
+        database_url: Database connection URL
+
+    Returns:
+        True if successful, False otherwise
+    """
+    migration = MultiExamRankingsMigration(database_url)
+    return migration.rollback_migration()
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    # Get database URL from environment
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        logger.error("DATABASE_URL environment variable not set")
+        sys.exit(1)
+
+    # Check command line arguments
+    if len(sys.argv) > 1 and sys.argv[1] == 'rollback':
+        success = rollback_migration(database_url)
+        action = "rollback"
+    else:
+        success = run_migration(database_url)
+        action = "migration"
+
+    if success:
+        logger.info(f"Database {action} completed successfully")
+        sys.exit(0)
+    else:
+        logger.error(f"Database {action} failed")
+        sys.exit(1)
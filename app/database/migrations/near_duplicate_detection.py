@@ -0,0 +1,250 @@
+"""
+Database migration: Near-duplicate detection at ingestion
+
+Adds articles.canonical_article_id, which links a near-duplicate article
+to the article it repeats, and the article_signatures / article_lsh_bands
+tables holding each article's MinHash signature and LSH band keys.
+Existing articles stay canonical; only articles ingested after the
+migration are signed and checked.
+
+Migration: 003_near_duplicate_detection
+Created: 2026-10-18
+"""
+
+import logging
+from sqlalchemy import create_engine, inspect, text
+
+
+logger = logging.getLogger(__name__)
+
+
+MIGRATION_NAME = '003_near_duplicate_detection'
+
+
+class NearDuplicateDetectionMigration:
+    """
+    Migration handler for near-duplicate detection storage.
+
+    Handles forward migration, rollback, and verification procedures.
+    Requires PostgreSQL.
+    """
+
+    def __init__(self, database_url: str):
+        """
+        Initialize migration handler.
+
+        Args:
+            database_url: Database connection URL
+        """
+        self.database_url = database_url
+        self.engine = create_engine(database_url)
+
+    def execute_migration(self) -> bool:
+        """
+        Execute the migration.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        logger.info(f"Starting database migration: {MIGRATION_NAME}")
+
+        try:
+            with self.engine.begin() as conn:
+                # Link from a duplicate to its canonical article
+                conn.execute(text("""
+                    ALTER TABLE articles
+                    ADD COLUMN IF NOT EXISTS canonical_article_id INTEGER
+                    REFERENCES articles(id) ON DELETE SET NULL
+                """))
+                conn.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_article_canonical_article_id
+                    ON articles (canonical_article_id)
+                """))
+
+                # MinHash signatures and their LSH band keys
+                conn.execute(text("""
+                    CREATE TABLE IF NOT EXISTS article_signatures (
+                        article_id INTEGER PRIMARY KEY
+                            REFERENCES articles(id) ON DELETE CASCADE,
+                        signature BYTEA NOT NULL
+                    )
+                """))
+                conn.execute(text("""
+                    CREATE TABLE IF NOT EXISTS article_lsh_bands (
+                        article_id INTEGER NOT NULL
+                            REFERENCES articles(id) ON DELETE CASCADE,
+                        band INTEGER NOT NULL,
+                        band_hash BIGINT NOT NULL,
+                        PRIMARY KEY (article_id, band)
+                    )
+                """))
+                conn.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_article_lsh_bands_hash
+                    ON article_lsh_bands (band_hash)
+                """))
+
+                self._record_migration(conn)
+
+            logger.info("Migration completed successfully")
+            return True
+
+        except Exception as e:
+            logger.error(f"Migration failed: {str(e)}", exc_info=True)
+            return False
+
+    def rollback_migration(self) -> bool:
+        """
+        Rollback the migration changes.
+
+        Duplicate links are dropped, so linked articles become canonical
+        again and are processed by the next pipeline run.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        logger.info(f"Starting migration rollback: {MIGRATION_NAME}")
+
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(text("DROP TABLE IF EXISTS article_lsh_bands"))
+                conn.execute(text("DROP TABLE IF EXISTS article_signatures"))
+                conn.execute(text("DROP INDEX IF EXISTS idx_article_canonical_article_id"))
+                conn.execute(text(
+                    "ALTER TABLE articles DROP COLUMN IF EXISTS canonical_article_id"
+                ))
+
+                self._remove_migration_record(conn)
+
+            logger.info("Migration rollback completed successfully")
+            return True
+
+        except Exception as e:
+            logger.error(f"Migration rollback failed: {str(e)}", exc_info=True)
+            return False
+
+    def verify_migration(self) -> bool:
+        """
+        Verify migration was applied correctly.
+
+        Returns:
+            True if verification passes, False otherwise
+        """
+        logger.info(f"Verifying migration: {MIGRATION_NAME}")
+
+        try:
+            inspector = inspect(self.engine)
+
+            columns = {column['name'] for column in inspector.get_columns('articles')}
+            if 'canonical_article_id' not in columns:
+                logger.error("Column articles.canonical_article_id missing")
+                return False
+
+            for table in ('article_signatures', 'article_lsh_bands'):
+                if not inspector.has_table(table):
+                    logger.error(f"Table {table} missing")
+                    return False
+
+            indexes = {index['name'] for index in inspector.get_indexes('article_lsh_bands')}
+            if 'idx_article_lsh_bands_hash' not in indexes:
+                logger.error("Index idx_article_lsh_bands_hash missing")
+                return False
+
+            logger.info("Migration verification passed")
+            return True
+
+        except Exception as e:
+            logger.error(f"Migration verification failed: {str(e)}", exc_info=True)
+            return False
+
+    def _record_migration(self, conn) -> None:
+        """Record migration in migrations table."""
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS migrations (
+                id SERIAL PRIMARY KEY,
+                migration_name VARCHAR(255) NOT NULL UNIQUE,
+                applied_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                rollback_sql TEXT
+            )
+        """))
+        conn.execute(text("""
+            INSERT INTO migrations (migration_name, rollback_sql)
+            VALUES (:name, 'See near_duplicate_detection.py rollback_migration()')
+            ON CONFLICT (migration_name) DO NOTHING
+        """), {'name': MIGRATION_NAME})
+
+    def _remove_migration_record(self, conn) -> None:
+        """Remove migration record."""
+        conn.execute(
+            text("DELETE FROM migrations WHERE migration_name = :name"),
+            {'name': MIGRATION_NAME}
+        )
+
+
+def run_migration(database_url: str) -> bool:
+    """
+    Run the near-duplicate detection migration.
+
+    Args:
+        database_url: Database connection URL
+
+    Returns:
+        True if successful, False otherwise
+    """
+    migration = NearDuplicateDetectionMigration(database_url)
+
+    if migration.execute_migration():
+        if migration.verify_migration():
+            logger.info("Migration completed and verified successfully")
+            return True
+        else:
+            logger.error("Migration verification failed")
+            return False
+    else:
+        logger.error("Migration execution failed")
+        return False
+
+
+def rollback_migration(database_url: str) -> bool:
+    """
+    Rollback the near-duplicate detection migration.
+
+    Args:
+        database_url: Database connection URL
+
+    Returns:
+        True if successful, False otherwise
+    """
+    migration = NearDuplicateDetectionMigration(database_url)
+    return migration.rollback_migration()
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    # Get database URL from environment
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        logger.error("DATABASE_URL environment variable not set")
+        sys.exit(1)
+
+    # Check command line arguments
+    if len(sys.argv) > 1 and sys.argv[1] == 'rollback':
+        success = rollback_migration(database_url)
+        action = "rollback"
+    else:
+        success = run_migration(database_url)
+        action = "migration"
+
+    if success:
+        logger.info(f"Database {action} completed successfully")
+        sys.exit(0)
+    else:
+        logger.error(f"Database {action} failed")
+        sys.exit(1)
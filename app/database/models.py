@@ -8,8 +8,8 @@ implementing proper relationships, indexes, and the Repository Pattern.
 from datetime import datetime, timezone
 from typing import Optional
 from sqlalchemy import (
-    Column, String, DateTime, Text, Integer, Float, Boolean,
-    ForeignKey, Index, Enum as SQLEnum
+    Column, String, DateTime, Text, Integer, BigInteger, Float, Boolean,
+    LargeBinary, ForeignKey, Index, UniqueConstraint, Enum as SQLEnum
 )
 from sqlalchemy.orm import declarative_base, relationship
 from enum import Enum
@@ -118,10 +118,13 @@ class Article(Base, TimestampMixin):
         category_id: Foreign key to Category (assigned by CategorizationAgent)
         secondary_categories: Comma-separated secondary category names
         metadata: JSON field for article-specific data
+        canonical_article_id: Article this one near-duplicates (None for
+            canonical articles); duplicates skip categorization,
+            summarization and ranking
         source: Relationship to Source
         category: Relationship to Category
         summary: Relationship to Summary (one-to-one)
-        ranking: Relationship to Ranking (one-to-one)
+        rankings: Relationship to Rankings (one per exam type)
     """
     __tablename__ = "articles"
     
@@ -134,12 +137,15 @@ class Article(Base, TimestampMixin):
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=True)
     secondary_categories = Column(String(200), nullable=True)  # Comma-separated
     article_metadata = Column(Text, nullable=True)  # JSON string
+    canonical_article_id = Column(
+        Integer, ForeignKey("articles.id", ondelete="SET NULL"), nullable=True
+    )
     
     # Relationships
     source = relationship("Source", back_populates="articles")
     category = relationship("Category", back_populates="articles")
     summary = relationship("Summary", back_populates="article", uselist=False, cascade="all, delete-orphan")
-    ranking = relationship("Ranking", back_populates="article", uselist=False, cascade="all, delete-orphan")
+    rankings = relationship("Ranking", back_populates="article", cascade="all, delete-orphan")
     
     # Indexes for performance
     __table_args__ = (
@@ -147,6 +153,7 @@ class Article(Base, TimestampMixin):
         Index("idx_article_category_id", "category_id"),
         Index("idx_article_source_id", "source_id"),
         Index("idx_article_url", "url"),
+        Index("idx_article_canonical_article_id", "canonical_article_id"),
     )
     
     def __repr__(self) -> str:
@@ -193,10 +200,11 @@ class Ranking(Base, TimestampMixin):
     Model representing exam relevance rankings for articles.
     
     Stores scores calculated by ranking strategies (UPSC, SSC, Banking).
+    An article has at most one ranking per exam type.
     
     Attributes:
         id: Primary key
-        article_id: Foreign key to Article (one-to-one)
+        article_id: Foreign key to Article (unique together with exam_type)
         score: Relevance score (0.0 to 10.0)
         exam_type: Exam type used for ranking (UPSC, SSC, Banking)
         reasoning: Explanation of the score
@@ -206,22 +214,29 @@ class Ranking(Base, TimestampMixin):
     __tablename__ = "rankings"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False, unique=True)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False)
     score = Column(Float, nullable=False)
     exam_type = Column(String(50), nullable=False)
     reasoning = Column(Text, nullable=True)
     factors = Column(Text, nullable=True)  # JSON object
     
     # Relationships
-    article = relationship("Article", back_populates="ranking")
+    article = relationship("Article", back_populates="rankings")
     
-    # Index for performance (top-N queries)
+    # Indexes for performance (top-N queries). The composite index serves
+    # per-exam top-N straight from the index: filter on exam_type, already
+    # ordered by score, with article_id included for the article join.
     __table_args__ = (
+        UniqueConstraint("article_id", "exam_type", name="uq_rankings_article_exam"),
         Index("idx_ranking_score", "score"),
+        Index("idx_rankings_exam_type_score", "exam_type", score.desc(), "article_id"),
     )
     
     def __repr__(self) -> str:
-        return f"<Ranking(id={self.id}, article_id={self.article_id}, score={self.score})>"
+        return (
+            f"<Ranking(id={self.id}, article_id={self.article_id}, "
+            f"exam_type={self.exam_type}, score={self.score})>"
+        )
 
 
 class UserProfile(Base, TimestampMixin):
@@ -252,6 +267,177 @@ class UserProfile(Base, TimestampMixin):
         return f"<UserProfile(id={self.id}, email='{self.email}', exam_type='{self.exam_type}')>"
 
 
+class PipelineRunStatus(str, Enum):
+    """Enumeration of pipeline run and stage states."""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class PipelineRun(Base, TimestampMixin):
+    """
+    Model recording one execution of the pipeline, for checkpoint and resume.
+    
+    Stores the run parameters and the status of every stage, so a run
+    that crashed or hit the API quota can be resumed with the same
+    parameters, skipping the stages it already completed.
+    
+    Attributes:
+        id: Primary key (the run id passed to --resume)
+        status: Overall run status (PipelineRunStatus value)
+        hours: Lookback window used for scraping
+        top_n: Number of articles in the digest
+        exam_type: Exam type of the digest
+        streaming: Whether the run used the streaming mode
+        stage_status: JSON object mapping stage name to PipelineRunStatus value
+        error: Last error message of a failed run
+        completed_at: Timestamp when the run completed
+        articles: Relationship to the articles processed by each stage
+    """
+    __tablename__ = "pipeline_runs"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    status = Column(String(20), nullable=False, default=PipelineRunStatus.RUNNING.value)
+    hours = Column(Integer, nullable=False)
+    top_n = Column(Integer, nullable=False)
+    exam_type = Column(String(50), nullable=False)
+    streaming = Column(Boolean, default=False, nullable=False)
+    stage_status = Column(Text, nullable=True)  # JSON object
+    error = Column(Text, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    
+    # Relationships
+    articles = relationship("PipelineRunArticle", cascade="all, delete-orphan")
+    
+    def __repr__(self) -> str:
+        return f"<PipelineRun(id={self.id}, status='{self.status}')>"
+
+
+class PipelineRunArticle(Base):
+    """
+    Model recording an article processed by one stage of a pipeline run.
+    
+    The composite primary key makes recording idempotent, so a batch can
+    be recorded again after a retry without creating duplicates.
+    
+    Attributes:
+        run_id: Foreign key to PipelineRun
+        stage: Stage name (e.g. "Summarization")
+        article_id: Foreign key to Article
+    """
+    __tablename__ = "pipeline_run_articles"
+    
+    run_id = Column(Integer, ForeignKey("pipeline_runs.id", ondelete="CASCADE"), primary_key=True)
+    stage = Column(String(50), primary_key=True)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
+    
+    def __repr__(self) -> str:
+        return (
+            f"<PipelineRunArticle(run_id={self.run_id}, stage='{self.stage}', "
+            f"article_id={self.article_id})>"
+        )
+
+
+class WorkItemStatus(str, Enum):
+    """Enumeration of work queue item states."""
+    PENDING = "pending"
+    CLAIMED = "claimed"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class WorkItem(Base, TimestampMixin):
+    """
+    Model representing one article waiting for one pipeline stage.
+    
+    Work items form a database-backed queue shared by pipeline workers on
+    any number of nodes. A worker claims a batch of pending items with
+    SELECT ... FOR UPDATE SKIP LOCKED and holds them under a lease; items
+    whose lease expires (crashed worker) become claimable again.
+    
+    Attributes:
+        id: Primary key (queue order)
+        article_id: Foreign key to Article
+        stage: Stage the article is waiting for (categorize, summarize, rank)
+        status: Item status (WorkItemStatus value)
+        worker_id: Worker holding the current claim
+        lease_expires_at: When the current claim expires
+        attempts: Number of times the item has been claimed
+        last_error: Error of the last failed attempt
+    """
+    __tablename__ = "work_items"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False)
+    stage = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False, default=WorkItemStatus.PENDING.value)
+    worker_id = Column(String(255), nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    
+    # One item per article and stage; the composite index serves the claim
+    # query (next claimable items of a stage in queue order)
+    __table_args__ = (
+        UniqueConstraint("article_id", "stage", name="uq_work_items_article_stage"),
+        Index("idx_work_items_claim", "stage", "status", "id"),
+    )
+    
+    def __repr__(self) -> str:
+        return (
+            f"<WorkItem(id={self.id}, article_id={self.article_id}, "
+            f"stage='{self.stage}', status='{self.status}')>"
+        )
+
+
+class ArticleSignature(Base):
+    """
+    Model storing the MinHash signature of an article.
+    
+    Used for near-duplicate detection at ingestion: the signature of a new
+    article is compared with the signatures of the articles found through
+    its LSH bands.
+    
+    Attributes:
+        article_id: Foreign key to Article (primary key)
+        signature: MinHash signature (little-endian uint32 values)
+    """
+    __tablename__ = "article_signatures"
+    
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
+    signature = Column(LargeBinary, nullable=False)
+    
+    def __repr__(self) -> str:
+        return f"<ArticleSignature(article_id={self.article_id})>"
+
+
+class ArticleLshBand(Base):
+    """
+    Model storing one LSH band key of an article's MinHash signature.
+    
+    Articles sharing any band key are near-duplicate candidates; the index
+    on band_hash turns candidate search into exact lookups.
+    
+    Attributes:
+        article_id: Foreign key to Article
+        band: Band number within the signature
+        band_hash: Hash of the band's position and signature rows
+    """
+    __tablename__ = "article_lsh_bands"
+    
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
+    band = Column(Integer, primary_key=True)
+    band_hash = Column(BigInteger, nullable=False)
+    
+    __table_args__ = (
+        Index("idx_article_lsh_bands_hash", "band_hash"),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<ArticleLshBand(article_id={self.article_id}, band={self.band})>"
+
+
 # Legacy models (kept for backward compatibility during migration)
 class YouTubeVideo(Base):
     """Legacy model for YouTube videos (pre-transformation)."""
@@ -11,6 +11,10 @@ Available Repositories:
 - RankingRepository: Repository for Ranking entities with top-N queries
 - CategoryRepository: Repository for Category entities
 - SourceRepository: Repository for Source entities
+- PipelineRunRepository: Repository for pipeline run checkpoints
+- WorkItemRepository: Database-backed work queue for pipeline workers
+- ArticleSignatureRepository: MinHash signatures for near-duplicate detection
+- UnitOfWork: Shares one session and transaction across repository calls
 
 Example Usage:
     ```python
@@ -36,6 +40,10 @@ from app.database.repositories.summary_repository import SummaryRepository
 from app.database.repositories.ranking_repository import RankingRepository
 from app.database.repositories.category_repository import CategoryRepository
 from app.database.repositories.source_repository import SourceRepository
+from app.database.repositories.pipeline_run_repository import PipelineRunRepository
+from app.database.repositories.work_item_repository import WorkItemRepository
+from app.database.repositories.article_signature_repository import ArticleSignatureRepository
+from app.database.repositories.unit_of_work import UnitOfWork
 
 __all__ = [
     "BaseRepository",
@@ -45,4 +53,8 @@ __all__ = [
     "RankingRepository",
     "CategoryRepository",
     "SourceRepository",
+    "PipelineRunRepository",
+    "WorkItemRepository",
+    "ArticleSignatureRepository",
+    "UnitOfWork",
 ]
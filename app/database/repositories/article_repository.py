@@ -10,14 +10,36 @@ Demonstrates:
 - Bulk operations for performance
 """
 
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
-from app.database.models import Article
+from sqlalchemy.orm import joinedload
+from app.database.models import Article, Ranking, Summary
 from app.database.repositories.base_repository import BaseRepository, RepositoryException
 
 
+@dataclass
+class BulkUpsertResult:
+    """
+    Outcome of an idempotent bulk insert.
+    
+    Attributes:
+        inserted_ids: IDs of the newly inserted articles
+        skipped: Number of rows skipped because their URL already existed
+    """
+    inserted_ids: List[int] = field(default_factory=list)
+    skipped: int = 0
+    
+    @property
+    def inserted(self) -> int:
+        """Number of rows actually inserted."""
+        return len(self.inserted_ids)
+
+
 class ArticleRepository(BaseRepository[Article]):
     """
     Repository for Article entities with exam-specific queries.
@@ -30,6 +52,9 @@ class ArticleRepository(BaseRepository[Article]):
     - Single Responsibility Principle (only handles article data access)
     """
     
+    # Maximum number of URLs bound into a single IN (...) clause
+    URL_LOOKUP_CHUNK_SIZE = 500
+    
     def __init__(self):
         """Initialize the article repository."""
         super().__init__(Article)
@@ -175,6 +200,51 @@ class ArticleRepository(BaseRepository[Article]):
                 Article.url == url
             ).first()
     
+    def find_existing_urls(
+        self,
+        urls: Iterable[str],
+        chunk_size: Optional[int] = None
+    ) -> Set[str]:
+        """
+        Find which of the given URLs already exist (batched duplicate detection).
+        
+        Replaces one find_by_url() query per URL with a single session running
+        one WHERE url IN (...) query per chunk, using the unique index on url.
+        Only the url column is loaded.
+        
+        Args:
+            urls: Candidate article URLs (duplicates are ignored)
+            chunk_size: Maximum URLs per IN clause (defaults to URL_LOOKUP_CHUNK_SIZE)
+            
+        Returns:
+            Set of URLs that are already stored
+            
+        Raises:
+            RepositoryException: If query fails
+            
+        Example:
+            ```python
+            existing = repo.find_existing_urls(["https://a.com", "https://b.com"])
+            new_urls = [u for u in urls if u not in existing]
+            ```
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return set()
+        
+        chunk_size = chunk_size or self.URL_LOOKUP_CHUNK_SIZE
+        existing: Set[str] = set()
+        
+        with self._get_session() as session:
+            for start in range(0, len(unique_urls), chunk_size):
+                chunk = unique_urls[start:start + chunk_size]
+                rows = session.query(Article.url).filter(
+                    Article.url.in_(chunk)
+                ).all()
+                existing.update(row.url for row in rows)
+        
+        return existing
+    
     def bulk_create(self, articles: List[Article]) -> List[Article]:
         """
         Create multiple articles in a single transaction (bulk insert).
@@ -217,11 +287,105 @@ class ArticleRepository(BaseRepository[Article]):
             except IntegrityError as e:
                 raise RepositoryException(f"Bulk create failed (duplicate URL?): {str(e)}")
     
+    def bulk_upsert(self, articles: List[Article]) -> BulkUpsertResult:
+        """
+        Insert articles, silently skipping any whose URL already exists.
+        
+        Uses a single INSERT ... ON CONFLICT (url) DO NOTHING RETURNING id
+        statement, so concurrent pipeline runs cannot race on the unique
+        url constraint and no separate duplicate check is needed. Supported
+        natively on PostgreSQL and SQLite (used in tests); other dialects
+        fall back to a batched existence check followed by bulk_create().
+        
+        Args:
+            articles: Article instances to insert (need not be unique by URL)
+            
+        Returns:
+            BulkUpsertResult with inserted IDs and skipped row count
+            
+        Raises:
+            RepositoryException: If the insert fails
+            
+        Example:
+            ```python
+            result = repo.bulk_upsert(articles)
+            print(f"Inserted {result.inserted}, skipped {result.skipped}")
+            ```
+        """
+        if not articles:
+            return BulkUpsertResult()
+        
+        rows = self._to_insert_rows(articles)
+        
+        with self._get_session() as session:
+            dialect = session.get_bind().dialect.name
+            
+            if dialect == "postgresql":
+                stmt = postgresql_insert(Article)
+            elif dialect == "sqlite":
+                stmt = sqlite_insert(Article)
+            else:
+                stmt = None
+            
+            if stmt is not None:
+                stmt = stmt.on_conflict_do_nothing(
+                    index_elements=[Article.url]
+                ).returning(Article.id)
+                inserted_ids = [row.id for row in session.execute(stmt, rows)]
+                return BulkUpsertResult(
+                    inserted_ids=inserted_ids,
+                    skipped=len(rows) - len(inserted_ids)
+                )
+        
+        # Generic fallback: check-then-insert (not safe against concurrent runs)
+        existing_urls = self.find_existing_urls(article.url for article in articles)
+        new_articles = []
+        seen_urls = set(existing_urls)
+        for article in articles:
+            if article.url not in seen_urls:
+                seen_urls.add(article.url)
+                new_articles.append(article)
+        
+        created = self.bulk_create(new_articles)
+        return BulkUpsertResult(
+            inserted_ids=[article.id for article in created],
+            skipped=len(articles) - len(created)
+        )
+    
+    def _to_insert_rows(self, articles: List[Article]) -> List[Dict[str, Any]]:
+        """
+        Convert Article entities to column dictionaries for a core INSERT.
+        
+        Every row carries the same keys (required for executemany), and the
+        timestamp defaults that the ORM would normally apply are filled in.
+        
+        Args:
+            articles: Article instances
+            
+        Returns:
+            List of column-name to value dictionaries
+        """
+        now = datetime.now(timezone.utc)
+        columns = [
+            column.key for column in Article.__table__.columns
+            if column.key != "id"
+        ]
+        
+        rows = []
+        for article in articles:
+            row = {key: getattr(article, key) for key in columns}
+            row["created_at"] = row["created_at"] or now
+            row["updated_at"] = row["updated_at"] or now
+            rows.append(row)
+        
+        return rows
+    
     def find_uncategorized(self, limit: Optional[int] = None) -> List[Article]:
         """
         Find articles that haven't been categorized yet.
         
         Useful for pipeline processing to identify articles needing categorization.
+        Near-duplicates of other articles are skipped.
         
         Args:
             limit: Maximum number of results (optional)
@@ -242,7 +406,8 @@ class ArticleRepository(BaseRepository[Article]):
         """
         with self._get_session() as session:
             query = session.query(Article).filter(
-                Article.category_id.is_(None)
+                Article.category_id.is_(None),
+                Article.canonical_article_id.is_(None)
             ).order_by(Article.published_at.desc())
             
             if limit is not None:
@@ -250,6 +415,132 @@ class ArticleRepository(BaseRepository[Article]):
             
             return query.all()
     
+    def find_ids_matching(self, article_ids: List[int], filters: List[Any]) -> Set[int]:
+        """
+        Find which of the given articles match all filters.
+        
+        Only the IDs are selected, so this is a cheap way to check the
+        state of a batch (e.g. which articles already have a summary).
+        
+        Args:
+            article_ids: Article IDs to check
+            filters: SQLAlchemy filter expressions on Article
+            
+        Returns:
+            Set of the matching article IDs
+            
+        Raises:
+            RepositoryException: If query fails
+            
+        Example:
+            ```python
+            summarized = repo.find_ids_matching([1, 2, 3], [Article.summary.has()])
+            ```
+        """
+        if not article_ids:
+            return set()
+        
+        with self._get_session() as session:
+            rows = session.query(Article.id).filter(
+                Article.id.in_(article_ids), *filters
+            )
+            return {article_id for (article_id,) in rows}
+    
+    def link_duplicates(self, canonical_ids: Dict[int, int]) -> int:
+        """
+        Link near-duplicate articles to their canonical articles.
+        
+        Issues one UPDATE per canonical article.
+        
+        Args:
+            canonical_ids: Mapping of duplicate article ID to canonical article ID
+            
+        Returns:
+            Number of articles linked
+            
+        Raises:
+            RepositoryException: If the update fails
+            
+        Example:
+            ```python
+            repo.link_duplicates({102: 97, 103: 97})
+            ```
+        """
+        duplicates_by_canonical: Dict[int, List[int]] = {}
+        for duplicate_id, canonical_id in canonical_ids.items():
+            duplicates_by_canonical.setdefault(canonical_id, []).append(duplicate_id)
+        
+        with self._get_session() as session:
+            return sum(
+                session.query(Article).filter(Article.id.in_(duplicate_ids)).update(
+                    {
+                        Article.canonical_article_id: canonical_id,
+                        Article.updated_at: datetime.now(timezone.utc)
+                    },
+                    synchronize_session=False
+                )
+                for canonical_id, duplicate_ids in duplicates_by_canonical.items()
+            )
+    
+    def find_summarized_for_ranking(
+        self,
+        exam_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        article_ids: Optional[List[int]] = None
+    ) -> List[Article]:
+        """
+        Find summarized articles that still need a ranking.
+        
+        Runs a single query: articles are inner-joined to summaries and
+        anti-joined (LEFT JOIN ... IS NULL) to rankings for the exam type,
+        with the limit applied in SQL. Category and source are loaded in
+        the same query, so the returned (detached) articles can be ranked
+        without further lazy loads.
+        
+        Args:
+            exam_type: Only return articles without a ranking for this exam
+                       type (None = all summarized articles)
+            limit: Maximum number of results (optional)
+            article_ids: Only return these articles (optional)
+            
+        Returns:
+            List of summarized articles, ordered by published_at DESC
+            
+        Raises:
+            RepositoryException: If query fails
+            
+        Example:
+            ```python
+            to_rank = repo.find_summarized_for_ranking(exam_type="UPSC", limit=100)
+            ```
+        """
+        with self._get_session() as session:
+            query = session.query(Article).join(
+                Summary, Summary.article_id == Article.id
+            ).options(
+                joinedload(Article.category),
+                joinedload(Article.source)
+            )
+            
+            if article_ids is not None:
+                query = query.filter(Article.id.in_(article_ids))
+            
+            if exam_type is not None:
+                query = query.outerjoin(
+                    Ranking,
+                    and_(
+                        Ranking.article_id == Article.id,
+                        Ranking.exam_type == exam_type
+                    )
+                ).filter(Ranking.id.is_(None))
+            
+            query = query.order_by(Article.published_at.desc())
+            
+            if limit is not None:
+                query = query.limit(limit)
+            
+            return query.all()
+    
     def find_by_category_and_date_range(
         self,
         category_id: int,
@@ -0,0 +1,187 @@
+"""
+Article signature repository for near-duplicate detection.
+
+This module provides repository for ArticleSignature entities and their
+LSH band keys: storing the signatures of new articles and finding the
+stored articles that share a band with them.
+
+Demonstrates:
+- Repository Pattern specialization
+- Idempotent bulk inserts (INSERT ... ON CONFLICT DO NOTHING)
+- Index-backed candidate search (LSH band lookups)
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.database.models import Article, ArticleLshBand, ArticleSignature
+from app.database.repositories.base_repository import BaseRepository
+
+
+class SignatureMatch(NamedTuple):
+    """
+    A stored article sharing at least one LSH band with a probe.
+
+    Attributes:
+        article_id: ID of the stored article
+        canonical_article_id: Its canonical article (None if it is canonical)
+        signature: Its stored MinHash signature bytes
+        band_hashes: The probe's band keys it shares
+    """
+    article_id: int
+    canonical_article_id: Optional[int]
+    signature: bytes
+    band_hashes: List[int]
+
+
+class ArticleSignatureRepository(BaseRepository[ArticleSignature]):
+    """
+    Repository for ArticleSignature entities and their LSH band keys.
+
+    Inherits from BaseRepository[ArticleSignature] and adds bulk storage
+    of signatures with their bands and the band lookup used to find
+    near-duplicate candidates.
+
+    Demonstrates:
+    - Liskov Substitution Principle (can be used wherever BaseRepository is expected)
+    - Single Responsibility Principle (only handles signature data access)
+    """
+
+    # Maximum number of band keys bound into a single IN (...) clause
+    BAND_LOOKUP_CHUNK_SIZE = 500
+
+    def __init__(self):
+        """Initialize the article signature repository."""
+        super().__init__(ArticleSignature)
+
+    def save_signatures(self, signatures: Dict[int, Tuple[bytes, List[int]]]) -> int:
+        """
+        Store the signatures and band keys of articles.
+
+        Articles that already have a signature are left unchanged, so
+        storing a batch twice is harmless.
+
+        Args:
+            signatures: Mapping of article ID to (signature bytes, band keys)
+
+        Returns:
+            Number of newly stored signatures
+
+        Raises:
+            RepositoryException: If the insert fails
+
+        Example:
+            ```python
+            repo.save_signatures({42: (signature_bytes, [123, -456, 789])})
+            ```
+        """
+        if not signatures:
+            return 0
+
+        signature_rows = [
+            {"article_id": article_id, "signature": signature}
+            for article_id, (signature, _) in signatures.items()
+        ]
+
+        with self._get_session() as session:
+            dialect = session.get_bind().dialect.name
+
+            if dialect == "postgresql":
+                insert = postgresql_insert
+            elif dialect == "sqlite":
+                insert = sqlite_insert
+            else:
+                insert = None
+
+            if insert is not None:
+                stored = session.execute(
+                    insert(ArticleSignature).on_conflict_do_nothing().returning(
+                        ArticleSignature.article_id
+                    ),
+                    signature_rows
+                ).scalars().all()
+            else:
+                # Generic fallback: skip articles that already have a signature
+                existing = {
+                    article_id for (article_id,) in session.query(
+                        ArticleSignature.article_id
+                    ).filter(ArticleSignature.article_id.in_(list(signatures)))
+                }
+                stored = [article_id for article_id in signatures if article_id not in existing]
+                session.add_all(
+                    ArticleSignature(article_id=article_id, signature=signatures[article_id][0])
+                    for article_id in stored
+                )
+                session.flush()
+
+            band_rows = [
+                {"article_id": article_id, "band": band, "band_hash": band_hash}
+                for article_id in stored
+                for band, band_hash in enumerate(signatures[article_id][1])
+            ]
+            if band_rows:
+                session.execute(ArticleLshBand.__table__.insert(), band_rows)
+
+            return len(stored)
+
+    def find_band_matches(
+        self,
+        band_hashes: Iterable[int],
+        published_since: Optional[datetime] = None,
+        exclude_ids: Sequence[int] = ()
+    ) -> List[SignatureMatch]:
+        """
+        Find stored articles sharing any of the given band keys.
+
+        Uses the band_hash index, one IN query per chunk of keys.
+
+        Args:
+            band_hashes: Band keys of the probe signatures
+            published_since: Only match articles published at or after this
+                             time (optional)
+            exclude_ids: Article IDs never to return (e.g. the probes)
+
+        Returns:
+            One SignatureMatch per matching article, in article ID order
+
+        Raises:
+            RepositoryException: If query fails
+
+        Example:
+            ```python
+            for match in repo.find_band_matches(hasher.band_hashes(signature)):
+                print(match.article_id, len(match.band_hashes))
+            ```
+        """
+        unique_hashes = list(set(band_hashes))
+        matches: Dict[int, SignatureMatch] = {}
+
+        with self._get_session() as session:
+            for start in range(0, len(unique_hashes), self.BAND_LOOKUP_CHUNK_SIZE):
+                chunk = unique_hashes[start:start + self.BAND_LOOKUP_CHUNK_SIZE]
+                query = session.query(
+                    ArticleLshBand.band_hash,
+                    Article.id,
+                    Article.canonical_article_id,
+                    ArticleSignature.signature
+                ).join(
+                    Article, Article.id == ArticleLshBand.article_id
+                ).join(
+                    ArticleSignature, ArticleSignature.article_id == ArticleLshBand.article_id
+                ).filter(ArticleLshBand.band_hash.in_(chunk))
+
+                if published_since is not None:
+                    query = query.filter(Article.published_at >= published_since)
+                if exclude_ids:
+                    query = query.filter(Article.id.notin_(list(exclude_ids)))
+
+                for band_hash, article_id, canonical_id, signature in query:
+                    match = matches.get(article_id)
+                    if match is None:
+                        match = matches[article_id] = SignatureMatch(
+                            article_id, canonical_id, bytes(signature), []
+                        )
+                    match.band_hashes.append(band_hash)
+
+        return [matches[article_id] for article_id in sorted(matches)]
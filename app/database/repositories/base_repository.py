@@ -11,11 +11,16 @@ Demonstrates:
 - Single Responsibility Principle (data access only)
 """
 
-from typing import TypeVar, Generic, List, Optional, Type
+from typing import TypeVar, Generic, Any, Iterator, List, Optional, Sequence, Type, TYPE_CHECKING
 from contextlib import contextmanager
-from sqlalchemy.orm import Session, sessionmaker
+from contextvars import ContextVar
+from sqlalchemy.orm import Session, sessionmaker, load_only
 from sqlalchemy.exc import SQLAlchemyError
-from app.database.connection import get_engine
+from app.config import DB_ITER_BATCH_SIZE
+from app.database.connection import get_session_factory
+
+if TYPE_CHECKING:
+    from app.database.repositories.unit_of_work import UnitOfWork
 
 
 # Generic type variable for model classes
@@ -31,6 +36,23 @@ class RepositoryException(Exception):
     pass
 
 
+# Unit of work active in the current thread/task (set by UnitOfWork)
+_active_unit_of_work: ContextVar[Optional["UnitOfWork"]] = ContextVar(
+    "active_unit_of_work", default=None
+)
+
+
+def current_unit_of_work() -> Optional["UnitOfWork"]:
+    """
+    Get the unit of work active in the current context.
+    
+    Returns:
+        The active UnitOfWork, or None if repository calls run in their
+        own sessions
+    """
+    return _active_unit_of_work.get()
+
+
 class BaseRepository(Generic[T]):
     """
     Generic base repository for database operations.
@@ -56,15 +78,20 @@ class BaseRepository(Generic[T]):
         ```
     """
     
-    def __init__(self, model_class: Type[T]):
+    def __init__(self, model_class: Type[T], session_factory: Optional[sessionmaker] = None):
         """
         Initialize the repository with a model class.
         
+        All repositories share the process-wide engine and session factory
+        by default, so they draw from a single connection pool.
+        
         Args:
             model_class: The SQLAlchemy model class to manage
+            session_factory: Session factory to use (defaults to the shared
+                             factory from get_session_factory())
         """
         self._model_class = model_class
-        self._session_factory = sessionmaker(bind=get_engine())
+        self._session_factory = session_factory or get_session_factory()
     
     @contextmanager
     def _get_session(self):
@@ -77,6 +104,9 @@ class BaseRepository(Generic[T]):
         - Rolls back on error
         - Always closes session
         
+        Inside a UnitOfWork the unit's session is yielded instead; it is
+        committed, rolled back and closed by the unit of work.
+        
         Yields:
             Session: SQLAlchemy session
             
@@ -89,6 +119,14 @@ class BaseRepository(Generic[T]):
                 result = session.query(Article).all()
             ```
         """
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            try:
+                yield unit_of_work.session
+            except SQLAlchemyError as e:
+                raise RepositoryException(f"Database operation failed: {str(e)}")
+            return
+        
         session = self._session_factory()
         try:
             yield session
@@ -106,6 +144,9 @@ class BaseRepository(Generic[T]):
         """
         Create a new entity in the database.
         
+        Inside a UnitOfWork the insert is queued and flushed with the
+        unit's next batch, so the ID is populated after that flush.
+        
         Args:
             entity: The entity instance to create
             
@@ -122,6 +163,10 @@ class BaseRepository(Generic[T]):
             print(created.id)  # Auto-generated ID
             ```
         """
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            return unit_of_work.add(entity)
+        
         with self._get_session() as session:
             session.add(entity)
             session.flush()  # Populate ID before commit
@@ -157,6 +202,9 @@ class BaseRepository(Generic[T]):
         """
         Find all entities with optional pagination.
         
+        Loads every matching row at once; use iter_batches() for large
+        tables.
+        
         Args:
             limit: Maximum number of results (optional)
             offset: Number of results to skip (optional)
@@ -187,10 +235,95 @@ class BaseRepository(Generic[T]):
             
             return query.all()
     
+    def iter_batches(
+        self,
+        filters: Optional[Sequence[Any]] = None,
+        batch_size: int = DB_ITER_BATCH_SIZE,
+        columns: Optional[Sequence[str]] = None,
+        options: Optional[Sequence[Any]] = None,
+        limit: Optional[int] = None,
+        descending: bool = False
+    ) -> Iterator[List[T]]:
+        """
+        Stream entities in batches using keyset pagination on id.
+        
+        Each batch is one short query (WHERE id > last_id ORDER BY id
+        LIMIT batch_size) in its own session, so only one batch is held in
+        memory at a time and rows changed by the caller between batches
+        (e.g. articles just categorized) neither repeat nor shift later
+        pages. Unlike OFFSET paging, every page costs the same.
+        
+        Args:
+            filters: SQLAlchemy filter criteria, combined with AND (optional)
+            batch_size: Entities per batch (default: DB_ITER_BATCH_SIZE)
+            columns: Attribute names to load; all others are deferred and
+                     must not be accessed on the returned entities (id is
+                     always loaded). None loads every column.
+            options: Extra loader options, e.g. joinedload(...) (optional)
+            limit: Maximum total number of entities (optional)
+            descending: Walk ids from newest to oldest
+            
+        Yields:
+            Lists of up to batch_size entities, in id order
+            
+        Raises:
+            RepositoryException: If a query fails
+            
+        Example:
+            ```python
+            # Ids and titles only - full content is never loaded
+            for batch in repo.iter_batches(
+                filters=[Article.category_id.is_(None)],
+                columns=["title", "published_at"]
+            ):
+                for article in batch:
+                    print(article.id, article.title)
+            ```
+        """
+        model_id = self._model_class.id
+        last_id = None
+        remaining = limit
+        
+        while remaining is None or remaining > 0:
+            page_size = batch_size if remaining is None else min(batch_size, remaining)
+            
+            with self._get_session() as session:
+                query = session.query(self._model_class)
+                
+                if filters:
+                    query = query.filter(*filters)
+                if columns:
+                    query = query.options(
+                        load_only(*(getattr(self._model_class, name) for name in columns))
+                    )
+                if options:
+                    query = query.options(*options)
+                if last_id is not None:
+                    query = query.filter(model_id < last_id if descending else model_id > last_id)
+                
+                batch = query.order_by(
+                    model_id.desc() if descending else model_id.asc()
+                ).limit(page_size).all()
+            
+            if not batch:
+                return
+            
+            yield batch
+            
+            if len(batch) < page_size:
+                return
+            
+            last_id = batch[-1].id
+            if remaining is not None:
+                remaining -= len(batch)
+    
     def update(self, entity: T) -> T:
         """
         Update an existing entity in the database.
         
+        Inside a UnitOfWork the update is queued and flushed with the
+        unit's next batch.
+        
         Args:
             entity: The entity instance with updated values
             
@@ -207,6 +340,10 @@ class BaseRepository(Generic[T]):
             updated = repo.update(article)
             ```
         """
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            return unit_of_work.update(entity)
+        
         with self._get_session() as session:
             merged = session.merge(entity)
             session.flush()
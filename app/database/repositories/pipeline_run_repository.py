@@ -0,0 +1,258 @@
+"""
+Pipeline run repository for checkpointed, resumable pipeline executions.
+
+This module provides repository for PipelineRun entities: the run record
+with per-stage status, and the set of articles each stage has processed.
+
+Demonstrates:
+- Repository Pattern specialization
+- Idempotent bulk inserts (INSERT ... ON CONFLICT DO NOTHING)
+- Checkpointing through persisted progress records
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.database.models import PipelineRun, PipelineRunArticle, PipelineRunStatus
+from app.database.repositories.base_repository import BaseRepository, RepositoryException
+
+
+class PipelineRunRepository(BaseRepository[PipelineRun]):
+    """
+    Repository for PipelineRun entities and their processed articles.
+
+    Inherits from BaseRepository[PipelineRun] and adds methods for
+    tracking stage status and recording processed articles batch by batch,
+    so an interrupted run can be resumed from its last checkpoint.
+
+    Demonstrates:
+    - Liskov Substitution Principle (can be used wherever BaseRepository is expected)
+    - Single Responsibility Principle (only handles pipeline run bookkeeping)
+    """
+
+    def __init__(self):
+        """Initialize the pipeline run repository."""
+        super().__init__(PipelineRun)
+
+    def create_run(
+        self,
+        hours: int,
+        top_n: int,
+        exam_type: str,
+        streaming: bool,
+        stages: List[str]
+    ) -> PipelineRun:
+        """
+        Create a run record with all stages pending.
+
+        Args:
+            hours: Lookback window used for scraping
+            top_n: Number of articles in the digest
+            exam_type: Exam type of the digest
+            streaming: Whether the run uses the streaming mode
+            stages: Stage names in execution order
+
+        Returns:
+            The created run with populated ID
+
+        Raises:
+            RepositoryException: If creation fails
+
+        Example:
+            ```python
+            run = repo.create_run(24, 10, "UPSC", False, ["Scraping", "Ranking"])
+            print(run.id)
+            ```
+        """
+        return self.create(PipelineRun(
+            status=PipelineRunStatus.RUNNING.value,
+            hours=hours,
+            top_n=top_n,
+            exam_type=exam_type,
+            streaming=streaming,
+            stage_status=json.dumps({
+                stage: PipelineRunStatus.PENDING.value for stage in stages
+            })
+        ))
+
+    def get_stage_status(self, run: PipelineRun) -> Dict[str, str]:
+        """
+        Decode the stage status of a run.
+
+        Args:
+            run: The pipeline run
+
+        Returns:
+            Dictionary mapping stage name to PipelineRunStatus value
+        """
+        if not run.stage_status:
+            return {}
+        return json.loads(run.stage_status)
+
+    def set_stage_status(self, run_id: int, stage: str, status: PipelineRunStatus) -> None:
+        """
+        Update the status of one stage of a run.
+
+        Args:
+            run_id: The run ID
+            stage: Stage name
+            status: New stage status
+
+        Raises:
+            RepositoryException: If the run does not exist or the update fails
+        """
+        with self._get_session() as session:
+            run = session.get(PipelineRun, run_id)
+            if run is None:
+                raise RepositoryException(f"Pipeline run {run_id} not found")
+
+            stage_status = json.loads(run.stage_status) if run.stage_status else {}
+            stage_status[stage] = status.value
+            run.stage_status = json.dumps(stage_status)
+
+    def mark_running(self, run_id: int) -> None:
+        """
+        Mark a run as running again (used when resuming it).
+
+        Args:
+            run_id: The run ID
+
+        Raises:
+            RepositoryException: If the run does not exist or the update fails
+        """
+        self._set_run_status(run_id, PipelineRunStatus.RUNNING, error=None)
+
+    def finish_run(self, run_id: int, success: bool, error: Optional[str] = None) -> None:
+        """
+        Mark a run as completed or failed.
+
+        Args:
+            run_id: The run ID
+            success: Whether the run completed
+            error: Error message of a failed run (optional)
+
+        Raises:
+            RepositoryException: If the run does not exist or the update fails
+        """
+        status = PipelineRunStatus.COMPLETED if success else PipelineRunStatus.FAILED
+        self._set_run_status(run_id, status, error=error)
+
+    def _set_run_status(
+        self,
+        run_id: int,
+        status: PipelineRunStatus,
+        error: Optional[str]
+    ) -> None:
+        """Set the overall status (and completion time) of a run."""
+        with self._get_session() as session:
+            run = session.get(PipelineRun, run_id)
+            if run is None:
+                raise RepositoryException(f"Pipeline run {run_id} not found")
+
+            run.status = status.value
+            run.error = error
+            if status == PipelineRunStatus.COMPLETED:
+                run.completed_at = datetime.now(timezone.utc)
+
+    def record_articles(self, run_id: int, stage: str, article_ids: Iterable[int]) -> int:
+        """
+        Record articles as processed by a stage of a run.
+
+        Articles already recorded for the stage are ignored, so a batch
+        can safely be recorded twice (e.g. after a retry).
+
+        Args:
+            run_id: The run ID
+            stage: Stage name
+            article_ids: IDs of the articles the stage processed
+
+        Returns:
+            Number of newly recorded articles
+
+        Raises:
+            RepositoryException: If the insert fails
+
+        Example:
+            ```python
+            repo.record_articles(run.id, "Summarization", [12, 13, 14])
+            ```
+        """
+        rows = [
+            {"run_id": run_id, "stage": stage, "article_id": article_id}
+            for article_id in set(article_ids)
+        ]
+        if not rows:
+            return 0
+
+        with self._get_session() as session:
+            dialect = session.get_bind().dialect.name
+
+            if dialect == "postgresql":
+                stmt = postgresql_insert(PipelineRunArticle)
+            elif dialect == "sqlite":
+                stmt = sqlite_insert(PipelineRunArticle)
+            else:
+                stmt = None
+
+            if stmt is not None:
+                stmt = stmt.on_conflict_do_nothing()
+                return len(session.execute(
+                    stmt.returning(PipelineRunArticle.article_id), rows
+                ).all())
+
+            # Generic fallback: skip already recorded articles
+            recorded = self._processed_ids(session, run_id, stage)
+            new_rows = [row for row in rows if row["article_id"] not in recorded]
+            session.add_all(PipelineRunArticle(**row) for row in new_rows)
+            session.flush()
+            return len(new_rows)
+
+    def find_processed_article_ids(self, run_id: int, stage: str) -> Set[int]:
+        """
+        Get the IDs of the articles a stage of a run has processed.
+
+        Args:
+            run_id: The run ID
+            stage: Stage name
+
+        Returns:
+            Set of article IDs
+
+        Raises:
+            RepositoryException: If query fails
+        """
+        with self._get_session() as session:
+            return self._processed_ids(session, run_id, stage)
+
+    def count_processed_by_stage(self, run_id: int) -> Dict[str, int]:
+        """
+        Count the processed articles of every stage of a run.
+
+        Args:
+            run_id: The run ID
+
+        Returns:
+            Dictionary mapping stage name to number of processed articles
+
+        Raises:
+            RepositoryException: If query fails
+        """
+        with self._get_session() as session:
+            rows = session.query(
+                PipelineRunArticle.stage,
+                func.count(PipelineRunArticle.article_id)
+            ).filter(
+                PipelineRunArticle.run_id == run_id
+            ).group_by(PipelineRunArticle.stage).all()
+            return {stage: count for stage, count in rows}
+
+    def _processed_ids(self, session, run_id: int, stage: str) -> Set[int]:
+        """Query the processed article IDs of a stage within a session."""
+        rows = session.query(PipelineRunArticle.article_id).filter(
+            PipelineRunArticle.run_id == run_id,
+            PipelineRunArticle.stage == stage
+        )
+        return {article_id for (article_id,) in rows}
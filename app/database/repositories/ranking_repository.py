@@ -10,8 +10,11 @@ Demonstrates:
 - Performance-critical top-N queries
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
 from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from app.database.models import Ranking, Article
 from app.database.repositories.base_repository import BaseRepository
 
@@ -33,15 +36,21 @@ class RankingRepository(BaseRepository[Ranking]):
         """Initialize the ranking repository."""
         super().__init__(Ranking)
     
-    def find_by_article_id(self, article_id: int) -> Optional[Ranking]:
+    def find_by_article_id(
+        self,
+        article_id: int,
+        exam_type: Optional[str] = None
+    ) -> Optional[Ranking]:
         """
         Find a ranking by its associated article ID.
         
-        Since Ranking has a one-to-one relationship with Article,
-        this returns at most one ranking.
+        An article has at most one ranking per exam type, so with
+        exam_type this returns that ranking; without it, any one of the
+        article's rankings.
         
         Args:
             article_id: The article ID to find ranking for
+            exam_type: Exam type of the ranking (optional)
             
         Returns:
             The ranking if found, None otherwise
@@ -51,16 +60,166 @@ class RankingRepository(BaseRepository[Ranking]):
             
         Example:
             ```python
-            ranking = repo.find_by_article_id(42)
+            ranking = repo.find_by_article_id(42, exam_type="UPSC")
             if ranking:
                 print(f"Score: {ranking.score}")
                 print(f"Reasoning: {ranking.reasoning}")
             ```
         """
         with self._get_session() as session:
-            return session.query(Ranking).filter(
-                Ranking.article_id == article_id
-            ).first()
+            query = session.query(Ranking).filter(Ranking.article_id == article_id)
+            
+            if exam_type is not None:
+                query = query.filter(Ranking.exam_type == exam_type)
+            
+            return query.first()
+    
+    def find_by_article_ids(
+        self,
+        article_ids: List[int],
+        exam_type: str
+    ) -> Dict[int, Ranking]:
+        """
+        Find the rankings of many articles for one exam type.
+        
+        Args:
+            article_ids: Article IDs to look up
+            exam_type: Exam type of the rankings
+            
+        Returns:
+            Dictionary mapping article ID to its ranking (articles without
+            a ranking for exam_type are absent)
+            
+        Raises:
+            RepositoryException: If query fails
+            
+        Example:
+            ```python
+            existing = repo.find_by_article_ids([1, 2, 3], exam_type="SSC")
+            ```
+        """
+        if not article_ids:
+            return {}
+        
+        with self._get_session() as session:
+            rankings = session.query(Ranking).filter(
+                Ranking.article_id.in_(article_ids),
+                Ranking.exam_type == exam_type
+            ).all()
+            return {ranking.article_id: ranking for ranking in rankings}
+    
+    def bulk_upsert(
+        self,
+        rankings: List[Ranking],
+        overwrite: bool = True
+    ) -> Dict[str, int]:
+        """
+        Write many rankings, for any mix of exam types, in one statement.
+        
+        Uses a single INSERT ... ON CONFLICT (article_id, exam_type)
+        statement: with overwrite, existing rankings get the new score,
+        reasoning and factors (DO UPDATE); without it they are left as they
+        are (DO NOTHING). Supported natively on PostgreSQL and SQLite (used
+        in tests); other dialects fall back to a lookup followed by ORM
+        inserts and updates in one session.
+        
+        Args:
+            rankings: New (transient) Ranking instances, at most one per
+                      (article_id, exam_type)
+            overwrite: Replace existing rankings (default: True)
+            
+        Returns:
+            Dictionary mapping exam type to the number of rankings written
+            
+        Raises:
+            RepositoryException: If the write fails
+            
+        Example:
+            ```python
+            written = repo.bulk_upsert(rankings, overwrite=False)
+            print(written)  # {'UPSC': 180, 'SSC': 200, 'Banking': 200}
+            ```
+        """
+        if not rankings:
+            return {}
+        
+        rows = self._to_upsert_rows(rankings)
+        written: Dict[str, int] = {}
+        
+        with self._get_session() as session:
+            dialect = session.get_bind().dialect.name
+            
+            if dialect == "postgresql":
+                stmt = postgresql_insert(Ranking)
+            elif dialect == "sqlite":
+                stmt = sqlite_insert(Ranking)
+            else:
+                stmt = None
+            
+            if stmt is not None:
+                conflict_columns = [Ranking.article_id, Ranking.exam_type]
+                if overwrite:
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=conflict_columns,
+                        set_={
+                            "score": stmt.excluded.score,
+                            "reasoning": stmt.excluded.reasoning,
+                            "factors": stmt.excluded.factors,
+                            "updated_at": stmt.excluded.updated_at
+                        }
+                    )
+                else:
+                    stmt = stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+                
+                for row in session.execute(stmt.returning(Ranking.exam_type), rows):
+                    written[row.exam_type] = written.get(row.exam_type, 0) + 1
+                return written
+            
+            # Generic fallback: look up existing rankings, then insert/update
+            existing = {
+                (ranking.article_id, ranking.exam_type): ranking
+                for ranking in session.query(Ranking).filter(
+                    Ranking.article_id.in_({row["article_id"] for row in rows})
+                )
+            }
+            for row in rows:
+                current = existing.get((row["article_id"], row["exam_type"]))
+                if current is None:
+                    session.add(Ranking(**row))
+                elif overwrite:
+                    current.score = row["score"]
+                    current.reasoning = row["reasoning"]
+                    current.factors = row["factors"]
+                else:
+                    continue
+                written[row["exam_type"]] = written.get(row["exam_type"], 0) + 1
+            
+            session.flush()
+            return written
+    
+    def _to_upsert_rows(self, rankings: List[Ranking]) -> List[Dict[str, Any]]:
+        """
+        Convert Ranking entities to column dictionaries for a core INSERT.
+        
+        Args:
+            rankings: Ranking instances
+            
+        Returns:
+            List of column-name to value dictionaries with timestamps filled in
+        """
+        now = datetime.now(timezone.utc)
+        return [
+            {
+                "article_id": ranking.article_id,
+                "exam_type": ranking.exam_type,
+                "score": ranking.score,
+                "reasoning": ranking.reasoning,
+                "factors": ranking.factors,
+                "created_at": now,
+                "updated_at": now
+            }
+            for ranking in rankings
+        ]
     
     def find_top_n(
         self,
@@ -71,8 +230,10 @@ class RankingRepository(BaseRepository[Ranking]):
         """
         Find top N ranked articles by score.
         
-        Uses index on score column for performance.
-        Optionally filters by exam type and minimum score.
+        With exam_type, the (exam_type, score DESC) index returns rows
+        already in score order, so the query reads only the first N index
+        entries instead of sorting every ranking; without it, the index on
+        score is used. Optionally filters by minimum score.
         
         Args:
             n: Number of top rankings to return
@@ -162,7 +323,7 @@ class RankingRepository(BaseRepository[Ranking]):
             
             return query.all()
     
-    def exists_for_article(self, article_id: int) -> bool:
+    def exists_for_article(self, article_id: int, exam_type: Optional[str] = None) -> bool:
         """
         Check if a ranking exists for an article.
         
@@ -170,6 +331,7 @@ class RankingRepository(BaseRepository[Ranking]):
         
         Args:
             article_id: The article ID to check
+            exam_type: Only count a ranking for this exam type (optional)
             
         Returns:
             True if ranking exists, False otherwise
@@ -179,15 +341,18 @@ class RankingRepository(BaseRepository[Ranking]):
             
         Example:
             ```python
-            if not repo.exists_for_article(42):
-                # Generate ranking for this article
+            if not repo.exists_for_article(42, exam_type="UPSC"):
+                # Generate UPSC ranking for this article
                 pass
             ```
         """
         with self._get_session() as session:
-            return session.query(Ranking).filter(
-                Ranking.article_id == article_id
-            ).first() is not None
+            query = session.query(Ranking.id).filter(Ranking.article_id == article_id)
+            
+            if exam_type is not None:
+                query = query.filter(Ranking.exam_type == exam_type)
+            
+            return query.first() is not None
     
     def find_top_n_with_articles(
         self,
@@ -0,0 +1,286 @@
+"""
+Unit of work spanning many repository calls.
+
+By default every repository call opens, commits and closes its own
+session. Inside a UnitOfWork all repositories share one session and one
+transaction: reads reuse the identity map, writes are queued and flushed
+in batches, and everything is committed once when the block exits.
+
+Demonstrates:
+- Unit of Work Pattern (Design Pattern)
+- Context Manager Protocol (transaction scope)
+- Batching for fewer database round-trips
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, TypeVar
+import logging
+from sqlalchemy.exc import InvalidRequestError, SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+from app.config import DB_FLUSH_BATCH_SIZE
+from app.database.connection import get_session_factory
+from app.database.repositories.base_repository import (
+    RepositoryException,
+    _active_unit_of_work,
+    current_unit_of_work
+)
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class UnitOfWork:
+    """
+    Transaction shared by all repository calls made inside the block.
+
+    While active, BaseRepository._get_session() yields this unit's session
+    instead of opening a new one, and create()/update() queue their writes
+    here. Pending writes are flushed every batch_size writes, and the
+    transaction commits on a clean exit or rolls back on an exception.
+    Nested units join the outermost one.
+
+    Autoflush is off by default so that reads between writes do not flush
+    each pending write on their own; queries only see queued writes after
+    the next batch flush (call flush() to force one).
+
+    The session is not thread-safe: use a unit of work from one thread
+    (or one task) at a time.
+
+    Attributes:
+        _session_factory (sessionmaker): Factory for the unit's session
+        _batch_size (int): Pending writes per flush
+        _autoflush (bool): Whether queries flush pending writes first
+        _session (Optional[Session]): Session while the unit is active
+        _pending (int): Writes queued since the last flush
+        _stats (Dict[str, int]): Write, flush and commit counters
+
+    Example:
+        ```python
+        with UnitOfWork(batch_size=50) as uow:
+            for article in articles:
+                article.category_id = category_ids[article.id]
+                article_repo.update(article)  # queued, flushed every 50
+        print(uow.stats)  # {'writes': 200, 'flushes': 4, 'commits': 1}
+        ```
+    """
+
+    def __init__(
+        self,
+        batch_size: int = DB_FLUSH_BATCH_SIZE,
+        autoflush: bool = False,
+        session_factory: Optional[sessionmaker] = None
+    ):
+        """
+        Initialize the unit of work.
+
+        Args:
+            batch_size: Pending writes per flush (default: DB_FLUSH_BATCH_SIZE)
+            autoflush: Flush pending writes before every query (default: False)
+            session_factory: Session factory (defaults to the shared factory)
+        """
+        self._session_factory = session_factory or get_session_factory()
+        self._batch_size = max(1, batch_size)
+        self._autoflush = autoflush
+        self._session: Optional[Session] = None
+        self._outer: Optional["UnitOfWork"] = None
+        self._token = None
+        self._pending = 0
+        self._stats = {'writes': 0, 'flushes': 0, 'commits': 0}
+
+    @property
+    def session(self) -> Session:
+        """
+        Get the session shared by the unit's repository calls.
+
+        Returns:
+            The active session
+
+        Raises:
+            RepositoryException: If the unit of work is not active
+        """
+        if self._outer is not None:
+            return self._outer.session
+        if self._session is None:
+            raise RepositoryException("Unit of work is not active")
+        return self._session
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Get write, flush and commit counters.
+
+        Returns:
+            Dictionary with 'writes', 'flushes' and 'commits'
+        """
+        if self._outer is not None:
+            return self._outer.stats
+        return dict(self._stats)
+
+    def __enter__(self) -> "UnitOfWork":
+        outer = current_unit_of_work()
+        if outer is not None:
+            self._outer = outer
+            return self
+
+        self._session = self._session_factory(autoflush=self._autoflush)
+        self._token = _active_unit_of_work.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if self._outer is not None:
+            self._outer = None
+            return False
+
+        _active_unit_of_work.reset(self._token)
+        session = self._session
+
+        try:
+            if exc_type is None:
+                session.commit()
+                self._stats['commits'] += 1
+                self._pending = 0
+            else:
+                session.rollback()
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise RepositoryException(f"Unit of work commit failed: {str(e)}")
+        finally:
+            session.close()
+            self._session = None
+
+        return False
+
+    def add(self, entity: T) -> T:
+        """
+        Queue a new entity for insertion.
+
+        Args:
+            entity: The entity to insert
+
+        Returns:
+            The same entity (its ID is populated after the next flush)
+        """
+        self.session.add(entity)
+        self._record_write()
+        return entity
+
+    def update(self, entity: T) -> T:
+        """
+        Queue changes to an entity for the next flush.
+
+        Entities loaded in this unit (or detached ones that are not yet in
+        its identity map) are attached as-is, so no SELECT is needed;
+        otherwise the changes are merged into the loaded copy.
+
+        Args:
+            entity: The modified entity
+
+        Returns:
+            The entity tracked by the unit's session
+        """
+        try:
+            self.session.add(entity)
+        except InvalidRequestError:
+            entity = self.session.merge(entity)
+        self._record_write()
+        return entity
+
+    def flush(self) -> None:
+        """
+        Flush all pending writes to the database (without committing).
+
+        Raises:
+            RepositoryException: If the flush fails
+        """
+        if self._outer is not None:
+            self._outer.flush()
+            return
+
+        try:
+            self.session.flush()
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Unit of work flush failed: {str(e)}")
+
+        self._stats['flushes'] += 1
+        self._pending = 0
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """
+        Isolate the writes made inside the block in a savepoint.
+
+        The block's writes are flushed when it exits. If the block or that
+        flush fails, only the savepoint is rolled back: writes made before
+        it stay pending, the session stays usable, and the exception
+        propagates. Use it to keep one failed item of a batch from
+        poisoning the rest of the transaction.
+
+        Raises:
+            RepositoryException: If the flush fails
+
+        Example:
+            ```python
+            with UnitOfWork() as uow:
+                for ranking in rankings:
+                    try:
+                        with uow.savepoint():
+                            ranking_repo.create(ranking)
+                    except RepositoryException:
+                        continue  # earlier rankings are kept
+            ```
+        """
+        if self._outer is not None:
+            with self._outer.savepoint():
+                yield
+            return
+
+        nested = self.session.begin_nested()
+        try:
+            yield
+            self.session.flush()
+        except SQLAlchemyError as e:
+            nested.rollback()
+            raise RepositoryException(f"Unit of work flush failed: {str(e)}")
+        except BaseException:
+            nested.rollback()
+            raise
+
+        nested.commit()
+        self._stats['flushes'] += 1
+        self._pending = 0
+
+    def commit(self) -> None:
+        """
+        Commit the work done so far and keep the unit open.
+
+        Useful to bound transaction size in long-running stages.
+
+        Raises:
+            RepositoryException: If the commit fails
+        """
+        if self._outer is not None:
+            self._outer.commit()
+            return
+
+        try:
+            self.session.commit()
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            raise RepositoryException(f"Unit of work commit failed: {str(e)}")
+
+        self._stats['commits'] += 1
+        self._pending = 0
+
+    def _record_write(self) -> None:
+        """Count a queued write and flush once a batch is full."""
+        if self._outer is not None:
+            self._outer._record_write()
+            return
+
+        self._stats['writes'] += 1
+        self._pending += 1
+
+        if self._pending >= self._batch_size:
+            self.flush()
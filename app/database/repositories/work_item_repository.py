@@ -0,0 +1,316 @@
+"""
+Work item repository: a database-backed queue for pipeline workers.
+
+This module provides repository for WorkItem entities. Workers on any
+number of nodes claim batches of items with SELECT ... FOR UPDATE SKIP
+LOCKED, so concurrent workers never receive the same article, and each
+claim carries a lease after which a crashed worker's items are handed out
+again.
+
+Demonstrates:
+- Repository Pattern specialization
+- Competing consumers over a shared table (SKIP LOCKED)
+- Lease-based failure recovery
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.database.models import WorkItem, WorkItemStatus
+from app.database.repositories.base_repository import BaseRepository
+
+
+class WorkItemRepository(BaseRepository[WorkItem]):
+    """
+    Repository for WorkItem entities with claim/complete/fail operations.
+
+    Inherits from BaseRepository[WorkItem] and adds the queue operations.
+    Claims use row locks with SKIP LOCKED on PostgreSQL; on SQLite (tests)
+    the claiming UPDATE is atomic because SQLite serializes writers.
+
+    Demonstrates:
+    - Liskov Substitution Principle (can be used wherever BaseRepository is expected)
+    - Single Responsibility Principle (only handles work queue data access)
+    """
+
+    def __init__(self):
+        """Initialize the work item repository."""
+        super().__init__(WorkItem)
+
+    def enqueue(self, stage: str, article_ids: Iterable[int]) -> int:
+        """
+        Add articles to the queue of a stage.
+
+        Articles that already have an item for the stage (in any status)
+        are ignored, so enqueueing is idempotent.
+
+        Args:
+            stage: Stage name (e.g. "summarize")
+            article_ids: IDs of the articles to enqueue
+
+        Returns:
+            Number of newly enqueued items
+
+        Raises:
+            RepositoryException: If the insert fails
+
+        Example:
+            ```python
+            repo.enqueue("categorize", [101, 102, 103])
+            ```
+        """
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "article_id": article_id,
+                "stage": stage,
+                "status": WorkItemStatus.PENDING.value,
+                "attempts": 0,
+                "created_at": now,
+                "updated_at": now
+            }
+            for article_id in sorted(set(article_ids))
+        ]
+        if not rows:
+            return 0
+
+        with self._get_session() as session:
+            dialect = session.get_bind().dialect.name
+
+            if dialect == "postgresql":
+                stmt = postgresql_insert(WorkItem)
+            elif dialect == "sqlite":
+                stmt = sqlite_insert(WorkItem)
+            else:
+                stmt = None
+
+            if stmt is not None:
+                stmt = stmt.on_conflict_do_nothing(
+                    index_elements=[WorkItem.article_id, WorkItem.stage]
+                )
+                return len(session.execute(stmt.returning(WorkItem.id), rows).all())
+
+            # Generic fallback: skip articles already queued for the stage
+            queued = {
+                article_id for (article_id,) in session.query(WorkItem.article_id).filter(
+                    WorkItem.stage == stage,
+                    WorkItem.article_id.in_([row["article_id"] for row in rows])
+                )
+            }
+            new_rows = [row for row in rows if row["article_id"] not in queued]
+            session.add_all(WorkItem(**row) for row in new_rows)
+            session.flush()
+            return len(new_rows)
+
+    def claim(
+        self,
+        stage: str,
+        worker_id: str,
+        batch_size: int,
+        lease_seconds: int
+    ) -> List[int]:
+        """
+        Claim the next batch of items of a stage for a worker.
+
+        Claims pending items, and claimed items whose lease has expired,
+        in queue order with a single UPDATE ... WHERE id IN (SELECT ...
+        FOR UPDATE SKIP LOCKED): rows another worker is claiming at the
+        same moment are skipped instead of waited for, so concurrent
+        workers get disjoint batches without blocking.
+
+        Args:
+            stage: Stage name
+            worker_id: Unique ID of the claiming worker
+            batch_size: Maximum number of items to claim
+            lease_seconds: How long the claim is valid
+
+        Returns:
+            Article IDs of the claimed items (empty if the queue is drained)
+
+        Raises:
+            RepositoryException: If the claim fails
+
+        Example:
+            ```python
+            article_ids = repo.claim("summarize", "node-1:4242", 20, 600)
+            ```
+        """
+        now = datetime.now(timezone.utc)
+
+        claimable = select(WorkItem.id).where(
+            WorkItem.stage == stage,
+            or_(
+                WorkItem.status == WorkItemStatus.PENDING.value,
+                and_(
+                    WorkItem.status == WorkItemStatus.CLAIMED.value,
+                    WorkItem.lease_expires_at < now
+                )
+            )
+        ).order_by(WorkItem.id).limit(batch_size).with_for_update(skip_locked=True)
+
+        # One atomic UPDATE ... WHERE id IN (SELECT ... SKIP LOCKED)
+        stmt = update(WorkItem).where(
+            WorkItem.id.in_(claimable.scalar_subquery())
+        ).values(
+            status=WorkItemStatus.CLAIMED.value,
+            worker_id=worker_id,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            attempts=WorkItem.attempts + 1,
+            updated_at=now
+        ).returning(WorkItem.article_id).execution_options(synchronize_session=False)
+
+        with self._get_session() as session:
+            return sorted(session.execute(stmt).scalars().all())
+
+    def complete(self, stage: str, article_ids: Iterable[int], worker_id: str) -> int:
+        """
+        Mark claimed items as done.
+
+        Only items still claimed by the worker are updated, so a worker
+        whose lease expired cannot overwrite the claim of its successor.
+
+        Args:
+            stage: Stage name
+            article_ids: Article IDs of the finished items
+            worker_id: ID of the worker holding the claim
+
+        Returns:
+            Number of items marked done
+
+        Raises:
+            RepositoryException: If the update fails
+        """
+        article_ids = list(article_ids)
+        if not article_ids:
+            return 0
+
+        with self._get_session() as session:
+            return self._claimed_by(session, stage, article_ids, worker_id).update({
+                WorkItem.status: WorkItemStatus.DONE.value,
+                WorkItem.worker_id: None,
+                WorkItem.lease_expires_at: None,
+                WorkItem.last_error: None,
+                WorkItem.updated_at: datetime.now(timezone.utc)
+            }, synchronize_session=False)
+
+    def fail(
+        self,
+        stage: str,
+        article_ids: Iterable[int],
+        worker_id: str,
+        error: Optional[str],
+        max_attempts: int
+    ) -> int:
+        """
+        Release claimed items after a failed attempt.
+
+        Items with attempts left go back to pending; the others are marked
+        failed and stay out of the queue until re-enqueued by hand.
+
+        Args:
+            stage: Stage name
+            article_ids: Article IDs of the failed items
+            worker_id: ID of the worker holding the claim
+            error: Error message to record
+            max_attempts: Attempts after which an item is marked failed
+
+        Returns:
+            Number of items released
+
+        Raises:
+            RepositoryException: If the update fails
+        """
+        article_ids = list(article_ids)
+        if not article_ids:
+            return 0
+
+        with self._get_session() as session:
+            return self._release(
+                self._claimed_by(session, stage, article_ids, worker_id),
+                error, max_attempts
+            )
+
+    def release_expired(self, stage: str, max_attempts: int) -> int:
+        """
+        Release the items of crashed workers whose lease has expired.
+
+        claim() already picks up expired items; releasing them explicitly
+        also retires items that keep crashing their worker once they are
+        out of attempts.
+
+        Args:
+            stage: Stage name
+            max_attempts: Attempts after which an item is marked failed
+
+        Returns:
+            Number of items released
+
+        Raises:
+            RepositoryException: If the update fails
+        """
+        with self._get_session() as session:
+            expired = session.query(WorkItem).filter(
+                WorkItem.stage == stage,
+                WorkItem.status == WorkItemStatus.CLAIMED.value,
+                WorkItem.lease_expires_at < datetime.now(timezone.utc)
+            )
+            return self._release(expired, "Lease expired", max_attempts)
+
+    def count_by_status(self, stage: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Count items per stage and status.
+
+        Args:
+            stage: Only count this stage (optional)
+
+        Returns:
+            Dictionary mapping stage to a status -> count dictionary
+
+        Raises:
+            RepositoryException: If query fails
+
+        Example:
+            ```python
+            print(repo.count_by_status())
+            # {'summarize': {'pending': 120, 'claimed': 40, 'done': 900}}
+            ```
+        """
+        with self._get_session() as session:
+            query = session.query(WorkItem.stage, WorkItem.status, func.count(WorkItem.id))
+            if stage is not None:
+                query = query.filter(WorkItem.stage == stage)
+
+            counts: Dict[str, Dict[str, int]] = {}
+            for item_stage, status, count in query.group_by(WorkItem.stage, WorkItem.status):
+                counts.setdefault(item_stage, {})[status] = count
+            return counts
+
+    def _claimed_by(self, session, stage: str, article_ids: List[int], worker_id: str):
+        """Query the items of a stage currently claimed by a worker."""
+        return session.query(WorkItem).filter(
+            WorkItem.stage == stage,
+            WorkItem.article_id.in_(article_ids),
+            WorkItem.status == WorkItemStatus.CLAIMED.value,
+            WorkItem.worker_id == worker_id
+        )
+
+    def _release(self, query, error: Optional[str], max_attempts: int) -> int:
+        """Return the items of a query to pending, or fail those out of attempts."""
+        now = datetime.now(timezone.utc)
+        released = 0
+
+        for status, condition in (
+            (WorkItemStatus.PENDING, WorkItem.attempts < max_attempts),
+            (WorkItemStatus.FAILED, WorkItem.attempts >= max_attempts)
+        ):
+            released += query.filter(condition).update({
+                WorkItem.status: status.value,
+                WorkItem.worker_id: None,
+                WorkItem.lease_expires_at: None,
+                WorkItem.last_error: error,
+                WorkItem.updated_at: now
+            }, synchronize_session=False)
+
+        return released
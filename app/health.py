@@ -14,7 +14,7 @@ import requests
 import google.generativeai as genai
 from sqlalchemy import text
 
-from app.database.connection import get_session
+from app.database.connection import get_session, get_pool_stats
 from app import config
 
 
@@ -111,7 +111,8 @@ class HealthChecker:
                     "message": "Database connection successful",
                     "details": {
                         "existing_tables": existing_tables,
-                        "tables_count": len(existing_tables)
+                        "tables_count": len(existing_tables),
+                        "connection_pool": get_pool_stats()
                     }
                 })
             finally:
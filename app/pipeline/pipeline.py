@@ -9,15 +9,28 @@ via dependency injection, making it testable and maintainable.
 """
 
 import logging
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, field
 
+from app.config import (
+    PRERANK_TOP_K,
+    PIPELINE_QUEUE_SIZE,
+    PIPELINE_STAGE_WORKERS,
+    PIPELINE_STREAM_BATCH_SIZE
+)
+from app.agent.content_preparation import get_content_stats, reset_content_stats
+from app.pipeline.streaming import StreamingRunner, StreamingStage
 from app.services.scraping_service import ScrapingService
 from app.services.categorization_service import CategorizationService
+from app.services.categorize_summarize_service import CategorizeSummarizeService
 from app.services.summarization_service import SummarizationService
 from app.services.ranking_service import RankingService
 from app.services.digest_generation_service import DigestGenerationService
+from app.database.connection import get_pool_stats
+from app.database.models import PipelineRun, PipelineRunStatus
+from app.database.repositories.pipeline_run_repository import PipelineRunRepository
 
 
 @dataclass
@@ -36,6 +49,12 @@ class PipelineResult:
         digest_content: Generated digest content
         errors: List of errors encountered during execution
         stage_timings: Dictionary of timing for each stage
+        stage_metrics: Per-stage throughput and queue wait statistics
+                       (streaming mode only, see StageMetrics.to_dict)
+        run_id: ID of the persisted run record (None without checkpointing);
+                pass it to execute(resume_run_id=...) to resume the run
+        content_stats: Prompt content token accounting per agent task
+                       (see ContentPreparationStats.to_dict)
     """
     success: bool
     articles_scraped: int
@@ -47,6 +66,9 @@ class PipelineResult:
     digest_content: str
     errors: List[str]
     stage_timings: Dict[str, float]
+    stage_metrics: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    run_id: Optional[int] = None
+    content_stats: Dict[str, Dict[str, int]] = field(default_factory=dict)
 
 
 class PipelineException(Exception):
@@ -70,9 +92,15 @@ class Pipeline:
         _summarization_service: Service for content summarization
         _ranking_service: Service for content ranking
         _digest_service: Service for digest generation
+        _run_repository: Repository for run checkpoints (optional)
+        _categorize_summarize_service: Service for fused categorization and
+                                       summarization (optional, fused mode)
         _logger: Logger instance for pipeline execution
     """
     
+    # Checkpointed stages, in execution order
+    STAGES = ["Scraping", "Categorization", "Summarization", "Ranking", "Digest Generation"]
+    
     def __init__(
         self,
         scraping_service: ScrapingService,
@@ -80,7 +108,9 @@ class Pipeline:
         summarization_service: SummarizationService,
         ranking_service: RankingService,
         digest_service: DigestGenerationService,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        run_repository: Optional[PipelineRunRepository] = None,
+        categorize_summarize_service: Optional[CategorizeSummarizeService] = None
     ):
         """
         Initialize pipeline with all required services via dependency injection.
@@ -92,24 +122,42 @@ class Pipeline:
             ranking_service: Service for ranking articles by relevance
             digest_service: Service for generating formatted digests
             logger: Optional logger instance (creates default if None)
+            run_repository: Optional repository for persisting run
+                            checkpoints; without it runs cannot be resumed
+            categorize_summarize_service: Optional service for the fused
+                                          mode; without it execute(fused=True)
+                                          is rejected
         """
         self._scraping_service = scraping_service
         self._categorization_service = categorization_service
         self._summarization_service = summarization_service
         self._ranking_service = ranking_service
         self._digest_service = digest_service
+        self._run_repository = run_repository
+        self._categorize_summarize_service = categorize_summarize_service
         self._logger = logger or self._create_default_logger()
         
         # Statistics tracking
         self._stage_timings: Dict[str, float] = {}
+        self._stage_metrics: Dict[str, Dict[str, float]] = {}
         self._errors: List[str] = []
+        self._stats_lock = threading.Lock()
+        
+        # Checkpointing of the current run (None when not persisted)
+        self._run_id: Optional[int] = None
+        self._stage_failures: Dict[str, int] = {}
     
     def execute(
         self, 
         hours: int = 24, 
         top_n: int = 10,
         exam_type: str = "UPSC",
-        dry_run: bool = False
+        dry_run: bool = False,
+        streaming: bool = False,
+        stage_workers: Optional[Dict[str, int]] = None,
+        resume_run_id: Optional[int] = None,
+        prerank_top_k: Optional[int] = None,
+        fused: bool = False
     ) -> PipelineResult:
         """
         Execute the complete pipeline workflow.
@@ -122,42 +170,155 @@ class Pipeline:
         5. Store - Persist processed data (skipped in dry_run)
         6. Digest - Generate formatted output
         
+        By default each stage finishes before the next one starts. With
+        streaming=True, stages 1-4 run concurrently on bounded queues
+        (see _execute_streaming_stages), so articles flow through as soon
+        as their source is scraped; the digest still waits for all of them.
+        
+        In batch mode, summarization is preceded by a pre-ranking pass:
+        the ranking heuristics score the unsummarized articles of the
+        lookback window and only the top prerank_top_k per exam type are
+        summarized. The others stay unsummarized (and out of the digest)
+        until summarized on demand or by a run without pre-ranking.
+        Streaming mode summarizes every article, since pre-ranking needs
+        the whole window.
+        
+        With fused=True, the categorization stage categorizes and
+        summarizes each article with one agent call (see
+        CategorizeSummarizeService) instead of one call per stage, and
+        checkpoints the article for both stages. Fused mode therefore
+        disables pre-ranking for the articles it analyzes: every newly
+        categorized article is summarized, whatever prerank_top_k says
+        (a warning is logged). The summarization stage, pre-ranked as
+        usual, then only covers articles the fused stage left without a
+        summary (e.g. categorized by an earlier run).
+        
+        With a run repository (and not dry_run), every run is persisted as
+        a checkpoint: the status of each stage and the IDs of the articles
+        each stage has processed, recorded as soon as their results are
+        stored. Resuming a run skips the stages it completed before its
+        first unfinished stage and reruns the rest with the run's original
+        parameters; those stages only select articles that still lack
+        their result, so work finished before the failure is not repeated
+        and recovery costs only the remaining work. A stage counts as
+        completed when it raised no error and no article failed in it
+        (e.g. on the Gemini quota). Resumed stages always run in batch mode.
+        
         Args:
             hours: Number of hours to look back for content
             top_n: Number of top articles to include in digest
             exam_type: Type of exam (UPSC, SSC, Banking)
             dry_run: If True, skip database writes
+            streaming: Run scrape/categorize/summarize/rank as a stream
+            stage_workers: Worker threads per streaming stage, keyed
+                           "categorize", "summarize", "rank" (defaults to
+                           PIPELINE_STAGE_WORKERS)
+            resume_run_id: ID of a persisted run to resume; its hours,
+                           top_n and exam_type replace the arguments
+            prerank_top_k: Candidates per exam type to summarize (default:
+                           PRERANK_TOP_K, at least top_n; 0 summarizes all)
+            fused: Categorize and summarize with one agent call per article
             
         Returns:
             PipelineResult with execution statistics and digest content
             
         Raises:
-            PipelineException: If critical pipeline failure occurs
+            PipelineException: If critical pipeline failure occurs, the
+                               run to resume cannot be found, or fused mode
+                               lacks its service
         """
+        if fused and self._categorize_summarize_service is None:
+            raise PipelineException("Fused mode requires a categorize-summarize service")
+        
         start_time = datetime.now(timezone.utc)
-        self._logger.info(f"Starting pipeline execution - Hours: {hours}, Top N: {top_n}, Exam: {exam_type}, Dry Run: {dry_run}")
+        self._stage_failures = {}
+        reset_content_stats()
+        
+        run = self._start_run(hours, top_n, exam_type, dry_run, streaming, resume_run_id)
+        completed_stages: Set[str] = set()
+        if resume_run_id is not None:
+            hours, top_n, exam_type = run.hours, run.top_n, run.exam_type
+            streaming = False
+            # Skip the completed stages up to the first unfinished one; the
+            # stages after it consume its output and have to run again
+            stage_status = self._run_repository.get_stage_status(run)
+            for stage in self.STAGES:
+                if stage_status.get(stage) != PipelineRunStatus.COMPLETED.value:
+                    break
+                completed_stages.add(stage)
+            self._logger.info(
+                f"Resuming run {run.id} - completed stages: "
+                f"{', '.join(sorted(completed_stages)) or 'none'}"
+            )
+        
+        self._logger.info(f"Starting pipeline execution - Hours: {hours}, Top N: {top_n}, Exam: {exam_type}, Dry Run: {dry_run}, Streaming: {streaming}, Fused: {fused}, Run: {self._run_id}")
         
         try:
-            # Stage 1: Scrape content
-            articles_scraped = self._execute_scraping_stage(hours, dry_run)
-            
-            # Stage 2: Categorize articles
-            articles_categorized = self._execute_categorization_stage(dry_run)
-            
-            # Stage 3: Summarize articles
-            articles_summarized = self._execute_summarization_stage(dry_run)
-            
-            # Stage 4: Rank articles
-            articles_ranked = self._execute_ranking_stage(exam_type, dry_run)
+            if streaming:
+                # Stages 1-4 overlap: each batch moves on as soon as it is done
+                (
+                    articles_scraped, articles_categorized,
+                    articles_summarized, articles_ranked
+                ) = self._execute_streaming_stages(hours, stage_workers, fused)
+            else:
+                # Stage 1: Scrape content
+                articles_scraped = self._run_stage(
+                    "Scraping", completed_stages,
+                    lambda: self._execute_scraping_stage(hours, dry_run)
+                )
+                
+                # Stage 2: Categorize articles (and summarize them in fused mode)
+                fused_summarized = 0
+                if fused:
+                    if self._candidate_count(prerank_top_k, top_n) > 0:
+                        self._logger.warning(
+                            "Fused mode summarizes every newly categorized article; "
+                            "pre-ranking only applies to articles left without a summary"
+                        )
+                    articles_categorized = self._run_stage(
+                        "Categorization", completed_stages,
+                        lambda: self._execute_fused_stage(dry_run)
+                    )
+                    fused_summarized = articles_categorized
+                else:
+                    articles_categorized = self._run_stage(
+                        "Categorization", completed_stages,
+                        lambda: self._execute_categorization_stage(dry_run)
+                    )
+                
+                # Stage 3: Summarize articles (those left without a summary)
+                articles_summarized = fused_summarized + self._run_stage(
+                    "Summarization", completed_stages,
+                    lambda: self._execute_summarization_stage(
+                        hours, self._candidate_count(prerank_top_k, top_n), dry_run
+                    )
+                )
+                
+                # Stage 4: Rank articles
+                articles_ranked = self._run_stage(
+                    "Ranking", completed_stages,
+                    lambda: self._execute_ranking_stage(exam_type, dry_run)
+                )
             
             # Stage 5: Store results (handled by individual services)
             # No separate storage stage - services handle persistence
             
-            # Stage 6: Generate digest
-            digest_content, top_articles_selected = self._execute_digest_stage(
-                top_n, exam_type, dry_run
+            # Stage 6: Generate digest (always regenerated, also on resume)
+            digest_content, top_articles_selected = self._run_stage(
+                "Digest Generation", set(),
+                lambda: self._execute_digest_stage(top_n, exam_type, dry_run)
             )
             
+            # A resumed run reports the articles of all its attempts
+            if self._run_id is not None:
+                processed = self._processed_counts()
+                articles_scraped = processed.get("Scraping", articles_scraped)
+                articles_categorized = processed.get("Categorization", articles_categorized)
+                articles_summarized = processed.get("Summarization", articles_summarized)
+                articles_ranked = processed.get("Ranking", articles_ranked)
+            
+            self._finish_run(error=None)
+            
             # Calculate total execution time
             end_time = datetime.now(timezone.utc)
             execution_time = (end_time - start_time).total_seconds()
@@ -178,12 +339,16 @@ class Pipeline:
                 execution_time_seconds=execution_time,
                 digest_content=digest_content,
                 errors=self._errors.copy(),
-                stage_timings=self._stage_timings.copy()
+                stage_timings=self._stage_timings.copy(),
+                stage_metrics=self._stage_metrics.copy(),
+                run_id=self._run_id,
+                content_stats=get_content_stats()
             )
             
         except Exception as e:
             self._logger.error(f"Pipeline execution failed: {str(e)}")
             self._errors.append(f"Pipeline failure: {str(e)}")
+            self._finish_run(error=str(e))
             
             end_time = datetime.now(timezone.utc)
             execution_time = (end_time - start_time).total_seconds()
@@ -198,13 +363,196 @@ class Pipeline:
                 execution_time_seconds=execution_time,
                 digest_content="",
                 errors=self._errors.copy(),
-                stage_timings=self._stage_timings.copy()
+                stage_timings=self._stage_timings.copy(),
+                stage_metrics=self._stage_metrics.copy(),
+                run_id=self._run_id,
+                content_stats=get_content_stats()
+            )
+    
+    def _start_run(
+        self,
+        hours: int,
+        top_n: int,
+        exam_type: str,
+        dry_run: bool,
+        streaming: bool,
+        resume_run_id: Optional[int]
+    ) -> Optional[PipelineRun]:
+        """
+        Create the run record, or load the run to resume.
+        
+        Args:
+            hours: Number of hours to look back for content
+            top_n: Number of top articles to include in digest
+            exam_type: Type of exam
+            dry_run: If True, no run record is written
+            streaming: Whether the run uses the streaming mode
+            resume_run_id: ID of the run to resume (None for a new run)
+            
+        Returns:
+            The run record, or None if the run is not checkpointed
+            
+        Raises:
+            PipelineException: If the run to resume cannot be loaded
+        """
+        self._run_id = None
+        
+        if resume_run_id is not None:
+            if self._run_repository is None:
+                raise PipelineException("Cannot resume a run without a run repository")
+            if dry_run:
+                raise PipelineException("Cannot resume a run in dry-run mode")
+            
+            run = self._run_repository.find_by_id(resume_run_id)
+            if run is None:
+                raise PipelineException(f"Pipeline run {resume_run_id} not found")
+            
+            self._run_repository.mark_running(run.id)
+            self._run_id = run.id
+            return run
+        
+        if self._run_repository is None or dry_run:
+            return None
+        
+        try:
+            run = self._run_repository.create_run(
+                hours, top_n, exam_type, streaming, self.STAGES
             )
+        except Exception as e:
+            # Checkpointing is best effort; the run itself can proceed
+            self._logger.warning(f"Failed to create pipeline run record: {str(e)}")
+            return None
+        
+        self._run_id = run.id
+        self._logger.info(f"Recording pipeline run {run.id} (resume with --resume {run.id})")
+        return run
+    
+    def _run_stage(
+        self,
+        stage_name: str,
+        completed_stages: Set[str],
+        execute_stage: Callable[[], Any]
+    ) -> Any:
+        """
+        Execute a stage unless the resumed run already completed it.
+        
+        The stage is marked running before and completed or failed after
+        its execution: failed when it logged an error or some of its
+        articles failed.
+        
+        Args:
+            stage_name: Stage name (one of STAGES)
+            completed_stages: Stages to skip
+            execute_stage: Function executing the stage
+            
+        Returns:
+            The stage function's result (0 for a skipped stage)
+        """
+        if stage_name in completed_stages:
+            self._logger.info(f"Skipping stage {stage_name} (completed in run {self._run_id})")
+            return 0
+        
+        self._set_stage_status(stage_name, PipelineRunStatus.RUNNING)
+        errors_before = len(self._errors)
+        
+        result = execute_stage()
+        
+        failed = len(self._errors) > errors_before or self._stage_failures.get(stage_name, 0) > 0
+        self._set_stage_status(
+            stage_name,
+            PipelineRunStatus.FAILED if failed else PipelineRunStatus.COMPLETED
+        )
+        return result
+    
+    def _checkpoint(self, stage_name: str) -> Optional[Callable[[List[int]], None]]:
+        """
+        Get a callback recording the articles a stage has processed.
+        
+        Args:
+            stage_name: Stage name (one of STAGES)
+            
+        Returns:
+            Callback for the services' on_progress, or None without a run
+        """
+        if self._run_id is None:
+            return None
+        
+        run_id = self._run_id
+        
+        def record(article_ids: List[int]) -> None:
+            try:
+                self._run_repository.record_articles(run_id, stage_name, article_ids)
+            except Exception as e:
+                self._logger.warning(
+                    f"Failed to checkpoint {len(article_ids)} articles of stage "
+                    f"{stage_name}: {str(e)}"
+                )
+        
+        return record
+    
+    def _set_stage_status(self, stage_name: str, status: PipelineRunStatus) -> None:
+        """
+        Persist a stage status of the current run (no-op without a run).
+        
+        Args:
+            stage_name: Stage name (one of STAGES)
+            status: New stage status
+        """
+        if self._run_id is None:
+            return
+        
+        try:
+            self._run_repository.set_stage_status(self._run_id, stage_name, status)
+        except Exception as e:
+            self._logger.warning(f"Failed to update status of stage {stage_name}: {str(e)}")
+    
+    def _processed_counts(self) -> Dict[str, int]:
+        """
+        Count the articles each stage of the current run has processed.
+        
+        Returns:
+            Dictionary mapping stage name to count (empty on failure)
+        """
+        try:
+            return self._run_repository.count_processed_by_stage(self._run_id)
+        except Exception as e:
+            self._logger.warning(f"Failed to count processed articles: {str(e)}")
+            return {}
+    
+    def _finish_run(self, error: Optional[str]) -> None:
+        """
+        Mark the current run completed, or failed if any stage failed.
+        
+        Args:
+            error: Error that aborted the run (None if it ran to the end)
+        """
+        if self._run_id is None:
+            return
+        
+        try:
+            run = self._run_repository.find_by_id(self._run_id)
+            stage_status = self._run_repository.get_stage_status(run)
+            failed_stages = [
+                stage for stage, status in stage_status.items()
+                if status != PipelineRunStatus.COMPLETED.value
+            ]
+            
+            if error is None and failed_stages:
+                error = f"Incomplete stages: {', '.join(failed_stages)}"
+            
+            self._run_repository.finish_run(self._run_id, success=error is None, error=error)
+            if error is not None:
+                self._logger.info(f"Run {self._run_id} can be resumed with --resume {self._run_id}")
+        except Exception as e:
+            self._logger.warning(f"Failed to finish pipeline run record: {str(e)}")
     
     def _execute_scraping_stage(self, hours: int, dry_run: bool) -> int:
         """
         Execute the scraping stage.
         
+        Articles are stored source by source, and each source's new
+        article IDs are checkpointed as soon as they are stored.
+        
         Args:
             hours: Number of hours to look back
             dry_run: If True, skip database writes
@@ -219,11 +567,12 @@ class Pipeline:
             start_time = datetime.now(timezone.utc)
             
             # Execute scraping
-            result = self._scraping_service.scrape_all_sources(
-                hours=hours
-            )
-            
-            articles_scraped = result.get('articles_processed', 0)
+            checkpoint = self._checkpoint(stage_name)
+            articles_scraped = 0
+            for article_ids in self._scraping_service.iter_new_articles(hours=hours):
+                articles_scraped += len(article_ids)
+                if checkpoint is not None:
+                    checkpoint(article_ids)
             
             # Record timing
             end_time = datetime.now(timezone.utc)
@@ -255,9 +604,12 @@ class Pipeline:
             start_time = datetime.now(timezone.utc)
             
             # Execute categorization
-            result = self._categorization_service.categorize_articles()
+            result = self._categorization_service.categorize_articles(
+                on_progress=self._checkpoint(stage_name)
+            )
             
-            articles_categorized = result.get('articles_processed', 0)
+            articles_categorized = result.get('successfully_categorized', 0)
+            self._stage_failures[stage_name] = result.get('failed', 0)
             
             # Record timing
             end_time = datetime.now(timezone.utc)
@@ -272,11 +624,90 @@ class Pipeline:
             self._errors.append(error_msg)
             return 0
     
-    def _execute_summarization_stage(self, dry_run: bool) -> int:
+    def _execute_fused_stage(self, dry_run: bool) -> int:
+        """
+        Execute the categorization stage in fused mode.
+        
+        Each article is categorized and summarized with one agent call;
+        stored articles are checkpointed for both the categorization and
+        the summarization stage.
+        
+        Args:
+            dry_run: If True, skip database writes
+            
+        Returns:
+            Number of articles categorized and summarized
+        """
+        stage_name = "Categorization"
+        self._log_stage_start(stage_name)
+        
+        try:
+            start_time = datetime.now(timezone.utc)
+            
+            # Execute fused categorization and summarization
+            result = self._categorize_summarize_service.categorize_and_summarize(
+                on_progress=self._fused_checkpoint()
+            )
+            
+            articles_processed = result.get('successfully_processed', 0)
+            self._stage_failures[stage_name] = result.get('failed', 0)
+            
+            # Record timing
+            end_time = datetime.now(timezone.utc)
+            self._stage_timings[stage_name] = (end_time - start_time).total_seconds()
+            
+            self._log_stage_end(stage_name, articles_processed)
+            return articles_processed
+            
+        except Exception as e:
+            error_msg = f"Fused categorization stage failed: {str(e)}"
+            self._logger.error(error_msg)
+            self._errors.append(error_msg)
+            return 0
+    
+    def _fused_checkpoint(self) -> Optional[Callable[[List[int]], None]]:
+        """
+        Get a callback recording fused articles for both stages they complete.
+        
+        Returns:
+            Callback for the fused service's on_progress, or None without a run
+        """
+        categorized = self._checkpoint("Categorization")
+        summarized = self._checkpoint("Summarization")
+        if categorized is None or summarized is None:
+            return None
+        
+        def record(article_ids: List[int]) -> None:
+            categorized(article_ids)
+            summarized(article_ids)
+        
+        return record
+    
+    def _candidate_count(self, prerank_top_k: Optional[int], top_n: int) -> int:
+        """
+        Resolve the number of pre-ranking candidates per exam type.
+        
+        Args:
+            prerank_top_k: Requested candidates (None = PRERANK_TOP_K)
+            top_n: Digest size, the minimum for an enabled pre-ranking
+            
+        Returns:
+            Candidates per exam type (0 = pre-ranking disabled)
+        """
+        top_k = PRERANK_TOP_K if prerank_top_k is None else prerank_top_k
+        return max(top_k, top_n) if top_k > 0 else 0
+    
+    def _execute_summarization_stage(self, hours: int, top_k: int, dry_run: bool) -> int:
         """
         Execute the summarization stage.
         
+        With top_k > 0, the unsummarized articles published in the
+        lookback window are pre-ranked first and only the top_k
+        candidates per exam type are summarized.
+        
         Args:
+            hours: Lookback window of the pre-ranking
+            top_k: Candidates per exam type (0 = summarize all)
             dry_run: If True, skip database writes
             
         Returns:
@@ -288,10 +719,32 @@ class Pipeline:
         try:
             start_time = datetime.now(timezone.utc)
             
+            # Pre-rank to pick the candidates worth a summary
+            article_ids = None
+            if top_k > 0:
+                candidates = self._ranking_service.select_candidates(
+                    top_k, since=start_time - timedelta(hours=hours)
+                )
+                article_ids = sorted(set().union(*candidates.values()))
+                self._logger.info(
+                    f"Pre-ranking selected {len(article_ids)} candidates "
+                    f"(top {top_k} per exam type)"
+                )
+                if not article_ids:
+                    self._stage_timings[stage_name] = (
+                        datetime.now(timezone.utc) - start_time
+                    ).total_seconds()
+                    self._log_stage_end(stage_name, 0)
+                    return 0
+            
             # Execute summarization
-            result = self._summarization_service.summarize_articles()
+            result = self._summarization_service.summarize_articles(
+                article_ids=article_ids,
+                on_progress=self._checkpoint(stage_name)
+            )
             
-            articles_summarized = result.get('articles_processed', 0)
+            articles_summarized = result.get('successfully_summarized', 0)
+            self._stage_failures[stage_name] = result.get('failed', 0)
             
             # Record timing
             end_time = datetime.now(timezone.utc)
@@ -310,8 +763,12 @@ class Pipeline:
         """
         Execute the ranking stage.
         
+        Ranks articles for every exam type in one pass over the corpus
+        (shared text features, one bulk write per page), so the digest of
+        any exam type can be generated afterwards without re-ranking.
+        
         Args:
-            exam_type: Type of exam for ranking strategy
+            exam_type: Type of exam for the digest (ranked with all others)
             dry_run: If True, skip database writes
             
         Returns:
@@ -323,12 +780,13 @@ class Pipeline:
         try:
             start_time = datetime.now(timezone.utc)
             
-            # Execute ranking
-            result = self._ranking_service.rank_articles(
-                exam_type=exam_type
+            # Execute ranking for all exam types at once
+            result = self._ranking_service.rank_articles_all_exams(
+                on_progress=self._checkpoint(stage_name)
             )
             
-            articles_ranked = result.get('articles_processed', 0)
+            articles_ranked = result.get('total_processed', 0)
+            self._stage_failures[stage_name] = result.get('failed', 0)
             
             # Record timing
             end_time = datetime.now(timezone.utc)
@@ -343,6 +801,135 @@ class Pipeline:
             self._errors.append(error_msg)
             return 0
     
+    def _execute_streaming_stages(
+        self,
+        hours: int,
+        stage_workers: Optional[Dict[str, int]] = None,
+        fused: bool = False
+    ) -> Tuple[int, int, int, int]:
+        """
+        Execute scraping, categorization, summarization and ranking as a stream.
+        
+        The scraper yields the IDs of each source's new articles as soon
+        as that source is stored; they are cut into batches of
+        PIPELINE_STREAM_BATCH_SIZE and passed through bounded queues
+        (PIPELINE_QUEUE_SIZE batches each) to the worker pools of the
+        later stages. Each stage only works on the IDs it receives, so no
+        stage re-scans the database for pending articles. Processed
+        articles are checkpointed like in batch mode.
+        
+        In fused mode the categorization workers also summarize, and the
+        summarization stage only picks up the articles they left without
+        a summary.
+        
+        Args:
+            hours: Number of hours to look back for content
+            stage_workers: Worker threads per stage (overrides
+                           PIPELINE_STAGE_WORKERS entries)
+            fused: Categorize and summarize with one agent call per article
+            
+        Returns:
+            Tuple of (articles scraped, categorized, summarized, ranked)
+        """
+        stage_name = "Streaming"
+        self._log_stage_start(stage_name)
+        start_time = datetime.now(timezone.utc)
+        
+        workers = dict(PIPELINE_STAGE_WORKERS)
+        workers.update(stage_workers or {})
+        counts = {'Categorization': 0, 'Summarization': 0, 'Ranking': 0}
+        
+        def count(name: str, result: Dict[str, Any], key: str) -> None:
+            with self._stats_lock:
+                counts[name] += result.get(key, 0)
+                self._stage_failures[name] = (
+                    self._stage_failures.get(name, 0) + result.get('failed', 0)
+                )
+        
+        def categorize(article_ids: List[int]) -> None:
+            if fused:
+                result = self._categorize_summarize_service.categorize_and_summarize(
+                    article_ids=article_ids,
+                    on_progress=self._fused_checkpoint()
+                )
+                count("Categorization", result, 'successfully_processed')
+                with self._stats_lock:
+                    counts['Summarization'] += result.get('successfully_processed', 0)
+                return
+            
+            result = self._categorization_service.categorize_articles(
+                article_ids=article_ids,
+                on_progress=self._checkpoint("Categorization")
+            )
+            count("Categorization", result, 'successfully_categorized')
+        
+        def summarize(article_ids: List[int]) -> None:
+            result = self._summarization_service.summarize_articles(
+                article_ids=article_ids,
+                on_progress=self._checkpoint("Summarization")
+            )
+            count("Summarization", result, 'successfully_summarized')
+        
+        def rank(article_ids: List[int]) -> None:
+            result = self._ranking_service.rank_articles_all_exams(
+                article_ids=article_ids,
+                on_progress=self._checkpoint("Ranking")
+            )
+            count("Ranking", result, 'total_processed')
+        
+        def scraped_articles():
+            checkpoint = self._checkpoint("Scraping")
+            for article_ids in self._scraping_service.iter_new_articles(hours=hours):
+                if checkpoint is not None:
+                    checkpoint(article_ids)
+                yield article_ids
+        
+        def on_error(name: str, error: Exception) -> None:
+            with self._stats_lock:
+                self._errors.append(f"{name} stage failed on a batch: {str(error)}")
+        
+        streamed_stages = ["Scraping", "Categorization", "Summarization", "Ranking"]
+        for name in streamed_stages:
+            self._set_stage_status(name, PipelineRunStatus.RUNNING)
+        
+        runner = StreamingRunner(
+            batch_size=PIPELINE_STREAM_BATCH_SIZE,
+            queue_size=PIPELINE_QUEUE_SIZE,
+            on_error=on_error
+        )
+        metrics = runner.run(
+            "Scraping",
+            scraped_articles(),
+            [
+                StreamingStage("Categorization", categorize, workers['categorize']),
+                StreamingStage("Summarization", summarize, workers['summarize']),
+                StreamingStage("Ranking", rank, workers['rank'])
+            ]
+        )
+        
+        for name, stage_metrics in metrics.items():
+            self._stage_metrics[name] = stage_metrics.to_dict()
+            self._stage_timings[name] = stage_metrics.elapsed_seconds
+        
+        for name in streamed_stages:
+            failed = metrics[name].errors > 0 or self._stage_failures.get(name, 0) > 0
+            self._set_stage_status(
+                name, PipelineRunStatus.FAILED if failed else PipelineRunStatus.COMPLETED
+            )
+        
+        end_time = datetime.now(timezone.utc)
+        self._stage_timings[stage_name] = (end_time - start_time).total_seconds()
+        
+        articles_scraped = metrics["Scraping"].items_out
+        self._log_stage_end(stage_name, articles_scraped)
+        
+        return (
+            articles_scraped,
+            counts['Categorization'],
+            counts['Summarization'],
+            counts['Ranking']
+        )
+    
     def _execute_digest_stage(
         self, 
         top_n: int, 
@@ -456,6 +1043,42 @@ class Pipeline:
             percentage = (timing / execution_time * 100) if execution_time > 0 else 0
             self._logger.info(f"  {stage}: {timing:.2f}s ({percentage:.1f}%)")
         
+        if self._stage_metrics:
+            self._logger.info("\nStreaming Stages:")
+            for stage, metrics in self._stage_metrics.items():
+                self._logger.info(
+                    f"  {stage}: {metrics['items_in']} items, "
+                    f"{metrics['throughput_per_second']:.2f} items/s, "
+                    f"{metrics['workers']} workers, "
+                    f"input wait {metrics['input_wait_seconds']:.2f}s, "
+                    f"output wait {metrics['output_wait_seconds']:.2f}s"
+                )
+        
+        content_stats = get_content_stats()
+        if content_stats:
+            self._logger.info("\nPrompt Content:")
+            for task, stats in sorted(content_stats.items()):
+                saved_percent = (
+                    stats['tokens_saved'] / stats['original_tokens'] * 100
+                    if stats['original_tokens'] else 0
+                )
+                self._logger.info(
+                    f"  {task}: {stats['articles']} articles "
+                    f"({stats['shortened']} shortened), "
+                    f"{stats['prepared_tokens']} of {stats['original_tokens']} tokens sent, "
+                    f"{stats['tokens_saved']} saved ({saved_percent:.1f}%)"
+                )
+        
+        pool_stats = get_pool_stats()
+        if pool_stats:
+            self._logger.info(
+                f"\nDB Pool: size={pool_stats['pool_size']}, "
+                f"checkouts={pool_stats['total_checkouts']}, "
+                f"peak checked out={pool_stats['peak_checked_out']}, "
+                f"peak overflow={pool_stats['peak_overflow']}, "
+                f"connections opened={pool_stats['connections_created']}"
+            )
+        
         self._logger.info("=" * 60)
     
     def _create_default_logger(self) -> logging.Logger:
@@ -0,0 +1,310 @@
+"""
+Streaming execution of pipeline stages.
+
+In streaming mode the pipeline stages are connected by bounded queues and
+each stage runs its own pool of worker threads. A batch of article IDs
+moves on to the next stage as soon as the current stage has finished it,
+so categorization starts on the first scraped source while other sources
+are still being scraped, and the end-to-end time approaches that of the
+slowest stage instead of the sum of all stages.
+
+Demonstrates:
+- Pipes and Filters / Producer-Consumer pattern
+- Backpressure through bounded queues
+- Per-stage throughput and queue wait instrumentation
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+import logging
+import queue
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+# Sentinel telling a stage worker that its input is exhausted
+_END_OF_STREAM = object()
+
+
+@dataclass
+class StageMetrics:
+    """
+    Throughput and queue statistics of one streaming stage.
+
+    Attributes:
+        workers: Worker threads of the stage
+        batches: Batches processed
+        items_in: Article IDs received
+        items_out: Article IDs passed to the next stage
+        errors: Batches that raised an exception
+        busy_seconds: Time spent processing, summed over workers
+        elapsed_seconds: Time from the stage's first input to its last output
+        input_wait_seconds: Time workers waited for input (stage starved)
+        output_wait_seconds: Time spent blocked on a full downstream queue
+                             (stage held back by a slower successor)
+    """
+    workers: int = 1
+    batches: int = 0
+    items_in: int = 0
+    items_out: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    input_wait_seconds: float = 0.0
+    output_wait_seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Article IDs processed per second of stage wall-clock time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.items_in / self.elapsed_seconds
+
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Convert the metrics to a plain dictionary (for PipelineResult).
+
+        Returns:
+            Dictionary of all counters plus 'throughput_per_second'
+        """
+        return {
+            'workers': self.workers,
+            'batches': self.batches,
+            'items_in': self.items_in,
+            'items_out': self.items_out,
+            'errors': self.errors,
+            'busy_seconds': round(self.busy_seconds, 3),
+            'elapsed_seconds': round(self.elapsed_seconds, 3),
+            'input_wait_seconds': round(self.input_wait_seconds, 3),
+            'output_wait_seconds': round(self.output_wait_seconds, 3),
+            'throughput_per_second': round(self.throughput, 3)
+        }
+
+
+class StreamingStage:
+    """
+    One stage of a streaming pipeline.
+
+    The process callable receives a batch of article IDs and returns the
+    IDs to pass on to the next stage (None passes the whole batch on).
+    It is called from several threads at once when workers > 1, so it
+    must be thread-safe; the services it wraps share nothing but their
+    repositories, agents and caches, which are.
+
+    Attributes:
+        name (str): Stage name used in logs and metrics
+        process (Callable): Batch processing function
+        workers (int): Worker threads for this stage
+    """
+
+    def __init__(
+        self,
+        name: str,
+        process: Callable[[List[int]], Optional[List[int]]],
+        workers: int = 1
+    ):
+        """
+        Define a stage.
+
+        Args:
+            name: Stage name used in logs and metrics
+            process: Function processing one batch of article IDs
+            workers: Worker threads for this stage (at least 1)
+        """
+        self.name = name
+        self.process = process
+        self.workers = max(1, workers)
+
+
+class StreamingRunner:
+    """
+    Runs a source and a chain of stages connected by bounded queues.
+
+    The source (e.g. the scraper) runs in its own thread and its output
+    is cut into batches of batch_size IDs. Each queue holds at most
+    queue_size batches, so a fast stage blocks instead of piling up work
+    in memory when its successor falls behind (backpressure). Errors in a
+    batch are reported through on_error and drop only that batch.
+
+    Example:
+        ```python
+        runner = StreamingRunner(batch_size=20, queue_size=4)
+        metrics = runner.run(
+            "Scraping", scraping_service.iter_new_articles(hours=24),
+            [StreamingStage("Categorization", categorize, workers=2),
+             StreamingStage("Summarization", summarize, workers=4)]
+        )
+        print(metrics["Summarization"].throughput)
+        ```
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        queue_size: int,
+        on_error: Optional[Callable[[str, Exception], None]] = None
+    ):
+        """
+        Configure the runner.
+
+        Args:
+            batch_size: Article IDs per batch handed between stages
+            queue_size: Batches buffered between two stages
+            on_error: Called with (stage name, exception) for failed batches
+        """
+        self._batch_size = max(1, batch_size)
+        self._queue_size = max(1, queue_size)
+        self._on_error = on_error
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        source_name: str,
+        source: Iterable[List[int]],
+        stages: List[StreamingStage]
+    ) -> Dict[str, StageMetrics]:
+        """
+        Stream the source through all stages and wait for completion.
+
+        Args:
+            source_name: Name of the source in the returned metrics
+            source: Iterable of article ID lists (any sizes)
+            stages: Stages in execution order
+
+        Returns:
+            Metrics by stage name (source first, then stages in order)
+        """
+        queues = [queue.Queue(maxsize=self._queue_size) for _ in stages]
+        metrics = {source_name: StageMetrics()}
+        for stage in stages:
+            metrics[stage.name] = StageMetrics(workers=stage.workers)
+
+        threads = [threading.Thread(
+            target=self._run_source,
+            args=(source_name, source, queues[0] if queues else None,
+                  stages[0].workers if stages else 0, metrics[source_name]),
+            name=f"stream-{source_name.lower()}",
+            daemon=True
+        )]
+
+        for index, stage in enumerate(stages):
+            has_next = index + 1 < len(stages)
+            remaining = [stage.workers]
+            started = [None]
+            for worker in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._run_worker,
+                    args=(stage, queues[index],
+                          queues[index + 1] if has_next else None,
+                          stages[index + 1].workers if has_next else 0,
+                          metrics[stage.name], remaining, started),
+                    name=f"stream-{stage.name.lower()}-{worker}",
+                    daemon=True
+                ))
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return metrics
+
+    def _run_source(
+        self,
+        name: str,
+        source: Iterable[List[int]],
+        out_queue: Optional[queue.Queue],
+        downstream_workers: int,
+        metrics: StageMetrics
+    ) -> None:
+        """Drain the source into the first queue, cut into batches."""
+        start = time.monotonic()
+        try:
+            for ids in source:
+                metrics.batches += 1
+                metrics.items_in += len(ids)
+                for offset in range(0, len(ids), self._batch_size):
+                    batch = list(ids[offset:offset + self._batch_size])
+                    metrics.items_out += len(batch)
+                    if out_queue is not None:
+                        metrics.output_wait_seconds += self._put(out_queue, batch)
+        except Exception as e:
+            metrics.errors += 1
+            self._report_error(name, e)
+        finally:
+            metrics.elapsed_seconds = time.monotonic() - start
+            metrics.busy_seconds = metrics.elapsed_seconds - metrics.output_wait_seconds
+            if out_queue is not None:
+                for _ in range(downstream_workers):
+                    out_queue.put(_END_OF_STREAM)
+
+    def _run_worker(
+        self,
+        stage: StreamingStage,
+        in_queue: queue.Queue,
+        out_queue: Optional[queue.Queue],
+        downstream_workers: int,
+        metrics: StageMetrics,
+        remaining: List[int],
+        started: List[Optional[float]]
+    ) -> None:
+        """Process batches until end of stream; the last worker out closes the next queue."""
+        input_wait = busy = output_wait = 0.0
+
+        while True:
+            wait_start = time.monotonic()
+            batch = in_queue.get()
+            now = time.monotonic()
+
+            if batch is _END_OF_STREAM:
+                break
+
+            input_wait += now - wait_start
+            with self._lock:
+                if started[0] is None:
+                    started[0] = now
+                metrics.batches += 1
+                metrics.items_in += len(batch)
+
+            try:
+                result = stage.process(batch)
+                forward = batch if result is None else list(result)
+            except Exception as e:
+                forward = []
+                with self._lock:
+                    metrics.errors += 1
+                self._report_error(stage.name, e)
+            busy += time.monotonic() - now
+
+            if forward:
+                with self._lock:
+                    metrics.items_out += len(forward)
+                if out_queue is not None:
+                    output_wait += self._put(out_queue, forward)
+
+        with self._lock:
+            metrics.input_wait_seconds += input_wait
+            metrics.busy_seconds += busy
+            metrics.output_wait_seconds += output_wait
+            remaining[0] -= 1
+            last_worker = remaining[0] == 0
+            if last_worker and started[0] is not None:
+                metrics.elapsed_seconds = time.monotonic() - started[0]
+
+        if last_worker and out_queue is not None:
+            for _ in range(downstream_workers):
+                out_queue.put(_END_OF_STREAM)
+
+    def _put(self, out_queue: queue.Queue, batch: List[int]) -> float:
+        """Put a batch on a queue and return the seconds spent blocked."""
+        start = time.monotonic()
+        out_queue.put(batch)
+        return time.monotonic() - start
+
+    def _report_error(self, stage_name: str, error: Exception) -> None:
+        """Log a failed batch and pass it to the error callback."""
+        logger.error(f"Streaming stage {stage_name} failed on a batch: {str(error)}")
+        if self._on_error is not None:
+            self._on_error(stage_name, error)
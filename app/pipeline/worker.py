@@ -0,0 +1,282 @@
+"""
+Horizontally scalable pipeline workers on the database-backed work queue.
+
+Instead of one Pipeline.execute() process working through every stage,
+any number of StageWorker processes (on any number of nodes) claim batches
+of work items for one stage, process them with the usual services, and
+queue the finished articles for the next stage:
+
+    scrape -> categorize -> summarize -> rank
+
+Claims use SELECT ... FOR UPDATE SKIP LOCKED (see WorkItemRepository), so
+no two workers process the same article and adding workers adds
+throughput. A worker that crashes loses nothing: its claims expire after
+the lease and are handed to another worker.
+
+Demonstrates:
+- Competing Consumers pattern
+- Lease-based recovery from worker failures
+- Dependency Injection of services and repositories
+"""
+
+import logging
+import os
+import socket
+import time
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import and_
+
+from app.config import (
+    WORK_QUEUE_BATCH_SIZE,
+    WORK_QUEUE_LEASE_SECONDS,
+    WORK_QUEUE_MAX_ATTEMPTS,
+    WORK_QUEUE_POLL_SECONDS
+)
+from app.database.models import Article, Ranking
+from app.database.repositories.article_repository import ArticleRepository
+from app.database.repositories.unit_of_work import UnitOfWork
+from app.database.repositories.work_item_repository import WorkItemRepository
+from app.services.categorization_service import CategorizationService
+from app.services.ranking_service import RankingService
+from app.services.scraping_service import ScrapingService
+from app.services.summarization_service import SummarizationService
+
+
+logger = logging.getLogger(__name__)
+
+
+def default_worker_id() -> str:
+    """
+    Build a worker ID that is unique across nodes and processes.
+
+    Returns:
+        "<hostname>:<pid>"
+    """
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class StageWorker:
+    """
+    Processes work items of one pipeline stage from the shared queue.
+
+    An item is done when its article has the stage's result (a category,
+    a summary, a ranking for every exam type), whether this attempt or an
+    earlier, crashed one produced it. Done items are completed and queued
+    for the next stage in one transaction; the rest are released for a
+    retry until they run out of attempts.
+
+    The lease must comfortably exceed the time to process one batch,
+    otherwise a slow batch is handed to a second worker before it is done.
+
+    Example:
+        ```python
+        worker = StageWorker(
+            WorkItemRepository(), ArticleRepository(),
+            categorization_service, summarization_service, ranking_service
+        )
+        worker.enqueue_scraped(scraping_service, hours=24)
+        stats = worker.run("summarize", wait=False)
+        ```
+
+    Attributes:
+        STAGES (List[str]): Consumer stages in pipeline order
+        NEXT_STAGE (Dict[str, Optional[str]]): Stage fed by each stage
+    """
+
+    STAGES = ["categorize", "summarize", "rank"]
+    NEXT_STAGE = {"categorize": "summarize", "summarize": "rank", "rank": None}
+
+    def __init__(
+        self,
+        work_item_repository: WorkItemRepository,
+        article_repository: ArticleRepository,
+        categorization_service: CategorizationService,
+        summarization_service: SummarizationService,
+        ranking_service: RankingService,
+        worker_id: Optional[str] = None,
+        batch_size: int = WORK_QUEUE_BATCH_SIZE,
+        lease_seconds: int = WORK_QUEUE_LEASE_SECONDS,
+        max_attempts: int = WORK_QUEUE_MAX_ATTEMPTS
+    ):
+        """
+        Initialize the worker with its repositories and services.
+
+        Args:
+            work_item_repository: Repository of the work queue
+            article_repository: Repository for checking article state
+            categorization_service: Service for the categorize stage
+            summarization_service: Service for the summarize stage
+            ranking_service: Service for the rank stage
+            worker_id: Unique worker ID (default: hostname and pid)
+            batch_size: Items claimed per batch
+            lease_seconds: Claim lifetime
+            max_attempts: Claims per item before it is marked failed
+        """
+        self._work_items = work_item_repository
+        self._article_repo = article_repository
+        self._worker_id = worker_id or default_worker_id()
+        self._batch_size = max(1, batch_size)
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+
+        self._handlers: Dict[str, Callable[[List[int]], Dict]] = {
+            "categorize": lambda ids: categorization_service.categorize_articles(article_ids=ids),
+            "summarize": lambda ids: summarization_service.summarize_articles(article_ids=ids),
+            "rank": lambda ids: ranking_service.rank_articles_all_exams(article_ids=ids)
+        }
+        self._done_filters = {
+            "categorize": Article.category_id.isnot(None),
+            "summarize": Article.summary.has(),
+            "rank": and_(*[
+                Article.rankings.any(Ranking.exam_type == exam_type)
+                for exam_type in RankingService.EXAM_TYPES
+            ])
+        }
+
+    @property
+    def worker_id(self) -> str:
+        """Get the worker's unique ID."""
+        return self._worker_id
+
+    def enqueue_scraped(self, scraping_service: ScrapingService, hours: int = 24) -> int:
+        """
+        Scrape all sources and queue the new articles for categorization.
+
+        Each source's new articles are queued as soon as they are stored,
+        so categorize workers can start while scraping continues.
+
+        Args:
+            scraping_service: Service for scraping sources
+            hours: Number of hours to look back for content
+
+        Returns:
+            Number of articles queued
+        """
+        queued = 0
+        for article_ids in scraping_service.iter_new_articles(hours=hours):
+            queued += self._work_items.enqueue(self.STAGES[0], article_ids)
+
+        logger.info(f"Queued {queued} scraped articles for {self.STAGES[0]}")
+        return queued
+
+    def run(
+        self,
+        stage: str,
+        max_batches: Optional[int] = None,
+        wait: bool = True,
+        poll_seconds: float = WORK_QUEUE_POLL_SECONDS
+    ) -> Dict[str, int]:
+        """
+        Process batches of a stage until stopped or the queue is drained.
+
+        Args:
+            stage: Stage to work on (one of STAGES)
+            max_batches: Stop after this many batches (default: no limit)
+            wait: Poll for new items when the queue is empty (False stops
+                  the worker instead)
+            poll_seconds: Idle wait between polls
+
+        Returns:
+            Dictionary with statistics:
+            - 'batches': Batches processed
+            - 'claimed': Items claimed
+            - 'completed': Items done (and queued for the next stage)
+            - 'released': Items released for a retry or marked failed
+            - 'expired': Expired claims of other workers released
+
+        Raises:
+            ValueError: If the stage is unknown
+        """
+        self._validate_stage(stage)
+        logger.info(f"Worker {self._worker_id} starting on stage {stage}")
+
+        stats = {'batches': 0, 'claimed': 0, 'completed': 0, 'released': 0, 'expired': 0}
+
+        while max_batches is None or stats['batches'] < max_batches:
+            try:
+                stats['expired'] += self._work_items.release_expired(stage, self._max_attempts)
+                batch_stats = self.process_batch(stage)
+            except Exception as e:
+                # Database trouble: back off and try again
+                logger.error(f"Worker {self._worker_id} failed on stage {stage}: {str(e)}")
+                batch_stats = None
+                if not wait:
+                    break
+
+            if batch_stats is None:
+                if not wait:
+                    break
+                time.sleep(poll_seconds)
+                continue
+
+            stats['batches'] += 1
+            for key in ('claimed', 'completed', 'released'):
+                stats[key] += batch_stats[key]
+
+        logger.info(f"Worker {self._worker_id} stopping on stage {stage}: {stats}")
+        return stats
+
+    def process_batch(self, stage: str) -> Optional[Dict[str, int]]:
+        """
+        Claim and process one batch of a stage.
+
+        Args:
+            stage: Stage to work on (one of STAGES)
+
+        Returns:
+            Dictionary with 'claimed', 'completed' and 'released' counts,
+            or None if there was nothing to claim
+
+        Raises:
+            ValueError: If the stage is unknown
+            RepositoryException: If a queue operation fails
+        """
+        self._validate_stage(stage)
+
+        article_ids = self._work_items.claim(
+            stage, self._worker_id, self._batch_size, self._lease_seconds
+        )
+        if not article_ids:
+            return None
+
+        logger.info(f"Worker {self._worker_id} claimed {len(article_ids)} {stage} items")
+
+        error = None
+        try:
+            self._handlers[stage](article_ids)
+        except Exception as e:
+            error = str(e)
+            logger.error(f"Stage {stage} failed on {len(article_ids)} articles: {error}")
+
+        done_ids = self._article_repo.find_ids_matching(article_ids, [self._done_filters[stage]])
+        failed_ids = [article_id for article_id in article_ids if article_id not in done_ids]
+        next_stage = self.NEXT_STAGE[stage]
+
+        # Completing an item and queueing its next stage happen atomically,
+        # so a crash in between cannot lose an article
+        with UnitOfWork():
+            completed = self._work_items.complete(stage, done_ids, self._worker_id)
+            if next_stage is not None:
+                self._work_items.enqueue(next_stage, done_ids)
+            released = self._work_items.fail(
+                stage, failed_ids, self._worker_id,
+                error or f"No {stage} result stored", self._max_attempts
+            )
+
+        return {'claimed': len(article_ids), 'completed': completed, 'released': released}
+
+    def _validate_stage(self, stage: str) -> None:
+        """
+        Check that a stage is one of STAGES.
+
+        Args:
+            stage: Stage name
+
+        Raises:
+            ValueError: If the stage is unknown
+        """
+        if stage not in self.STAGES:
+            raise ValueError(
+                f"Invalid stage '{stage}'. Must be one of: {', '.join(self.STAGES)}"
+            )
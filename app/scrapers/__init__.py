@@ -10,6 +10,7 @@ from app.scrapers.abstract_scraper import (
     ScrapedContent,
     ScraperException
 )
+from app.scrapers.rate_limiter import HostRateLimiter
 from app.scrapers.youtube_scraper import YouTubeScraper
 from app.scrapers.pib_scraper import PIBScraper
 from app.scrapers.government_schemes_scraper import GovernmentSchemesScraper
@@ -25,6 +26,7 @@ __all__ = [
     'AbstractScraper',
     'ScrapedContent',
     'ScraperException',
+    'HostRateLimiter',
     
     # Concrete scrapers
     'YouTubeScraper',
@@ -0,0 +1,74 @@
+"""
+Per-host rate limiting for scrapers.
+
+This module provides a small thread-safe rate limiter that spaces out
+requests to the same host, so scrapers can fan out across worker threads
+without hammering a single upstream.
+"""
+
+from typing import Dict
+from urllib.parse import urlparse
+import threading
+import time
+
+
+class HostRateLimiter:
+    """
+    Thread-safe limiter enforcing a maximum request rate per host.
+
+    Each call to acquire() reserves the next free time slot for the host
+    and sleeps until that slot arrives. Slots are reserved under a lock but
+    the sleep happens outside it, so workers waiting on one host never
+    block workers talking to another.
+
+    Attributes:
+        _interval (float): Minimum seconds between requests to one host
+        _next_slot (Dict[str, float]): Next free monotonic slot per host
+    """
+
+    def __init__(self, requests_per_second: float):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_second: Maximum requests per second per host
+                                 (0 or less disables limiting)
+        """
+        self._interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def interval(self) -> float:
+        """
+        Get the minimum spacing between requests to one host.
+
+        Returns:
+            Interval in seconds
+        """
+        return self._interval
+
+    def acquire(self, url: str) -> float:
+        """
+        Block until a request to the URL's host is allowed.
+
+        Args:
+            url: Request URL (or bare host name)
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self._interval <= 0:
+            return 0.0
+
+        host = urlparse(url).netloc or url
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self._interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -8,12 +8,15 @@ Transcript API.
 
 from typing import List, Optional
 from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import feedparser
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
 
+from app.config import YOUTUBE_MAX_WORKERS, YOUTUBE_REQUESTS_PER_SECOND
 from app.scrapers.abstract_scraper import AbstractScraper, ScrapedContent, ScraperException
+from app.scrapers.rate_limiter import HostRateLimiter
 
 
 logger = logging.getLogger(__name__)
@@ -29,6 +32,8 @@ class YouTubeScraper(AbstractScraper):
     
     Attributes:
         _channel_ids (List[str]): YouTube channel IDs to scrape (private)
+        _max_workers (int): Concurrent feed/transcript fetches (private)
+        _rate_limiter (HostRateLimiter): Per-host request spacing (private)
     """
     
     # Class constant: Exam preparation channels
@@ -47,12 +52,24 @@ class YouTubeScraper(AbstractScraper):
         "UCawZsQWqfGSbCI5yjkdVkTG",  # Unacademy UPSC
     ]
     
-    def __init__(self, channel_ids: Optional[List[str]] = None):
+    # Transcript requests go to the watch page host
+    TRANSCRIPT_HOST = "www.youtube.com"
+    
+    def __init__(
+        self,
+        channel_ids: Optional[List[str]] = None,
+        max_workers: int = YOUTUBE_MAX_WORKERS,
+        requests_per_second: float = YOUTUBE_REQUESTS_PER_SECOND
+    ):
         """
         Initialize YouTube scraper.
         
         Args:
             channel_ids: Optional list of channel IDs (uses default if None)
+            max_workers: Number of feeds/transcripts fetched concurrently
+                         (1 fetches everything sequentially)
+            requests_per_second: Maximum requests per second per host
+                                 (0 disables rate limiting)
         """
         super().__init__(
             source_name="YouTube Exam Channels",
@@ -60,6 +77,8 @@ class YouTubeScraper(AbstractScraper):
             timeout=30
         )
         self._channel_ids = channel_ids or self.EXAM_CHANNELS
+        self._max_workers = max(1, max_workers)
+        self._rate_limiter = HostRateLimiter(requests_per_second)
     
     def scrape(self, hours: int = 24) -> List[ScrapedContent]:
         """
@@ -77,6 +96,9 @@ class YouTubeScraper(AbstractScraper):
         Raises:
             ScraperException: If scraping fails critically
         """
+        if self._max_workers > 1:
+            return self._scrape_concurrently(hours)
+        
         self._log_scrape_start(hours)
         all_content = []
         
@@ -88,30 +110,11 @@ class YouTubeScraper(AbstractScraper):
                 )
                 
                 for video in videos:
-                    transcript = self._get_transcript(video['video_id'])
-                    if transcript:
-                        content = ScrapedContent(
-                            title=video['title'],
-                            content=transcript,
-                            url=video['url'],
-                            published_at=video['published_at'],
-                            source_type='youtube',
-                            metadata={
-                                'channel_id': channel_id,
-                                'video_id': video['video_id'],
-                                'description': video['description']
-                            }
-                        )
-                        if self.validate_content(content):
-                            all_content.append(content)
-                        else:
-                            logger.warning(
-                                f"Content validation failed for video: {video['title']}"
-                            )
-                    else:
-                        logger.debug(
-                            f"No transcript available for video: {video['title']}"
-                        )
+                    content = self._build_content(
+                        channel_id, video, self._get_transcript(video['video_id'])
+                    )
+                    if content is not None:
+                        all_content.append(content)
             except Exception as e:
                 self._handle_network_error(e)
                 # Continue with next channel instead of failing completely
@@ -120,6 +123,115 @@ class YouTubeScraper(AbstractScraper):
         self._log_scrape_complete(len(all_content))
         return all_content
     
+    def _scrape_concurrently(self, hours: int) -> List[ScrapedContent]:
+        """
+        Scrape all channels with concurrent feed and transcript fetches.
+        
+        Fans out in two phases on a shared thread pool: first every channel's
+        RSS feed, then the transcript of every recent video. All requests go
+        through the per-host rate limiter, so adding channels increases
+        parallelism without exceeding the configured request rate. Results
+        keep the channel and feed order of the sequential path.
+        
+        Args:
+            hours: Number of hours to look back
+            
+        Returns:
+            List of scraped video transcripts
+        """
+        self._log_scrape_start(hours)
+        
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="youtube"
+        ) as executor:
+            # Phase 1: channel feeds
+            feed_futures = [
+                (channel_id, executor.submit(self._get_recent_videos, channel_id, hours))
+                for channel_id in self._channel_ids
+            ]
+            
+            channel_videos = []
+            for channel_id, future in feed_futures:
+                try:
+                    videos = future.result()
+                except Exception as e:
+                    # Continue with other channels instead of failing completely
+                    logger.error(
+                        f"Failed to fetch feed for channel {channel_id}: {str(e)}"
+                    )
+                    continue
+                
+                logger.info(
+                    f"Found {len(videos)} recent videos for channel {channel_id}"
+                )
+                channel_videos.extend((channel_id, video) for video in videos)
+            
+            # Phase 2: transcripts
+            transcript_futures = [
+                (channel_id, video, executor.submit(self._get_transcript, video['video_id']))
+                for channel_id, video in channel_videos
+            ]
+            
+            all_content = []
+            for channel_id, video, future in transcript_futures:
+                try:
+                    content = self._build_content(channel_id, video, future.result())
+                except Exception as e:
+                    # Skip this video instead of discarding every channel's results
+                    logger.error(f"Failed to process video {video.get('url')}: {str(e)}")
+                    continue
+                if content is not None:
+                    all_content.append(content)
+        
+        self._log_scrape_complete(len(all_content))
+        return all_content
+    
+    def _build_content(
+        self,
+        channel_id: str,
+        video: dict,
+        transcript: Optional[str]
+    ) -> Optional[ScrapedContent]:
+        """
+        Build validated ScrapedContent for a video and its transcript.
+        
+        Args:
+            channel_id: Channel the video belongs to
+            video: Video metadata dictionary from the RSS feed
+            transcript: Transcript text, or None if unavailable
+            
+        Returns:
+            ScrapedContent, or None if no transcript or validation fails
+            (e.g. an empty title), so one bad video never fails the scrape
+        """
+        if not transcript:
+            logger.debug(f"No transcript available for video: {video['title']}")
+            return None
+        
+        try:
+            content = ScrapedContent(
+                title=video['title'],
+                content=transcript,
+                url=video['url'],
+                published_at=video['published_at'],
+                source_type='youtube',
+                metadata={
+                    'channel_id': channel_id,
+                    'video_id': video['video_id'],
+                    'description': video['description']
+                }
+            )
+        except Exception as e:
+            logger.error(f"Skipping invalid video {video.get('url')}: {str(e)}")
+            return None
+        
+        if not self.validate_content(content):
+            logger.warning(f"Content validation failed for video: {video['title']}")
+            return None
+        
+        return content
+    
     def _get_recent_videos(
         self, 
         channel_id: str, 
@@ -142,6 +254,7 @@ class YouTubeScraper(AbstractScraper):
             Exception: If RSS feed cannot be fetched
         """
         rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+        self._rate_limiter.acquire(rss_url)
         feed = feedparser.parse(rss_url)
         
         if feed.bozo:
@@ -203,6 +316,8 @@ class YouTubeScraper(AbstractScraper):
             Transcript text or None if unavailable
         """
         try:
+            self._rate_limiter.acquire(self.TRANSCRIPT_HOST)
+            
             # Fetch transcript (prefers English, falls back to auto-generated)
             transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
             
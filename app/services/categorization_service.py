@@ -10,15 +10,21 @@ Demonstrates:
 - Error handling and logging
 """
 
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
+import asyncio
 import logging
 import json
 
+from sqlalchemy.orm import joinedload
+from app.config import CATEGORIZATION_BATCH_SIZE, GEMINI_MAX_CONCURRENCY
 from app.agent.categorization_agent import CategorizationAgent, CategoryResult
 from app.agent.abstract_agent import AgentException
 from app.database.repositories.article_repository import ArticleRepository
 from app.database.repositories.category_repository import CategoryRepository
+from app.database.repositories.base_repository import RepositoryException
+from app.database.repositories.unit_of_work import UnitOfWork
 from app.database.models import Article
+from app.services.local_classifier import LocalCategoryClassifier, article_text
 
 
 logger = logging.getLogger(__name__)
@@ -40,13 +46,21 @@ class CategorizationService:
         _categorization_agent (CategorizationAgent): Agent for AI categorization
         _article_repo (ArticleRepository): Repository for article persistence
         _category_repo (CategoryRepository): Repository for category lookup
+        _batch_size (int): Articles sent to the agent per API call
+        _max_in_flight (int): Concurrent agent calls (1 = sequential)
+        _category_ids (Dict[str, int]): Category IDs resolved so far, by name
+        _local_classifier (Optional[LocalCategoryClassifier]): Answers
+            confident articles without an API call
     """
     
     def __init__(
         self,
         categorization_agent: CategorizationAgent,
         article_repository: ArticleRepository,
-        category_repository: CategoryRepository
+        category_repository: CategoryRepository,
+        batch_size: int = CATEGORIZATION_BATCH_SIZE,
+        max_in_flight: int = GEMINI_MAX_CONCURRENCY,
+        local_classifier: Optional[LocalCategoryClassifier] = None
     ):
         """
         Initialize the categorization service with dependencies.
@@ -58,31 +72,63 @@ class CategorizationService:
             categorization_agent: Agent for AI-powered categorization
             article_repository: Repository for article data access
             category_repository: Repository for category data access
+            batch_size: Articles categorized per API call (1 disables batching)
+            max_in_flight: Batches categorized concurrently (1 = sequential)
+            local_classifier: Calibrated local model that categorizes the
+                              articles it is confident about (optional)
         """
         self._categorization_agent = categorization_agent
         self._article_repo = article_repository
         self._category_repo = category_repository
+        self._batch_size = max(1, batch_size)
+        self._max_in_flight = max(1, max_in_flight)
+        self._category_ids: Dict[str, int] = {}
+        self._local_classifier = local_classifier
         logger.info("CategorizationService initialized")
     
     def categorize_articles(
         self,
         article_ids: Optional[List[int]] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        on_progress: Optional[Callable[[List[int]], None]] = None
     ) -> Dict[str, int]:
         """
         Categorize multiple articles in batch.
         
         If article_ids is provided, categorizes those specific articles.
-        Otherwise, categorizes uncategorized articles (category_id is None).
+        Otherwise, categorizes uncategorized articles (category_id is None)
+        except near-duplicates, which summarization and ranking then skip
+        as well.
+        
+        Articles are sent to the agent in batches of batch_size per API
+        call (see CategorizationAgent.execute_batch), so API round-trips
+        and prompt overhead drop roughly by the batch factor. With
+        max_in_flight > 1, up to that many batches are categorized at once
+        on the async agent path, which stays under the Gemini request quota
+        via the shared request limiter. Must not be called from a running
+        event loop in that case. Both paths use the same retry policy:
+        single-article calls are retried on transient errors
+        (execute_with_fallback), batch calls retry only the entries that
+        failed validation.
+        
+        With a local classifier, each page of articles is classified on
+        the CPU first; articles whose calibrated confidence reaches the
+        classifier's threshold are categorized from its prediction, and
+        only the others are sent to the agent.
         
         Args:
             article_ids: Optional list of specific article IDs to categorize
             limit: Maximum number of articles to process (optional)
+            on_progress: Called with the IDs of the articles of each batch
+                         whose categorization was stored (e.g. to checkpoint
+                         a pipeline run)
             
         Returns:
             Dictionary with statistics:
             - 'total_processed': Total articles processed
             - 'successfully_categorized': Articles successfully categorized
+            - 'locally_categorized': Of those, articles categorized by the
+              local classifier
             - 'failed': Articles that failed categorization
             
         Example:
@@ -92,87 +138,348 @@ class CategorizationService:
         """
         logger.info("Starting batch categorization")
         
-        # Get articles to categorize
+        stats = {
+            'total_processed': 0,
+            'successfully_categorized': 0,
+            'locally_categorized': 0,
+            'failed': 0
+        }
+        
+        # Get articles to categorize: the given IDs, or else uncategorized
+        # articles (newest first) that are not near-duplicates of another
+        # article. Either way they are streamed one page at a time with
+        # their source, so memory stays flat however large the backlog is
         if article_ids:
-            articles = [
-                self._article_repo.find_by_id(article_id)
-                for article_id in article_ids
-            ]
-            articles = [a for a in articles if a is not None]
+            filters = [Article.id.in_(article_ids)]
         else:
-            articles = self._article_repo.find_uncategorized(limit=limit)
+            filters = [
+                Article.category_id.is_(None),
+                Article.canonical_article_id.is_(None)
+            ]
         
-        logger.info(f"Found {len(articles)} articles to categorize")
+        chunks = self._article_repo.iter_batches(
+            filters=filters,
+            options=[joinedload(Article.source)],
+            limit=limit,
+            descending=True
+        )
         
+        for articles in chunks:
+            if self._local_classifier is not None:
+                articles, local_stats = self._categorize_locally(articles, on_progress)
+                for key in local_stats:
+                    stats[key] += local_stats[key]
+                if not articles:
+                    continue
+            
+            batches = [
+                articles[start:start + self._batch_size]
+                for start in range(0, len(articles), self._batch_size)
+            ]
+            
+            if self._max_in_flight > 1 and len(batches) > 1:
+                chunk_stats = asyncio.run(
+                    self._categorize_concurrently(batches, len(articles), on_progress)
+                )
+            else:
+                chunk_stats = self._categorize_sequentially(batches, len(articles), on_progress)
+            
+            for key in chunk_stats:
+                stats[key] += chunk_stats[key]
+        
+        logger.info(f"Categorization complete: {stats}")
+        return stats
+    
+    def _categorize_locally(
+        self,
+        articles: List[Article],
+        on_progress: Optional[Callable[[List[int]], None]] = None
+    ) -> Tuple[List[Article], Dict[str, int]]:
+        """
+        Categorize the articles the local classifier is confident about.
+        
+        Args:
+            articles: Articles to categorize
+            on_progress: Called with the IDs categorized locally
+            
+        Returns:
+            Tuple of (articles left for the agent, statistics in the format
+            of categorize_articles)
+        """
+        predictions = self._local_classifier.predict(
+            [article_text(article.title, article.content) for article in articles]
+        )
+        
+        confident = []
+        remaining = []
+        results: Dict[int, CategoryResult] = {}
+        for article, prediction in zip(articles, predictions):
+            if not prediction.confident:
+                remaining.append(article)
+                continue
+            
+            confident.append(article)
+            results[article.id] = CategoryResult(
+                primary_category=prediction.category,
+                confidence=prediction.confidence,
+                reasoning=(
+                    f"Local classifier prediction (confidence {prediction.confidence:.2f}, "
+                    f"threshold {self._local_classifier.threshold:.2f})"
+                )
+            )
+        
+        categorized_ids, failed = [], 0
+        if confident:
+            categorized_ids, failed = self._apply_batch_results(confident, results, method="local")
+            if on_progress is not None and categorized_ids:
+                on_progress(categorized_ids)
+        
+        logger.info(
+            f"Local classifier categorized {len(categorized_ids)} of {len(articles)} articles"
+        )
+        return remaining, {
+            'total_processed': len(confident),
+            'successfully_categorized': len(categorized_ids),
+            'locally_categorized': len(categorized_ids),
+            'failed': failed
+        }
+    
+    def _categorize_sequentially(
+        self,
+        batches: List[List[Article]],
+        total: int,
+        on_progress: Optional[Callable[[List[int]], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Categorize batches one agent call at a time.
+        
+        Args:
+            batches: Article batches (one agent call each)
+            total: Total number of articles, for progress logging
+            on_progress: Called with the IDs categorized in each batch
+            
+        Returns:
+            Dictionary with statistics (same format as categorize_articles)
+        """
         # Statistics tracking
         total_processed = 0
         successfully_categorized = 0
         failed = 0
         
-        # Categorize each article
-        for article in articles:
-            try:
-                self._categorize_article(article)
-                successfully_categorized += 1
-                total_processed += 1
-                
-                if total_processed % 10 == 0:
-                    logger.info(f"Progress: {total_processed}/{len(articles)} articles")
-                    
-            except Exception as e:
-                failed += 1
-                total_processed += 1
-                logger.error(
-                    f"Failed to categorize article {article.id}: {str(e)}",
-                    exc_info=True
-                )
-                # Continue with other articles even if one fails
-                continue
+        # Categorize articles batch by batch
+        for batch in batches:
+            if len(batch) == 1:
+                results = self._categorize_single(batch[0])
+            else:
+                try:
+                    results = self._categorization_agent.execute_batch(
+                        [self._build_agent_input(article) for article in batch]
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Batch categorization failed for {len(batch)} articles: {str(e)}",
+                        exc_info=True
+                    )
+                    results = {}
+            
+            categorized_ids, batch_failed = self._apply_batch_results(batch, results)
+            total_processed += len(batch)
+            successfully_categorized += len(categorized_ids)
+            failed += batch_failed
+            
+            if on_progress is not None and categorized_ids:
+                on_progress(categorized_ids)
+            
+            logger.info(f"Progress: {total_processed}/{total} articles")
         
         # Return statistics
-        stats = {
+        return {
             'total_processed': total_processed,
             'successfully_categorized': successfully_categorized,
             'failed': failed
         }
+    
+    async def _categorize_concurrently(
+        self,
+        batches: List[List[Article]],
+        total: int,
+        on_progress: Optional[Callable[[List[int]], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Categorize batches with up to max_in_flight agent calls in flight.
         
-        logger.info(f"Categorization complete: {stats}")
-        return stats
+        Results are applied one batch at a time as they complete; the
+        database writes run in a worker thread so they don't stall the
+        event loop.
+        
+        Args:
+            batches: Article batches (one agent call each)
+            total: Total number of articles, for progress logging
+            on_progress: Called with the IDs categorized in each batch
+            
+        Returns:
+            Dictionary with statistics (same format as categorize_articles)
+        """
+        total_processed = 0
+        successfully_categorized = 0
+        failed = 0
+        
+        semaphore = asyncio.Semaphore(self._max_in_flight)
+        
+        async def categorize(batch: List[Article]) -> Tuple[List[Article], Dict[int, CategoryResult]]:
+            async with semaphore:
+                try:
+                    if len(batch) == 1:
+                        result = await self._categorization_agent.execute_with_fallback_async(
+                            self._build_agent_input(batch[0])
+                        )
+                        return batch, {batch[0].id: result}
+                    
+                    results = await self._categorization_agent.execute_batch_async(
+                        [self._build_agent_input(article) for article in batch]
+                    )
+                    return batch, results
+                except Exception as e:
+                    logger.error(
+                        f"Categorization failed for {len(batch)} articles: {str(e)}"
+                    )
+                    return batch, {}
+        
+        for next_done in asyncio.as_completed([categorize(batch) for batch in batches]):
+            batch, results = await next_done
+            
+            categorized_ids, batch_failed = await asyncio.to_thread(
+                self._apply_batch_results, batch, results
+            )
+            total_processed += len(batch)
+            successfully_categorized += len(categorized_ids)
+            failed += batch_failed
+            
+            if on_progress is not None and categorized_ids:
+                await asyncio.to_thread(on_progress, categorized_ids)
+            
+            logger.info(f"Progress: {total_processed}/{total} articles")
+        
+        return {
+            'total_processed': total_processed,
+            'successfully_categorized': successfully_categorized,
+            'failed': failed
+        }
     
-    def _categorize_article(self, article: Article) -> None:
+    def _apply_batch_results(
+        self,
+        batch: List[Article],
+        results: Dict[int, CategoryResult],
+        method: str = "llm"
+    ) -> Tuple[List[int], int]:
         """
-        Categorize a single article and update the database.
+        Store the categorization results of one batch.
         
-        Calls the CategorizationAgent to classify the article,
-        then updates the article's category_id and secondary_categories.
+        All updates of the batch share one UnitOfWork, so the batch costs
+        a single transaction instead of one session per article.
+        
+        Args:
+            batch: Articles in the batch
+            results: Agent results by article id (missing = failed)
+            method: How the results were obtained ("llm" or "local")
+            
+        Returns:
+            Tuple of (IDs of the articles categorized, articles failed)
+        """
+        categorized_ids = []
+        failed = 0
+        
+        try:
+            with UnitOfWork():
+                for article in batch:
+                    result = results.get(article.id)
+                    
+                    if result is None:
+                        failed += 1
+                        logger.error(f"Failed to categorize article {article.id}")
+                        continue
+                    
+                    try:
+                        self.apply_categorization(article, result, method)
+                        categorized_ids.append(article.id)
+                    except Exception as e:
+                        failed += 1
+                        logger.error(
+                            f"Failed to categorize article {article.id}: {str(e)}",
+                            exc_info=True
+                        )
+                        # Continue with other articles even if one fails
+                        continue
+        except RepositoryException as e:
+            logger.error(
+                f"Failed to store categorization batch of {len(batch)} articles: {str(e)}"
+            )
+            return [], len(batch)
+        
+        return categorized_ids, failed
+    
+    def _categorize_single(self, article: Article) -> Dict[int, CategoryResult]:
+        """
+        Categorize one article with the single-article prompt.
         
         Args:
             article: The article entity to categorize
             
-        Raises:
-            AgentException: If categorization fails
-            Exception: If database update fails
+        Returns:
+            Dictionary mapping the article id to its result, or empty on failure
         """
-        logger.debug(f"Categorizing article {article.id}: {article.title[:50]}...")
+        try:
+            result = self._categorization_agent.execute_with_fallback(
+                self._build_agent_input(article)
+            )
+        except Exception as e:
+            logger.error(f"Agent failed for article {article.id}: {str(e)}")
+            return {}
         
-        # Prepare input for agent
-        input_data = {
+        return {article.id: result}
+    
+    def _build_agent_input(self, article: Article) -> dict:
+        """
+        Build the CategorizationAgent input for an article.
+        
+        Args:
+            article: The article entity to categorize
+            
+        Returns:
+            Agent input dictionary (id, title, content, source_type)
+        """
+        return {
+            'id': article.id,
             'title': article.title,
             'content': article.content,
             'source_type': article.source.source_type.value if article.source else 'unknown'
         }
+    
+    def apply_categorization(
+        self,
+        article: Article,
+        result: CategoryResult,
+        method: str = "llm"
+    ) -> None:
+        """
+        Store a categorization result on an article and update the database.
         
-        # Call categorization agent
-        try:
-            result: CategoryResult = self._categorization_agent.execute(input_data)
-        except AgentException as e:
-            logger.error(f"Agent failed for article {article.id}: {str(e)}")
-            raise
+        Updates the article's category_id and secondary_categories and
+        records confidence, reasoning and method in its metadata. The
+        method keeps local predictions out of the local classifier's
+        training data.
         
+        Args:
+            article: The article entity that was categorized
+            result: Categorization result from the agent
+            method: How the result was obtained ("llm" or "local")
+            
+        Raises:
+            ValueError: If the primary category is not in the database
+            Exception: If database update fails
+        """
         # Get category ID for primary category
-        primary_category_id = self._category_repo.get_category_id_by_name(
-            result.primary_category
-        )
+        primary_category_id = self._get_category_id(result.primary_category)
         
         if primary_category_id is None:
             raise ValueError(
@@ -190,9 +497,9 @@ class CategorizationService:
         
         # Store categorization metadata (confidence, reasoning)
         metadata = {}
-        if article.metadata:
+        if article.article_metadata:
             try:
-                metadata = json.loads(article.metadata)
+                metadata = json.loads(article.article_metadata)
             except json.JSONDecodeError:
                 metadata = {}
         
@@ -200,10 +507,11 @@ class CategorizationService:
             'confidence': result.confidence,
             'reasoning': result.reasoning,
             'primary_category': result.primary_category,
-            'secondary_categories': result.secondary_categories
+            'secondary_categories': result.secondary_categories,
+            'method': method
         }
         
-        article.metadata = json.dumps(metadata)
+        article.article_metadata = json.dumps(metadata)
         
         # Update in database
         self._article_repo.update(article)
@@ -213,6 +521,27 @@ class CategorizationService:
             f"(confidence: {result.confidence:.2f})"
         )
     
+    def _get_category_id(self, name: str) -> Optional[int]:
+        """
+        Resolve a category name to its ID, caching found categories.
+        
+        Categories are static reference data, so each name is looked up
+        at most once per service instance.
+        
+        Args:
+            name: Category name
+            
+        Returns:
+            The category ID, or None if not found
+        """
+        if name not in self._category_ids:
+            category_id = self._category_repo.get_category_id_by_name(name)
+            if category_id is None:
+                return None
+            self._category_ids[name] = category_id
+        
+        return self._category_ids[name]
+    
     def categorize_single_article(self, article_id: int) -> CategoryResult:
         """
         Categorize a single article by ID.
@@ -236,52 +565,11 @@ class CategorizationService:
         
         logger.info(f"Categorizing single article: {article.id}")
         
-        # Prepare input
-        input_data = {
-            'title': article.title,
-            'content': article.content,
-            'source_type': article.source.source_type.value if article.source else 'unknown'
-        }
-        
         # Call agent
-        result = self._categorization_agent.execute(input_data)
+        result = self._categorization_agent.execute(self._build_agent_input(article))
         
         # Update article
-        primary_category_id = self._category_repo.get_category_id_by_name(
-            result.primary_category
-        )
-        
-        if primary_category_id is None:
-            raise ValueError(
-                f"Category '{result.primary_category}' not found in database"
-            )
-        
-        article.category_id = primary_category_id
-        
-        if result.secondary_categories:
-            article.secondary_categories = ','.join(result.secondary_categories)
-        else:
-            article.secondary_categories = None
-        
-        # Store metadata
-        metadata = {}
-        if article.metadata:
-            try:
-                metadata = json.loads(article.metadata)
-            except json.JSONDecodeError:
-                metadata = {}
-        
-        metadata['categorization'] = {
-            'confidence': result.confidence,
-            'reasoning': result.reasoning,
-            'primary_category': result.primary_category,
-            'secondary_categories': result.secondary_categories
-        }
-        
-        article.metadata = json.dumps(metadata)
-        
-        # Update in database
-        self._article_repo.update(article)
+        self.apply_categorization(article, result)
         
         logger.info(
             f"Article {article.id} categorized as {result.primary_category}"
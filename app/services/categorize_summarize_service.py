@@ -0,0 +1,291 @@
+"""
+Categorize-Summarize Service for fused article analysis.
+
+This module implements the Service Layer Pattern for categorizing and
+summarizing articles with one CategorizeSummarizeAgent call each, and
+storing both results through the categorization and summarization
+services.
+
+Demonstrates:
+- Service Layer Pattern (business logic coordination)
+- Dependency Injection (depends on abstractions)
+- Error handling and logging
+"""
+
+from typing import Callable, List, Dict, Optional, Tuple
+import asyncio
+import logging
+
+from sqlalchemy.orm import joinedload
+from app.config import GEMINI_MAX_CONCURRENCY
+from app.agent.categorize_summarize_agent import (
+    CategorizeSummarizeAgent,
+    CategorizeSummarizeResult
+)
+from app.database.repositories.article_repository import ArticleRepository
+from app.database.repositories.unit_of_work import UnitOfWork
+from app.database.models import Article
+from app.services.categorization_service import CategorizationService
+from app.services.summarization_service import SummarizationService
+
+
+logger = logging.getLogger(__name__)
+
+
+class CategorizeSummarizeService:
+    """
+    Service for categorizing and summarizing articles in one pass.
+
+    Replaces a categorization pass followed by a summarization pass: each
+    article costs one agent call, and its category and summary are stored
+    in one transaction, so an article is either fully analyzed or left for
+    the next run.
+
+    Demonstrates:
+    - Dependency Inversion Principle (depends on abstractions: agent, services)
+    - Single Responsibility Principle (only handles fused orchestration)
+    - Error handling for production readiness
+
+    Attributes:
+        _agent (CategorizeSummarizeAgent): Agent for fused analysis
+        _article_repo (ArticleRepository): Repository for article data access
+        _categorization_service (CategorizationService): Stores categories
+        _summarization_service (SummarizationService): Stores summaries
+        _max_in_flight (int): Concurrent agent calls (1 = sequential)
+    """
+
+    def __init__(
+        self,
+        categorize_summarize_agent: CategorizeSummarizeAgent,
+        article_repository: ArticleRepository,
+        categorization_service: CategorizationService,
+        summarization_service: SummarizationService,
+        max_in_flight: int = GEMINI_MAX_CONCURRENCY
+    ):
+        """
+        Initialize the categorize-summarize service with dependencies.
+
+        Args:
+            categorize_summarize_agent: Agent for fused analysis
+            article_repository: Repository for article data access
+            categorization_service: Service storing categorization results
+            summarization_service: Service storing summaries
+            max_in_flight: Articles analyzed concurrently (1 = sequential)
+        """
+        self._agent = categorize_summarize_agent
+        self._article_repo = article_repository
+        self._categorization_service = categorization_service
+        self._summarization_service = summarization_service
+        self._max_in_flight = max(1, max_in_flight)
+        logger.info("CategorizeSummarizeService initialized")
+
+    def categorize_and_summarize(
+        self,
+        article_ids: Optional[List[int]] = None,
+        limit: Optional[int] = None,
+        on_progress: Optional[Callable[[List[int]], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Categorize and summarize multiple articles.
+
+        If article_ids is provided, analyzes those specific articles.
+        Otherwise, analyzes the articles CategorizationService would
+        categorize: uncategorized articles that are not near-duplicates.
+        Articles are streamed from the database in pages.
+
+        With max_in_flight > 1, up to that many articles are analyzed at
+        once on the async agent path. Must not be called from a running
+        event loop in that case.
+
+        Args:
+            article_ids: Optional list of specific article IDs to analyze
+            limit: Maximum number of articles to process (optional)
+            on_progress: Called with [article_id] after each article's
+                         category and summary are stored
+
+        Returns:
+            Dictionary with statistics:
+            - 'total_processed': Total articles processed
+            - 'successfully_processed': Articles categorized and summarized
+            - 'failed': Articles that failed
+
+        Example:
+            >>> service = CategorizeSummarizeService(agent, article_repo, cat_service, sum_service)
+            >>> stats = service.categorize_and_summarize(limit=100)
+            >>> print(f"Analyzed {stats['successfully_processed']} articles")
+        """
+        logger.info("Starting fused categorization and summarization")
+
+        stats = {
+            'total_processed': 0,
+            'successfully_processed': 0,
+            'failed': 0
+        }
+
+        if article_ids:
+            filters = [Article.id.in_(article_ids)]
+        else:
+            filters = [
+                Article.category_id.is_(None),
+                Article.canonical_article_id.is_(None)
+            ]
+
+        batches = self._article_repo.iter_batches(
+            filters=filters,
+            options=[joinedload(Article.source)],
+            limit=limit,
+            descending=True
+        )
+
+        for articles in batches:
+            if self._max_in_flight > 1 and len(articles) > 1:
+                batch_stats = asyncio.run(self._analyze_concurrently(articles, on_progress))
+            else:
+                batch_stats = self._analyze_sequentially(articles, on_progress)
+
+            for key in stats:
+                stats[key] += batch_stats[key]
+
+        logger.info(f"Fused categorization and summarization complete: {stats}")
+        return stats
+
+    def _analyze_sequentially(
+        self,
+        articles: List[Article],
+        on_progress: Optional[Callable[[List[int]], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Analyze articles one at a time.
+
+        Args:
+            articles: Articles to analyze
+            on_progress: Called with [article_id] after each stored result
+
+        Returns:
+            Dictionary with statistics (same format as categorize_and_summarize)
+        """
+        total_processed = 0
+        successfully_processed = 0
+        failed = 0
+
+        for article in articles:
+            total_processed += 1
+            try:
+                result = self._agent.execute_with_fallback(self._build_agent_input(article))
+                self._store_result(article, result)
+                successfully_processed += 1
+
+                if on_progress is not None:
+                    on_progress([article.id])
+            except Exception as e:
+                failed += 1
+                logger.error(
+                    f"Failed to categorize and summarize article {article.id}: {str(e)}",
+                    exc_info=True
+                )
+
+            if total_processed % 10 == 0:
+                logger.info(f"Progress: {total_processed}/{len(articles)} articles")
+
+        return {
+            'total_processed': total_processed,
+            'successfully_processed': successfully_processed,
+            'failed': failed
+        }
+
+    async def _analyze_concurrently(
+        self,
+        articles: List[Article],
+        on_progress: Optional[Callable[[List[int]], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Analyze articles with up to max_in_flight agent calls in flight.
+
+        Results are stored one at a time as they complete; the database
+        writes run in a worker thread so they don't stall the event loop.
+
+        Args:
+            articles: Articles to analyze
+            on_progress: Called with [article_id] after each stored result
+
+        Returns:
+            Dictionary with statistics (same format as categorize_and_summarize)
+        """
+        total_processed = 0
+        successfully_processed = 0
+        failed = 0
+
+        semaphore = asyncio.Semaphore(self._max_in_flight)
+
+        async def analyze(
+            article: Article
+        ) -> Tuple[Article, Optional[CategorizeSummarizeResult], Optional[Exception]]:
+            async with semaphore:
+                try:
+                    result = await self._agent.execute_with_fallback_async(
+                        self._build_agent_input(article)
+                    )
+                    return article, result, None
+                except Exception as e:
+                    return article, None, e
+
+        for next_done in asyncio.as_completed([analyze(article) for article in articles]):
+            article, result, error = await next_done
+            total_processed += 1
+
+            if error is None:
+                try:
+                    await asyncio.to_thread(self._store_result, article, result)
+                    successfully_processed += 1
+                    if on_progress is not None:
+                        await asyncio.to_thread(on_progress, [article.id])
+                except Exception as e:
+                    error = e
+
+            if error is not None:
+                failed += 1
+                logger.error(
+                    f"Failed to categorize and summarize article {article.id}: {str(error)}"
+                )
+
+            if total_processed % 10 == 0:
+                logger.info(f"Progress: {total_processed}/{len(articles)} articles")
+
+        return {
+            'total_processed': total_processed,
+            'successfully_processed': successfully_processed,
+            'failed': failed
+        }
+
+    def _build_agent_input(self, article: Article) -> dict:
+        """
+        Build the CategorizeSummarizeAgent input for an article.
+
+        Args:
+            article: The article entity to analyze
+
+        Returns:
+            Agent input dictionary (id, title, content, source_type)
+        """
+        return {
+            'id': article.id,
+            'title': article.title,
+            'content': article.content,
+            'source_type': article.source.source_type.value if article.source else 'unknown'
+        }
+
+    def _store_result(self, article: Article, result: CategorizeSummarizeResult) -> None:
+        """
+        Store an article's category and summary in one transaction.
+
+        Args:
+            article: The analyzed article entity
+            result: Fused result from the agent
+
+        Raises:
+            ValueError: If the primary category is not in the database
+            Exception: If database operation fails
+        """
+        with UnitOfWork():
+            self._categorization_service.apply_categorization(article, result.category)
+            self._summarization_service.store_summary(article, result.summary)
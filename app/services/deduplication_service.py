@@ -0,0 +1,222 @@
+"""
+Deduplication Service for near-duplicate detection at ingestion.
+
+This module implements the Service Layer Pattern for finding articles
+that repeat an already stored article with different wording or URL (a
+PIB release re-published on a schemes portal, a transcript uploaded
+twice) and linking them to that canonical article, so only the canonical
+copy is categorized, summarized, ranked and put in the digest.
+
+Demonstrates:
+- Service Layer Pattern (business logic coordination)
+- Dependency Injection (depends on abstractions)
+- Locality-sensitive hashing for sub-quadratic similarity search
+"""
+
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+
+from app.config import (
+    NEAR_DUP_BANDS,
+    NEAR_DUP_LOOKBACK_DAYS,
+    NEAR_DUP_NUM_PERM,
+    NEAR_DUP_SHINGLE_SIZE,
+    NEAR_DUP_THRESHOLD
+)
+from app.database.models import Article
+from app.database.repositories.article_repository import ArticleRepository
+from app.database.repositories.article_signature_repository import ArticleSignatureRepository
+from app.database.repositories.unit_of_work import UnitOfWork
+from app.services.minhash import MinHasher
+
+
+logger = logging.getLogger(__name__)
+
+
+class DeduplicationService:
+    """
+    Service for linking newly stored articles to their near-duplicates.
+
+    Each new article gets a MinHash signature of its title and content,
+    persisted with its LSH band keys. Stored articles sharing a band are
+    candidates; a candidate whose estimated Jaccard similarity reaches the
+    threshold makes the new article a duplicate, linked to the candidate's
+    canonical article. New articles are checked in ID order against stored
+    articles and against each other, so the first copy stays canonical.
+
+    Demonstrates:
+    - Dependency Inversion Principle (depends on abstractions: repositories)
+    - Single Responsibility Principle (only handles duplicate detection)
+
+    Attributes:
+        _article_repo (ArticleRepository): Repository for articles and links
+        _signature_repo (ArticleSignatureRepository): Repository for signatures
+        _hasher (MinHasher): Signature and band key calculator
+        _threshold (float): Minimum estimated similarity of a duplicate
+        _lookback_days (int): Age limit of candidate articles (0 = none)
+    """
+
+    def __init__(
+        self,
+        article_repository: ArticleRepository,
+        signature_repository: ArticleSignatureRepository,
+        hasher: Optional[MinHasher] = None,
+        threshold: float = NEAR_DUP_THRESHOLD,
+        lookback_days: int = NEAR_DUP_LOOKBACK_DAYS
+    ):
+        """
+        Initialize the deduplication service with dependencies.
+
+        Args:
+            article_repository: Repository for article data access
+            signature_repository: Repository for signature data access
+            hasher: MinHash calculator (default: configured NEAR_DUP_* settings)
+            threshold: Minimum estimated Jaccard similarity of a duplicate
+            lookback_days: Only match articles published this many days
+                           before the new ones (0 matches all)
+        """
+        self._article_repo = article_repository
+        self._signature_repo = signature_repository
+        self._hasher = hasher or MinHasher(
+            num_perm=NEAR_DUP_NUM_PERM,
+            bands=NEAR_DUP_BANDS,
+            shingle_size=NEAR_DUP_SHINGLE_SIZE
+        )
+        self._threshold = threshold
+        self._lookback_days = lookback_days
+        logger.info("DeduplicationService initialized")
+
+    def detect_duplicates(self, article_ids: List[int]) -> Dict[int, int]:
+        """
+        Sign newly stored articles and link their near-duplicates.
+
+        Candidate search is one indexed band lookup for the whole batch;
+        the signatures and duplicate links are written in one transaction.
+
+        Args:
+            article_ids: IDs of the newly stored articles
+
+        Returns:
+            Dictionary mapping each duplicate's ID to its canonical article ID
+
+        Raises:
+            RepositoryException: If loading or storing fails
+
+        Example:
+            >>> service = DeduplicationService(article_repo, signature_repo)
+            >>> duplicates = service.detect_duplicates(upsert_result.inserted_ids)
+            >>> new_ids = [i for i in upsert_result.inserted_ids if i not in duplicates]
+        """
+        signed = self._sign_articles(article_ids)
+        if not signed:
+            return {}
+
+        since = None
+        if self._lookback_days > 0:
+            since = min(published_at for _, published_at, _, _ in signed) - timedelta(
+                days=self._lookback_days
+            )
+
+        # Band key -> (article ID, canonical ID, signature) of stored articles,
+        # extended with each new article once it has been checked
+        band_index: Dict[int, List[Tuple[int, Optional[int], np.ndarray]]] = {}
+        for match in self._signature_repo.find_band_matches(
+            (band_hash for _, _, _, bands in signed for band_hash in bands),
+            published_since=since,
+            exclude_ids=article_ids
+        ):
+            entry = (
+                match.article_id,
+                match.canonical_article_id,
+                MinHasher.from_bytes(match.signature)
+            )
+            for band_hash in match.band_hashes:
+                band_index.setdefault(band_hash, []).append(entry)
+
+        canonical_ids: Dict[int, int] = {}
+        for article_id, _, signature, bands in signed:
+            canonical_id = self._find_canonical(signature, bands, band_index)
+            if canonical_id is not None:
+                canonical_ids[article_id] = canonical_id
+
+            entry = (article_id, canonical_ids.get(article_id), signature)
+            for band_hash in bands:
+                band_index.setdefault(band_hash, []).append(entry)
+
+        with UnitOfWork():
+            self._signature_repo.save_signatures({
+                article_id: (MinHasher.to_bytes(signature), bands)
+                for article_id, _, signature, bands in signed
+            })
+            self._article_repo.link_duplicates(canonical_ids)
+
+        logger.info(
+            f"Signed {len(signed)} articles, linked {len(canonical_ids)} near-duplicates"
+        )
+        return canonical_ids
+
+    def _sign_articles(self, article_ids: List[int]) -> List[tuple]:
+        """
+        Compute signatures and band keys of articles.
+
+        Args:
+            article_ids: Article IDs
+
+        Returns:
+            (article ID, published_at, signature, band keys) tuples in ID order
+        """
+        if not article_ids:
+            return []
+
+        signed = []
+        for articles in self._article_repo.iter_batches(
+            filters=[Article.id.in_(article_ids)],
+            columns=["title", "content", "published_at"]
+        ):
+            for article in articles:
+                signature = self._hasher.signature(f"{article.title}\n{article.content}")
+                signed.append((
+                    article.id,
+                    article.published_at,
+                    signature,
+                    self._hasher.band_hashes(signature)
+                ))
+        return signed
+
+    def _find_canonical(
+        self,
+        signature: np.ndarray,
+        bands: List[int],
+        band_index: Dict[int, List[Tuple[int, Optional[int], np.ndarray]]]
+    ) -> Optional[int]:
+        """
+        Find the canonical article a signature near-duplicates.
+
+        Args:
+            signature: Signature of the new article
+            bands: Its band keys
+            band_index: Known articles by band key
+
+        Returns:
+            Canonical article ID of the most similar candidate at or above
+            the threshold (earliest candidate on ties), or None
+        """
+        best: Optional[Tuple[float, int, int]] = None
+        seen = set()
+
+        for band_hash in bands:
+            for article_id, canonical_id, candidate in band_index.get(band_hash, ()):
+                if article_id in seen:
+                    continue
+                seen.add(article_id)
+
+                similarity = MinHasher.similarity(signature, candidate)
+                if similarity >= self._threshold and (
+                    best is None or (similarity, -article_id) > best[:2]
+                ):
+                    best = (similarity, -article_id, canonical_id or article_id)
+
+        return best[2] if best is not None else None
@@ -0,0 +1,635 @@
+"""
+Local category classifier for pre-categorization without the LLM.
+
+Categorization picks one of eight fixed categories, and the database
+already holds thousands of articles Gemini has categorized. This module
+learns that mapping with a CPU-only model - TF-IDF weighted unigrams and
+bigrams fed to a multinomial logistic regression - so articles it is
+confident about can be categorized without an API call.
+
+Confidence is made trustworthy in two steps on articles held out from
+training: temperature scaling calibrates the predicted probabilities, and
+the confidence threshold is the lowest one at which the held-out
+predictions still agree with Gemini at the target precision. Articles
+below the threshold go to Gemini as before.
+
+Everything runs on numpy; documents are kept as sparse rows (CSR arrays)
+so the vocabulary size does not blow up memory.
+"""
+
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import json
+import math
+import os
+import zlib
+
+import numpy as np
+
+from app.services.ranking.keyword_matcher import tokenize
+
+
+# Candidate temperatures tried by calibrate() (1.0 = uncalibrated)
+_TEMPERATURES = np.geomspace(0.25, 4.0, 33)
+
+
+def _sparse_dot(
+    positions: np.ndarray,
+    lookups: np.ndarray,
+    data: np.ndarray,
+    size: int,
+    dense: np.ndarray
+) -> np.ndarray:
+    """
+    Multiply a sparse matrix given as coordinates by a dense matrix.
+
+    Computes out[p] = sum of data[i] * dense[lookups[i]] over all stored
+    values i with positions[i] == p, one bincount per dense column. With
+    (rows, columns) this is X @ dense; with (columns, rows) it is X^T @ dense.
+
+    Args:
+        positions: Output row of every stored value
+        lookups: Row of dense multiplied with every stored value
+        data: Stored values
+        size: Number of output rows
+        dense: Dense right-hand matrix
+
+    Returns:
+        Array of shape (size, dense columns)
+    """
+    return np.stack([
+        np.bincount(positions, weights=data * dense[lookups, column], minlength=size)
+        for column in range(dense.shape[1])
+    ], axis=1)
+
+
+def article_text(title: str, content: str) -> str:
+    """
+    Build the classifier input of an article.
+
+    Training and prediction must use the same text, so both go through
+    this function.
+
+    Args:
+        title: Article title
+        content: Article content
+
+    Returns:
+        Text to classify
+    """
+    return f"{title or ''}\n{content or ''}"
+
+
+def is_holdout(article_id: int, fraction: float) -> bool:
+    """
+    Decide deterministically whether an article belongs to the held-out split.
+
+    The split depends only on the article ID, so training and later
+    evaluations agree on which articles the model has not seen.
+
+    Args:
+        article_id: Article ID
+        fraction: Share of articles held out (0.0 - 1.0)
+
+    Returns:
+        True if the article is held out
+    """
+    return zlib.crc32(str(article_id).encode("utf-8")) % 10000 < fraction * 10000
+
+
+class CategoryPrediction(NamedTuple):
+    """
+    Prediction of the local classifier for one article.
+
+    Attributes:
+        category: Most probable category
+        confidence: Its calibrated probability (0.0 - 1.0)
+        confident: Whether the confidence reaches the calibrated threshold
+    """
+    category: str
+    confidence: float
+    confident: bool
+
+
+class LocalCategoryClassifier:
+    """
+    TF-IDF + multinomial logistic regression classifier for categories.
+
+    Texts are tokenized with the ranking tokenizer; the max_features most
+    frequent unigrams and bigrams occurring in at least min_df training
+    texts form the vocabulary. Term weights are sublinear TF times smoothed
+    IDF, L2-normalized per text. The regression is trained by full-batch
+    Adam on the L2-regularized cross-entropy.
+
+    Example:
+        ```python
+        classifier = LocalCategoryClassifier(EXAM_CATEGORIES)
+        classifier.fit(train_texts, train_labels)
+        classifier.calibrate(holdout_texts, holdout_labels, target_precision=0.95)
+        classifier.save(".cache/local_classifier.npz")
+
+        prediction = classifier.predict([article_text(title, content)])[0]
+        if prediction.confident:
+            category = prediction.category
+        ```
+
+    Attributes:
+        _categories (List[str]): Category names, in model output order
+        _max_features (int): Maximum vocabulary size
+        _min_df (int): Minimum document frequency of a vocabulary term
+        _max_chars (int): Characters of each text used for features
+        _l2 (float): L2 regularization strength
+        _epochs (int): Training iterations
+        _learning_rate (float): Adam step size
+        _vocabulary (Dict[str, int]): Term -> feature index
+        _idf (np.ndarray): IDF weight per feature
+        _weights (np.ndarray): Feature x category weights
+        _bias (np.ndarray): Category biases
+        _temperature (float): Softmax temperature from calibrate()
+        _threshold (Optional[float]): Confidence threshold from calibrate()
+        _info (Dict[str, Any]): Training metadata stored with the model
+    """
+
+    def __init__(
+        self,
+        categories: Sequence[str],
+        max_features: int = 20000,
+        min_df: int = 2,
+        max_chars: int = 20000,
+        l2: float = 1e-4,
+        epochs: int = 200,
+        learning_rate: float = 0.05
+    ):
+        """
+        Initialize an untrained classifier.
+
+        Args:
+            categories: Category names the classifier chooses from
+            max_features: Maximum vocabulary size
+            min_df: Minimum number of training texts containing a term
+            max_chars: Characters of each text used for features
+            l2: L2 regularization strength
+            epochs: Training iterations
+            learning_rate: Adam step size
+
+        Raises:
+            ValueError: If fewer than two categories are given
+        """
+        if len(categories) < 2:
+            raise ValueError("At least two categories are required")
+
+        self._categories = list(categories)
+        self._max_features = max_features
+        self._min_df = min_df
+        self._max_chars = max_chars
+        self._l2 = l2
+        self._epochs = epochs
+        self._learning_rate = learning_rate
+
+        self._vocabulary: Dict[str, int] = {}
+        self._idf = np.zeros(0)
+        self._weights = np.zeros((0, len(self._categories)))
+        self._bias = np.zeros(len(self._categories))
+        self._temperature = 1.0
+        self._threshold: Optional[float] = None
+        self._info: Dict[str, Any] = {}
+
+    @property
+    def categories(self) -> List[str]:
+        """Get the category names, in model output order."""
+        return list(self._categories)
+
+    @property
+    def threshold(self) -> Optional[float]:
+        """Get the calibrated confidence threshold (None before calibrate())."""
+        return self._threshold
+
+    @property
+    def info(self) -> Dict[str, Any]:
+        """Get the training metadata (sizes, calibration results)."""
+        return dict(self._info)
+
+    def update_info(self, **values: Any) -> None:
+        """
+        Add training metadata stored with the model.
+
+        Args:
+            **values: JSON-serializable metadata values
+        """
+        self._info.update(values)
+
+    def fit(self, texts: Sequence[str], labels: Sequence[str]) -> "LocalCategoryClassifier":
+        """
+        Build the vocabulary and train the regression.
+
+        Args:
+            texts: Training texts (title and content)
+            labels: Category name of each text
+
+        Returns:
+            self
+
+        Raises:
+            ValueError: If there are no texts or a label is not a known category
+        """
+        if not texts or len(texts) != len(labels):
+            raise ValueError("fit() needs the same non-zero number of texts and labels")
+        targets = self._encode_labels(labels)
+
+        term_counts = [self._term_counts(text) for text in texts]
+        document_frequency = Counter(term for counts in term_counts for term in counts)
+        terms = sorted(
+            (term for term, df in document_frequency.items() if df >= self._min_df),
+            key=lambda term: (-document_frequency[term], term)
+        )[:self._max_features]
+
+        self._vocabulary = {term: index for index, term in enumerate(terms)}
+        self._idf = np.array([
+            math.log((1 + len(texts)) / (1 + document_frequency[term])) + 1.0
+            for term in terms
+        ])
+
+        matrix = self._vectorize_counts(term_counts)
+        self._train(matrix, targets)
+        self._temperature = 1.0
+        self._threshold = None
+        self._info = {
+            "training_articles": len(texts),
+            "vocabulary_size": len(terms)
+        }
+        return self
+
+    def calibrate(
+        self,
+        texts: Sequence[str],
+        labels: Sequence[str],
+        target_precision: float,
+        min_accepted: int = 20
+    ) -> float:
+        """
+        Calibrate probabilities and choose the confidence threshold.
+
+        Fits the softmax temperature that minimizes the log loss on the
+        given (held-out) texts, then picks the lowest threshold at which
+        the predictions at or above it agree with the labels at least
+        target_precision of the time, over at least min_accepted texts.
+
+        Args:
+            texts: Held-out texts
+            labels: Their category names
+            target_precision: Required agreement above the threshold
+            min_accepted: Minimum held-out texts above the threshold
+
+        Returns:
+            The confidence threshold (above 1.0 if no threshold reaches
+            the target, so nothing is answered locally)
+
+        Raises:
+            ValueError: If there are no texts or a label is unknown
+        """
+        if not texts or len(texts) != len(labels):
+            raise ValueError("calibrate() needs the same non-zero number of texts and labels")
+        targets = self._encode_labels(labels)
+        logits = self._logits(self._vectorize(texts))
+
+        losses = []
+        for temperature in _TEMPERATURES:
+            probabilities = self._softmax(logits / temperature)
+            losses.append(-np.mean(np.log(probabilities[np.arange(len(targets)), targets] + 1e-12)))
+        self._temperature = float(_TEMPERATURES[int(np.argmin(losses))])
+
+        probabilities = self._softmax(logits / self._temperature)
+        confidence = probabilities.max(axis=1)
+        correct = probabilities.argmax(axis=1) == targets
+
+        order = np.argsort(-confidence, kind="stable")
+        precision = np.cumsum(correct[order]) / np.arange(1, len(order) + 1)
+        reaches = np.nonzero(precision >= target_precision)[0]
+        reaches = reaches[reaches + 1 >= min_accepted]
+
+        self._threshold = float(confidence[order[reaches[-1]]]) if len(reaches) else 1.01
+        self._info.update({
+            "calibration_articles": len(texts),
+            "temperature": self._temperature,
+            "target_precision": target_precision
+        })
+        return self._threshold
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Compute calibrated category probabilities.
+
+        Args:
+            texts: Texts to classify
+
+        Returns:
+            Array of shape (len(texts), len(categories))
+        """
+        return self._softmax(self._logits(self._vectorize(texts)) / self._temperature)
+
+    def predict(self, texts: Sequence[str]) -> List[CategoryPrediction]:
+        """
+        Predict the category of each text.
+
+        Args:
+            texts: Texts to classify
+
+        Returns:
+            One CategoryPrediction per text (never confident before calibrate())
+        """
+        if not texts:
+            return []
+
+        probabilities = self.predict_proba(texts)
+        best = probabilities.argmax(axis=1)
+        return [
+            CategoryPrediction(
+                self._categories[index],
+                float(probabilities[row, index]),
+                bool(self._threshold is not None and probabilities[row, index] >= self._threshold)
+            )
+            for row, index in enumerate(best)
+        ]
+
+    def evaluate(self, texts: Sequence[str], labels: Sequence[str]) -> Dict[str, Any]:
+        """
+        Measure agreement of the predictions with reference labels.
+
+        Args:
+            texts: Texts with known labels (not used for training)
+            labels: Their reference category names (e.g. Gemini's)
+
+        Returns:
+            Dictionary with:
+            - 'articles': Number of texts evaluated
+            - 'agreement': Share of top predictions equal to the label
+            - 'coverage': Share of texts at or above the threshold
+            - 'confident_agreement': Agreement among those texts
+            - 'calibration_error': Expected calibration error (10 bins)
+            - 'per_category': {category: {'articles', 'agreement', 'coverage'}}
+
+        Raises:
+            ValueError: If a label is unknown
+        """
+        targets = self._encode_labels(labels)
+        if not len(targets):
+            return {
+                'articles': 0, 'agreement': 0.0, 'coverage': 0.0,
+                'confident_agreement': 0.0, 'calibration_error': 0.0, 'per_category': {}
+            }
+
+        probabilities = self.predict_proba(texts)
+        confidence = probabilities.max(axis=1)
+        correct = probabilities.argmax(axis=1) == targets
+        threshold = self._threshold if self._threshold is not None else math.inf
+        confident = confidence >= threshold
+
+        bins = np.minimum((confidence * 10).astype(int), 9)
+        calibration_error = sum(
+            abs(correct[bins == b].mean() - confidence[bins == b].mean()) * np.mean(bins == b)
+            for b in range(10) if np.any(bins == b)
+        )
+
+        per_category = {}
+        for index, category in enumerate(self._categories):
+            members = targets == index
+            if np.any(members):
+                per_category[category] = {
+                    'articles': int(members.sum()),
+                    'agreement': float(correct[members].mean()),
+                    'coverage': float(confident[members].mean())
+                }
+
+        return {
+            'articles': len(targets),
+            'agreement': float(correct.mean()),
+            'coverage': float(confident.mean()),
+            'confident_agreement': float(correct[confident].mean()) if confident.any() else 0.0,
+            'calibration_error': float(calibration_error),
+            'per_category': per_category
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Store the trained model as a numpy archive.
+
+        Args:
+            path: File path (parent directories are created)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        terms = sorted(self._vocabulary, key=self._vocabulary.get)
+        params = {
+            "max_features": self._max_features,
+            "min_df": self._min_df,
+            "max_chars": self._max_chars,
+            "l2": self._l2,
+            "epochs": self._epochs,
+            "learning_rate": self._learning_rate,
+            "temperature": self._temperature,
+            "threshold": self._threshold,
+            "info": self._info
+        }
+        with open(path, "wb") as handle:
+            np.savez_compressed(
+                handle,
+                categories=np.array(self._categories),
+                vocabulary=np.array(terms, dtype=str),
+                idf=self._idf,
+                weights=self._weights,
+                bias=self._bias,
+                params=np.array(json.dumps(params))
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "LocalCategoryClassifier":
+        """
+        Load a model stored with save().
+
+        Args:
+            path: File path
+
+        Returns:
+            The trained classifier
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a classifier archive
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            try:
+                params = json.loads(str(archive["params"]))
+                classifier = cls(
+                    [str(category) for category in archive["categories"]],
+                    max_features=params["max_features"],
+                    min_df=params["min_df"],
+                    max_chars=params["max_chars"],
+                    l2=params["l2"],
+                    epochs=params["epochs"],
+                    learning_rate=params["learning_rate"]
+                )
+                classifier._vocabulary = {
+                    str(term): index for index, term in enumerate(archive["vocabulary"])
+                }
+                classifier._idf = archive["idf"]
+                classifier._weights = archive["weights"]
+                classifier._bias = archive["bias"]
+            except KeyError as e:
+                raise ValueError(f"{path} is not a local classifier model: missing {e}")
+
+        classifier._temperature = params["temperature"]
+        classifier._threshold = params["threshold"]
+        classifier._info = params["info"]
+        return classifier
+
+    def _encode_labels(self, labels: Sequence[str]) -> np.ndarray:
+        """
+        Map category names to output indices.
+
+        Args:
+            labels: Category names
+
+        Returns:
+            Integer array of category indices
+
+        Raises:
+            ValueError: If a label is not a known category
+        """
+        index = {category: i for i, category in enumerate(self._categories)}
+        unknown = set(labels) - set(index)
+        if unknown:
+            raise ValueError(f"Unknown categories: {', '.join(sorted(unknown))}")
+        return np.array([index[label] for label in labels], dtype=np.int64)
+
+    def _term_counts(self, text: str) -> Counter:
+        """
+        Count the unigrams and bigrams of a text.
+
+        Args:
+            text: Text to count
+
+        Returns:
+            Counter of terms (bigrams joined with a space)
+        """
+        tokens = tokenize((text or "")[:self._max_chars])
+        counts = Counter(tokens)
+        counts.update(f"{first} {second}" for first, second in zip(tokens, tokens[1:]))
+        return counts
+
+    def _vectorize(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Turn texts into TF-IDF rows.
+
+        Args:
+            texts: Texts to vectorize
+
+        Returns:
+            CSR arrays (indptr, indices, data) of the L2-normalized rows
+        """
+        return self._vectorize_counts([self._term_counts(text) for text in texts])
+
+    def _vectorize_counts(
+        self,
+        term_counts: Sequence[Counter]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Turn term counts into TF-IDF rows.
+
+        Args:
+            term_counts: Term counts per text
+
+        Returns:
+            CSR arrays (indptr, indices, data) of the L2-normalized rows
+        """
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+
+        for counts in term_counts:
+            row = [
+                (self._vocabulary[term], 1.0 + math.log(count))
+                for term, count in counts.items() if term in self._vocabulary
+            ]
+            if row:
+                columns = np.array([column for column, _ in row])
+                values = np.array([tf for _, tf in row]) * self._idf[columns]
+                values /= np.linalg.norm(values)
+                indices.extend(columns.tolist())
+                data.extend(values.tolist())
+            indptr.append(len(indices))
+
+        return (
+            np.array(indptr, dtype=np.int64),
+            np.array(indices, dtype=np.int64),
+            np.array(data, dtype=np.float64)
+        )
+
+    def _logits(self, matrix: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> np.ndarray:
+        """
+        Compute the regression scores of TF-IDF rows.
+
+        Args:
+            matrix: CSR arrays from _vectorize()
+
+        Returns:
+            Array of shape (rows, categories)
+        """
+        indptr, indices, data = matrix
+        count = len(indptr) - 1
+        rows = np.repeat(np.arange(count), np.diff(indptr))
+        return _sparse_dot(rows, indices, data, count, self._weights) + self._bias
+
+    def _train(self, matrix: Tuple[np.ndarray, np.ndarray, np.ndarray], targets: np.ndarray) -> None:
+        """
+        Fit weights and biases by full-batch Adam on the cross-entropy.
+
+        Args:
+            matrix: CSR arrays of the training rows
+            targets: Category index per row
+        """
+        indptr, indices, data = matrix
+        count = len(indptr) - 1
+        rows = np.repeat(np.arange(count), np.diff(indptr))
+        one_hot = np.eye(len(self._categories))[targets]
+
+        self._weights = np.zeros((len(self._vocabulary), len(self._categories)))
+        self._bias = np.log(one_hot.mean(axis=0) + 1e-3)
+        moments = [np.zeros_like(self._weights), np.zeros_like(self._bias)]
+        squares = [np.zeros_like(self._weights), np.zeros_like(self._bias)]
+        beta1, beta2 = 0.9, 0.999
+
+        for step in range(1, self._epochs + 1):
+            scores = _sparse_dot(rows, indices, data, count, self._weights) + self._bias
+            error = (self._softmax(scores) - one_hot) / count
+
+            gradients = [
+                _sparse_dot(indices, rows, data, len(self._vocabulary), error)
+                + self._l2 * self._weights,
+                error.sum(axis=0)
+            ]
+            for parameter, gradient, moment, square in zip(
+                (self._weights, self._bias), gradients, moments, squares
+            ):
+                moment *= beta1
+                moment += (1 - beta1) * gradient
+                square *= beta2
+                square += (1 - beta2) * gradient ** 2
+                parameter -= self._learning_rate * (moment / (1 - beta1 ** step)) / (
+                    np.sqrt(square / (1 - beta2 ** step)) + 1e-8
+                )
+
+    @staticmethod
+    def _softmax(scores: np.ndarray) -> np.ndarray:
+        """
+        Row-wise softmax.
+
+        Args:
+            scores: Array of shape (rows, categories)
+
+        Returns:
+            Probabilities of the same shape
+        """
+        shifted = np.exp(scores - scores.max(axis=1, keepdims=True))
+        return shifted / shifted.sum(axis=1, keepdims=True)
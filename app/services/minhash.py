@@ -0,0 +1,208 @@
+"""
+MinHash signatures and LSH banding for near-duplicate detection.
+
+The same announcement often arrives as a PIB release, a schemes-portal
+page and several video transcripts with slightly different wording. This
+module turns a text into a set of word shingles, compresses the set into
+a fixed-size MinHash signature whose agreement rate estimates the Jaccard
+similarity of two texts, and cuts the signature into LSH bands so that
+similar texts can be found by exact band lookups instead of comparing
+every pair.
+"""
+
+from typing import List, Set
+import hashlib
+import zlib
+import numpy as np
+
+from app.services.ranking.keyword_matcher import tokenize
+
+
+# Mersenne prime 2^61 - 1 and the 32-bit range of the hashed values
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+class MinHasher:
+    """
+    Computes MinHash signatures and LSH band keys of texts.
+
+    Texts are tokenized with the ranking tokenizer and split into
+    overlapping word shingles; each shingle is hashed to 32 bits and the
+    signature holds, for each of num_perm random hash permutations, the
+    minimum permuted hash over all shingles. Two signatures agree in a
+    position with probability equal to the Jaccard similarity of the
+    shingle sets.
+
+    For LSH the signature is cut into `bands` bands of num_perm / bands
+    rows; two texts become candidates when any band is identical, which
+    happens with probability 1 - (1 - s^rows)^bands for similarity s. The
+    permutations are derived from a fixed seed, so signatures stay
+    comparable across processes and runs.
+
+    Example:
+        ```python
+        hasher = MinHasher(num_perm=128, bands=32)
+        a = hasher.signature("Cabinet approves PM-KUSUM scheme extension ...")
+        b = hasher.signature("The Cabinet has approved the PM-KUSUM scheme extension ...")
+        hasher.similarity(a, b)  # ~0.85
+        set(hasher.band_hashes(a)) & set(hasher.band_hashes(b))  # non-empty
+        ```
+
+    Attributes:
+        _num_perm (int): Signature length
+        _bands (int): Number of LSH bands
+        _rows (int): Signature positions per band
+        _shingle_size (int): Words per shingle
+        _a (np.ndarray): Multipliers of the hash permutations
+        _b (np.ndarray): Offsets of the hash permutations
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 3,
+        seed: int = 1
+    ):
+        """
+        Initialize the hasher.
+
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            bands: Number of LSH bands (must divide num_perm)
+            shingle_size: Number of consecutive words per shingle
+            seed: Seed of the hash permutations
+
+        Raises:
+            ValueError: If bands does not divide num_perm or a size is not positive
+        """
+        if num_perm < 1 or bands < 1 or shingle_size < 1:
+            raise ValueError("num_perm, bands and shingle_size must be positive")
+        if num_perm % bands:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm})")
+
+        self._num_perm = num_perm
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    @property
+    def num_perm(self) -> int:
+        """Get the signature length."""
+        return self._num_perm
+
+    @property
+    def bands(self) -> int:
+        """Get the number of LSH bands."""
+        return self._bands
+
+    def shingles(self, text: str) -> Set[int]:
+        """
+        Hash the word shingles of a text.
+
+        Args:
+            text: Text to shingle
+
+        Returns:
+            Set of 32-bit shingle hashes (a text shorter than one shingle
+            yields a single shingle of all its words; an empty text yields
+            an empty set)
+        """
+        tokens = tokenize(text)
+        if not tokens:
+            return set()
+
+        size = min(self._shingle_size, len(tokens))
+        return {
+            zlib.crc32(" ".join(tokens[start:start + size]).encode("utf-8"))
+            for start in range(len(tokens) - size + 1)
+        }
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: Text to sign
+
+        Returns:
+            uint32 array of length num_perm (all positions at the maximum
+            hash for an empty text)
+        """
+        shingles = self.shingles(text)
+        if not shingles:
+            return np.full(self._num_perm, _MAX_HASH, dtype=np.uint32)
+
+        values = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+        # (a * x + b) mod p, truncated to 32 bits; one row per permutation.
+        # uint64 products wrap around, which keeps the permutations random.
+        with np.errstate(over="ignore"):
+            permuted = (np.outer(self._a, values) + self._b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1).astype(np.uint32)
+
+    def band_hashes(self, signature: np.ndarray) -> List[int]:
+        """
+        Compute the LSH band keys of a signature.
+
+        Each key hashes the band's position and rows, so equal keys mean
+        the same band is identical in both signatures.
+
+        Args:
+            signature: Signature from signature()
+
+        Returns:
+            One signed 64-bit key per band (fits a BIGINT column)
+        """
+        keys = []
+        for band in range(self._bands):
+            rows = signature[band * self._rows:(band + 1) * self._rows]
+            digest = hashlib.blake2b(
+                band.to_bytes(2, "big") + rows.astype("<u4").tobytes(), digest_size=8
+            ).digest()
+            keys.append(int.from_bytes(digest, "big", signed=True))
+        return keys
+
+    @staticmethod
+    def similarity(first: np.ndarray, second: np.ndarray) -> float:
+        """
+        Estimate the Jaccard similarity of two signed texts.
+
+        Args:
+            first: Signature of the first text
+            second: Signature of the second text
+
+        Returns:
+            Fraction of agreeing signature positions (0.0 - 1.0)
+        """
+        return float(np.mean(first == second))
+
+    @staticmethod
+    def to_bytes(signature: np.ndarray) -> bytes:
+        """
+        Serialize a signature for storage.
+
+        Args:
+            signature: Signature from signature()
+
+        Returns:
+            Little-endian uint32 bytes
+        """
+        return signature.astype("<u4").tobytes()
+
+    @staticmethod
+    def from_bytes(data: bytes) -> np.ndarray:
+        """
+        Deserialize a stored signature.
+
+        Args:
+            data: Bytes from to_bytes()
+
+        Returns:
+            uint32 signature array
+        """
+        return np.frombuffer(data, dtype="<u4").astype(np.uint32)
@@ -10,6 +10,8 @@ from app.services.ranking.abstract_ranking_strategy import (
     ArticleMetadata,
     RankingResult
 )
+from app.services.ranking.keyword_matcher import KeywordMatcher
+from app.services.ranking.text_features import TextFeatures
 from app.services.ranking.upsc_ranking_strategy import UPSCRankingStrategy
 from app.services.ranking.ssc_ranking_strategy import SSCRankingStrategy
 from app.services.ranking.banking_ranking_strategy import BankingRankingStrategy
@@ -18,6 +20,8 @@ __all__ = [
     "AbstractRankingStrategy",
     "ArticleMetadata",
     "RankingResult",
+    "KeywordMatcher",
+    "TextFeatures",
     "UPSCRankingStrategy",
     "SSCRankingStrategy",
     "BankingRankingStrategy",
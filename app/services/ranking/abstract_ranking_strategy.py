@@ -2,13 +2,19 @@
 Abstract base class for ranking strategies.
 
 This module implements the Strategy pattern, allowing different ranking
-algorithms to be used interchangeably for different exam types.
+algorithms to be used interchangeably for different exam types. Besides
+per-article scoring, strategies support batch scoring, which builds an
+(articles x factors) NumPy matrix and applies the weights as one dot
+product. Batch scoring reads text features from a TextFeatures object,
+which several strategies can share to score the same batch.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime, timezone
+import numpy as np
 from pydantic import BaseModel, Field
+from app.services.ranking.text_features import TextFeatures
 
 
 class ArticleMetadata(BaseModel):
@@ -117,6 +123,299 @@ class AbstractRankingStrategy(ABC):
         """
         pass
     
+    def calculate_scores(
+        self,
+        contents: Sequence[str],
+        metadatas: Sequence[ArticleMetadata],
+        now: Optional[datetime] = None,
+        include_reasoning: bool = True,
+        features: Optional[TextFeatures] = None
+    ) -> List[RankingResult]:
+        """
+        Calculate relevance scores for many articles at once.
+        
+        Builds the factor matrix with calculate_factor_matrix() and applies
+        the weights as a single matrix-vector product. Freshness is measured
+        against one shared `now`, so all articles in the batch are scored
+        at the same instant.
+        
+        When several strategies score the same batch, pass them the same
+        `features` so tokenization and keyword scans run only once.
+        
+        Args:
+            contents: Article content texts
+            metadatas: Article metadata, aligned with contents
+            now: Reference time for freshness (defaults to current UTC time)
+            include_reasoning: Generate reasoning text (skip for bulk re-ranking)
+            features: Precomputed features of contents (built if None)
+            
+        Returns:
+            RankingResult per article, in input order
+            
+        Raises:
+            ValueError: If contents, metadatas and features differ in length
+            
+        Example:
+            ```python
+            results = strategy.calculate_scores(contents, metadatas)
+            top = max(results, key=lambda r: r.score)
+            ```
+        """
+        features = features if features is not None else TextFeatures(contents)
+        factor_names, matrix = self.calculate_factor_matrix(
+            contents, metadatas, now, features
+        )
+        scores = self._score_matrix(factor_names, matrix)
+        
+        results = []
+        for i, metadata in enumerate(metadatas):
+            factors = dict(zip(factor_names, matrix[i].tolist()))
+            reasoning = (
+                self._batch_reasoning(factors, metadata, features, i)
+                if include_reasoning else ""
+            )
+            results.append(RankingResult(
+                score=float(scores[i]),
+                reasoning=reasoning,
+                factors=factors
+            ))
+        
+        return results
+    
+    def score_batch(
+        self,
+        contents: Sequence[str],
+        metadatas: Sequence[ArticleMetadata],
+        now: Optional[datetime] = None,
+        features: Optional[TextFeatures] = None
+    ) -> np.ndarray:
+        """
+        Calculate only the scores of many articles at once.
+        
+        Same scores as calculate_scores(), without building a
+        RankingResult (factors, reasoning) per article; meant for
+        pre-ranking large candidate pools.
+        
+        Args:
+            contents: Article content texts
+            metadatas: Article metadata, aligned with contents
+            now: Reference time for freshness (defaults to current UTC time)
+            features: Precomputed features of contents (built if None)
+            
+        Returns:
+            Scores from 0.0 to 10.0, in input order
+            
+        Raises:
+            ValueError: If contents, metadatas and features differ in length
+        """
+        factor_names, matrix = self.calculate_factor_matrix(
+            contents, metadatas, now, features
+        )
+        return self._score_matrix(factor_names, matrix)
+    
+    def calculate_factor_matrix(
+        self,
+        contents: Sequence[str],
+        metadatas: Sequence[ArticleMetadata],
+        now: Optional[datetime] = None,
+        features: Optional[TextFeatures] = None
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Compute every factor score for a batch of articles.
+        
+        Args:
+            contents: Article content texts
+            metadatas: Article metadata, aligned with contents
+            now: Reference time for freshness (defaults to current UTC time)
+            features: Precomputed features of contents (built if None)
+            
+        Returns:
+            Tuple of (factor names in weight order, float matrix of shape
+            (len(contents), len(factor names)))
+            
+        Raises:
+            ValueError: If contents, metadatas and features differ in length
+        """
+        if len(contents) != len(metadatas):
+            raise ValueError(
+                f"Got {len(contents)} contents but {len(metadatas)} metadata entries"
+            )
+        if features is not None and len(features) != len(contents):
+            raise ValueError(
+                f"Got {len(contents)} contents but features for {len(features)}"
+            )
+        
+        factor_names = list(self._weights)
+        if not contents:
+            return factor_names, np.zeros((0, len(factor_names)))
+        
+        columns = self._batch_factor_columns(
+            features if features is not None else TextFeatures(contents),
+            metadatas,
+            now or datetime.now(timezone.utc)
+        )
+        matrix = np.column_stack([
+            np.asarray(columns[name], dtype=float) for name in factor_names
+        ])
+        return factor_names, matrix
+    
+    def _batch_factor_columns(
+        self,
+        features: TextFeatures,
+        metadatas: Sequence[ArticleMetadata],
+        now: datetime
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute factor columns for a batch of articles.
+        
+        Concrete strategies override this with vectorized implementations.
+        The default falls back to calculate_score() per article, so any
+        strategy supports batch scoring.
+        
+        Args:
+            features: Text features of the article contents
+            metadatas: Article metadata, aligned with the contents
+            now: Reference time for freshness
+            
+        Returns:
+            Dictionary mapping factor name to a column of scores
+        """
+        rows = [
+            self.calculate_score(content, metadata).factors
+            for content, metadata in zip(features.contents, metadatas)
+        ]
+        return {
+            name: np.array([row.get(name, 0.0) for row in rows])
+            for name in self._weights
+        }
+    
+    def _batch_reasoning(
+        self,
+        factors: Dict[str, float],
+        metadata: ArticleMetadata,
+        features: TextFeatures,
+        index: int
+    ) -> str:
+        """
+        Generate reasoning text for a batch-scored article.
+        
+        Concrete strategies override this to reuse their per-article
+        reasoning; the default names the strongest and weakest factors.
+        
+        Args:
+            factors: Factor scores for the article
+            metadata: Article metadata
+            features: Text features of the batch
+            index: Position of the article in the batch
+            
+        Returns:
+            Reasoning text
+        """
+        ordered = sorted(factors.items(), key=lambda item: item[1], reverse=True)
+        return (
+            f"Strongest factor: {ordered[0][0]} ({ordered[0][1]:.2f}). "
+            f"Weakest factor: {ordered[-1][0]} ({ordered[-1][1]:.2f})."
+        )
+    
+    def _score_matrix(self, factor_names: List[str], matrix: np.ndarray) -> np.ndarray:
+        """
+        Apply the weights to a factor matrix.
+        
+        Args:
+            factor_names: Column names of the matrix
+            matrix: Factor scores, one row per article
+            
+        Returns:
+            Scores normalized to 0.0-10.0, one per article
+        """
+        weights = np.array([self._weights[name] for name in factor_names])
+        return np.clip(matrix @ weights * 10.0, 0.0, 10.0)
+    
+    def _freshness_vector(
+        self,
+        metadatas: Sequence[ArticleMetadata],
+        now: datetime
+    ) -> np.ndarray:
+        """
+        Vectorized _calculate_freshness_score().
+        
+        Args:
+            metadatas: Article metadata
+            now: Reference time
+            
+        Returns:
+            Freshness scores from 0.0 to 1.0
+        """
+        timestamps = np.array([
+            (m.published_at if m.published_at.tzinfo is not None
+             else m.published_at.replace(tzinfo=timezone.utc)).timestamp()
+            for m in metadatas
+        ])
+        age_hours = (now.timestamp() - timestamps) / 3600
+        return np.clip(np.exp2(-age_hours / 24), 0.0, 1.0)
+    
+    def _category_relevance_vector(
+        self,
+        metadatas: Sequence[ArticleMetadata],
+        priority_categories: List[str]
+    ) -> np.ndarray:
+        """
+        Vectorized _calculate_category_relevance().
+        
+        Args:
+            metadatas: Article metadata
+            priority_categories: High-priority categories for this exam
+            
+        Returns:
+            Category relevance scores from 0.0 to 1.0
+        """
+        lookup = {
+            category: max(0.5, 1.0 - (index * 0.1))
+            for index, category in reversed(list(enumerate(priority_categories)))
+        }
+        return np.array([lookup.get(m.category, 0.5) for m in metadatas])
+    
+    def _lookup_vector(
+        self,
+        keys: Sequence[str],
+        table: Dict[str, float],
+        default: float
+    ) -> np.ndarray:
+        """
+        Map keys through a score table (e.g. source credibility).
+        
+        Args:
+            keys: Lookup keys, one per article
+            table: Score per key
+            default: Score for keys not in the table
+            
+        Returns:
+            Scores, one per article
+        """
+        return np.array([table.get(key, default) for key in keys])
+    
+    def _content_length_vector(self, metadatas: Sequence[ArticleMetadata]) -> np.ndarray:
+        """
+        Vectorized _calculate_content_length_score().
+        
+        Args:
+            metadatas: Article metadata
+            
+        Returns:
+            Content length scores from 0.0 to 1.0
+        """
+        length = np.array([m.content_length for m in metadatas], dtype=float)
+        return np.select(
+            [length < 100, length < 500, length <= 2000, length <= 5000],
+            [
+                0.2,
+                0.6 + (length - 100) / 400 * 0.2,
+                1.0,
+                1.0 - (length - 2000) / 3000 * 0.3
+            ],
+            default=0.5
+        )
+    
     def _validate_weights(self) -> None:
         """
         Validate that weights sum to 1.0.
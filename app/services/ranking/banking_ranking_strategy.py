@@ -6,13 +6,17 @@ This module implements a ranking strategy optimized for banking examinations
 schemes, and financial literacy content.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
+from datetime import datetime
 import re
+import numpy as np
 from app.services.ranking.abstract_ranking_strategy import (
     AbstractRankingStrategy,
     ArticleMetadata,
     RankingResult
 )
+from app.services.ranking.keyword_matcher import KeywordMatcher
+from app.services.ranking.text_features import TextFeatures
 
 
 class BankingRankingStrategy(AbstractRankingStrategy):
@@ -118,6 +122,22 @@ class BankingRankingStrategy(AbstractRankingStrategy):
         for keyword in category
     ]
     
+    # Weight of each keyword group in the banking keyword score
+    KEYWORD_GROUP_WEIGHTS = {
+        "core_banking": 0.35,
+        "schemes": 0.25,
+        "regulatory": 0.15,
+        "economic": 0.15,
+        "digital": 0.10
+    }
+    
+    # Single-pass indexes built once for the class: all keywords by group,
+    # and each group's first five (headline) keywords for the reasoning text
+    KEYWORD_MATCHER = KeywordMatcher(BANKING_KEYWORDS)
+    HEADLINE_KEYWORD_MATCHER = KeywordMatcher({
+        group: keywords[:5] for group, keywords in BANKING_KEYWORDS.items()
+    })
+    
     def __init__(self, weights: Dict[str, float] = None):
         """
         Initialize Banking ranking strategy.
@@ -211,7 +231,6 @@ class BankingRankingStrategy(AbstractRankingStrategy):
         if not content:
             return 0.0
         
-        content_lower = content.lower()
         word_count = len(content.split())
         
         if word_count == 0:
@@ -220,28 +239,15 @@ class BankingRankingStrategy(AbstractRankingStrategy):
         # Count keywords by category
         category_scores = {}
         
-        for category_name, keywords in self.BANKING_KEYWORDS.items():
-            keyword_count = sum(
-                1 for keyword in keywords
-                if keyword in content_lower
-            )
-            
+        for category_name, keyword_count in self.KEYWORD_MATCHER.count(content).items():
             # Normalize by category size and content length
             # Target: 2+ keywords per 100 words per category
             category_density = keyword_count / (word_count / 100) / 2
             category_scores[category_name] = min(1.0, category_density)
         
         # Weighted combination of category scores
-        weights = {
-            "core_banking": 0.35,
-            "schemes": 0.25,
-            "regulatory": 0.15,
-            "economic": 0.15,
-            "digital": 0.10
-        }
-        
         total_score = sum(
-            category_scores[cat] * weights[cat]
+            category_scores[cat] * self.KEYWORD_GROUP_WEIGHTS[cat]
             for cat in category_scores
         )
         
@@ -256,6 +262,83 @@ class BankingRankingStrategy(AbstractRankingStrategy):
         
         return final_score
     
+    def _batch_factor_columns(
+        self,
+        features: TextFeatures,
+        metadatas: Sequence[ArticleMetadata],
+        now: datetime
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized factor columns for calculate_scores().
+        
+        Args:
+            features: Text features of the article contents
+            metadatas: Article metadata, aligned with the contents
+            now: Reference time for freshness
+            
+        Returns:
+            Dictionary mapping factor name to a column of scores
+        """
+        return {
+            "category_relevance": self._category_relevance_vector(
+                metadatas, self.PRIORITY_CATEGORIES
+            ),
+            "banking_keyword_score": self._banking_keyword_vector(features),
+            "source_credibility": self._lookup_vector(
+                [m.source_type for m in metadatas], self.CREDIBLE_SOURCES, 0.5
+            ),
+            "freshness": self._freshness_vector(metadatas, now),
+            "content_length": self._content_length_vector(metadatas)
+        }
+    
+    def _banking_keyword_vector(self, features: TextFeatures) -> np.ndarray:
+        """
+        Vectorized _calculate_banking_keyword_score().
+        
+        Builds an (articles x keyword groups) count matrix, then computes
+        group densities, the weighted total and the diversity bonus with
+        array operations.
+        
+        Args:
+            features: Text features of the article contents
+            
+        Returns:
+            Banking keyword scores from 0.0 to 1.0
+        """
+        groups = self.KEYWORD_MATCHER.groups
+        counts = features.keyword_counts(self.KEYWORD_MATCHER).astype(float)
+        word_counts = features.word_counts
+        
+        # Target: 2+ keywords per 100 words per group
+        densities = np.divide(
+            counts,
+            (word_counts / 100)[:, None] * 2,
+            out=np.zeros_like(counts),
+            where=word_counts[:, None] > 0
+        )
+        group_scores = np.minimum(1.0, densities)
+        
+        total = group_scores @ np.array([self.KEYWORD_GROUP_WEIGHTS[g] for g in groups])
+        diversity_bonus = np.minimum(0.2, (group_scores > 0.3).sum(axis=1) * 0.05)
+        
+        return np.minimum(1.0, total + diversity_bonus)
+    
+    def _batch_reasoning(
+        self,
+        factors: Dict[str, float],
+        metadata: ArticleMetadata,
+        features: TextFeatures,
+        index: int
+    ) -> str:
+        """Reuse the per-article reasoning, with headline hits from the shared features."""
+        headline_counts = dict(zip(
+            self.HEADLINE_KEYWORD_MATCHER.groups,
+            features.keyword_counts(self.HEADLINE_KEYWORD_MATCHER)[index].tolist()
+        ))
+        return self._generate_reasoning(
+            factors, metadata, features.contents[index], headline_counts
+        )
+    
     def _calculate_source_credibility(self, source_type: str) -> float:
         """
         Calculate source credibility score for Banking preparation.
@@ -275,7 +358,8 @@ class BankingRankingStrategy(AbstractRankingStrategy):
         self, 
         factors: Dict[str, float],
         metadata: ArticleMetadata,
-        content: str
+        content: str,
+        headline_counts: Optional[Dict[str, int]] = None
     ) -> str:
         """
         Generate human-readable reasoning for the score.
@@ -284,6 +368,8 @@ class BankingRankingStrategy(AbstractRankingStrategy):
             factors: Dictionary of factor scores
             metadata: Article metadata
             content: Article content (for keyword analysis)
+            headline_counts: Precomputed HEADLINE_KEYWORD_MATCHER counts for
+                             content (computed from content if None)
             
         Returns:
             Reasoning text explaining the score
@@ -309,12 +395,14 @@ class BankingRankingStrategy(AbstractRankingStrategy):
             reasoning_parts.append("Limited banking-specific content")
         
         # Identify which banking categories are present
-        content_lower = content.lower() if content else ""
-        present_categories = []
+        if headline_counts is None:
+            headline_counts = self.HEADLINE_KEYWORD_MATCHER.count(content)
         
-        for category_name, keywords in self.BANKING_KEYWORDS.items():
-            if any(keyword in content_lower for keyword in keywords[:5]):
-                present_categories.append(category_name.replace("_", " "))
+        present_categories = [
+            category_name.replace("_", " ")
+            for category_name, count in headline_counts.items()
+            if count
+        ]
         
         if present_categories:
             reasoning_parts.append(
@@ -0,0 +1,191 @@
+"""
+Precompiled multi-keyword matcher for ranking strategies.
+
+This module provides a keyword index that finds every keyword of several
+keyword groups in a single pass over the text, instead of one substring
+scan per keyword. Matching works on whole words, so "rbi" does not match
+inside "herbicide".
+"""
+
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+import re
+import numpy as np
+
+
+# Words ending in "s" that are not plurals of a shorter word
+_INVARIANT_WORDS = ("news", "series", "species", "imps")
+
+# Word tokens, lowercased by the caller, with a plain plural "s" stripped
+# from stems of at least three characters; "-ss", "-us" and "-sis" words
+# are not plurals ("banks" -> "bank", "upis" -> "upi", but "gas", "class",
+# "status", "analysis" and the invariant words stay as they are)
+_TOKEN_PATTERN = re.compile(
+    r"((?:" + "|".join(_INVARIANT_WORDS) + r")(?!\w)|\w+?)"
+    r"(?:(?<=\w{3})(?<![su])(?<!si)s)?(?!\w)"
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into normalized word tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Lowercased word tokens with a plain plural "s" removed
+    """
+    return _TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+class KeywordMatcher:
+    """
+    Single-pass keyword index over named keyword groups.
+
+    The text is tokenized once with a compiled pattern; single-word
+    keywords are then found with one set intersection and multi-word
+    keywords by checking the phrases that start at each candidate token.
+    Matching is case-insensitive, whole-word, plural-tolerant and treats
+    hyphens and line breaks like spaces. Every keyword is checked at every
+    position, so "reserve bank" counts both "reserve bank" and "bank",
+    matching the "distinct keywords present" meaning of the original
+    substring scans.
+
+    Build one matcher per strategy class (as a class attribute) and reuse
+    it for every article.
+
+    Example:
+        ```python
+        matcher = KeywordMatcher({"core": ["bank", "rbi"], "digital": ["upi"]})
+        matcher.count("The RBI asked banks to expand UPI")
+        # {"core": 2, "digital": 1}
+        ```
+
+    Attributes:
+        _groups (List[str]): Group names, in definition order
+        _keyword_groups (Dict[Tuple[str, ...], Set[int]]): Group indexes per keyword
+        _words (Set[str]): Single-word keywords
+        _phrases (Dict[str, List[Tuple[str, ...]]]): Multi-word keywords by first word
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        """
+        Build the index.
+
+        Args:
+            groups: Mapping of group name to its keywords (a keyword may
+                    appear in several groups)
+        """
+        self._groups: List[str] = list(groups)
+        self._keyword_groups: Dict[Tuple[str, ...], Set[int]] = {}
+        self._words: Set[str] = set()
+        self._phrases: Dict[str, List[Tuple[str, ...]]] = {}
+
+        for group_index, group in enumerate(self._groups):
+            for keyword in groups[group]:
+                tokens = tuple(tokenize(keyword))
+                if not tokens:
+                    continue
+
+                if tokens not in self._keyword_groups:
+                    self._keyword_groups[tokens] = set()
+                    if len(tokens) == 1:
+                        self._words.add(tokens[0])
+                    else:
+                        self._phrases.setdefault(tokens[0], []).append(tokens)
+
+                self._keyword_groups[tokens].add(group_index)
+
+    @property
+    def groups(self) -> List[str]:
+        """
+        Get the group names.
+
+        Returns:
+            Group names, in the column order used by count_many()
+        """
+        return list(self._groups)
+
+    def present(self, text: str) -> Set[Tuple[str, ...]]:
+        """
+        Find the distinct keywords present in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of keywords found, as normalized token tuples
+        """
+        return self.present_in_tokens(tokenize(text))
+
+    def present_in_tokens(self, tokens: Sequence[str]) -> Set[Tuple[str, ...]]:
+        """
+        Find the distinct keywords present in an already tokenized text.
+
+        Lets several matchers share one tokenize() call per text.
+
+        Args:
+            tokens: Output of tokenize() for the text
+
+        Returns:
+            Set of keywords found, as normalized token tuples
+        """
+        found = {(word,) for word in self._words.intersection(tokens)}
+
+        if self._phrases:
+            phrases = self._phrases
+            starts = [i for i, token in enumerate(tokens) if token in phrases]
+            for i in starts:
+                for phrase in phrases[tokens[i]]:
+                    if tuple(tokens[i:i + len(phrase)]) == phrase:
+                        found.add(phrase)
+
+        return found
+
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        Count distinct keywords per group in a single pass.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Dictionary mapping every group name to its number of distinct
+            keywords found
+        """
+        counts = [0] * len(self._groups)
+        for keyword in self.present(text):
+            for group_index in self._keyword_groups[keyword]:
+                counts[group_index] += 1
+        return dict(zip(self._groups, counts))
+
+    def count_many(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Count distinct keywords per group for many texts.
+
+        Args:
+            texts: Texts to scan
+
+        Returns:
+            Integer matrix of shape (len(texts), len(groups))
+        """
+        return self.count_tokenized(tokenize(text) for text in texts)
+
+    def count_tokenized(self, token_lists: Iterable[Sequence[str]]) -> np.ndarray:
+        """
+        Count distinct keywords per group for many tokenized texts.
+
+        Args:
+            token_lists: Output of tokenize() for each text
+
+        Returns:
+            Integer matrix of shape (number of texts, len(groups))
+        """
+        rows = []
+        for tokens in token_lists:
+            row = [0] * len(self._groups)
+            for keyword in self.present_in_tokens(tokens):
+                for group_index in self._keyword_groups[keyword]:
+                    row[group_index] += 1
+            rows.append(row)
+        return np.array(rows, dtype=int).reshape(len(rows), len(self._groups))
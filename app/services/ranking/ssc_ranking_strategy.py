@@ -6,13 +6,17 @@ Commission) examinations, focusing on factual density, clarity, and
 objective-type question suitability.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Sequence
+from datetime import datetime
 import re
+import numpy as np
 from app.services.ranking.abstract_ranking_strategy import (
     AbstractRankingStrategy,
     ArticleMetadata,
     RankingResult
 )
+from app.services.ranking.keyword_matcher import KeywordMatcher
+from app.services.ranking.text_features import TextFeatures
 
 
 class SSCRankingStrategy(AbstractRankingStrategy):
@@ -77,6 +81,16 @@ class SSCRankingStrategy(AbstractRankingStrategy):
         "agreement", "treaty", "memorandum", "protocol", "convention"
     ]
     
+    # Compiled once for the class: the patterns that feed the density score
+    # (in column order) and a single-pass index over FACTUAL_KEYWORDS
+    # ("years" is informational only and not scored)
+    DENSITY_PATTERNS = [
+        re.compile(pattern)
+        for name, pattern in FACTUAL_PATTERNS.items()
+        if name != "years"
+    ]
+    KEYWORD_MATCHER = KeywordMatcher({"factual": FACTUAL_KEYWORDS})
+    
     def __init__(self, weights: Dict[str, float] = None):
         """
         Initialize SSC ranking strategy.
@@ -167,33 +181,24 @@ class SSCRankingStrategy(AbstractRankingStrategy):
         if not content:
             return 0.0
         
-        content_lower = content.lower()
         word_count = len(content.split())
         
         if word_count == 0:
             return 0.0
         
-        # Count factual patterns
-        pattern_counts = {}
-        for pattern_name, pattern in self.FACTUAL_PATTERNS.items():
-            matches = re.findall(pattern, content)
-            pattern_counts[pattern_name] = len(matches)
-        
-        # Count factual keywords
-        keyword_count = sum(
-            1 for keyword in self.FACTUAL_KEYWORDS
-            if keyword in content_lower
+        date_count, number_count, noun_count, keyword_count = (
+            self._factual_signal_counts(content)
         )
         
         # Calculate density scores
         # Dates: 1+ per 100 words is good
-        date_density = min(1.0, pattern_counts["dates"] / (word_count / 100))
+        date_density = min(1.0, date_count / (word_count / 100))
         
         # Numbers: 3+ per 100 words is good
-        number_density = min(1.0, pattern_counts["numbers"] / (word_count / 100) / 3)
+        number_density = min(1.0, number_count / (word_count / 100) / 3)
         
         # Proper nouns: 5+ per 100 words is good
-        noun_density = min(1.0, pattern_counts["proper_nouns"] / (word_count / 100) / 5)
+        noun_density = min(1.0, noun_count / (word_count / 100) / 5)
         
         # Keywords: 3+ per 100 words is good
         keyword_density = min(1.0, keyword_count / (word_count / 100) / 3)
@@ -208,6 +213,96 @@ class SSCRankingStrategy(AbstractRankingStrategy):
         
         return min(1.0, factual_score)
     
+    def _factual_signal_counts(self, content: str) -> List[int]:
+        """
+        Count the factual signals used by the density score.
+        
+        Args:
+            content: Article content text
+            
+        Returns:
+            [dates, numbers, proper nouns, distinct factual keywords]
+        """
+        counts = [len(pattern.findall(content)) for pattern in self.DENSITY_PATTERNS]
+        counts.append(self.KEYWORD_MATCHER.count(content)["factual"])
+        return counts
+    
+    def _batch_factor_columns(
+        self,
+        features: TextFeatures,
+        metadatas: Sequence[ArticleMetadata],
+        now: datetime
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized factor columns for calculate_scores().
+        
+        Args:
+            features: Text features of the article contents
+            metadatas: Article metadata, aligned with the contents
+            now: Reference time for freshness
+            
+        Returns:
+            Dictionary mapping factor name to a column of scores
+        """
+        return {
+            "category_relevance": self._category_relevance_vector(
+                metadatas, self.PRIORITY_CATEGORIES
+            ),
+            "factual_density": self._factual_density_vector(features),
+            "source_credibility": self._lookup_vector(
+                [m.source_type for m in metadatas], self.CREDIBLE_SOURCES, 0.5
+            ),
+            "freshness": self._freshness_vector(metadatas, now),
+            "content_length": self._content_length_vector(metadatas)
+        }
+    
+    def _factual_density_vector(self, features: TextFeatures) -> np.ndarray:
+        """
+        Vectorized _calculate_factual_density().
+        
+        Pattern counts are gathered per article; word and keyword counts
+        come from the shared features. The density arithmetic runs on the
+        whole (articles x signals) count matrix at once.
+        
+        Args:
+            features: Text features of the article contents
+            
+        Returns:
+            Factual density scores from 0.0 to 1.0
+        """
+        # Columns: dates, numbers, proper nouns, keywords
+        counts = np.zeros((len(features), 4))
+        word_counts = features.word_counts
+        
+        for i, content in enumerate(features.contents):
+            if content:
+                counts[i, :3] = [
+                    len(pattern.findall(content)) for pattern in self.DENSITY_PATTERNS
+                ]
+        counts[:, 3] = features.keyword_counts(self.KEYWORD_MATCHER)[:, 0]
+        
+        # Matches per 100 words, scaled by each signal's "good" target
+        per_hundred = np.divide(
+            counts,
+            (word_counts / 100)[:, None],
+            out=np.zeros_like(counts),
+            where=word_counts[:, None] > 0
+        )
+        targets = np.array([1.0, 3.0, 5.0, 3.0])
+        densities = np.minimum(1.0, per_hundred / targets)
+        
+        return np.minimum(1.0, densities @ np.full(4, 0.25))
+    
+    def _batch_reasoning(
+        self,
+        factors: Dict[str, float],
+        metadata: ArticleMetadata,
+        features: TextFeatures,
+        index: int
+    ) -> str:
+        """Reuse the per-article reasoning for batch-scored articles."""
+        return self._generate_reasoning(factors, metadata)
+    
     def _calculate_source_credibility(self, source_type: str) -> float:
         """
         Calculate source credibility score for SSC preparation.
@@ -0,0 +1,103 @@
+"""
+Text features shared by several ranking strategies.
+
+Scoring the same articles for several exam types used to tokenize and
+scan every text once per strategy. TextFeatures computes the text-derived
+inputs of the strategies once per batch (normalized tokens, word counts)
+and memoizes keyword-hit tables per KeywordMatcher, so each strategy only
+adds the work that is specific to it.
+"""
+
+from typing import Dict, List, Sequence
+import numpy as np
+from app.services.ranking.keyword_matcher import KeywordMatcher, tokenize
+
+
+class TextFeatures:
+    """
+    Precomputed text features for a batch of article contents.
+
+    Pass one instance to the calculate_scores() of every strategy that
+    scores the batch. Features are computed lazily and cached, so a
+    strategy that does not need a feature never pays for it.
+
+    Example:
+        ```python
+        features = TextFeatures(contents)
+        for strategy in strategies:
+            results = strategy.calculate_scores(
+                contents, metadatas, now=now, features=features
+            )
+        ```
+
+    Attributes:
+        _contents (List[str]): Article content texts
+        _tokens (List[List[str]]): tokenize() output per text
+        _word_counts (np.ndarray): Whitespace-separated words per text
+        _keyword_counts (Dict[KeywordMatcher, np.ndarray]): Hit tables by matcher
+    """
+
+    def __init__(self, contents: Sequence[str]):
+        """
+        Wrap a batch of contents.
+
+        Args:
+            contents: Article content texts
+        """
+        self._contents: List[str] = [content or "" for content in contents]
+        self._tokens = None
+        self._word_counts = None
+        self._keyword_counts: Dict[KeywordMatcher, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    @property
+    def contents(self) -> List[str]:
+        """
+        Get the content texts.
+
+        Returns:
+            Content texts, with None replaced by ""
+        """
+        return self._contents
+
+    @property
+    def tokens(self) -> List[List[str]]:
+        """
+        Get the normalized word tokens of every text (tokenized once).
+
+        Returns:
+            tokenize() output per text
+        """
+        if self._tokens is None:
+            self._tokens = [tokenize(content) for content in self._contents]
+        return self._tokens
+
+    @property
+    def word_counts(self) -> np.ndarray:
+        """
+        Get the number of whitespace-separated words of every text.
+
+        Returns:
+            Float array of word counts
+        """
+        if self._word_counts is None:
+            self._word_counts = np.array(
+                [len(content.split()) for content in self._contents], dtype=float
+            )
+        return self._word_counts
+
+    def keyword_counts(self, matcher: KeywordMatcher) -> np.ndarray:
+        """
+        Get a matcher's keyword-hit table, computing it on first use.
+
+        Args:
+            matcher: Keyword matcher (normally a strategy class attribute)
+
+        Returns:
+            Integer matrix of shape (len(contents), len(matcher.groups))
+        """
+        if matcher not in self._keyword_counts:
+            self._keyword_counts[matcher] = matcher.count_tokenized(self.tokens)
+        return self._keyword_counts[matcher]
@@ -6,12 +6,16 @@ Service Commission) civil services examination, focusing on analytical depth,
 source credibility, and syllabus alignment.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Sequence
+from datetime import datetime
+import numpy as np
 from app.services.ranking.abstract_ranking_strategy import (
     AbstractRankingStrategy,
     ArticleMetadata,
     RankingResult
 )
+from app.services.ranking.keyword_matcher import KeywordMatcher
+from app.services.ranking.text_features import TextFeatures
 
 
 class UPSCRankingStrategy(AbstractRankingStrategy):
@@ -65,6 +69,18 @@ class UPSCRankingStrategy(AbstractRankingStrategy):
         "sustainable", "development", "welfare", "rights", "justice"
     ]
     
+    # Phrases indicating multi-perspective content
+    PERSPECTIVE_INDICATORS = [
+        "however", "on the other hand", "alternatively", "conversely",
+        "in contrast", "meanwhile", "furthermore", "moreover"
+    ]
+    
+    # Single-pass index over both keyword groups, built once for the class
+    KEYWORD_MATCHER = KeywordMatcher({
+        "analytical": ANALYTICAL_KEYWORDS,
+        "perspective": PERSPECTIVE_INDICATORS
+    })
+    
     def __init__(self, weights: Dict[str, float] = None):
         """
         Initialize UPSC ranking strategy.
@@ -157,27 +173,13 @@ class UPSCRankingStrategy(AbstractRankingStrategy):
         if not content:
             return 0.0
         
-        content_lower = content.lower()
+        hits = self.KEYWORD_MATCHER.count(content)
         
-        # Count analytical keywords
-        keyword_count = sum(
-            1 for keyword in self.ANALYTICAL_KEYWORDS
-            if keyword in content_lower
-        )
-        
-        # Normalize keyword count (5+ keywords = full score)
-        keyword_score = min(1.0, keyword_count / 5.0)
+        # Normalize analytical keyword count (5+ keywords = full score)
+        keyword_score = min(1.0, hits["analytical"] / 5.0)
         
         # Check for multi-perspective content (indicates depth)
-        perspective_indicators = [
-            "however", "on the other hand", "alternatively", "conversely",
-            "in contrast", "meanwhile", "furthermore", "moreover"
-        ]
-        perspective_count = sum(
-            1 for indicator in perspective_indicators
-            if indicator in content_lower
-        )
-        perspective_score = min(1.0, perspective_count / 3.0)
+        perspective_score = min(1.0, hits["perspective"] / 3.0)
         
         # Check for question-answer format (good for exam prep)
         has_questions = "?" in content
@@ -192,6 +194,65 @@ class UPSCRankingStrategy(AbstractRankingStrategy):
         
         return min(1.0, depth_score)
     
+    def _batch_factor_columns(
+        self,
+        features: TextFeatures,
+        metadatas: Sequence[ArticleMetadata],
+        now: datetime
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized factor columns for calculate_scores().
+        
+        Args:
+            features: Text features of the article contents
+            metadatas: Article metadata, aligned with the contents
+            now: Reference time for freshness
+            
+        Returns:
+            Dictionary mapping factor name to a column of scores
+        """
+        return {
+            "category_relevance": self._category_relevance_vector(
+                metadatas, self.PRIORITY_CATEGORIES
+            ),
+            "content_depth": self._content_depth_vector(features),
+            "source_credibility": self._lookup_vector(
+                [m.source_type for m in metadatas], self.CREDIBLE_SOURCES, 0.5
+            ),
+            "freshness": self._freshness_vector(metadatas, now),
+            "content_length": self._content_length_vector(metadatas)
+        }
+    
+    def _content_depth_vector(self, features: TextFeatures) -> np.ndarray:
+        """
+        Vectorized _calculate_content_depth().
+        
+        Args:
+            features: Text features of the article contents
+            
+        Returns:
+            Content depth scores from 0.0 to 1.0
+        """
+        counts = features.keyword_counts(self.KEYWORD_MATCHER)
+        has_questions = np.array(["?" in c for c in features.contents], dtype=float)
+        
+        depth = (
+            np.minimum(1.0, counts[:, 0] / 5.0) * 0.5 +
+            np.minimum(1.0, counts[:, 1] / 3.0) * 0.3 +
+            has_questions * 0.2 * 0.2
+        )
+        return np.minimum(1.0, depth)
+    
+    def _batch_reasoning(
+        self,
+        factors: Dict[str, float],
+        metadata: ArticleMetadata,
+        features: TextFeatures,
+        index: int
+    ) -> str:
+        """Reuse the per-article reasoning for batch-scored articles."""
+        return self._generate_reasoning(factors, metadata)
+    
     def _calculate_source_credibility(self, source_type: str) -> float:
         """
         Calculate source credibility score for UPSC preparation.
@@ -11,17 +11,26 @@ Demonstrates:
 - Error handling and logging
 """
 
-from typing import List, Dict, Optional
-from datetime import datetime
+from typing import Any, Callable, List, Dict, Optional, Tuple
+from datetime import datetime, timezone
+import heapq
 import logging
 import json
 
+from sqlalchemy import and_, not_
+from sqlalchemy.orm import joinedload
 from app.agent.ranking_agent import RankingAgent
 from app.agent.abstract_agent import AgentException
 from app.database.repositories.article_repository import ArticleRepository
 from app.database.repositories.ranking_repository import RankingRepository
+from app.database.repositories.base_repository import RepositoryException
+from app.database.repositories.unit_of_work import UnitOfWork
 from app.database.models import Article, Ranking
-from app.services.ranking.abstract_ranking_strategy import ArticleMetadata
+from app.services.ranking.abstract_ranking_strategy import (
+    AbstractRankingStrategy,
+    ArticleMetadata
+)
+from app.services.ranking.text_features import TextFeatures
 from app.services.ranking.upsc_ranking_strategy import UPSCRankingStrategy
 from app.services.ranking.ssc_ranking_strategy import SSCRankingStrategy
 from app.services.ranking.banking_ranking_strategy import BankingRankingStrategy
@@ -85,8 +94,10 @@ class RankingService:
         """
         Rank multiple articles for a specific exam type.
         
-        If article_ids is provided, ranks those specific articles.
+        If article_ids is provided, ranks those specific articles (those
+        without a summary are ignored, as in rank_articles_all_exams()).
         Otherwise, ranks summarized articles that don't have rankings yet.
+        Either way the articles are loaded with one query.
         
         Args:
             exam_type: Exam type (UPSC, SSC, Banking)
@@ -107,80 +118,387 @@ class RankingService:
             >>> stats = service.rank_articles(exam_type="UPSC", limit=100)
             >>> print(f"Ranked {stats['successfully_ranked']} articles")
         """
-        # Validate exam type
-        if exam_type not in self.EXAM_TYPES:
-            raise ValueError(
-                f"Invalid exam type '{exam_type}'. "
-                f"Must be one of: {', '.join(self.EXAM_TYPES)}"
-            )
+        # Validate exam type and select appropriate strategy
+        self._activate_strategy(exam_type)
         
         logger.info(f"Starting batch ranking for {exam_type}")
         
-        # Select appropriate strategy
-        strategy = self._select_strategy(exam_type)
-        self._ranking_agent.set_strategy(strategy)
-        
         # Get articles to rank
         if article_ids:
-            articles = [
-                self._article_repo.find_by_id(article_id)
-                for article_id in article_ids
-            ]
-            articles = [a for a in articles if a is not None]
+            # One query with category and source loaded; existing rankings
+            # are checked per article in _rank_batch
+            articles = self._article_repo.find_summarized_for_ranking(
+                article_ids=article_ids
+            )
+            check_existing = skip_existing
         else:
-            # Get articles that have summaries (summary relationship exists)
-            # This could be optimized with a dedicated repository method
-            all_articles = self._article_repo.find_all()
-            articles = [a for a in all_articles if a.summary is not None]
-            
-            if limit:
-                articles = articles[:limit]
+            # One joined query: summarized articles not yet ranked for this
+            # exam type, limit applied in SQL
+            articles = self._article_repo.find_summarized_for_ranking(
+                exam_type=exam_type if skip_existing else None,
+                limit=limit
+            )
+            check_existing = False
         
         logger.info(f"Found {len(articles)} articles to process")
         
+        stats = self._rank_batch(articles, exam_type, use_ai_enhancement, check_existing)
+        
+        logger.info(f"Ranking complete: {stats}")
+        return stats
+    
+    def rank_articles_all_exams(
+        self,
+        exam_types: Optional[List[str]] = None,
+        article_ids: Optional[List[int]] = None,
+        limit: Optional[int] = None,
+        skip_existing: bool = True,
+        on_progress: Optional[Callable[[List[int]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Rank articles for several exam types in one pass over the corpus.
+        
+        Each page of articles is loaded once and its text features
+        (tokens, word counts, keyword hits) are computed once and shared by
+        every exam's strategy through calculate_scores(). The rankings of
+        all exam types for the page are then written with one bulk upsert.
+        Scoring is heuristic only (no AI enhancement), so ranking every
+        exam type costs about as much as ranking one.
+        
+        Args:
+            exam_types: Exam types to rank for (default: all EXAM_TYPES)
+            article_ids: Optional list of specific article IDs to rank
+                         (articles without a summary are ignored)
+            limit: Maximum number of articles to process (optional)
+            skip_existing: If True, keep existing rankings; otherwise
+                           overwrite them with the new scores
+            on_progress: Called with the IDs of the articles of each page
+                         whose rankings were written (e.g. to checkpoint a
+                         pipeline run)
+            
+        Returns:
+            Dictionary with statistics:
+            - 'total_processed': Total articles processed
+            - 'successfully_ranked': Rankings written (all exam types)
+            - 'skipped': Rankings skipped (already existed)
+            - 'failed': Articles that could not be ranked
+            - 'by_exam_type': Rankings written per exam type
+            
+        Raises:
+            ValueError: If an exam type is invalid
+            
+        Example:
+            >>> stats = service.rank_articles_all_exams(limit=500)
+            >>> print(stats['by_exam_type'])
+        """
+        exam_types = exam_types or list(self.EXAM_TYPES)
+        for exam_type in exam_types:
+            if exam_type not in self.EXAM_TYPES:
+                raise ValueError(
+                    f"Invalid exam type '{exam_type}'. "
+                    f"Must be one of: {', '.join(self.EXAM_TYPES)}"
+                )
+        
+        strategies = [self._select_strategy(exam_type) for exam_type in exam_types]
+        
+        logger.info(f"Starting multi-exam ranking for {', '.join(exam_types)}")
+        
+        # Summarized articles (the given IDs only, if any); with
+        # skip_existing, only those missing a ranking for some exam type
+        filters = [Article.summary.has()]
+        if article_ids:
+            filters.append(Article.id.in_(article_ids))
+        if skip_existing:
+            filters.append(not_(and_(*[
+                Article.rankings.any(Ranking.exam_type == exam_type)
+                for exam_type in exam_types
+            ])))
+        
+        stats = {
+            'total_processed': 0,
+            'successfully_ranked': 0,
+            'skipped': 0,
+            'failed': 0,
+            'by_exam_type': {exam_type: 0 for exam_type in exam_types}
+        }
+        
+        for articles in self._article_repo.iter_batches(
+            filters=filters,
+            options=[joinedload(Article.category), joinedload(Article.source)],
+            limit=limit,
+            descending=True
+        ):
+            batch_stats = self._rank_batch_all_exams(
+                articles, strategies, skip_existing, on_progress
+            )
+            for key in ('total_processed', 'successfully_ranked', 'skipped', 'failed'):
+                stats[key] += batch_stats[key]
+            for exam_type, written in batch_stats['by_exam_type'].items():
+                stats['by_exam_type'][exam_type] += written
+        
+        logger.info(f"Multi-exam ranking complete: {stats}")
+        return stats
+    
+    def select_candidates(
+        self,
+        top_k: int,
+        exam_types: Optional[List[str]] = None,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, List[int]]:
+        """
+        Pre-rank articles that have no summary yet and pick the top K per exam.
+        
+        The ranking strategies only look at raw content, category, source
+        and publication date, so scoring an article does not need its
+        summary. Scoring categorized but unsummarized articles first lets
+        the pipeline summarize (the most token-expensive step) only the
+        articles that can reach a digest. Nothing is written: the
+        candidates get their stored rankings after summarization.
+        
+        Args:
+            top_k: Candidates to select per exam type
+            exam_types: Exam types to select for (default: all EXAM_TYPES)
+            since: Only consider articles published at or after this time
+            limit: Maximum number of articles to score (optional)
+            
+        Returns:
+            Dictionary mapping exam type to candidate article IDs, best first
+            
+        Raises:
+            ValueError: If an exam type is invalid
+            
+        Example:
+            >>> candidates = service.select_candidates(top_k=30)
+            >>> article_ids = set().union(*candidates.values())
+        """
+        exam_types = exam_types or list(self.EXAM_TYPES)
+        strategies = [self._select_strategy(exam_type) for exam_type in exam_types]
+        
+        filters = [Article.category_id.isnot(None), ~Article.summary.has()]
+        if since is not None:
+            filters.append(Article.published_at >= since)
+        
+        # Running top K of (score, article_id) per exam type
+        best: Dict[str, List[Tuple[float, int]]] = {exam_type: [] for exam_type in exam_types}
+        scored = 0
+        now = datetime.now(timezone.utc)
+        
+        for articles in self._article_repo.iter_batches(
+            filters=filters,
+            options=[joinedload(Article.category), joinedload(Article.source)],
+            limit=limit,
+            descending=True
+        ):
+            prepared, metadatas, _ = self._prepare_articles(articles)
+            if not prepared:
+                continue
+            
+            contents = [article.content for article in prepared]
+            features = TextFeatures(contents)
+            article_ids = [article.id for article in prepared]
+            scored += len(prepared)
+            
+            for strategy in strategies:
+                scores = strategy.score_batch(contents, metadatas, now=now, features=features)
+                best[strategy.exam_type] = heapq.nlargest(
+                    top_k,
+                    best[strategy.exam_type] + list(zip(scores.tolist(), article_ids))
+                )
+        
+        candidates = {
+            exam_type: [article_id for _, article_id in ranked]
+            for exam_type, ranked in best.items()
+        }
+        
+        selected = len(set().union(*candidates.values())) if candidates else 0
+        logger.info(
+            f"Pre-ranking selected {selected} of {scored} unsummarized articles "
+            f"(top {top_k} per exam type)"
+        )
+        return candidates
+    
+    def _rank_batch_all_exams(
+        self,
+        articles: List[Article],
+        strategies: List[AbstractRankingStrategy],
+        skip_existing: bool,
+        on_progress: Optional[Callable[[List[int]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Score a page of articles with every strategy and write all rankings.
+        
+        Args:
+            articles: Articles to rank (category and source loaded)
+            strategies: One ranking strategy per exam type
+            skip_existing: Keep existing rankings instead of overwriting them
+            on_progress: Called with the IDs of the ranked articles once
+                         their rankings are written
+            
+        Returns:
+            Dictionary with statistics (same format as rank_articles_all_exams)
+        """
+        ranked_articles, metadatas, failed = self._prepare_articles(articles)
+        
+        contents = [article.content for article in ranked_articles]
+        features = TextFeatures(contents)
+        now = datetime.now(timezone.utc)
+        
+        rankings = []
+        for strategy in strategies:
+            results = strategy.calculate_scores(
+                contents, metadatas, now=now, features=features
+            )
+            rankings.extend(
+                self._create_ranking_entity(article.id, result, strategy.exam_type)
+                for article, result in zip(ranked_articles, results)
+            )
+        
+        try:
+            written = self._ranking_repo.bulk_upsert(rankings, overwrite=not skip_existing)
+        except Exception as e:
+            logger.error(f"Failed to write rankings for {len(ranked_articles)} articles: {str(e)}")
+            written = {}
+            failed += len(ranked_articles)
+            rankings = []
+        else:
+            if on_progress is not None and ranked_articles:
+                on_progress([article.id for article in ranked_articles])
+        
+        return {
+            'total_processed': len(articles),
+            'successfully_ranked': sum(written.values()),
+            'skipped': len(rankings) - sum(written.values()),
+            'failed': failed,
+            'by_exam_type': written
+        }
+    
+    def _prepare_articles(
+        self,
+        articles: List[Article]
+    ) -> Tuple[List[Article], List[ArticleMetadata], int]:
+        """
+        Build the ranking metadata of a page of articles.
+        
+        Args:
+            articles: Articles to rank (category and source loaded)
+            
+        Returns:
+            Tuple of (rankable articles, their metadata, articles that failed)
+        """
+        prepared = []
+        metadatas = []
+        failed = 0
+        
+        for article in articles:
+            try:
+                metadatas.append(self._build_metadata(article))
+                prepared.append(article)
+            except Exception as e:
+                failed += 1
+                logger.error(f"Failed to prepare article {article.id} for ranking: {str(e)}")
+        
+        return prepared, metadatas, failed
+    
+    def _activate_strategy(self, exam_type: str) -> None:
+        """
+        Validate the exam type and set its strategy on the ranking agent.
+        
+        Args:
+            exam_type: Exam type (UPSC, SSC, Banking)
+            
+        Raises:
+            ValueError: If exam type is invalid
+        """
+        if exam_type not in self.EXAM_TYPES:
+            raise ValueError(
+                f"Invalid exam type '{exam_type}'. "
+                f"Must be one of: {', '.join(self.EXAM_TYPES)}"
+            )
+        
+        self._ranking_agent.set_strategy(self._select_strategy(exam_type))
+    
+    def _rank_batch(
+        self,
+        articles: List[Article],
+        exam_type: str,
+        use_ai_enhancement: bool,
+        check_existing: bool
+    ) -> Dict[str, int]:
+        """
+        Rank a batch of articles with the active strategy.
+        
+        All writes of the batch share one UnitOfWork (one transaction).
+        Each article is written in its own savepoint, so an article whose
+        write fails (e.g. a ranking inserted concurrently by another run)
+        is counted as failed without rolling back the others. If the final
+        commit fails, every article ranked in the batch is counted as
+        failed.
+        
+        Args:
+            articles: Articles to rank (category and source loaded)
+            exam_type: Exam type for ranking
+            use_ai_enhancement: Enable AI enhancement for borderline scores
+            check_existing: Skip articles that already have a ranking
+            
+        Returns:
+            Dictionary with statistics (same format as rank_articles)
+        """
         # Statistics tracking
         total_processed = 0
         successfully_ranked = 0
         skipped = 0
         failed = 0
         
+        # Existing rankings for this exam type, fetched in one query
+        existing_rankings = self._ranking_repo.find_by_article_ids(
+            [article.id for article in articles], exam_type
+        )
+        
         # Rank each article
-        for article in articles:
-            try:
-                # Skip if ranking already exists
-                if skip_existing and self._ranking_repo.exists_for_article(article.id):
-                    skipped += 1
-                    total_processed += 1
-                    logger.debug(f"Skipping article {article.id} (ranking exists)")
-                    continue
-                
-                self._rank_article(article, exam_type, use_ai_enhancement)
-                successfully_ranked += 1
-                total_processed += 1
-                
-                if total_processed % 10 == 0:
-                    logger.info(f"Progress: {total_processed}/{len(articles)} articles")
+        try:
+            with UnitOfWork() as uow:
+                for article in articles:
+                    try:
+                        # Skip if ranking already exists
+                        if check_existing and article.id in existing_rankings:
+                            skipped += 1
+                            total_processed += 1
+                            logger.debug(f"Skipping article {article.id} (ranking exists)")
+                            continue
                     
-            except Exception as e:
-                failed += 1
-                total_processed += 1
-                logger.error(
-                    f"Failed to rank article {article.id}: {str(e)}",
-                    exc_info=True
-                )
-                # Continue with other articles even if one fails
-                continue
+                        with uow.savepoint():
+                            self._rank_article(
+                                article, exam_type, use_ai_enhancement,
+                                existing_rankings.get(article.id)
+                            )
+                        successfully_ranked += 1
+                        total_processed += 1
+                    
+                        if total_processed % 10 == 0:
+                            logger.info(f"Progress: {total_processed}/{len(articles)} articles")
+                        
+                    except Exception as e:
+                        failed += 1
+                        total_processed += 1
+                        logger.error(
+                            f"Failed to rank article {article.id}: {str(e)}",
+                            exc_info=True
+                        )
+                        # Continue with other articles even if one fails
+                        continue
+        except RepositoryException as e:
+            logger.error(f"Failed to store rankings for {exam_type}: {str(e)}")
+            failed += successfully_ranked
+            successfully_ranked = 0
         
         # Return statistics
-        stats = {
+        return {
             'total_processed': total_processed,
             'successfully_ranked': successfully_ranked,
             'skipped': skipped,
             'failed': failed
         }
-        
-        logger.info(f"Ranking complete: {stats}")
-        return stats
     
     def _select_strategy(self, exam_type: str):
         """
@@ -211,18 +529,21 @@ class RankingService:
         self,
         article: Article,
         exam_type: str,
-        use_ai_enhancement: bool
+        use_ai_enhancement: bool,
+        existing_ranking: Optional[Ranking]
     ) -> None:
         """
         Rank a single article and persist to database.
         
         Calls the RankingAgent to score the article,
-        then creates or updates a Ranking entity.
+        then creates or updates its Ranking entity for exam_type.
         
         Args:
             article: The article entity to rank
             exam_type: Exam type for ranking
             use_ai_enhancement: Enable AI enhancement
+            existing_ranking: The article's current ranking for exam_type
+                              (None if it has none)
             
         Raises:
             AgentException: If ranking fails
@@ -231,13 +552,7 @@ class RankingService:
         logger.debug(f"Ranking article {article.id}: {article.title[:50]}...")
         
         # Prepare metadata for ranking
-        metadata = ArticleMetadata(
-            category=article.category.name if article.category else 'General',
-            source_type=article.source.source_type.value if article.source else 'unknown',
-            published_at=article.published_at,
-            content_length=len(article.content),
-            keywords=self._extract_keywords(article)
-        )
+        metadata = self._build_metadata(article)
         
         # Prepare input for agent
         input_data = {
@@ -253,9 +568,7 @@ class RankingService:
             logger.error(f"Agent failed for article {article.id}: {str(e)}")
             raise
         
-        # Check if ranking already exists (update) or create new
-        existing_ranking = self._ranking_repo.find_by_article_id(article.id)
-        
+        # Update the existing ranking for this exam type or create new
         if existing_ranking:
             # Update existing ranking
             self._update_ranking_entity(existing_ranking, result, exam_type)
@@ -267,6 +580,27 @@ class RankingService:
             self._ranking_repo.create(ranking)
             logger.debug(f"Created ranking for article {article.id}")
     
+    def _build_metadata(self, article: Article) -> ArticleMetadata:
+        """
+        Build the ranking metadata of an article.
+        
+        Args:
+            article: Article entity (category and source loaded)
+            
+        Returns:
+            ArticleMetadata for the ranking strategies
+            
+        Raises:
+            ValidationError: If the article has no content
+        """
+        return ArticleMetadata(
+            category=article.category.name if article.category else 'General',
+            source_type=article.source.source_type.value if article.source else 'unknown',
+            published_at=article.published_at,
+            content_length=len(article.content),
+            keywords=self._extract_keywords(article)
+        )
+    
     def _extract_keywords(self, article: Article) -> List[str]:
         """
         Extract keywords from article for ranking context.
@@ -286,9 +620,9 @@ class RankingService:
         keywords.extend([w for w in title_words if len(w) > 4])
         
         # Extract from metadata if available
-        if article.metadata:
+        if article.article_metadata:
             try:
-                metadata = json.loads(article.metadata)
+                metadata = json.loads(article.article_metadata)
                 if 'keywords' in metadata:
                     keywords.extend(metadata['keywords'])
             except json.JSONDecodeError:
@@ -398,13 +732,7 @@ class RankingService:
         self._ranking_agent.set_strategy(strategy)
         
         # Prepare metadata
-        metadata = ArticleMetadata(
-            category=article.category.name if article.category else 'General',
-            source_type=article.source.source_type.value if article.source else 'unknown',
-            published_at=article.published_at,
-            content_length=len(article.content),
-            keywords=self._extract_keywords(article)
-        )
+        metadata = self._build_metadata(article)
         
         # Prepare input
         input_data = {
@@ -416,8 +744,8 @@ class RankingService:
         # Call agent
         result = self._ranking_agent.execute(input_data)
         
-        # Check if ranking exists
-        existing_ranking = self._ranking_repo.find_by_article_id(article.id)
+        # Check if a ranking for this exam type exists
+        existing_ranking = self._ranking_repo.find_by_article_id(article.id, exam_type)
         
         if existing_ranking:
             # Update existing
@@ -475,19 +803,30 @@ class RankingService:
         Returns:
             Dictionary with statistics (same format as rank_articles)
         """
+        self._activate_strategy(exam_type)
+        
         logger.info(f"Re-ranking articles for {exam_type}")
         
-        # Get all articles with summaries
-        all_articles = self._article_repo.find_all()
-        articles = [a for a in all_articles if a.summary is not None]
+        stats = {
+            'total_processed': 0,
+            'successfully_ranked': 0,
+            'skipped': 0,
+            'failed': 0
+        }
         
-        if limit:
-            articles = articles[:limit]
+        # Stream all articles with summaries one page at a time, so memory
+        # stays flat however large the archive is; existing rankings are
+        # overwritten to force re-ranking
+        for articles in self._article_repo.iter_batches(
+            filters=[Article.summary.has()],
+            options=[joinedload(Article.category), joinedload(Article.source)],
+            limit=limit
+        ):
+            batch_stats = self._rank_batch(
+                articles, exam_type, use_ai_enhancement=False, check_existing=False
+            )
+            for key in stats:
+                stats[key] += batch_stats[key]
         
-        # Rank with skip_existing=False to force re-ranking
-        article_ids = [article.id for article in articles]
-        return self.rank_articles(
-            exam_type=exam_type,
-            article_ids=article_ids,
-            skip_existing=False
-        )
+        logger.info(f"Re-ranking complete: {stats}")
+        return stats
@@ -10,16 +10,20 @@ Demonstrates:
 - Error handling and logging
 """
 
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import logging
 import json
+import time
 
+from app.config import SCRAPER_MAX_WORKERS, SCRAPER_SOURCE_TIMEOUT
 from app.scrapers.scraper_factory import ScraperFactory, SourceType
 from app.scrapers.abstract_scraper import AbstractScraper, ScrapedContent
 from app.database.repositories.article_repository import ArticleRepository
 from app.database.repositories.source_repository import SourceRepository
 from app.database.models import Article, Source
+from app.services.deduplication_service import DeduplicationService
 
 
 logger = logging.getLogger(__name__)
@@ -42,13 +46,20 @@ class ScrapingService:
         _scraper_factory (ScraperFactory): Factory for creating scrapers
         _article_repo (ArticleRepository): Repository for article persistence
         _source_repo (SourceRepository): Repository for source metadata
+        _max_workers (int): Number of sources scraped in parallel
+        _source_timeout (float): Wall-clock budget per source in seconds
+        _deduplication_service (Optional[DeduplicationService]): Links new
+            articles to near-duplicates already stored (None disables it)
     """
     
     def __init__(
         self,
         scraper_factory: ScraperFactory,
         article_repository: ArticleRepository,
-        source_repository: SourceRepository
+        source_repository: SourceRepository,
+        max_workers: int = SCRAPER_MAX_WORKERS,
+        source_timeout: float = SCRAPER_SOURCE_TIMEOUT,
+        deduplication_service: Optional[DeduplicationService] = None
     ):
         """
         Initialize the scraping service with dependencies.
@@ -60,16 +71,29 @@ class ScrapingService:
             scraper_factory: Factory for creating scraper instances
             article_repository: Repository for article data access
             source_repository: Repository for source data access
+            max_workers: Number of sources to scrape in parallel
+                         (1 scrapes sources sequentially)
+            source_timeout: Seconds a single source may run before it is
+                            counted as failed
+            deduplication_service: Service for near-duplicate detection of
+                                   newly stored articles (optional)
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        
         self._scraper_factory = scraper_factory
         self._article_repo = article_repository
         self._source_repo = source_repository
-        logger.info("ScrapingService initialized")
+        self._max_workers = max_workers
+        self._source_timeout = source_timeout
+        self._deduplication_service = deduplication_service
+        logger.info(f"ScrapingService initialized (max_workers={max_workers})")
     
     def scrape_all_sources(
         self,
         hours: int = 24,
-        source_types: Optional[List[SourceType]] = None
+        source_types: Optional[List[SourceType]] = None,
+        max_workers: Optional[int] = None
     ) -> Dict[str, int]:
         """
         Scrape content from all active sources.
@@ -80,17 +104,26 @@ class ScrapingService:
         3. Scrape content from each source
         4. Filter duplicates
         5. Store new articles in database
+        6. Link near-duplicates of stored articles to their canonical article
+        
+        Sources are scraped concurrently on a bounded thread pool, so the
+        scraping wall-clock time tracks the slowest source rather than the
+        sum of all sources. A source that exceeds the per-source timeout is
+        counted as failed and its results are discarded.
         
         Args:
             hours: Number of hours to look back for content
             source_types: Optional list of specific source types to scrape
                          (if None, scrapes all active sources)
+            max_workers: Optional override of the parallelism configured on
+                         the service (1 scrapes sources sequentially)
         
         Returns:
             Dictionary with statistics:
             - 'total_scraped': Total items scraped from all sources
             - 'duplicates_filtered': Number of duplicates filtered out
             - 'articles_stored': Number of new articles stored
+            - 'near_duplicates': Stored articles linked to a canonical article
             - 'sources_processed': Number of sources successfully processed
             - 'sources_failed': Number of sources that failed
             
@@ -101,32 +134,7 @@ class ScrapingService:
         """
         logger.info(f"Starting scraping for last {hours} hours")
         
-        # Get active sources from database and extract data while in session
-        active_sources_data = []
-        
-        if source_types:
-            for source_type in source_types:
-                sources = self._source_repo.find_active_by_type(source_type)
-                for source in sources:
-                    # Extract all data while source is still in session
-                    source_type_value = source.source_type.value if hasattr(source.source_type, 'value') else str(source.source_type)
-                    active_sources_data.append({
-                        'id': source.id,
-                        'name': source.name,
-                        'source_type': source_type_value,
-                        'url': source.url
-                    })
-        else:
-            sources = self._source_repo.find_active_sources()
-            for source in sources:
-                # Extract all data while source is still in session
-                source_type_value = source.source_type.value if hasattr(source.source_type, 'value') else str(source.source_type)
-                active_sources_data.append({
-                    'id': source.id,
-                    'name': source.name,
-                    'source_type': source_type_value,
-                    'url': source.url
-                })
+        active_sources_data = self._load_active_sources(source_types)
         
         logger.info(f"Found {len(active_sources_data)} active sources to scrape")
         
@@ -136,41 +144,56 @@ class ScrapingService:
         sources_failed = 0
         all_scraped_content: List[tuple[ScrapedContent, dict]] = []
         
-        # Scrape each source
-        for source_data in active_sources_data:
-            try:
-                content_list = self._scrape_source_data(source_data, hours)
-                
-                # Pair each content with its source data
-                for content in content_list:
-                    all_scraped_content.append((content, source_data))
-                
-                total_scraped += len(content_list)
-                sources_processed += 1
-                
-                logger.info(
-                    f"Scraped {len(content_list)} items from {source_data['name']}"
-                )
-            except Exception as e:
+        # Scrape each source (in parallel when more than one worker is allowed)
+        workers = max_workers or self._max_workers
+        if workers > 1 and len(active_sources_data) > 1:
+            outcomes = self._scrape_sources_concurrently(
+                active_sources_data, hours, workers
+            )
+        else:
+            outcomes = self._scrape_sources_sequentially(active_sources_data, hours)
+        
+        for source_data, content_list, error in outcomes:
+            if error is not None:
                 sources_failed += 1
                 logger.error(
-                    f"Failed to scrape {source_data['name']}: {str(e)}",
-                    exc_info=True
+                    f"Failed to scrape {source_data['name']}: {str(error)}",
+                    exc_info=error
                 )
                 # Continue with other sources even if one fails
                 continue
+            
+            # Pair each content with its source data
+            for content in content_list:
+                all_scraped_content.append((content, source_data))
+            
+            total_scraped += len(content_list)
+            sources_processed += 1
+            
+            logger.info(
+                f"Scraped {len(content_list)} items from {source_data['name']}"
+            )
         
-        # Filter duplicates and create article entities
-        articles_to_create = self._filter_duplicates(all_scraped_content)
+        # Drop in-batch repeats and create article entities; URLs already in
+        # the database are skipped by the upsert itself
+        articles_to_create = self._dedupe_batch(all_scraped_content)
         
         duplicates_filtered = total_scraped - len(articles_to_create)
         
-        # Bulk insert articles
+        # Idempotent bulk insert (ON CONFLICT (url) DO NOTHING)
+        near_duplicates = 0
         if articles_to_create:
             try:
-                created_articles = self._article_repo.bulk_create(articles_to_create)
-                articles_stored = len(created_articles)
-                logger.info(f"Stored {articles_stored} new articles in database")
+                upsert_result = self._article_repo.bulk_upsert(articles_to_create)
+                articles_stored = upsert_result.inserted
+                duplicates_filtered += upsert_result.skipped
+                logger.info(
+                    f"Stored {articles_stored} new articles in database "
+                    f"({upsert_result.skipped} already existed)"
+                )
+                near_duplicates = len(
+                    self._link_near_duplicates(upsert_result.inserted_ids)
+                )
             except Exception as e:
                 logger.error(f"Failed to store articles: {str(e)}", exc_info=True)
                 articles_stored = 0
@@ -183,6 +206,7 @@ class ScrapingService:
             'total_scraped': total_scraped,
             'duplicates_filtered': duplicates_filtered,
             'articles_stored': articles_stored,
+            'near_duplicates': near_duplicates,
             'sources_processed': sources_processed,
             'sources_failed': sources_failed
         }
@@ -190,6 +214,308 @@ class ScrapingService:
         logger.info(f"Scraping complete: {stats}")
         return stats
     
+    def iter_new_articles(
+        self,
+        hours: int = 24,
+        source_types: Optional[List[SourceType]] = None,
+        max_workers: Optional[int] = None
+    ) -> Iterator[List[int]]:
+        """
+        Scrape all active sources and yield new article IDs per source.
+        
+        Streaming counterpart of scrape_all_sources(): each source's
+        content is stored (ON CONFLICT (url) DO NOTHING) as soon as that
+        source finishes, and the IDs of its newly inserted articles are
+        yielded right away, so downstream stages can start on the first
+        source's articles while slower sources are still being scraped.
+        Sources are yielded in completion order. Near-duplicates of stored
+        articles are stored and linked but not yielded.
+        
+        Args:
+            hours: Number of hours to look back for content
+            source_types: Optional list of specific source types to scrape
+                         (if None, scrapes all active sources)
+            max_workers: Optional override of the parallelism configured on
+                         the service (1 scrapes sources sequentially)
+            
+        Yields:
+            Lists of newly stored canonical article IDs, one list per source
+            with new content
+            
+        Example:
+            >>> for article_ids in service.iter_new_articles(hours=24):
+            ...     categorization_service.categorize_articles(article_ids=article_ids)
+        """
+        active_sources_data = self._load_active_sources(source_types)
+        logger.info(
+            f"Streaming scrape of {len(active_sources_data)} sources "
+            f"for last {hours} hours"
+        )
+        
+        workers = max_workers or self._max_workers
+        if workers > 1 and len(active_sources_data) > 1:
+            outcomes = self._iter_scrape_outcomes(active_sources_data, hours, workers)
+        else:
+            outcomes = self._scrape_sources_sequentially(active_sources_data, hours)
+        
+        for source_data, content_list, error in outcomes:
+            if error is not None:
+                logger.error(
+                    f"Failed to scrape {source_data['name']}: {str(error)}",
+                    exc_info=error
+                )
+                continue
+            
+            articles_to_create = self._dedupe_batch(
+                [(content, source_data) for content in content_list]
+            )
+            if not articles_to_create:
+                continue
+            
+            try:
+                upsert_result = self._article_repo.bulk_upsert(articles_to_create)
+            except Exception as e:
+                logger.error(
+                    f"Failed to store articles from {source_data['name']}: {str(e)}",
+                    exc_info=True
+                )
+                continue
+            
+            logger.info(
+                f"Stored {upsert_result.inserted} new articles from "
+                f"{source_data['name']} ({upsert_result.skipped} already existed)"
+            )
+            near_duplicates = self._link_near_duplicates(upsert_result.inserted_ids)
+            new_ids = [
+                article_id for article_id in upsert_result.inserted_ids
+                if article_id not in near_duplicates
+            ]
+            if new_ids:
+                yield new_ids
+    
+    def _link_near_duplicates(self, article_ids: List[int]) -> Dict[int, int]:
+        """
+        Link newly stored articles to near-duplicates already stored.
+        
+        Detection failures are logged and treated as "no duplicates", so
+        they never lose scraped articles.
+        
+        Args:
+            article_ids: IDs of the newly stored articles
+            
+        Returns:
+            Dictionary mapping each duplicate's ID to its canonical article ID
+        """
+        if self._deduplication_service is None or not article_ids:
+            return {}
+        
+        try:
+            return self._deduplication_service.detect_duplicates(article_ids)
+        except Exception as e:
+            logger.error(f"Near-duplicate detection failed: {str(e)}", exc_info=True)
+            return {}
+    
+    def _load_active_sources(
+        self,
+        source_types: Optional[List[SourceType]] = None
+    ) -> List[dict]:
+        """
+        Load active sources as plain dicts (safe to use after the session closes).
+        
+        Args:
+            source_types: Optional list of specific source types
+                         (if None, loads all active sources)
+            
+        Returns:
+            List of source data dicts (id, name, source_type, url)
+        """
+        if source_types:
+            sources = [
+                source
+                for source_type in source_types
+                for source in self._source_repo.find_active_by_type(source_type)
+            ]
+        else:
+            sources = self._source_repo.find_active_sources()
+        
+        active_sources_data = []
+        for source in sources:
+            # Extract all data while source is still in session
+            source_type_value = source.source_type.value if hasattr(source.source_type, 'value') else str(source.source_type)
+            active_sources_data.append({
+                'id': source.id,
+                'name': source.name,
+                'source_type': source_type_value,
+                'url': source.url
+            })
+        
+        return active_sources_data
+    
+    def _scrape_sources_sequentially(
+        self,
+        sources_data: List[dict],
+        hours: int
+    ) -> List[tuple[dict, Optional[List[ScrapedContent]], Optional[Exception]]]:
+        """
+        Scrape sources one after another.
+        
+        Each source runs on its own worker thread so the per-source timeout
+        applies here too; a timed-out scrape is abandoned (its thread
+        finishes in the background) and the next source starts right away.
+        
+        Args:
+            sources_data: Source data dicts to scrape
+            hours: Number of hours to look back
+            
+        Returns:
+            List of (source_data, content_list, error) tuples in source order;
+            exactly one of content_list and error is set
+        """
+        outcomes = []
+        
+        for source_data in sources_data:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scraper")
+            try:
+                future = executor.submit(self._scrape_source_data, source_data, hours)
+                done, _ = wait([future], timeout=self._source_timeout)
+                if not done:
+                    outcomes.append((
+                        source_data,
+                        None,
+                        TimeoutError(f"Scraping exceeded {self._source_timeout}s timeout")
+                    ))
+                    continue
+                
+                try:
+                    outcomes.append((source_data, future.result(), None))
+                except Exception as e:
+                    outcomes.append((source_data, None, e))
+            finally:
+                # Don't block on an abandoned scrape
+                executor.shutdown(wait=False)
+        
+        return outcomes
+    
+    def _scrape_sources_concurrently(
+        self,
+        sources_data: List[dict],
+        hours: int,
+        max_workers: int
+    ) -> List[tuple[dict, Optional[List[ScrapedContent]], Optional[Exception]]]:
+        """
+        Scrape sources in parallel on a bounded thread pool.
+        
+        Args:
+            sources_data: Source data dicts to scrape
+            hours: Number of hours to look back
+            max_workers: Maximum number of sources scraped at once
+            
+        Returns:
+            List of (source_data, content_list, error) tuples in source order;
+            exactly one of content_list and error is set
+        """
+        order = {id(source_data): index for index, source_data in enumerate(sources_data)}
+        return sorted(
+            self._iter_scrape_outcomes(sources_data, hours, max_workers),
+            key=lambda outcome: order[id(outcome[0])]
+        )
+    
+    def _iter_scrape_outcomes(
+        self,
+        sources_data: List[dict],
+        hours: int,
+        max_workers: int
+    ) -> Iterator[tuple[dict, Optional[List[ScrapedContent]], Optional[Exception]]]:
+        """
+        Scrape sources in parallel, yielding each outcome as it completes.
+        
+        Scrapers are I/O bound (HTTP and RSS fetches), so threads give real
+        parallelism here. Each source gets its own timeout measured from the
+        moment a worker picks it up, so queueing behind other sources does
+        not count against it. Timed-out scrapes are abandoned rather than
+        awaited; their worker threads finish in the background.
+        
+        An abandoned scrape keeps its worker busy. Once every worker is held
+        by an abandoned scrape, the sources still queued could never start
+        (and so never time out), so they are cancelled and reported as
+        timed out instead of waiting forever.
+        
+        Args:
+            sources_data: Source data dicts to scrape
+            hours: Number of hours to look back
+            max_workers: Maximum number of sources scraped at once
+            
+        Yields:
+            (source_data, content_list, error) tuples in completion order;
+            exactly one of content_list and error is set
+        """
+        started_at: Dict[int, float] = {}
+        abandoned = []
+        
+        def scrape(index: int, source_data: dict) -> List[ScrapedContent]:
+            started_at[index] = time.monotonic()
+            return self._scrape_source_data(source_data, hours)
+        
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="scraper"
+        )
+        try:
+            futures = {
+                executor.submit(scrape, index, source_data): index
+                for index, source_data in enumerate(sources_data)
+            }
+            pending = set(futures)
+            
+            while pending:
+                done, pending = wait(
+                    pending,
+                    timeout=min(1.0, self._source_timeout),
+                    return_when=FIRST_COMPLETED
+                )
+                
+                for future in done:
+                    index = futures[future]
+                    try:
+                        outcome = (sources_data[index], future.result(), None)
+                    except Exception as e:
+                        outcome = (sources_data[index], None, e)
+                    yield outcome
+                
+                # Abandon sources that have run past their timeout
+                now = time.monotonic()
+                for future in list(pending):
+                    index = futures[future]
+                    started = started_at.get(index)
+                    if started is not None and now - started > self._source_timeout:
+                        pending.discard(future)
+                        abandoned.append(future)
+                        yield (
+                            sources_data[index],
+                            None,
+                            TimeoutError(
+                                f"Scraping exceeded {self._source_timeout}s timeout"
+                            )
+                        )
+                
+                # With every worker stuck in an abandoned scrape, queued
+                # sources would never start; fail them instead of hanging
+                if sum(1 for future in abandoned if not future.done()) >= max_workers:
+                    for future in list(pending):
+                        if future.cancel():
+                            pending.discard(future)
+                            yield (
+                                sources_data[futures[future]],
+                                None,
+                                TimeoutError(
+                                    f"Scraping not started: all {max_workers} workers "
+                                    f"are held by timed-out sources"
+                                )
+                            )
+        finally:
+            # Don't block on abandoned scrapes; cancel anything not yet started
+            executor.shutdown(wait=False, cancel_futures=True)
+    
     def _scrape_source_data(
         self,
         source_data: dict,
@@ -278,40 +604,37 @@ class ScrapingService:
         
         return content_list
     
-    def _filter_duplicates(
+    def _dedupe_batch(
         self,
         scraped_content: List[tuple[ScrapedContent, dict]]
     ) -> List[Article]:
         """
-        Filter out duplicate articles using URL comparison.
+        Create Article entities, dropping URLs repeated within the batch.
         
-        Checks each scraped content URL against existing articles in database.
-        Only creates Article entities for new content.
+        The same item can be reported by more than one source; the first
+        occurrence wins. URLs already in the database are left to the
+        upsert (ON CONFLICT (url) DO NOTHING).
         
         Args:
             scraped_content: List of (ScrapedContent, source_data) tuples
             
         Returns:
-            List of Article entities ready for insertion (no duplicates)
+            List of Article entities with unique URLs
         """
         articles_to_create = []
+        seen_urls = set()
         
         for content, source_data in scraped_content:
-            # Check if article with this URL already exists
-            existing = self._article_repo.find_by_url(content.url)
-            
-            if existing is not None:
-                logger.debug(f"Duplicate found: {content.url}")
+            if content.url in seen_urls:
+                logger.debug(f"Duplicate within batch: {content.url}")
                 continue
             
+            seen_urls.add(content.url)
+            
             # Create new article entity
             article = self._create_article_entity_from_data(content, source_data)
             articles_to_create.append(article)
         
-        logger.info(
-            f"Filtered {len(scraped_content) - len(articles_to_create)} duplicates"
-        )
-        
         return articles_to_create
     
     def _create_article_entity_from_data(
@@ -414,22 +737,31 @@ class ScrapingService:
             content_list = self._scrape_source(source, hours)
             
             # Pair content with source
-            scraped_content = [(content, source) for content in content_list]
+            source_data = {'id': source.id, 'name': source.name}
+            scraped_content = [(content, source_data) for content in content_list]
             
-            # Filter duplicates and create articles
-            articles_to_create = self._filter_duplicates(scraped_content)
+            # Drop in-batch repeats; URLs already stored are skipped by the upsert
+            articles_to_create = self._dedupe_batch(scraped_content)
+            duplicates_filtered = len(content_list) - len(articles_to_create)
             
-            # Store articles
+            # Idempotent bulk insert (ON CONFLICT (url) DO NOTHING), so an
+            # overlapping run storing the same URLs doesn't fail this one
             if articles_to_create:
-                created_articles = self._article_repo.bulk_create(articles_to_create)
-                articles_stored = len(created_articles)
+                upsert_result = self._article_repo.bulk_upsert(articles_to_create)
+                articles_stored = upsert_result.inserted
+                duplicates_filtered += upsert_result.skipped
+                near_duplicates = len(
+                    self._link_near_duplicates(upsert_result.inserted_ids)
+                )
             else:
                 articles_stored = 0
+                near_duplicates = 0
             
             stats = {
                 'total_scraped': len(content_list),
-                'duplicates_filtered': len(content_list) - len(articles_to_create),
+                'duplicates_filtered': duplicates_filtered,
                 'articles_stored': articles_stored,
+                'near_duplicates': near_duplicates,
                 'sources_processed': 1,
                 'sources_failed': 0
             }
@@ -443,6 +775,7 @@ class ScrapingService:
                 'total_scraped': 0,
                 'duplicates_filtered': 0,
                 'articles_stored': 0,
+                'near_duplicates': 0,
                 'sources_processed': 0,
                 'sources_failed': 1
             }
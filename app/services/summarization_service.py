@@ -10,10 +10,13 @@ Demonstrates:
 - Error handling and logging
 """
 
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
+import asyncio
 import logging
 import json
 
+from sqlalchemy.orm import joinedload
+from app.config import GEMINI_MAX_CONCURRENCY
 from app.agent.summarization_agent import SummarizationAgent, SummaryResult
 from app.agent.abstract_agent import AgentException
 from app.database.repositories.article_repository import ArticleRepository
@@ -40,13 +43,15 @@ class SummarizationService:
         _summarization_agent (SummarizationAgent): Agent for AI summarization
         _article_repo (ArticleRepository): Repository for article data access
         _summary_repo (SummaryRepository): Repository for summary persistence
+        _max_in_flight (int): Concurrent agent calls (1 = sequential)
     """
     
     def __init__(
         self,
         summarization_agent: SummarizationAgent,
         article_repository: ArticleRepository,
-        summary_repository: SummaryRepository
+        summary_repository: SummaryRepository,
+        max_in_flight: int = GEMINI_MAX_CONCURRENCY
     ):
         """
         Initialize the summarization service with dependencies.
@@ -58,28 +63,41 @@ class SummarizationService:
             summarization_agent: Agent for AI-powered summarization
             article_repository: Repository for article data access
             summary_repository: Repository for summary persistence
+            max_in_flight: Articles summarized concurrently (1 = sequential)
         """
         self._summarization_agent = summarization_agent
         self._article_repo = article_repository
         self._summary_repo = summary_repository
+        self._max_in_flight = max(1, max_in_flight)
         logger.info("SummarizationService initialized")
     
     def summarize_articles(
         self,
         article_ids: Optional[List[int]] = None,
         limit: Optional[int] = None,
-        skip_existing: bool = True
+        skip_existing: bool = True,
+        on_progress: Optional[Callable[[List[int]], None]] = None
     ) -> Dict[str, int]:
         """
         Generate summaries for multiple articles in batch.
         
         If article_ids is provided, summarizes those specific articles.
-        Otherwise, summarizes categorized articles that don't have summaries yet.
+        Otherwise, summarizes categorized articles that don't have summaries yet,
+        streamed from the database in pages (see BaseRepository.iter_batches).
+        
+        With max_in_flight > 1, up to that many articles are summarized at
+        once on the async agent path, which stays under the Gemini request
+        quota via the shared request limiter. Must not be called from a
+        running event loop in that case. Either way each article's agent
+        call is retried on transient errors (execute_with_fallback), so
+        max_in_flight does not change which articles fail.
         
         Args:
             article_ids: Optional list of specific article IDs to summarize
             limit: Maximum number of articles to process (optional)
             skip_existing: If True, skip articles that already have summaries
+            on_progress: Called with [article_id] after each summary is
+                         stored (e.g. to checkpoint a pipeline run)
             
         Returns:
             Dictionary with statistics:
@@ -95,24 +113,64 @@ class SummarizationService:
         """
         logger.info("Starting batch summarization")
         
-        # Get articles to summarize
+        stats = {
+            'total_processed': 0,
+            'successfully_summarized': 0,
+            'skipped': 0,
+            'failed': 0
+        }
+        
+        # Get articles to summarize: the given IDs, or else categorized
+        # articles (newest first). Either way they are streamed one page at
+        # a time, so memory stays flat however large the archive is, and
+        # articles that already have a summary are excluded in SQL
         if article_ids:
-            articles = [
-                self._article_repo.find_by_id(article_id)
-                for article_id in article_ids
-            ]
-            articles = [a for a in articles if a is not None]
+            filters = [Article.id.in_(article_ids)]
         else:
-            # Get categorized articles (category_id is not None)
-            # This could be optimized with a dedicated repository method
-            all_articles = self._article_repo.find_all()
-            articles = [a for a in all_articles if a.category_id is not None]
+            filters = [Article.category_id.isnot(None)]
+        
+        if skip_existing:
+            filters.append(~Article.summary.has())
+            skip_existing = False
+        
+        batches = self._article_repo.iter_batches(
+            filters=filters,
+            options=[joinedload(Article.category), joinedload(Article.source)],
+            limit=limit,
+            descending=True
+        )
+        
+        for articles in batches:
+            if self._max_in_flight > 1 and len(articles) > 1:
+                batch_stats = asyncio.run(
+                    self._summarize_concurrently(articles, skip_existing, on_progress)
+                )
+            else:
+                batch_stats = self._summarize_sequentially(articles, skip_existing, on_progress)
             
-            if limit:
-                articles = articles[:limit]
+            for key in stats:
+                stats[key] += batch_stats[key]
         
-        logger.info(f"Found {len(articles)} articles to process")
+        logger.info(f"Summarization complete: {stats}")
+        return stats
+    
+    def _summarize_sequentially(
+        self,
+        articles: List[Article],
+        skip_existing: bool,
+        on_progress: Optional[Callable[[List[int]], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Summarize articles one at a time.
         
+        Args:
+            articles: Articles to summarize
+            skip_existing: If True, skip articles that already have summaries
+            on_progress: Called with [article_id] after each stored summary
+            
+        Returns:
+            Dictionary with statistics (same format as summarize_articles)
+        """
         # Statistics tracking
         total_processed = 0
         successfully_summarized = 0
@@ -133,6 +191,9 @@ class SummarizationService:
                 successfully_summarized += 1
                 total_processed += 1
                 
+                if on_progress is not None:
+                    on_progress([article.id])
+                
                 if total_processed % 10 == 0:
                     logger.info(f"Progress: {total_processed}/{len(articles)} articles")
                     
@@ -147,15 +208,85 @@ class SummarizationService:
                 continue
         
         # Return statistics
-        stats = {
+        return {
             'total_processed': total_processed,
             'successfully_summarized': successfully_summarized,
             'skipped': skipped,
             'failed': failed
         }
+    
+    async def _summarize_concurrently(
+        self,
+        articles: List[Article],
+        skip_existing: bool,
+        on_progress: Optional[Callable[[List[int]], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Summarize articles with up to max_in_flight agent calls in flight.
         
-        logger.info(f"Summarization complete: {stats}")
-        return stats
+        Results are persisted one at a time as they complete; the database
+        writes run in a worker thread so they don't stall the event loop.
+        
+        Args:
+            articles: Articles to summarize
+            skip_existing: If True, skip articles that already have summaries
+            on_progress: Called with [article_id] after each stored summary
+            
+        Returns:
+            Dictionary with statistics (same format as summarize_articles)
+        """
+        total_processed = 0
+        successfully_summarized = 0
+        skipped = 0
+        failed = 0
+        
+        pending = []
+        for article in articles:
+            if skip_existing and self._summary_repo.exists_for_article(article.id):
+                skipped += 1
+                total_processed += 1
+                logger.debug(f"Skipping article {article.id} (summary exists)")
+            else:
+                pending.append(article)
+        
+        semaphore = asyncio.Semaphore(self._max_in_flight)
+        
+        async def summarize(article: Article) -> Tuple[Article, Optional[SummaryResult], Optional[Exception]]:
+            async with semaphore:
+                try:
+                    result = await self._summarization_agent.execute_with_fallback_async(
+                        self._build_agent_input(article)
+                    )
+                    return article, result, None
+                except Exception as e:
+                    return article, None, e
+        
+        for next_done in asyncio.as_completed([summarize(article) for article in pending]):
+            article, result, error = await next_done
+            total_processed += 1
+            
+            if error is None:
+                try:
+                    await asyncio.to_thread(self.store_summary, article, result)
+                    successfully_summarized += 1
+                    if on_progress is not None:
+                        await asyncio.to_thread(on_progress, [article.id])
+                except Exception as e:
+                    error = e
+            
+            if error is not None:
+                failed += 1
+                logger.error(f"Failed to summarize article {article.id}: {str(error)}")
+            
+            if total_processed % 10 == 0:
+                logger.info(f"Progress: {total_processed}/{len(articles)} articles")
+        
+        return {
+            'total_processed': total_processed,
+            'successfully_summarized': successfully_summarized,
+            'skipped': skipped,
+            'failed': failed
+        }
     
     def _summarize_article(self, article: Article) -> None:
         """
@@ -173,24 +304,48 @@ class SummarizationService:
         """
         logger.debug(f"Summarizing article {article.id}: {article.title[:50]}...")
         
+        # Call summarization agent
+        try:
+            result: SummaryResult = self._summarization_agent.execute_with_fallback(
+                self._build_agent_input(article)
+            )
+        except AgentException as e:
+            logger.error(f"Agent failed for article {article.id}: {str(e)}")
+            raise
+        
+        self.store_summary(article, result)
+    
+    def _build_agent_input(self, article: Article) -> dict:
+        """
+        Build the SummarizationAgent input for an article.
+        
+        Args:
+            article: The article entity to summarize
+            
+        Returns:
+            Agent input dictionary (title, content, category, source_type)
+        """
         # Get category name for context
         category_name = article.category.name if article.category else 'General'
         
-        # Prepare input for agent
-        input_data = {
+        return {
             'title': article.title,
             'content': article.content,
             'category': category_name,
             'source_type': article.source.source_type.value if article.source else 'unknown'
         }
+    
+    def store_summary(self, article: Article, result: SummaryResult) -> None:
+        """
+        Create or update the summary for an article.
         
-        # Call summarization agent
-        try:
-            result: SummaryResult = self._summarization_agent.execute(input_data)
-        except AgentException as e:
-            logger.error(f"Agent failed for article {article.id}: {str(e)}")
-            raise
-        
+        Args:
+            article: The summarized article entity
+            result: Summarization result from agent
+            
+        Raises:
+            Exception: If database operation fails
+        """
         # Check if summary already exists (update) or create new
         existing_summary = self._summary_repo.find_by_article_id(article.id)
         
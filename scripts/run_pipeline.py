@@ -12,6 +12,7 @@ Examples:
     python scripts/run_pipeline.py 24 10 --exam-type UPSC
     python scripts/run_pipeline.py 48 15 --exam-type SSC --dry-run
     python scripts/run_pipeline.py --exam-type Banking --no-email
+    python scripts/run_pipeline.py --resume 42
 """
 import os
 import sys
@@ -65,9 +66,15 @@ def initialize_dependencies():
     """
     try:
         # Import all required components
+        from app.config import (
+            NEAR_DUP_ENABLED,
+            LOCAL_CLASSIFIER_ENABLED,
+            LOCAL_CLASSIFIER_MODEL_PATH
+        )
         from app.agent.abstract_agent import AgentConfig
         from app.agent.categorization_agent import CategorizationAgent
         from app.agent.summarization_agent import SummarizationAgent
+        from app.agent.categorize_summarize_agent import CategorizeSummarizeAgent
         from app.agent.ranking_agent import RankingAgent
         from app.agent.digest_agent import DigestAgent
         
@@ -82,10 +89,15 @@ def initialize_dependencies():
         from app.database.repositories.ranking_repository import RankingRepository
         from app.database.repositories.category_repository import CategoryRepository
         from app.database.repositories.source_repository import SourceRepository
+        from app.database.repositories.pipeline_run_repository import PipelineRunRepository
+        from app.database.repositories.article_signature_repository import ArticleSignatureRepository
         
         from app.services.scraping_service import ScrapingService
+        from app.services.deduplication_service import DeduplicationService
         from app.services.categorization_service import CategorizationService
+        from app.services.local_classifier import LocalCategoryClassifier
         from app.services.summarization_service import SummarizationService
+        from app.services.categorize_summarize_service import CategorizeSummarizeService
         from app.services.ranking_service import RankingService
         from app.services.digest_generation_service import DigestGenerationService
         
@@ -104,6 +116,9 @@ def initialize_dependencies():
         # Initialize agents
         categorization_agent = CategorizationAgent(agent_config)
         summarization_agent = SummarizationAgent(agent_config)
+        categorize_summarize_agent = CategorizeSummarizeAgent(
+            agent_config, categorization_agent, summarization_agent
+        )
         digest_agent = DigestAgent(agent_config)
         
         # Initialize ranking strategies
@@ -130,16 +145,36 @@ def initialize_dependencies():
         scraper_factory = ScraperFactory()
         
         # Initialize services
+        deduplication_service = None
+        if NEAR_DUP_ENABLED:
+            deduplication_service = DeduplicationService(
+                article_repository=article_repo,
+                signature_repository=ArticleSignatureRepository()
+            )
+        
         scraping_service = ScrapingService(
             scraper_factory=scraper_factory,
             article_repository=article_repo,
-            source_repository=source_repo
+            source_repository=source_repo,
+            deduplication_service=deduplication_service
         )
         
+        # Local classifier (trained with scripts/train_local_classifier.py)
+        local_classifier = None
+        if LOCAL_CLASSIFIER_ENABLED and os.path.exists(LOCAL_CLASSIFIER_MODEL_PATH):
+            try:
+                local_classifier = LocalCategoryClassifier.load(LOCAL_CLASSIFIER_MODEL_PATH)
+                logger.info(
+                    f"Local classifier loaded (threshold {local_classifier.threshold:.3f})"
+                )
+            except (OSError, ValueError) as e:
+                logger.warning(f"Local classifier not loaded, using Gemini only: {e}")
+        
         categorization_service = CategorizationService(
             categorization_agent=categorization_agent,
             article_repository=article_repo,
-            category_repository=category_repo
+            category_repository=category_repo,
+            local_classifier=local_classifier
         )
         
         summarization_service = SummarizationService(
@@ -148,6 +183,13 @@ def initialize_dependencies():
             summary_repository=summary_repo
         )
         
+        categorize_summarize_service = CategorizeSummarizeService(
+            categorize_summarize_agent=categorize_summarize_agent,
+            article_repository=article_repo,
+            categorization_service=categorization_service,
+            summarization_service=summarization_service
+        )
+        
         ranking_service = RankingService(
             ranking_agent=ranking_agent,
             article_repository=article_repo,
@@ -166,7 +208,9 @@ def initialize_dependencies():
             summarization_service=summarization_service,
             ranking_service=ranking_service,
             digest_service=digest_service,
-            logger=logger
+            logger=logger,
+            run_repository=PipelineRunRepository(),
+            categorize_summarize_service=categorize_summarize_service
         )
         
         services = {
@@ -260,6 +304,9 @@ Examples:
   %(prog)s 24 10 --exam-type UPSC
   %(prog)s 48 15 --exam-type SSC --dry-run
   %(prog)s --exam-type Banking --no-email
+  %(prog)s 24 10 --streaming
+  %(prog)s 24 10 --fused
+  %(prog)s --resume 42
         """
     )
     parser.add_argument(
@@ -292,6 +339,32 @@ Examples:
         action="store_true",
         help="Skip email generation and sending (still writes to database)"
     )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Overlap scraping, categorization, summarization and ranking "
+             "using bounded queues between stages"
+    )
+    parser.add_argument(
+        "--fused",
+        action="store_true",
+        help="Categorize and summarize each article with a single Gemini call "
+             "(summarizes every new article: disables pre-ranking for them)"
+    )
+    parser.add_argument(
+        "--prerank-top-k",
+        type=int,
+        metavar="K",
+        help="Summarize only the top K pre-ranked articles per exam type "
+             "(default: PRERANK_TOP_K from config; 0 summarizes all)"
+    )
+    parser.add_argument(
+        "--resume",
+        type=int,
+        metavar="RUN_ID",
+        help="Resume a failed or interrupted run with its original parameters, "
+             "skipping completed stages and already-processed articles"
+    )
     parser.add_argument(
         "--skip-validation",
         action="store_true",
@@ -300,6 +373,9 @@ Examples:
     
     args = parser.parse_args()
     
+    if args.resume is not None and args.dry_run:
+        parser.error("--resume cannot be combined with --dry-run")
+    
     # Validate exam type
     exam_type = args.exam_type.upper()
     
@@ -312,6 +388,8 @@ Examples:
     logger.info(f"Top N articles: {args.top_n}")
     logger.info(f"Dry run: {args.dry_run}")
     logger.info(f"No email: {args.no_email}")
+    logger.info(f"Streaming: {args.streaming}")
+    logger.info(f"Fused: {args.fused}")
     logger.info(f"Timestamp: {datetime.now().isoformat()}")
     logger.info("=" * 80)
     
@@ -335,6 +413,25 @@ Examples:
         logger.error(f"Failed to initialize pipeline dependencies: {e}")
         sys.exit(1)
     
+    # A resumed run keeps the parameters it was started with
+    if args.resume is not None:
+        try:
+            from app.database.repositories.pipeline_run_repository import PipelineRunRepository
+            run = PipelineRunRepository().find_by_id(args.resume)
+        except Exception as e:
+            logger.error(f"Failed to load pipeline run {args.resume}: {e}")
+            sys.exit(1)
+        
+        if run is None:
+            logger.error(f"Pipeline run {args.resume} not found")
+            sys.exit(1)
+        
+        args.hours, args.top_n, exam_type = run.hours, run.top_n, run.exam_type
+        logger.info(
+            f"Resuming run {run.id} (status: {run.status}) - Hours: {args.hours}, "
+            f"Top N: {args.top_n}, Exam Type: {exam_type}"
+        )
+    
     # Pipeline execution phase
     logger.info("Phase 4: Pipeline Execution")
     try:
@@ -343,7 +440,11 @@ Examples:
             hours=args.hours,
             top_n=args.top_n,
             exam_type=exam_type,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            streaming=args.streaming,
+            resume_run_id=args.resume,
+            prerank_top_k=args.prerank_top_k,
+            fused=args.fused
         )
         
         # Display results
@@ -385,6 +486,13 @@ Examples:
             logger.info(f"Articles Summarized: {result.articles_summarized}")
             logger.info(f"Articles Ranked: {result.articles_ranked}")
             logger.info(f"Top Articles Selected: {result.top_articles_selected}")
+            if result.run_id is not None:
+                logger.info(f"Run ID: {result.run_id}")
+            if result.content_stats:
+                tokens_saved = sum(
+                    stats['tokens_saved'] for stats in result.content_stats.values()
+                )
+                logger.info(f"Prompt Tokens Saved: {tokens_saved}")
             
             if result.errors:
                 logger.info(f"Errors Encountered: {len(result.errors)}")
@@ -411,6 +519,9 @@ Examples:
                 for error in result.errors:
                     logger.error(f"  - {error}")
             
+            if result.run_id is not None:
+                logger.error(f"Resume with: --resume {result.run_id}")
+            
             logger.error("=" * 80)
             sys.exit(1)
             
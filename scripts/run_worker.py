@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Competitive Exam Intelligence System - Queue Worker Runner
+
+Runs one pipeline stage as a worker on the database-backed work queue.
+Start as many workers per stage as needed, on any number of nodes; they
+share the work_items table and never process the same article twice.
+
+Usage:
+    python scripts/run_worker.py scrape [--hours N]
+    python scripts/run_worker.py {categorize,summarize,rank} [options]
+    python scripts/run_worker.py status
+
+Examples:
+    python scripts/run_worker.py scrape --hours 24
+    python scripts/run_worker.py summarize --batch-size 10
+    python scripts/run_worker.py rank --once
+"""
+
+import os
+import sys
+import argparse
+import logging
+
+# Add parent directory to path for app imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from run_pipeline import initialize_dependencies, test_database_connection
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main entry point for the queue worker."""
+    from app.config import (
+        WORK_QUEUE_BATCH_SIZE,
+        WORK_QUEUE_LEASE_SECONDS,
+        WORK_QUEUE_MAX_ATTEMPTS,
+        WORK_QUEUE_POLL_SECONDS
+    )
+    from app.database.repositories.article_repository import ArticleRepository
+    from app.database.repositories.work_item_repository import WorkItemRepository
+    from app.pipeline.worker import StageWorker
+
+    parser = argparse.ArgumentParser(
+        description="Competitive Exam Intelligence System - Queue Worker",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s scrape --hours 24
+  %(prog)s summarize --batch-size 10
+  %(prog)s rank --once
+  %(prog)s status
+        """
+    )
+    parser.add_argument(
+        "command",
+        choices=["scrape"] + StageWorker.STAGES + ["status"],
+        help="scrape: queue new articles; categorize/summarize/rank: process "
+             "that stage's queue; status: show queue counts"
+    )
+    parser.add_argument(
+        "--hours",
+        type=int,
+        default=24,
+        help="Hours to look back when scraping (default: 24)"
+    )
+    parser.add_argument(
+        "--worker-id",
+        help="Unique worker ID (default: <hostname>:<pid>)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=WORK_QUEUE_BATCH_SIZE,
+        help=f"Items claimed per batch (default: {WORK_QUEUE_BATCH_SIZE})"
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=int,
+        default=WORK_QUEUE_LEASE_SECONDS,
+        help=f"Claim lifetime in seconds (default: {WORK_QUEUE_LEASE_SECONDS})"
+    )
+    parser.add_argument(
+        "--max-batches",
+        type=int,
+        help="Stop after this many batches"
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Stop when the queue is empty instead of polling for new items"
+    )
+
+    args = parser.parse_args()
+
+    if not test_database_connection():
+        logger.error("Database connection test failed. Exiting.")
+        sys.exit(1)
+
+    work_items = WorkItemRepository()
+
+    if args.command == "status":
+        for stage, counts in sorted(work_items.count_by_status().items()):
+            summary = ", ".join(f"{status}={count}" for status, count in sorted(counts.items()))
+            logger.info(f"{stage}: {summary}")
+        sys.exit(0)
+
+    _, services = initialize_dependencies()
+
+    worker = StageWorker(
+        work_item_repository=work_items,
+        article_repository=ArticleRepository(),
+        categorization_service=services['categorization'],
+        summarization_service=services['summarization'],
+        ranking_service=services['ranking'],
+        worker_id=args.worker_id,
+        batch_size=args.batch_size,
+        lease_seconds=args.lease_seconds,
+        max_attempts=WORK_QUEUE_MAX_ATTEMPTS
+    )
+
+    try:
+        if args.command == "scrape":
+            worker.enqueue_scraped(services['scraping'], hours=args.hours)
+        else:
+            worker.run(
+                args.command,
+                max_batches=args.max_batches,
+                wait=not args.once,
+                poll_seconds=WORK_QUEUE_POLL_SECONDS
+            )
+    except KeyboardInterrupt:
+        # Claimed items are handed out again once their lease expires
+        logger.warning(f"Worker {worker.worker_id} interrupted by user (Ctrl+C)")
+        sys.exit(130)
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Test script for batched article categorization.
+
+This script tests CategorizationAgent.execute_batch() against a scripted
+Gemini model: one call per batch, follow-up prompts for articles left
+uncategorized, and that bad responses are never replayed from the
+response cache.
+"""
+
+import sys
+import os
+import json
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# No rate limiting and no shared on-disk cache for scripted responses
+os.environ["GEMINI_REQUESTS_PER_MINUTE"] = "0"
+os.environ["GEMINI_TOKENS_PER_MINUTE"] = "0"
+os.environ["RATE_LIMIT_BACKEND"] = "memory"
+os.environ["LLM_CACHE_ENABLED"] = "false"
+
+from app.agent.abstract_agent import AgentConfig
+from app.agent.categorization_agent import CategorizationAgent
+from app.agent.response_cache import InMemoryLRUCache
+
+_ARTICLES = [
+    {"id": 1, "title": "RBI keeps repo rate unchanged", "content": "The MPC kept the repo rate at 6.5 percent.", "source_type": "pib"},
+    {"id": 2, "title": "Supreme Court upholds law", "content": "A constitution bench ruled on federalism.", "source_type": "pib"},
+    {"id": 3, "title": "ISRO launches satellite", "content": "The PSLV placed an earth observation satellite in orbit.", "source_type": "youtube"}
+]
+
+
+class _Response:
+    """Minimal Gemini response."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _ScriptedModel:
+    """Gemini model stand-in that answers with scripted responses in order."""
+
+    def __init__(self, responses: list):
+        self._responses = list(responses)
+        self.prompts = []
+
+    def generate_content(self, prompt, generation_config=None):
+        self.prompts.append(prompt)
+        return _Response(self._responses.pop(0))
+
+
+def _entry(article_id, category: str) -> dict:
+    """Build a valid batch response entry."""
+    return {
+        "article_id": str(article_id),
+        "primary_category": category,
+        "secondary_categories": [],
+        "confidence": 0.9,
+        "reasoning": "Scripted answer"
+    }
+
+
+def _agent(responses: list) -> CategorizationAgent:
+    """Build an agent answering from scripted responses with a private cache."""
+    agent = CategorizationAgent(AgentConfig(api_key="test-key"))
+    agent.response_cache = InMemoryLRUCache()
+    agent._model = _ScriptedModel(responses)
+    return agent
+
+
+def test_one_call_per_batch():
+    """Test that a fully answered batch takes a single API call."""
+    try:
+        agent = _agent([json.dumps([
+            _entry(1, "Economy"), _entry(2, "Polity"), _entry(3, "Science & Tech")
+        ])])
+
+        results = agent.execute_batch(_ARTICLES)
+
+        assert len(agent._model.prompts) == 1, f"Made {len(agent._model.prompts)} calls"
+        assert {k: r.primary_category for k, r in results.items()} == {
+            1: "Economy", 2: "Polity", 3: "Science & Tech"
+        }, f"Unexpected results: {results}"
+
+        print("✅ A batch is categorized with one call")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Single call test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_retries_only_missing_articles():
+    """Test that missing or invalid entries are retried in a smaller prompt."""
+    try:
+        agent = _agent([
+            json.dumps([_entry(1, "Economy"), _entry(2, "Cricket")]),
+            json.dumps([_entry(2, "Polity"), _entry(3, "Science & Tech")])
+        ])
+
+        results = agent.execute_batch(_ARTICLES, max_retries=1)
+
+        prompts = agent._model.prompts
+        assert len(prompts) == 2, f"Made {len(prompts)} calls"
+        assert "Article ID: 1" not in prompts[1], "The answered article should not be retried"
+        assert "Article ID: 2" in prompts[1] and "Article ID: 3" in prompts[1]
+        assert sorted(results) == [1, 2, 3], f"Unexpected results: {results}"
+        assert results[2].primary_category == "Polity"
+
+        print("✅ Only uncategorized articles are retried")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Retry test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_non_list_response_is_discarded():
+    """Test that a bare JSON value is rejected and not replayed from the cache."""
+    try:
+        agent = _agent(["42", json.dumps([_entry(1, "Economy")])])
+        articles = _ARTICLES[:1]
+
+        first = agent.execute_batch(articles, max_retries=0)
+        assert first == {}, f"A bare number should categorize nothing, got {first}"
+
+        prompt = agent._model.prompts[0]
+        assert agent.response_cache.get(agent._cache_key(prompt)) is None, \
+            "The bad response should be removed from the cache"
+
+        second = agent.execute_batch(articles, max_retries=0)
+        assert len(agent._model.prompts) == 2, "The next run should ask the model again"
+        assert second[1].primary_category == "Economy"
+
+        print("✅ Non-list responses are discarded")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Non-list response test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_invalid_items_are_skipped():
+    """Test that items without an id or content never reach the prompt."""
+    try:
+        agent = _agent([json.dumps([_entry(1, "Economy")])])
+
+        results = agent.execute_batch([
+            _ARTICLES[0],
+            {"title": "No id", "content": "Some content"},
+            {"id": 9, "title": "No content", "content": ""}
+        ])
+
+        assert list(results) == [1], f"Unexpected results: {results}"
+        assert "Article ID: 9" not in agent._model.prompts[0]
+
+        print("✅ Invalid batch items are skipped")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Invalid item test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Testing batch categorization...")
+
+    tests = [
+        ("One Call per Batch", test_one_call_per_batch),
+        ("Retry Missing Articles", test_retries_only_missing_articles),
+        ("Non-list Response", test_non_list_response_is_discarded),
+        ("Invalid Items", test_invalid_items_are_skipped)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+
+    print(f"\n🏁 Batch Categorization Tests: {passed}/{total} passed")
+
+    if passed == total:
+        print("🎉 All batch categorization tests passed!")
+        sys.exit(0)
+    else:
+        print("💥 Some batch categorization tests failed!")
+        sys.exit(1)
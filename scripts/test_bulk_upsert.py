@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test script for idempotent article inserts.
+
+This script tests that ArticleRepository.bulk_upsert() inserts new URLs,
+skips URLs that are already stored or repeated within a batch, and can be
+re-run safely, against a throwaway SQLite database.
+"""
+
+import sys
+import os
+import tempfile
+from datetime import datetime
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.database.connection import dispose_engine, get_engine, get_session_factory
+from app.database.models import Base, Source, SourceType, Article
+from app.database.repositories.article_repository import ArticleRepository
+
+_DB_DIR = tempfile.mkdtemp(prefix="test_bulk_upsert_")
+
+
+def _reset_database(name: str) -> int:
+    """Point the shared engine at a fresh SQLite database with one source."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, name)}.db"
+    dispose_engine()
+    Base.metadata.create_all(get_engine())
+
+    with get_session_factory()() as session:
+        source = Source(name="PIB", source_type=SourceType.PIB, url="https://pib.gov.in")
+        session.add(source)
+        session.commit()
+        return source.id
+
+
+def _article(source_id: int, slug: str) -> Article:
+    """Build an unsaved article for a URL slug."""
+    return Article(
+        title=f"Article {slug}",
+        content=f"Content of {slug}",
+        url=f"https://pib.gov.in/{slug}",
+        published_at=datetime.now(),
+        source_id=source_id
+    )
+
+
+def _stored_urls() -> list:
+    """Get the URLs of all stored articles."""
+    with get_session_factory()() as session:
+        return sorted(url for (url,) in session.query(Article.url))
+
+
+def test_inserts_new_articles():
+    """Test that a batch of new URLs is inserted and IDs are returned."""
+    try:
+        source_id = _reset_database("insert")
+        repo = ArticleRepository()
+
+        result = repo.bulk_upsert([_article(source_id, slug) for slug in ("a", "b", "c")])
+
+        assert result.inserted == 3, f"Expected 3 inserted, got {result.inserted}"
+        assert result.skipped == 0, f"Expected 0 skipped, got {result.skipped}"
+        assert len(set(result.inserted_ids)) == 3, "Inserted IDs should be distinct"
+        assert len(_stored_urls()) == 3
+
+        print("✅ New articles are inserted")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Insert test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_skips_existing_and_repeated_urls():
+    """Test that stored URLs and URLs repeated within the batch are skipped."""
+    try:
+        source_id = _reset_database("skip")
+        repo = ArticleRepository()
+        repo.bulk_upsert([_article(source_id, "a")])
+
+        result = repo.bulk_upsert([
+            _article(source_id, "a"),
+            _article(source_id, "b"),
+            _article(source_id, "b"),
+            _article(source_id, "c")
+        ])
+
+        assert result.inserted == 2, f"Expected 2 inserted, got {result.inserted}"
+        assert result.skipped == 2, f"Expected 2 skipped, got {result.skipped}"
+        assert _stored_urls() == [
+            "https://pib.gov.in/a",
+            "https://pib.gov.in/b",
+            "https://pib.gov.in/c"
+        ], f"Unexpected stored URLs: {_stored_urls()}"
+
+        print("✅ Existing and repeated URLs are skipped")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Skip test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_rerun_is_idempotent():
+    """Test that storing the same scrape twice inserts nothing the second time."""
+    try:
+        source_id = _reset_database("rerun")
+        repo = ArticleRepository()
+        slugs = ("a", "b", "c")
+
+        first = repo.bulk_upsert([_article(source_id, slug) for slug in slugs])
+        second = repo.bulk_upsert([_article(source_id, slug) for slug in slugs])
+
+        assert first.inserted == 3, f"First run inserted {first.inserted}"
+        assert second.inserted == 0, f"Second run inserted {second.inserted}"
+        assert second.skipped == 3, f"Second run skipped {second.skipped}"
+        assert len(_stored_urls()) == 3
+        assert repo.bulk_upsert([]).inserted == 0, "An empty batch should be a no-op"
+
+        print("✅ Re-running the same batch is idempotent")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Idempotency test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Testing bulk upsert functionality...")
+
+    tests = [
+        ("Insert New Articles", test_inserts_new_articles),
+        ("Skip Duplicate URLs", test_skips_existing_and_repeated_urls),
+        ("Idempotent Re-run", test_rerun_is_idempotent)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+
+    print(f"\n🏁 Bulk Upsert Tests: {passed}/{total} passed")
+
+    if passed == total:
+        print("🎉 All bulk upsert tests passed!")
+        sys.exit(0)
+    else:
+        print("💥 Some bulk upsert tests failed!")
+        sys.exit(1)
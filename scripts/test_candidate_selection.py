@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Test script for pre-ranking candidate selection.
+
+This script tests that RankingService.select_candidates() returns the top K
+unsummarized, categorized articles per exam type, best first, matching a
+direct scoring of every eligible article, across pages of the keyset scan.
+Runs against a throwaway SQLite database.
+"""
+
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy.orm import joinedload
+
+from app.database.connection import dispose_engine, get_engine, get_session_factory
+from app.database.models import Base, Source, SourceType, Article, Category, Summary
+from app.database.repositories.article_repository import ArticleRepository
+from app.services.ranking_service import RankingService
+
+_DB_DIR = tempfile.mkdtemp(prefix="test_candidate_selection_")
+
+_TOPICS = [
+    ("Polity", "The Supreme Court constitution bench ruled on federalism and fundamental rights under Article 21."),
+    ("Economy", "RBI kept the repo rate unchanged; the MPC cited inflation, GDP growth and NPAs of public sector banks."),
+    ("Environment & Ecology", "The climate summit agreed on a loss and damage fund and biodiversity targets."),
+    ("Science & Tech", "ISRO launched an earth observation satellite on the PSLV from Sriharikota."),
+    ("Government Schemes", "The Cabinet approved a rooftop solar scheme with subsidies for one crore households."),
+    ("Social Issues", "A report on malnutrition and school enrolment among girls was released.")
+]
+
+
+class _SmallPageArticleRepository(ArticleRepository):
+    """Article repository with tiny pages, so the top K spans several pages."""
+
+    def iter_batches(self, *args, **kwargs):
+        kwargs.setdefault("batch_size", 3)
+        return super().iter_batches(*args, **kwargs)
+
+
+def _seed_database(name: str) -> dict:
+    """
+    Create a fresh database with categorized, summarized and uncategorized articles.
+
+    Returns:
+        Dictionary of article ID lists by kind ('eligible', 'summarized', 'uncategorized', 'old')
+    """
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, name)}.db"
+    dispose_engine()
+    Base.metadata.create_all(get_engine())
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    ids = {'eligible': [], 'summarized': [], 'uncategorized': [], 'old': []}
+
+    with get_session_factory()() as session:
+        source = Source(name="PIB", source_type=SourceType.PIB, url="https://pib.gov.in")
+        categories = {topic: Category(name=topic) for topic, _ in _TOPICS}
+        session.add(source)
+        session.add_all(categories.values())
+        session.flush()
+
+        def add(kind: str, index: int, topic: int, age_hours: float, categorized: bool = True):
+            category, content = _TOPICS[topic]
+            article = Article(
+                title=f"{category} update {index}",
+                content=f"{content} Update number {index}. " * (1 + index % 4),
+                url=f"https://pib.gov.in/{kind}/{index}",
+                published_at=now - timedelta(hours=age_hours),
+                source_id=source.id,
+                category_id=categories[category].id if categorized else None
+            )
+            session.add(article)
+            session.flush()
+            ids[kind].append(article.id)
+            return article
+
+        for i in range(14):
+            add('eligible', i, i % len(_TOPICS), age_hours=1 + i * 1.7)
+        for i in range(3):
+            article = add('summarized', i, i, age_hours=0.5)
+            session.add(Summary(article_id=article.id, summary_text="Already summarized"))
+        for i in range(2):
+            add('uncategorized', i, i, age_hours=0.5, categorized=False)
+        add('old', 0, 1, age_hours=24 * 10)
+
+        session.commit()
+
+    return ids
+
+
+def _expected_top_k(service: RankingService, exam_type: str, article_ids: list, top_k: int) -> list:
+    """Score the given articles directly and return the best top_k IDs."""
+    with get_session_factory()() as session:
+        articles = (
+            session.query(Article)
+            .options(joinedload(Article.category), joinedload(Article.source))
+            .filter(Article.id.in_(article_ids))
+            .order_by(Article.id)
+            .all()
+        )
+        metadatas = [service._build_metadata(article) for article in articles]
+        contents = [article.content for article in articles]
+        scores = service._select_strategy(exam_type).score_batch(contents, metadatas)
+        ranked = sorted(zip(scores.tolist(), [a.id for a in articles]), reverse=True)
+        return [article_id for _, article_id in ranked[:top_k]]
+
+
+def test_top_k_matches_direct_scoring():
+    """Test that the selected candidates are the best K per exam type, best first."""
+    try:
+        ids = _seed_database("top_k")
+        service = RankingService(None, _SmallPageArticleRepository(), None)
+
+        candidates = service.select_candidates(top_k=4)
+
+        assert sorted(candidates) == sorted(RankingService.EXAM_TYPES), f"Exam types: {list(candidates)}"
+        eligible = ids['eligible'] + ids['old']
+        for exam_type, selected in candidates.items():
+            expected = _expected_top_k(service, exam_type, eligible, 4)
+            assert selected == expected, f"{exam_type}: selected {selected}, expected {expected}"
+
+        print("✅ Candidates are the top K per exam type")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Top K test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_only_unsummarized_categorized_articles():
+    """Test that summarized, uncategorized and out-of-window articles are never selected."""
+    try:
+        ids = _seed_database("eligibility")
+        service = RankingService(None, _SmallPageArticleRepository(), None)
+
+        since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=2)
+        candidates = service.select_candidates(top_k=100, since=since)
+
+        for exam_type, selected in candidates.items():
+            assert sorted(selected) == sorted(ids['eligible']), \
+                f"{exam_type}: selected {sorted(selected)}, eligible {sorted(ids['eligible'])}"
+
+        one = service.select_candidates(top_k=1, exam_types=["SSC"])
+        assert list(one) == ["SSC"] and len(one["SSC"]) == 1, f"Unexpected selection: {one}"
+
+        print("✅ Only unsummarized, categorized articles in the window are selected")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Eligibility test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Testing candidate selection...")
+
+    tests = [
+        ("Top K", test_top_k_matches_direct_scoring),
+        ("Eligibility", test_only_unsummarized_categorized_articles)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+
+    print(f"\n🏁 Candidate Selection Tests: {passed}/{total} passed")
+
+    if passed == total:
+        print("🎉 All candidate selection tests passed!")
+        sys.exit(0)
+    else:
+        print("💥 Some candidate selection tests failed!")
+        sys.exit(1)
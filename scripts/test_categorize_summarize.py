@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Test script for one-call categorization and summarization.
+
+This script tests CategorizeSummarizeAgent against a scripted Gemini
+model: parsing of the fused response (raw or in a code block), rejection
+of invalid sections without replaying them from the response cache, and
+the hand-off to the separate agents for content that needs map-reduce.
+"""
+
+import sys
+import os
+import json
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# No rate limiting and no shared on-disk cache for scripted responses
+os.environ["GEMINI_REQUESTS_PER_MINUTE"] = "0"
+os.environ["GEMINI_TOKENS_PER_MINUTE"] = "0"
+os.environ["RATE_LIMIT_BACKEND"] = "memory"
+os.environ["LLM_CACHE_ENABLED"] = "false"
+
+from app.agent.abstract_agent import AgentConfig, AgentException
+from app.agent.categorization_agent import CategorizationAgent
+from app.agent.summarization_agent import SummarizationAgent
+from app.agent.categorize_summarize_agent import CategorizeSummarizeAgent
+from app.agent.response_cache import InMemoryLRUCache
+
+_ARTICLE = {
+    "title": "RBI keeps repo rate unchanged",
+    "content": "The MPC kept the repo rate at 6.5 percent. Inflation stayed within the target band.",
+    "source_type": "pib"
+}
+
+_CATEGORIZATION = {
+    "primary_category": "Economy",
+    "secondary_categories": ["Government Schemes"],
+    "confidence": 0.9,
+    "reasoning": "Monetary policy decision"
+}
+
+_SUMMARY = {
+    "main_summary": " ".join(["The RBI kept the repo rate unchanged at 6.5 percent."] * 20),
+    "why_important": "Monetary policy is a core economy topic.",
+    "prelims_relevance": "Repo rate and MPC composition.",
+    "mains_relevance": "Inflation targeting and growth trade-offs.",
+    "possible_questions": ["Question 1?", "Question 2?", "Question 3?"],
+    "key_facts": ["Repo rate 6.5 percent"]
+}
+
+
+class _Response:
+    """Minimal Gemini response."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _ScriptedModel:
+    """Gemini model stand-in that answers with scripted responses in order."""
+
+    def __init__(self, responses: list):
+        self._responses = list(responses)
+        self.prompts = []
+        self.generation_configs = []
+
+    def generate_content(self, prompt, generation_config=None):
+        self.prompts.append(prompt)
+        self.generation_configs.append(generation_config)
+        return _Response(self._responses.pop(0))
+
+
+def _fused(categorization=_CATEGORIZATION, summary=_SUMMARY) -> str:
+    """Build a fused response."""
+    return json.dumps({"categorization": categorization, "summary": summary})
+
+
+def _agents(responses: list, **summarization_options):
+    """Build the fused agent and its helpers with private caches and scripted models."""
+    config = AgentConfig(api_key="test-key")
+    categorization_agent = CategorizationAgent(config)
+    summarization_agent = SummarizationAgent(config, **summarization_options)
+    agent = CategorizeSummarizeAgent(config, categorization_agent, summarization_agent)
+
+    for each in (agent, categorization_agent, summarization_agent):
+        each.response_cache = InMemoryLRUCache()
+        each._model = _ScriptedModel([])
+    agent._model = _ScriptedModel(responses)
+    return agent, categorization_agent, summarization_agent
+
+
+def test_fused_response_parsed():
+    """Test that one call yields both validated results."""
+    try:
+        agent, _, _ = _agents([_fused()])
+
+        result = agent.execute(_ARTICLE)
+
+        assert result.category.primary_category == "Economy", f"Got {result.category.primary_category}"
+        assert result.category.secondary_categories == ["Government Schemes"]
+        assert result.summary.word_count == len(_SUMMARY["main_summary"].split())
+        assert result.summary.possible_questions == _SUMMARY["possible_questions"]
+        assert len(agent._model.prompts) == 1, "Expected a single API call"
+        assert agent._model.generation_configs[0]["response_mime_type"] == "application/json", \
+            "The fused call should request a JSON response"
+
+        print("✅ Fused response parsed into both results")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Fused parsing test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_code_block_response_parsed():
+    """Test that a fused response wrapped in a markdown code block is accepted."""
+    try:
+        agent, _, _ = _agents([f"```json\n{_fused()}\n```"])
+
+        result = agent.execute(_ARTICLE)
+        assert result.category.primary_category == "Economy"
+
+        print("✅ Code block response parsed")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Code block test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_invalid_sections_rejected():
+    """Test that invalid responses raise and are not replayed from the cache."""
+    try:
+        invalid_responses = [
+            ("unknown category", _fused(categorization=dict(_CATEGORIZATION, primary_category="Sports"))),
+            ("missing summary", json.dumps({"categorization": _CATEGORIZATION})),
+            ("short summary", _fused(summary=dict(_SUMMARY, main_summary="Too short."))),
+            ("not an object", json.dumps([_CATEGORIZATION, _SUMMARY])),
+            ("not JSON", "The article is about the economy.")
+        ]
+
+        for name, response in invalid_responses:
+            agent, _, _ = _agents([response, _fused()])
+            try:
+                agent.execute(_ARTICLE)
+                assert False, f"Expected AgentException for {name}"
+            except AgentException:
+                pass
+
+            # The rejected response is discarded, so a retry asks again
+            result = agent.execute(_ARTICLE)
+            assert result.category.primary_category == "Economy", f"Retry after {name} failed"
+            assert len(agent._model.prompts) == 2, f"Response for {name} was replayed from the cache"
+
+        print(f"✅ {len(invalid_responses)} kinds of invalid responses rejected and discarded")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Invalid response test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_long_content_uses_separate_agents():
+    """Test that content needing map-reduce goes to the separate agents."""
+    try:
+        agent, categorization_agent, summarization_agent = _agents(
+            [], map_reduce_min_tokens=20, chunk_tokens=200
+        )
+        categorization_agent._model = _ScriptedModel([json.dumps(_CATEGORIZATION)])
+        summarization_agent._model = _ScriptedModel([
+            json.dumps({"key_points": ["Repo rate unchanged"], "key_facts": ["6.5 percent"]}),
+            json.dumps(_SUMMARY)
+        ])
+
+        result = agent.execute(_ARTICLE)
+
+        assert result.category.primary_category == "Economy"
+        assert result.summary.word_count > 0
+        assert agent._model.prompts == [], "The fused prompt should not be used"
+        assert len(categorization_agent._model.prompts) == 1, "Expected one categorization call"
+        assert len(summarization_agent._model.prompts) == 2, "Expected one map and one reduce call"
+        assert "Economy" in summarization_agent._model.prompts[-1], \
+            "The summary should use the category found"
+
+        print("✅ Long content handed to categorization and map-reduce summarization")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Long content test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Testing categorize-summarize agent...")
+
+    tests = [
+        ("Fused Response", test_fused_response_parsed),
+        ("Code Block Response", test_code_block_response_parsed),
+        ("Invalid Responses", test_invalid_sections_rejected),
+        ("Long Content", test_long_content_uses_separate_agents)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+
+    print(f"\n🏁 Categorize-Summarize Tests: {passed}/{total} passed")
+
+    if passed == total:
+        print("🎉 All categorize-summarize tests passed!")
+        sys.exit(0)
+    else:
+        print("💥 Some categorize-summarize tests failed!")
+        sys.exit(1)
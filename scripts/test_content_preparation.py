@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Test script for token-budgeted content preparation.
+
+This script tests that ContentPreparer strips caption filler without
+altering figures, fits long content into its token budget, and splits
+oversized content into overlapping chunks.
+"""
+
+import sys
+import os
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.agent.content_preparation import ContentPreparer, get_content_stats, reset_content_stats
+from app.agent.rate_limiter import estimate_tokens
+
+
+def _numbered_sentences(count: int) -> list:
+    """Build distinct filler sentences that each mention their number."""
+    topics = ["railways", "ports", "highways", "airports", "pipelines", "canals"]
+    return [
+        f"Sentence {i} notes routine progress on {topics[i % len(topics)]} in district {i}."
+        for i in range(count)
+    ]
+
+
+def test_figures_are_preserved():
+    """Test that decimals, thousands separators and ranges survive cleaning."""
+    try:
+        preparer = ContentPreparer("test", token_budget=500)
+        cases = [
+            "The fiscal deficit target is 4.4 percent of GDP.",
+            "The outlay is Rs 10,000,000 crore for the mission.",
+            "Growth was 5.5 percent in the quarter.",
+            "The 20-20 series ended 2-2 in 2024 2024."
+        ]
+        for text in cases:
+            prepared = preparer.prepare(text)
+            assert prepared == text, f"{text!r} became {prepared!r}"
+
+        print("✅ Figures are preserved")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Figure test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_caption_filler_is_removed():
+    """Test that caption cues, filler words and repeated phrases are removed."""
+    try:
+        preparer = ContentPreparer("test", token_budget=500)
+        transcript = (
+            "[Music] >> Hello everyone, welcome to my channel. um in this video in this "
+            "video we discuss the repo rate. The RBI kept the repo rate at 6.5 percent. "
+            "Please like and subscribe. (applause)"
+        )
+
+        prepared = preparer.prepare(transcript)
+
+        for filler in ("[Music]", ">>", "Hello everyone", "welcome", "subscribe", "um ", "applause"):
+            assert filler.lower() not in prepared.lower(), f"{filler!r} left in {prepared!r}"
+        assert prepared.count("in this video") == 1, f"Repeated phrase kept: {prepared!r}"
+        assert "The RBI kept the repo rate at 6.5 percent." in prepared, f"Fact lost: {prepared!r}"
+
+        print("✅ Caption filler is removed")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Filler test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_budget_selection():
+    """Test that long content is cut to its budget keeping salient sentences in order."""
+    try:
+        reset_content_stats()
+        preparer = ContentPreparer("test", token_budget=120)
+        sentences = _numbered_sentences(30)
+        key_fact = "The Monetary Policy Committee raised the repo rate to 6.75 percent."
+        sentences.insert(17, key_fact)
+        content = " ".join(sentences)
+
+        prepared = preparer.prepare(content, title="RBI Monetary Policy Committee raises repo rate")
+
+        assert estimate_tokens(prepared) <= 120, f"Prepared {estimate_tokens(prepared)} tokens"
+        assert key_fact in prepared, "The sentence matching the title should be kept"
+        positions = [content.index(sentence) for sentence in sentences if sentence in prepared]
+        assert positions == sorted(positions), "Selected sentences should keep their order"
+
+        stats = get_content_stats()["test"]
+        assert stats["articles"] == 1 and stats["shortened"] == 1, f"Unexpected stats: {stats}"
+        assert stats["tokens_saved"] > 0, f"No tokens saved: {stats}"
+
+        print("✅ Long content is fitted to the budget")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Budget test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_split_chunks_overlap():
+    """Test that chunks fit their budget, cover every sentence and overlap."""
+    try:
+        preparer = ContentPreparer("test", token_budget=2000)
+        sentences = _numbered_sentences(40)
+        content = " ".join(sentences)
+
+        chunks = preparer.split_chunks(content, chunk_tokens=100, overlap_tokens=30)
+
+        assert len(chunks) > 1, "Content should need several chunks"
+        for chunk in chunks:
+            assert estimate_tokens(chunk) <= 100, f"Chunk of {estimate_tokens(chunk)} tokens"
+        for sentence in sentences:
+            assert any(sentence in chunk for chunk in chunks), f"Lost {sentence!r}"
+        for previous, chunk in zip(chunks, chunks[1:]):
+            last_sentence = previous.split(". ")[-1]
+            assert chunk.startswith(last_sentence), "Each chunk should repeat the previous chunk's tail"
+
+        limited = preparer.split_chunks(content, chunk_tokens=100, overlap_tokens=30, max_chunks=2)
+        assert len(limited) <= 2, f"max_chunks=2 gave {len(limited)} chunks"
+
+        print("✅ Chunks fit, cover the content and overlap")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Chunking test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Testing content preparation...")
+
+    tests = [
+        ("Figures", test_figures_are_preserved),
+        ("Caption Filler", test_caption_filler_is_removed),
+        ("Budget Selection", test_budget_selection),
+        ("Chunk Overlap", test_split_chunks_overlap)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+
+    print(f"\n🏁 Content Preparation Tests: {passed}/{total} passed")
+
+    if passed == total:
+        print("🎉 All content preparation tests passed!")
+        sys.exit(0)
+    else:
+        print("💥 Some content preparation tests failed!")
+        sys.exit(1)
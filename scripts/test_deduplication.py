@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Test script for near-duplicate article linking.
+
+This script tests that DeduplicationService links re-worded copies of an
+article to the first stored copy, leaves distinct articles canonical, and
+keeps earlier links when new copies arrive, against a throwaway SQLite
+database.
+"""
+
+import sys
+import os
+import tempfile
+from datetime import datetime
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.database.connection import dispose_engine, get_engine, get_session_factory
+from app.database.models import Base, Source, SourceType, Article
+from app.database.repositories.article_repository import ArticleRepository
+from app.database.repositories.article_signature_repository import ArticleSignatureRepository
+from app.services.deduplication_service import DeduplicationService
+
+_DB_DIR = tempfile.mkdtemp(prefix="test_deduplication_")
+
+_STORY = (
+    "The Reserve Bank of India kept the repo rate unchanged at 6.5 per cent "
+    "for the eighth consecutive meeting of the Monetary Policy Committee, "
+    "citing persistent food inflation and steady growth in the economy. The "
+    "committee retained its stance of withdrawal of accommodation and "
+    "projected real GDP growth of 7.2 per cent for the current financial year."
+)
+_OTHER_STORY = (
+    "The Union Cabinet approved a new scheme to provide rooftop solar panels "
+    "to one crore households, offering free electricity of up to 300 units a "
+    "month and central financial assistance for installation through a "
+    "national portal run by the Ministry of New and Renewable Energy."
+)
+
+
+def _reset_database(name: str) -> int:
+    """Point the shared engine at a fresh SQLite database with one source."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, name)}.db"
+    dispose_engine()
+    Base.metadata.create_all(get_engine())
+
+    with get_session_factory()() as session:
+        source = Source(name="PIB", source_type=SourceType.PIB, url="https://pib.gov.in")
+        session.add(source)
+        session.commit()
+        return source.id
+
+
+def _store(source_id: int, articles: list) -> list:
+    """Store (slug, title, content) tuples and return their IDs in order."""
+    result = ArticleRepository().bulk_upsert([
+        Article(
+            title=title,
+            content=content,
+            url=f"https://pib.gov.in/{slug}",
+            published_at=datetime.now(),
+            source_id=source_id
+        )
+        for slug, title, content in articles
+    ])
+    return sorted(result.inserted_ids)
+
+
+def _canonical_links() -> dict:
+    """Map every stored article ID to its canonical article ID."""
+    with get_session_factory()() as session:
+        return dict(session.query(Article.id, Article.canonical_article_id))
+
+
+def _service() -> DeduplicationService:
+    """Build the service on repositories bound to the current database."""
+    return DeduplicationService(ArticleRepository(), ArticleSignatureRepository())
+
+
+def test_links_copies_within_batch():
+    """Test that copies in one batch link to the first copy."""
+    try:
+        source_id = _reset_database("batch")
+        ids = _store(source_id, [
+            ("rbi-1", "RBI keeps repo rate unchanged", _STORY),
+            ("rbi-2", "RBI keeps repo rate unchanged at 6.5%", _STORY + " Read more."),
+            ("rbi-3", "Repo rate unchanged by RBI", "Update: " + _STORY),
+            ("solar", "Cabinet approves rooftop solar scheme", _OTHER_STORY)
+        ])
+
+        duplicates = _service().detect_duplicates(ids)
+
+        assert duplicates == {ids[1]: ids[0], ids[2]: ids[0]}, f"Unexpected duplicates: {duplicates}"
+        assert _canonical_links() == {
+            ids[0]: None,
+            ids[1]: ids[0],
+            ids[2]: ids[0],
+            ids[3]: None
+        }, f"Unexpected links: {_canonical_links()}"
+
+        print("✅ Copies in a batch link to the first copy")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Batch linking test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_links_copies_across_runs():
+    """Test that a later copy links to the canonical article of an earlier run."""
+    try:
+        source_id = _reset_database("runs")
+        service = _service()
+
+        first_ids = _store(source_id, [
+            ("rbi-1", "RBI keeps repo rate unchanged", _STORY),
+            ("rbi-2", "RBI keeps repo rate unchanged at 6.5%", _STORY + " Read more.")
+        ])
+        service.detect_duplicates(first_ids)
+
+        later_ids = _store(source_id, [
+            ("rbi-3", "Repo rate unchanged by RBI", "Update: " + _STORY),
+            ("solar", "Cabinet approves rooftop solar scheme", _OTHER_STORY)
+        ])
+        duplicates = service.detect_duplicates(later_ids)
+
+        # Chained copies point at the first canonical, never at another duplicate
+        assert duplicates == {later_ids[0]: first_ids[0]}, f"Unexpected duplicates: {duplicates}"
+        links = _canonical_links()
+        assert links[first_ids[0]] is None, "The first copy must stay canonical"
+        assert links[first_ids[1]] == first_ids[0], "Earlier links must be kept"
+        assert links[later_ids[1]] is None, "A distinct article must stay canonical"
+
+        print("✅ Copies across runs link to the first canonical article")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Cross-run linking test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Testing near-duplicate detection...")
+
+    tests = [
+        ("Linking Within a Batch", test_links_copies_within_batch),
+        ("Linking Across Runs", test_links_copies_across_runs)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+
+    print(f"\n🏁 Deduplication Tests: {passed}/{total} passed")
+
+    if passed == total:
+        print("🎉 All deduplication tests passed!")
+        sys.exit(0)
+    else:
+        print("💥 Some deduplication tests failed!")
+        sys.exit(1)
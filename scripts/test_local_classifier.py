@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Test script for the local category classifier.
+
+This script tests LocalCategoryClassifier on a small synthetic corpus:
+training, threshold calibration against a target precision, evaluation,
+and that a saved model loads back with identical predictions.
+"""
+
+import sys
+import os
+import random
+import tempfile
+
+import numpy as np
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.local_classifier import LocalCategoryClassifier, article_text, is_holdout
+
+_CATEGORIES = ["Economy", "Polity", "Science & Tech"]
+
+_TERMS = {
+    "Economy": ["inflation", "repo", "fiscal", "deficit", "gdp", "tax", "bank", "rupee"],
+    "Polity": ["parliament", "constitution", "court", "bill", "governor", "election", "amendment", "federal"],
+    "Science & Tech": ["satellite", "isro", "launch", "quantum", "vaccine", "semiconductor", "orbit", "research"]
+}
+
+_COMMON = ["india", "government", "announced", "new", "report", "minister", "national", "year"]
+
+
+def _corpus(count: int, seed: int, noise: float = 0.0) -> tuple:
+    """
+    Build synthetic articles with category-specific terms.
+
+    A share of `noise` articles gets a random label, like disagreements
+    between the local model and Gemini.
+    """
+    rng = random.Random(seed)
+    texts, labels = [], []
+    for i in range(count):
+        category = _CATEGORIES[i % len(_CATEGORIES)]
+        words = rng.sample(_TERMS[category], 4) + rng.sample(_COMMON, 4)
+        rng.shuffle(words)
+        texts.append(article_text(f"{words[0]} {words[1]} update", " ".join(words)))
+        labels.append(rng.choice(_CATEGORIES) if rng.random() < noise else category)
+    return texts, labels
+
+
+def _trained() -> LocalCategoryClassifier:
+    """Train a classifier on a clean synthetic corpus."""
+    texts, labels = _corpus(150, seed=1)
+    return LocalCategoryClassifier(_CATEGORIES, min_df=1).fit(texts, labels)
+
+
+def test_fit_and_predict():
+    """Test that a trained model predicts held-out texts and is never confident uncalibrated."""
+    try:
+        classifier = _trained()
+        texts, labels = _corpus(60, seed=2)
+
+        predictions = classifier.predict(texts)
+        agreement = np.mean([p.category == label for p, label in zip(predictions, labels)])
+        assert agreement >= 0.9, f"Agreement on separable texts is only {agreement:.2f}"
+        assert not any(p.confident for p in predictions), "Predictions must not be confident before calibrate()"
+        assert classifier.threshold is None, "Threshold should be unset before calibrate()"
+        assert classifier.info["training_articles"] == 150, f"Unexpected info: {classifier.info}"
+        assert classifier.predict([]) == [], "No texts should give no predictions"
+
+        try:
+            classifier.fit(texts, ["Sports"] * len(texts))
+            assert False, "Expected ValueError for an unknown label"
+        except ValueError:
+            pass
+
+        print(f"✅ Trained model agrees on {agreement:.0%} of held-out texts")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Fit/predict test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_calibrate_threshold():
+    """Test that the calibrated threshold meets the target precision and minimum coverage."""
+    try:
+        classifier = _trained()
+        texts, labels = _corpus(120, seed=3, noise=0.2)
+
+        threshold = classifier.calibrate(texts, labels, target_precision=0.85, min_accepted=20)
+        assert 0.0 < threshold <= 1.0, f"Expected a reachable threshold, got {threshold}"
+        assert classifier.threshold == threshold
+
+        metrics = classifier.evaluate(texts, labels)
+        confident = round(metrics["coverage"] * metrics["articles"])
+        assert metrics["confident_agreement"] >= 0.85, \
+            f"Precision above the threshold is {metrics['confident_agreement']:.2f}"
+        assert confident >= 20, f"Only {confident} texts above the threshold"
+        assert set(metrics["per_category"]) == set(_CATEGORIES), "Expected metrics for every category"
+
+        predictions = classifier.predict(texts)
+        assert all(p.confident == (p.confidence >= threshold) for p in predictions), \
+            "Predictions should be confident exactly at or above the threshold"
+        assert classifier.info["target_precision"] == 0.85
+
+        # A target the noisy labels cannot reach answers nothing locally
+        unreachable = classifier.calibrate(texts, labels, target_precision=1.0, min_accepted=len(texts))
+        assert unreachable > 1.0, f"Unreachable target gave threshold {unreachable}"
+        assert not any(p.confident for p in classifier.predict(texts)), \
+            "No prediction should be confident with an unreachable target"
+
+        print(f"✅ Threshold {threshold:.3f} covers {confident} texts at "
+              f"{metrics['confident_agreement']:.0%} precision")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Calibration test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_save_load_round_trip():
+    """Test that a saved model loads back with identical predictions and metadata."""
+    try:
+        classifier = _trained()
+        texts, labels = _corpus(60, seed=4, noise=0.1)
+        classifier.calibrate(texts, labels, target_precision=0.8, min_accepted=10)
+        classifier.update_info(trained_at="2024-01-01T00:00:00")
+
+        directory = tempfile.mkdtemp(prefix="test_local_classifier_")
+        path = os.path.join(directory, "models", "classifier.npz")
+        classifier.save(path)
+        loaded = LocalCategoryClassifier.load(path)
+
+        assert loaded.categories == classifier.categories, "Categories differ after loading"
+        assert loaded.threshold == classifier.threshold, "Threshold differs after loading"
+        assert loaded.info == classifier.info, f"Info differs after loading: {loaded.info}"
+        assert np.allclose(loaded.predict_proba(texts), classifier.predict_proba(texts)), \
+            "Probabilities differ after loading"
+        assert loaded.predict(texts) == classifier.predict(texts), "Predictions differ after loading"
+
+        # Any other numpy archive is rejected
+        other = os.path.join(directory, "other.npz")
+        np.savez(other, values=np.zeros(3))
+        try:
+            LocalCategoryClassifier.load(other)
+            assert False, "Expected ValueError for a foreign archive"
+        except ValueError:
+            pass
+
+        print("✅ Saved model loads back identically")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Save/load test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_holdout_split():
+    """Test that the held-out split is deterministic and close to the fraction."""
+    try:
+        first = [is_holdout(article_id, 0.2) for article_id in range(1, 5001)]
+        second = [is_holdout(article_id, 0.2) for article_id in range(1, 5001)]
+        share = sum(first) / len(first)
+
+        assert first == second, "The split must not change between calls"
+        assert 0.17 <= share <= 0.23, f"Held-out share is {share:.3f}"
+        assert not any(is_holdout(article_id, 0.0) for article_id in range(1, 1001)), \
+            "A zero fraction should hold nothing out"
+
+        print(f"✅ Deterministic split holds out {share:.1%} of articles")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Holdout split test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Testing local category classifier...")
+
+    tests = [
+        ("Fit and Predict", test_fit_and_predict),
+        ("Calibrate Threshold", test_calibrate_threshold),
+        ("Save/Load Round Trip", test_save_load_round_trip),
+        ("Holdout Split", test_holdout_split)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+
+    print(f"\n🏁 Local Classifier Tests: {passed}/{total} passed")
+
+    if passed == total:
+        print("🎉 All local classifier tests passed!")
+        sys.exit(0)
+    else:
+        print("💥 Some local classifier tests failed!")
+        sys.exit(1)
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Test script for map-reduce summarization of long articles.
+
+This script tests SummarizationAgent against a scripted Gemini model:
+short content takes a single call, long content is split into overlapping
+chunks whose notes feed one reduce call, and chunks with invalid notes are
+skipped (and dropped from the response cache) as long as at least half of
+the chunks succeed.
+"""
+
+import sys
+import os
+import re
+import json
+import asyncio
+import threading
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# No rate limiting and no shared on-disk cache for scripted responses
+os.environ["GEMINI_REQUESTS_PER_MINUTE"] = "0"
+os.environ["GEMINI_TOKENS_PER_MINUTE"] = "0"
+os.environ["RATE_LIMIT_BACKEND"] = "memory"
+os.environ["LLM_CACHE_ENABLED"] = "false"
+
+from app.agent.abstract_agent import AgentConfig, AgentException
+from app.agent.summarization_agent import SummarizationAgent
+from app.agent.response_cache import InMemoryLRUCache
+
+_SHORT_CONTENT = "The MPC kept the repo rate at 6.5 percent. Inflation stayed within the target band."
+
+# Distinct sentences with figures, long enough to need several chunks
+_LONG_CONTENT = " ".join(
+    f"District {i} received {i * 7} crore rupees under scheme number {i + 100} for rural roads."
+    for i in range(1, 41)
+)
+
+_SUMMARY = {
+    "main_summary": " ".join(["The government expanded rural road funding across districts."] * 25),
+    "why_important": "Shows how centrally sponsored schemes are funded.",
+    "prelims_relevance": "Scheme names and allocation figures.",
+    "mains_relevance": "Fiscal federalism and rural infrastructure.",
+    "possible_questions": ["Question 1?", "Question 2?", "Question 3?"],
+    "key_facts": ["40 districts covered"]
+}
+
+_PART = re.compile(r"part (\d+) of (\d+)")
+
+
+class _Response:
+    """Minimal Gemini response."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _ScriptedModel:
+    """
+    Gemini model stand-in that answers chunk prompts with notes and any
+    other prompt with a summary. Parts listed in invalid_parts get a
+    response without key points.
+    """
+
+    def __init__(self, invalid_parts=()):
+        self._invalid_parts = set(invalid_parts)
+        self._lock = threading.Lock()
+        self.prompts = []
+
+    def generate_content(self, prompt, generation_config=None):
+        with self._lock:
+            self.prompts.append(prompt)
+
+        match = _PART.search(prompt)
+        if match is None:
+            return _Response(json.dumps(_SUMMARY))
+        part = int(match.group(1))
+        if part in self._invalid_parts:
+            return _Response(json.dumps({"key_points": []}))
+        return _Response(json.dumps({
+            "key_points": [f"Point from part {part}"],
+            "key_facts": [f"Fact from part {part}"]
+        }))
+
+    async def generate_content_async(self, prompt, generation_config=None):
+        return self.generate_content(prompt, generation_config)
+
+    def chunk_prompts(self) -> list:
+        return [prompt for prompt in self.prompts if _PART.search(prompt)]
+
+
+def _agent(model: _ScriptedModel) -> SummarizationAgent:
+    """Build an agent with small chunks answering from a scripted model."""
+    agent = SummarizationAgent(
+        AgentConfig(api_key="test-key"),
+        map_reduce_min_tokens=200,
+        chunk_tokens=150,
+        chunk_overlap_tokens=30,
+        max_chunks=4,
+        map_concurrency=2
+    )
+    agent.response_cache = InMemoryLRUCache()
+    agent._model = model
+    return agent
+
+
+def _input(content: str) -> dict:
+    """Build summarization input for some content."""
+    return {"title": "Rural road funding", "content": content, "category": "Economy"}
+
+
+def test_short_content_single_call():
+    """Test that content within the limit is summarized in one call."""
+    try:
+        model = _ScriptedModel()
+        agent = _agent(model)
+
+        assert not agent.needs_map_reduce(_SHORT_CONTENT), "Short content should not need map-reduce"
+        result = agent.execute(_input(_SHORT_CONTENT))
+
+        assert result.word_count > 0, "Expected a validated summary"
+        assert len(model.prompts) == 1, f"Expected 1 call, got {len(model.prompts)}"
+        assert model.chunk_prompts() == [], "Short content should not be chunked"
+
+        print("✅ Short content takes a single call")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Short content test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_long_content_map_reduce():
+    """Test that long content is mapped chunk by chunk and reduced once."""
+    try:
+        model = _ScriptedModel()
+        agent = _agent(model)
+
+        assert agent.needs_map_reduce(_LONG_CONTENT), "Long content should need map-reduce"
+        chunks = agent._split_long_content("Rural road funding", _LONG_CONTENT)
+        assert 2 <= len(chunks) <= 4, f"Expected 2-4 chunks, got {len(chunks)}"
+
+        result = agent.execute(_input(_LONG_CONTENT))
+
+        assert result.word_count > 0, "Expected a validated summary"
+        chunk_prompts = model.chunk_prompts()
+        assert len(chunk_prompts) == len(chunks), \
+            f"Expected {len(chunks)} map calls, got {len(chunk_prompts)}"
+        assert len(model.prompts) == len(chunks) + 1, "Expected exactly one reduce call"
+
+        reduce_prompt = [prompt for prompt in model.prompts if not _PART.search(prompt)][0]
+        for part in range(1, len(chunks) + 1):
+            assert f"Point from part {part}" in reduce_prompt, f"Reduce prompt misses notes of part {part}"
+        assert "District 1 received" not in reduce_prompt, "Reduce prompt should carry notes, not content"
+
+        print(f"✅ Long content mapped into {len(chunks)} chunks and reduced once")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Map-reduce test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_invalid_chunk_skipped():
+    """Test that a chunk with invalid notes is skipped and not cached."""
+    try:
+        model = _ScriptedModel(invalid_parts={2})
+        agent = _agent(model)
+
+        agent.execute(_input(_LONG_CONTENT))
+        reduce_prompt = model.prompts[-1]
+        assert "Point from part 2" not in reduce_prompt, "Invalid notes must not reach the reduce prompt"
+        assert "Point from part 1" in reduce_prompt, "Valid notes should reach the reduce prompt"
+
+        # A second run replays the valid chunks from the cache and asks
+        # again for the chunk whose notes were discarded
+        calls = len(model.prompts)
+        agent.execute(_input(_LONG_CONTENT))
+        repeated = [
+            int(_PART.search(prompt).group(1))
+            for prompt in model.prompts[calls:] if _PART.search(prompt)
+        ]
+        assert repeated == [2], f"Expected only part 2 to be asked again, got {repeated}"
+
+        print("✅ Invalid chunk notes are skipped and discarded from the cache")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Invalid chunk test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_too_many_invalid_chunks():
+    """Test that summarization fails when most chunks produce no notes."""
+    try:
+        model = _ScriptedModel(invalid_parts={1, 2, 3, 4})
+        agent = _agent(model)
+
+        try:
+            agent.execute(_input(_LONG_CONTENT))
+            assert False, "Expected AgentException"
+        except AgentException as e:
+            assert "chunks produced valid notes" in str(e), f"Unexpected error: {e}"
+
+        assert model.chunk_prompts() == model.prompts, "No reduce call should be made"
+
+        print("✅ Summarization fails when most chunks are invalid")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Invalid majority test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_async_map_reduce():
+    """Test that execute_async() makes the same map and reduce calls."""
+    try:
+        model = _ScriptedModel()
+        agent = _agent(model)
+        chunks = agent._split_long_content("Rural road funding", _LONG_CONTENT)
+
+        result = asyncio.run(agent.execute_async(_input(_LONG_CONTENT)))
+
+        assert result.word_count > 0, "Expected a validated summary"
+        assert len(model.chunk_prompts()) == len(chunks), "Expected one map call per chunk"
+        assert len(model.prompts) == len(chunks) + 1, "Expected exactly one reduce call"
+
+        print("✅ Async map-reduce matches the sync flow")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Async map-reduce test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Testing map-reduce summarization...")
+
+    tests = [
+        ("Short Content", test_short_content_single_call),
+        ("Long Content", test_long_content_map_reduce),
+        ("Invalid Chunk", test_invalid_chunk_skipped),
+        ("Invalid Majority", test_too_many_invalid_chunks),
+        ("Async Map-Reduce", test_async_map_reduce)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+
+    print(f"\n🏁 Map-Reduce Tests: {passed}/{total} passed")
+
+    if passed == total:
+        print("🎉 All map-reduce tests passed!")
+        sys.exit(0)
+    else:
+        print("💥 Some map-reduce tests failed!")
+        sys.exit(1)
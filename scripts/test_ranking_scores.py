@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Test script for batch ranking scores.
+
+This script tests that the vectorized calculate_scores() and score_batch()
+of every ranking strategy give the same scores and factors as scoring each
+article on its own with calculate_score().
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.ranking import (
+    ArticleMetadata,
+    BankingRankingStrategy,
+    SSCRankingStrategy,
+    TextFeatures,
+    UPSCRankingStrategy
+)
+
+# Freshness decays between the per-article and batch calls; over the few
+# milliseconds a test takes the drift stays far below this tolerance
+_TOLERANCE = 1e-6
+
+_ARTICLES = [
+    (
+        "The Supreme Court upheld the constitutional validity of Article 370 "
+        "abrogation, ruling that Parliament acted within its powers under the "
+        "Constitution. The judgment discusses federalism and fundamental rights.",
+        "Polity", "pib", 2
+    ),
+    (
+        "RBI kept the repo rate unchanged at 6.5 per cent. The Monetary Policy "
+        "Committee cited inflation, NPAs in public sector banks and UPI growth.",
+        "Economy", "youtube", 20
+    ),
+    (
+        "India won the gold medal in the Asian Games hockey final, securing "
+        "direct qualification for the Olympics.",
+        "Sports", "government_schemes", 47
+    ),
+    (
+        "The Union Cabinet approved the PM Surya Ghar scheme for rooftop solar "
+        "panels, providing free electricity and subsidies to one crore households "
+        "under the Ministry of New and Renewable Energy.",
+        "Government Schemes", "pib", 90
+    ),
+    ("Short note.", "Unknown", "blog", 0)
+]
+
+
+def _batch():
+    """Build the contents and metadata of the test articles."""
+    contents = []
+    metadatas = []
+    for content, category, source_type, age_hours in _ARTICLES:
+        contents.append(content)
+        metadatas.append(ArticleMetadata(
+            category=category,
+            source_type=source_type,
+            published_at=datetime.now(timezone.utc) - timedelta(hours=age_hours),
+            content_length=len(content)
+        ))
+    return contents, metadatas
+
+
+def _check_strategy(strategy) -> None:
+    """Assert that batch and per-article scoring agree for one strategy."""
+    contents, metadatas = _batch()
+    name = type(strategy).__name__
+
+    single = [strategy.calculate_score(c, m) for c, m in zip(contents, metadatas)]
+    batch = strategy.calculate_scores(contents, metadatas)
+    scores = strategy.score_batch(contents, metadatas)
+
+    assert len(batch) == len(single) == len(scores), f"{name}: result count mismatch"
+    for i, (one, many) in enumerate(zip(single, batch)):
+        assert abs(one.score - many.score) < _TOLERANCE, \
+            f"{name} article {i}: score {one.score} != batch {many.score}"
+        assert abs(one.score - float(scores[i])) < _TOLERANCE, \
+            f"{name} article {i}: score {one.score} != score_batch {scores[i]}"
+        assert one.factors.keys() == many.factors.keys(), \
+            f"{name} article {i}: factors {sorted(one.factors)} != {sorted(many.factors)}"
+        for factor, value in one.factors.items():
+            assert abs(value - many.factors[factor]) < _TOLERANCE, \
+                f"{name} article {i}: factor {factor} {value} != batch {many.factors[factor]}"
+
+
+def test_upsc_batch_matches_single():
+    """Test UPSC batch scores against per-article scores."""
+    try:
+        _check_strategy(UPSCRankingStrategy())
+        print("✅ UPSC batch scores match per-article scores")
+        return True
+    except AssertionError as e:
+        print(f"❌ UPSC test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_ssc_batch_matches_single():
+    """Test SSC batch scores against per-article scores."""
+    try:
+        _check_strategy(SSCRankingStrategy())
+        print("✅ SSC batch scores match per-article scores")
+        return True
+    except AssertionError as e:
+        print(f"❌ SSC test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_banking_batch_matches_single():
+    """Test Banking batch scores against per-article scores."""
+    try:
+        _check_strategy(BankingRankingStrategy())
+        print("✅ Banking batch scores match per-article scores")
+        return True
+    except AssertionError as e:
+        print(f"❌ Banking test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_shared_features_match():
+    """Test that strategies sharing one TextFeatures score as if unshared."""
+    try:
+        contents, metadatas = _batch()
+        now = datetime.now(timezone.utc)
+        features = TextFeatures(contents)
+
+        for strategy in (UPSCRankingStrategy(), SSCRankingStrategy(), BankingRankingStrategy()):
+            shared = strategy.score_batch(contents, metadatas, now=now, features=features)
+            own = strategy.score_batch(contents, metadatas, now=now)
+            assert shared.tolist() == own.tolist(), \
+                f"{type(strategy).__name__}: shared features changed the scores"
+
+        print("✅ Shared text features give the same scores")
+        return True
+    except AssertionError as e:
+        print(f"❌ Shared features test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Testing batch ranking scores...")
+
+    tests = [
+        ("UPSC Strategy", test_upsc_batch_matches_single),
+        ("SSC Strategy", test_ssc_batch_matches_single),
+        ("Banking Strategy", test_banking_batch_matches_single),
+        ("Shared Features", test_shared_features_match)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+
+    print(f"\n🏁 Ranking Score Tests: {passed}/{total} passed")
+
+    if passed == total:
+        print("🎉 All ranking score tests passed!")
+        sys.exit(0)
+    else:
+        print("💥 Some ranking score tests failed!")
+        sys.exit(1)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared Gemini rate limiter.
+
+This script tests the token-bucket arithmetic, sharing bucket state through
+the file store, the in-process fallback when a shared store fails, and that
+async callers never run blocking reservations on the event loop.
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import threading
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.agent.rate_limiter import (
+    _refill_and_take,
+    FallbackBucketStore,
+    FileBucketStore,
+    GeminiRateLimiter,
+    InProcessBucketStore,
+    TokenBucket
+)
+
+
+class _BrokenStore(InProcessBucketStore):
+    """Shared store that has gone away (e.g. database restarted)."""
+
+    blocking = True
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def reserve(self, name, tokens, rate, capacity):
+        self.calls += 1
+        raise OSError("connection refused")
+
+
+class _ThreadRecordingStore(InProcessBucketStore):
+    """Blocking store that records which thread reserved."""
+
+    blocking = True
+
+    def reserve(self, name, tokens, rate, capacity):
+        self.thread_id = threading.get_ident()
+        return super().reserve(name, tokens, rate, capacity)
+
+
+def test_bucket_math():
+    """Test refill, capacity clamping and queueing delays."""
+    try:
+        # Full bucket: no wait, one token left
+        assert _refill_and_take(2.0, 0.0, 1.0, 1.0, 2.0, 0.0) == (1.0, 0.0)
+        # Empty bucket at 2 tokens/s: 1 token is 0.5s away
+        assert _refill_and_take(0.0, 0.0, 1.0, 2.0, 2.0, 0.0) == (-1.0, 0.5)
+        # Refill is clamped to capacity however long the bucket sat idle
+        assert _refill_and_take(0.0, 0.0, 1.0, 1.0, 3.0, 1000.0) == (2.0, 0.0)
+        # A debt is paid back by elapsed time before taking
+        assert _refill_and_take(-1.0, 0.0, 1.0, 1.0, 1.0, 2.0) == (0.0, 0.0)
+
+        # 60/min with a burst of 1: callers queue one second apart
+        bucket = TokenBucket(60, capacity=1)
+        delays = [bucket.reserve() for _ in range(3)]
+        assert delays[0] == 0.0, f"First reservation waited {delays[0]}"
+        assert abs(delays[1] - 1.0) < 0.05 and abs(delays[2] - 2.0) < 0.05, f"Delays {delays}"
+
+        assert TokenBucket(0).reserve(1000) == 0.0, "A zero rate disables limiting"
+
+        print("✅ Token bucket arithmetic is correct")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Bucket math test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_file_store_is_shared():
+    """Test that two stores on one state file draw from the same bucket."""
+    try:
+        path = os.path.join(tempfile.mkdtemp(prefix="test_rate_limiter_"), "buckets.json")
+        first = TokenBucket(60, capacity=1, name="requests", store=FileBucketStore(path))
+        second = TokenBucket(60, capacity=1, name="requests", store=FileBucketStore(path))
+
+        assert first.reserve() == 0.0
+        delay = second.reserve()
+        assert abs(delay - 1.0) < 0.05, f"Second process should queue behind the first, waited {delay}"
+
+        print("✅ File store shares buckets between processes")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ File store test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_runtime_store_failure_falls_back():
+    """Test that a failing shared store degrades to in-process limiting."""
+    try:
+        broken = _BrokenStore()
+        store = FallbackBucketStore(broken)
+        limiter = GeminiRateLimiter(60, 0, store=store)
+
+        assert store.blocking, "The shared store is blocking until it fails"
+        first = limiter.acquire(caller="test")
+        second = limiter.reserve()
+
+        assert first == 0.0, f"First call after the failure waited {first}"
+        assert abs(second - 1.0) < 0.05, f"Fallback should still limit, got {second}"
+        assert broken.calls == 1, "The failed store should not be retried on every call"
+        assert not store.blocking, "The in-process fallback does not block"
+
+        print("✅ Store failures degrade to in-process limiting")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Fallback test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_async_reserve_leaves_event_loop():
+    """Test that blocking reservations run in a worker thread for async callers."""
+    try:
+        store = _ThreadRecordingStore()
+        limiter = GeminiRateLimiter(600, 0, store=store)
+        bucket = TokenBucket(600, store=store)
+
+        async def acquire():
+            loop_thread = threading.get_ident()
+            await limiter.acquire_async(10, caller="test")
+            limiter_thread = store.thread_id
+            await bucket.acquire_async()
+            return loop_thread, limiter_thread, store.thread_id
+
+        loop_thread, limiter_thread, bucket_thread = asyncio.run(acquire())
+        assert limiter_thread != loop_thread, "GeminiRateLimiter reserved on the event loop"
+        assert bucket_thread != loop_thread, "TokenBucket reserved on the event loop"
+
+        print("✅ Blocking reservations run off the event loop")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Async reserve test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Testing rate limiter...")
+
+    tests = [
+        ("Bucket Math", test_bucket_math),
+        ("Shared File Store", test_file_store_is_shared),
+        ("Store Failure Fallback", test_runtime_store_failure_falls_back),
+        ("Async Reservations", test_async_reserve_leaves_event_loop)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+
+    print(f"\n🏁 Rate Limiter Tests: {passed}/{total} passed")
+
+    if passed == total:
+        print("🎉 All rate limiter tests passed!")
+        sys.exit(0)
+    else:
+        print("💥 Some rate limiter tests failed!")
+        sys.exit(1)
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Test script for the Gemini response cache.
+
+This script tests LRU eviction and TTL expiry of the cache backends,
+persistence and promotion in the tiered cache, and that agents use the
+shared cache by default but can opt out with response_cache=None.
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+_CACHE_DIR = tempfile.mkdtemp(prefix="test_response_cache_")
+
+# Shared cache in a throwaway file, no rate limiting for scripted responses
+os.environ["LLM_CACHE_ENABLED"] = "true"
+os.environ["LLM_CACHE_PATH"] = os.path.join(_CACHE_DIR, "shared.sqlite3")
+os.environ["GEMINI_REQUESTS_PER_MINUTE"] = "0"
+os.environ["GEMINI_TOKENS_PER_MINUTE"] = "0"
+os.environ["RATE_LIMIT_BACKEND"] = "memory"
+
+from app.agent.abstract_agent import AbstractAgent, AgentConfig
+from app.agent.response_cache import (
+    InMemoryLRUCache,
+    SQLiteResponseCache,
+    TieredResponseCache,
+    get_default_response_cache,
+    make_cache_key
+)
+
+
+class _Response:
+    """Minimal Gemini response."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _CountingModel:
+    """Gemini model stand-in that counts its calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_content(self, prompt, generation_config=None):
+        self.calls += 1
+        return _Response(f"answer {self.calls}")
+
+
+class _EchoAgent(AbstractAgent):
+    """Agent that sends its input as the prompt."""
+
+    def execute(self, input_data):
+        return self._call_gemini_api(input_data)
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted first."""
+    try:
+        cache = InMemoryLRUCache(max_entries=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        assert cache.get("a") == "A"
+        cache.set("c", "C")
+
+        assert cache.get("b") is None, "The least recently used entry should be evicted"
+        assert cache.get("a") == "A" and cache.get("c") == "C"
+        assert cache.stats.evictions == 1, f"Evictions: {cache.stats.evictions}"
+
+        disk = SQLiteResponseCache(os.path.join(_CACHE_DIR, "lru.sqlite3"), max_entries=2)
+        disk.set("a", "A")
+        time.sleep(0.01)
+        disk.set("b", "B")
+        time.sleep(0.01)
+        assert disk.get("a") == "A"
+        time.sleep(0.01)
+        disk.set("c", "C")
+        assert disk.get("b") is None and disk.get("a") == "A", "SQLite cache should evict by last access"
+
+        print("✅ Least recently used entries are evicted")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ LRU test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_ttl_expiry():
+    """Test that entries older than the TTL are dropped on lookup."""
+    try:
+        caches = [
+            InMemoryLRUCache(ttl_seconds=0.05),
+            SQLiteResponseCache(os.path.join(_CACHE_DIR, "ttl.sqlite3"), ttl_seconds=0.05)
+        ]
+        for cache in caches:
+            cache.set("key", "value")
+            assert cache.get("key") == "value", f"{type(cache).__name__}: fresh entry missing"
+
+        time.sleep(0.1)
+        for cache in caches:
+            name = type(cache).__name__
+            assert cache.get("key") is None, f"{name}: expired entry returned"
+            assert cache.stats.expirations == 1, f"{name}: expirations {cache.stats.expirations}"
+
+        assert InMemoryLRUCache(ttl_seconds=0)._ttl_seconds is None, "A TTL of 0 means no expiry"
+
+        print("✅ Expired entries are dropped")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ TTL test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_tiered_cache():
+    """Test persistence across processes, promotion and deletes in the tiered cache."""
+    try:
+        path = os.path.join(_CACHE_DIR, "tiered.sqlite3")
+        key = make_cache_key("gemini-1.5-flash", 0.7, "prompt")
+        first_run = TieredResponseCache(InMemoryLRUCache(), SQLiteResponseCache(path))
+        first_run.set(key, "response")
+
+        # A new process starts with an empty front and the same file
+        second_run = TieredResponseCache(InMemoryLRUCache(), SQLiteResponseCache(path))
+        assert second_run.get(key) == "response", "The response should survive a restart"
+        assert second_run.front.get(key) == "response", "Backend hits should be promoted to the front"
+
+        second_run.delete(key)
+        assert second_run.front.get(key) is None and second_run.back.get(key) is None, \
+            "Deletes should reach both tiers"
+        assert make_cache_key("gemini-1.5-flash", 0.2, "prompt") != key, \
+            "The temperature should be part of the key"
+
+        print("✅ Tiered cache persists, promotes and deletes")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Tiered cache test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_agent_cache_opt_out():
+    """Test that agents share the default cache unless given response_cache=None."""
+    try:
+        config = AgentConfig(api_key="test-key")
+
+        cached_agent = _EchoAgent(config)
+        cached_agent._model = _CountingModel()
+        assert cached_agent.response_cache is get_default_response_cache()
+        assert cached_agent.execute("same prompt") == cached_agent.execute("same prompt")
+        assert cached_agent._model.calls == 1, "A repeated prompt should be answered from the cache"
+
+        uncached_agent = _EchoAgent(config, response_cache=None)
+        uncached_agent._model = _CountingModel()
+        assert uncached_agent.response_cache is None, "None should disable caching"
+        uncached_agent.execute("same prompt")
+        uncached_agent.execute("same prompt")
+        assert uncached_agent._model.calls == 2, "An agent without a cache should always call the API"
+
+        print("✅ Agents can opt out of the shared cache")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Agent cache test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Testing response cache...")
+
+    tests = [
+        ("LRU Eviction", test_lru_eviction),
+        ("TTL Expiry", test_ttl_expiry),
+        ("Tiered Cache", test_tiered_cache),
+        ("Agent Opt-out", test_agent_cache_opt_out)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+
+    print(f"\n🏁 Response Cache Tests: {passed}/{total} passed")
+
+    if passed == total:
+        print("🎉 All response cache tests passed!")
+        sys.exit(0)
+    else:
+        print("💥 Some response cache tests failed!")
+        sys.exit(1)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Test script for streaming stage execution.
+
+This script tests that StreamingRunner passes every batch through all
+stages, always ends (end-of-stream reaches every worker, even after a
+source or stage error), drops only failed batches and reports them
+through on_error.
+"""
+
+import sys
+import os
+import threading
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.pipeline.streaming import StreamingRunner, StreamingStage
+
+# A run that takes longer than this is treated as hung
+_TIMEOUT_SECONDS = 10
+
+
+def _run(runner: StreamingRunner, source, stages):
+    """Run the runner in a thread and fail instead of hanging."""
+    result = {}
+    thread = threading.Thread(
+        target=lambda: result.update(metrics=runner.run("Source", source, stages)),
+        daemon=True
+    )
+    thread.start()
+    thread.join(_TIMEOUT_SECONDS)
+    assert not thread.is_alive(), "The run did not reach end of stream"
+    return result["metrics"]
+
+
+class _Collector:
+    """Thread-safe sink recording every ID it receives."""
+
+    def __init__(self):
+        self.ids = []
+        self._lock = threading.Lock()
+
+    def __call__(self, batch):
+        with self._lock:
+            self.ids.extend(batch)
+        return batch
+
+
+def test_all_batches_reach_the_last_stage():
+    """Test that every ID passes through multi-worker stages exactly once."""
+    try:
+        sink = _Collector()
+        runner = StreamingRunner(batch_size=3, queue_size=1)
+        source = [list(range(i * 10, i * 10 + 10)) for i in range(5)]
+
+        metrics = _run(runner, source, [
+            StreamingStage("Double", lambda batch: [i * 2 for i in batch], workers=3),
+            StreamingStage("Sink", sink, workers=2)
+        ])
+
+        assert sorted(sink.ids) == [i * 2 for i in range(50)], f"Sink got {len(sink.ids)} IDs"
+        assert metrics["Source"].items_out == 50 and metrics["Source"].batches == 5
+        assert metrics["Double"].batches == 20, f"Batches: {metrics['Double'].batches}"
+        assert metrics["Sink"].items_in == 50 and metrics["Sink"].errors == 0
+        assert list(metrics) == ["Source", "Double", "Sink"], "Metrics should keep stage order"
+
+        print("✅ All batches reach the last stage")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Flow test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_filtered_ids_are_not_forwarded():
+    """Test that a stage passes on only the IDs it returns (None passes all)."""
+    try:
+        sink = _Collector()
+        runner = StreamingRunner(batch_size=4, queue_size=2)
+
+        metrics = _run(runner, [list(range(20))], [
+            StreamingStage("Pass", lambda batch: None),
+            StreamingStage("Even", lambda batch: [i for i in batch if i % 2 == 0], workers=2),
+            StreamingStage("Sink", sink)
+        ])
+
+        assert sorted(sink.ids) == list(range(0, 20, 2)), f"Sink got {sorted(sink.ids)}"
+        assert metrics["Pass"].items_out == 20
+        assert metrics["Even"].items_out == 10
+
+        print("✅ Only returned IDs are forwarded")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Filter test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_stage_error_drops_only_its_batch():
+    """Test that a failing batch is reported and the rest still completes."""
+    try:
+        errors = []
+        sink = _Collector()
+        runner = StreamingRunner(
+            batch_size=5, queue_size=1,
+            on_error=lambda stage, error: errors.append((stage, str(error)))
+        )
+
+        def fail_on_seven(batch):
+            if 7 in batch:
+                raise RuntimeError("bad article 7")
+            return batch
+
+        metrics = _run(runner, [list(range(20))], [
+            StreamingStage("Fragile", fail_on_seven, workers=2),
+            StreamingStage("Sink", sink)
+        ])
+
+        assert sorted(sink.ids) == [i for i in range(20) if not 5 <= i < 10], \
+            f"Sink got {sorted(sink.ids)}"
+        assert errors == [("Fragile", "bad article 7")], f"Errors: {errors}"
+        assert metrics["Fragile"].errors == 1
+
+        print("✅ A failed batch is dropped and reported")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Stage error test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_source_error_still_ends_the_stream():
+    """Test that a failing source ends the stream after the batches it produced."""
+    try:
+        errors = []
+        sink = _Collector()
+        runner = StreamingRunner(
+            batch_size=2, queue_size=1,
+            on_error=lambda stage, error: errors.append(stage)
+        )
+
+        def broken_source():
+            yield [1, 2, 3]
+            raise ConnectionError("scraper crashed")
+
+        metrics = _run(runner, broken_source(), [StreamingStage("Sink", sink, workers=3)])
+
+        assert sorted(sink.ids) == [1, 2, 3], f"Sink got {sink.ids}"
+        assert errors == ["Source"] and metrics["Source"].errors == 1
+
+        empty = _run(StreamingRunner(batch_size=2, queue_size=1), [], [StreamingStage("Sink", sink)])
+        assert empty["Sink"].batches == 0, "An empty source should end the stream at once"
+
+        print("✅ Source errors still end the stream")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Source error test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Testing streaming runner...")
+
+    tests = [
+        ("Full Flow", test_all_batches_reach_the_last_stage),
+        ("Filtering", test_filtered_ids_are_not_forwarded),
+        ("Stage Errors", test_stage_error_drops_only_its_batch),
+        ("Source Errors", test_source_error_still_ends_the_stream)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+
+    print(f"\n🏁 Streaming Runner Tests: {passed}/{total} passed")
+
+    if passed == total:
+        print("🎉 All streaming runner tests passed!")
+        sys.exit(0)
+    else:
+        print("💥 Some streaming runner tests failed!")
+        sys.exit(1)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test script for the unit of work.
+
+This script tests that repository calls inside a UnitOfWork share one
+transaction: batched flushes, one commit on a clean exit, rollback on an
+exception, nested units joining the outer one, and savepoints that roll
+back only their own writes. Runs against a throwaway SQLite database.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.database.connection import dispose_engine, get_engine, get_session_factory
+from app.database.models import Base, Source, SourceType
+from app.database.repositories.base_repository import RepositoryException
+from app.database.repositories.source_repository import SourceRepository
+from app.database.repositories.unit_of_work import UnitOfWork
+
+_DB_DIR = tempfile.mkdtemp(prefix="test_unit_of_work_")
+
+
+def _reset_database(name: str) -> None:
+    """Point the shared engine at a fresh SQLite database."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, name)}.db"
+    dispose_engine()
+    Base.metadata.create_all(get_engine())
+
+
+def _source(name: str) -> Source:
+    """Build an unsaved source (names are unique)."""
+    return Source(name=name, source_type=SourceType.PIB, url=f"https://pib.gov.in/{name}")
+
+
+def _stored_names() -> list:
+    """Get the names of all committed sources."""
+    with get_session_factory()() as session:
+        return sorted(name for (name,) in session.query(Source.name))
+
+
+def test_commits_once_on_exit():
+    """Test that writes are flushed in batches and committed once."""
+    try:
+        _reset_database("commit")
+        repo = SourceRepository()
+
+        with UnitOfWork(batch_size=2) as uow:
+            for name in ("a", "b", "c"):
+                repo.create(_source(name))
+            assert _stored_names() == [], "Nothing should be visible before the commit"
+
+        assert uow.stats == {'writes': 3, 'flushes': 1, 'commits': 1}, f"Stats: {uow.stats}"
+        assert _stored_names() == ["a", "b", "c"]
+
+        print("✅ Writes are batched and committed once")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Commit test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_rolls_back_on_exception():
+    """Test that an exception rolls back every write of the unit, nested ones included."""
+    try:
+        _reset_database("rollback")
+        repo = SourceRepository()
+
+        try:
+            with UnitOfWork(batch_size=1):
+                repo.create(_source("a"))
+                with UnitOfWork() as inner:
+                    repo.create(_source("b"))
+                assert inner.stats['commits'] == 0, "A nested unit must not commit on its own"
+                raise ValueError("stage failed")
+        except ValueError:
+            pass
+
+        assert _stored_names() == [], f"Rolled back writes were stored: {_stored_names()}"
+
+        print("✅ Exceptions roll back the whole unit")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Rollback test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_savepoint_rolls_back_only_its_writes():
+    """Test that a failed savepoint keeps earlier writes and the session usable."""
+    try:
+        _reset_database("savepoint")
+        repo = SourceRepository()
+        repo.create(_source("existing"))
+
+        failures = 0
+        with UnitOfWork() as uow:
+            for name in ("a", "existing", "b"):
+                try:
+                    with uow.savepoint():
+                        repo.create(_source(name))
+                except RepositoryException:
+                    failures += 1
+
+        assert failures == 1, f"Expected 1 failed savepoint, got {failures}"
+        assert _stored_names() == ["a", "b", "existing"], f"Stored: {_stored_names()}"
+
+        print("✅ Savepoints roll back only their own writes")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Savepoint test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_commit_failure_raises_repository_exception():
+    """Test that a failing commit surfaces as RepositoryException and stores nothing."""
+    try:
+        _reset_database("commit_failure")
+        repo = SourceRepository()
+
+        try:
+            with UnitOfWork():
+                repo.create(_source("a"))
+                repo.create(_source("a"))
+            raised = False
+        except RepositoryException:
+            raised = True
+
+        assert raised, "A duplicate name should fail the commit"
+        assert _stored_names() == [], f"Stored: {_stored_names()}"
+
+        print("✅ Commit failures raise RepositoryException")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Commit failure test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Testing unit of work...")
+
+    tests = [
+        ("Single Commit", test_commits_once_on_exit),
+        ("Rollback", test_rolls_back_on_exception),
+        ("Savepoints", test_savepoint_rolls_back_only_its_writes),
+        ("Commit Failure", test_commit_failure_raises_repository_exception)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+
+    print(f"\n🏁 Unit of Work Tests: {passed}/{total} passed")
+
+    if passed == total:
+        print("🎉 All unit of work tests passed!")
+        sys.exit(0)
+    else:
+        print("💥 Some unit of work tests failed!")
+        sys.exit(1)
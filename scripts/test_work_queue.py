@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Test script for the database-backed work queue.
+
+This script tests the enqueue/claim/complete/fail cycle and lease expiry
+of WorkItemRepository against a throwaway SQLite database.
+"""
+
+import sys
+import os
+import tempfile
+from datetime import datetime
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.database.connection import dispose_engine, get_engine, get_session_factory
+from app.database.models import Base, Source, SourceType, Article, WorkItem, WorkItemStatus
+from app.database.repositories.work_item_repository import WorkItemRepository
+
+_DB_DIR = tempfile.mkdtemp(prefix="test_work_queue_")
+
+
+def _reset_database(name: str, article_count: int) -> list:
+    """Point the shared engine at a fresh SQLite database with some articles."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, name)}.db"
+    dispose_engine()
+    Base.metadata.create_all(get_engine())
+
+    with get_session_factory()() as session:
+        source = Source(name="PIB", source_type=SourceType.PIB, url="https://pib.gov.in")
+        session.add(source)
+        session.flush()
+        articles = [
+            Article(
+                title=f"Article {i}",
+                content="Content",
+                url=f"https://pib.gov.in/{i}",
+                published_at=datetime.now(),
+                source_id=source.id
+            )
+            for i in range(article_count)
+        ]
+        session.add_all(articles)
+        session.commit()
+        return [article.id for article in articles]
+
+
+def _statuses(stage: str) -> dict:
+    """Map article ID to work item status for a stage."""
+    with get_session_factory()() as session:
+        return {
+            item.article_id: item.status
+            for item in session.query(WorkItem).filter(WorkItem.stage == stage)
+        }
+
+
+def test_enqueue_is_idempotent():
+    """Test that enqueueing the same articles twice adds them once."""
+    try:
+        article_ids = _reset_database("enqueue", 5)
+        repo = WorkItemRepository()
+
+        assert repo.enqueue("summarize", article_ids[:3]) == 3, "First enqueue should add 3 items"
+        assert repo.enqueue("summarize", article_ids) == 2, "Second enqueue should only add the 2 new items"
+        assert repo.enqueue("rank", article_ids[:1]) == 1, "Stages have separate queues"
+
+        counts = repo.count_by_status()
+        assert counts == {
+            "summarize": {WorkItemStatus.PENDING.value: 5},
+            "rank": {WorkItemStatus.PENDING.value: 1}
+        }, f"Unexpected counts: {counts}"
+
+        print("✅ Enqueue is idempotent per stage")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Enqueue test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_claims_are_disjoint():
+    """Test that workers claim disjoint batches in queue order."""
+    try:
+        article_ids = _reset_database("claim", 5)
+        repo = WorkItemRepository()
+        repo.enqueue("summarize", article_ids)
+
+        first = repo.claim("summarize", "worker-1", batch_size=2, lease_seconds=600)
+        second = repo.claim("summarize", "worker-2", batch_size=2, lease_seconds=600)
+        third = repo.claim("summarize", "worker-3", batch_size=2, lease_seconds=600)
+        drained = repo.claim("summarize", "worker-4", batch_size=2, lease_seconds=600)
+
+        assert first == article_ids[0:2], f"Worker 1 got {first}"
+        assert second == article_ids[2:4], f"Worker 2 got {second}"
+        assert third == article_ids[4:5], f"Worker 3 got {third}"
+        assert drained == [], f"Drained queue returned {drained}"
+
+        print("✅ Claims are disjoint and in queue order")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Claim test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_complete_and_fail():
+    """Test completing items and retrying failed items until out of attempts."""
+    try:
+        article_ids = _reset_database("complete_fail", 3)
+        repo = WorkItemRepository()
+        repo.enqueue("summarize", article_ids)
+
+        claimed = repo.claim("summarize", "worker-1", batch_size=3, lease_seconds=600)
+        assert repo.complete("summarize", claimed[:1], "worker-1") == 1, "Complete should mark 1 item"
+        assert repo.complete("summarize", claimed[1:2], "worker-2") == 0, \
+            "A worker must not complete another worker's claim"
+        assert repo.fail("summarize", claimed[1:], "worker-1", "quota", max_attempts=2) == 2, \
+            "Fail should release 2 items"
+
+        statuses = _statuses("summarize")
+        assert statuses[article_ids[0]] == WorkItemStatus.DONE.value
+        assert statuses[article_ids[1]] == WorkItemStatus.PENDING.value, "Items with attempts left go back to pending"
+
+        # Second attempt uses up max_attempts=2
+        retried = repo.claim("summarize", "worker-2", batch_size=3, lease_seconds=600)
+        assert retried == article_ids[1:], f"Retry claimed {retried}"
+        repo.fail("summarize", retried, "worker-2", "quota", max_attempts=2)
+
+        statuses = _statuses("summarize")
+        assert statuses[article_ids[1]] == WorkItemStatus.FAILED.value, "Items out of attempts are failed"
+        assert repo.claim("summarize", "worker-3", batch_size=3, lease_seconds=600) == [], \
+            "Failed items must not be claimed again"
+
+        print("✅ Complete and fail follow the attempt limit")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Complete/fail test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+def test_lease_expiry():
+    """Test that a crashed worker's items are handed out again after the lease."""
+    try:
+        article_ids = _reset_database("lease", 2)
+        repo = WorkItemRepository()
+        repo.enqueue("rank", article_ids)
+
+        # Already expired lease: the worker "crashed" right after claiming
+        crashed = repo.claim("rank", "worker-1", batch_size=2, lease_seconds=-1)
+        assert crashed == article_ids, f"First claim got {crashed}"
+
+        reclaimed = repo.claim("rank", "worker-2", batch_size=2, lease_seconds=600)
+        assert reclaimed == article_ids, f"Expired items should be reclaimed, got {reclaimed}"
+        assert repo.complete("rank", reclaimed, "worker-1") == 0, \
+            "The crashed worker must not complete its successor's claim"
+        assert repo.complete("rank", reclaimed, "worker-2") == 2
+
+        # release_expired() retires items that keep crashing their worker
+        _reset_database("lease_release", 1)
+        repo = WorkItemRepository()
+        repo.enqueue("rank", [1])
+        repo.claim("rank", "worker-1", batch_size=1, lease_seconds=-1)
+        assert repo.release_expired("rank", max_attempts=1) == 1
+        assert _statuses("rank") == {1: WorkItemStatus.FAILED.value}, \
+            "An expired item out of attempts should be failed"
+
+        print("✅ Expired leases are reclaimed and released")
+        return True
+
+    except AssertionError as e:
+        print(f"❌ Lease expiry test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Testing work queue functionality...")
+
+    tests = [
+        ("Enqueue", test_enqueue_is_idempotent),
+        ("Disjoint Claims", test_claims_are_disjoint),
+        ("Complete and Fail", test_complete_and_fail),
+        ("Lease Expiry", test_lease_expiry)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        if test_func():
+            passed += 1
+
+    print(f"\n🏁 Work Queue Tests: {passed}/{total} passed")
+
+    if passed == total:
+        print("🎉 All work queue tests passed!")
+        sys.exit(0)
+    else:
+        print("💥 Some work queue tests failed!")
+        sys.exit(1)
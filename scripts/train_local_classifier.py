@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Competitive Exam Intelligence System - Local Classifier Trainer
+
+Trains the CPU-only category classifier on articles Gemini has already
+categorized, calibrates its confidence threshold on a held-out share of
+them, and reports how often it agrees with Gemini. The pipeline loads the
+stored model and sends only the articles it is not confident about to
+Gemini.
+
+Articles categorized by the local classifier itself are never used as
+training or evaluation labels.
+
+Usage:
+    python scripts/train_local_classifier.py train [options]
+    python scripts/train_local_classifier.py evaluate [--model PATH]
+
+Examples:
+    python scripts/train_local_classifier.py train
+    python scripts/train_local_classifier.py train --target-precision 0.97
+    python scripts/train_local_classifier.py evaluate
+"""
+
+import os
+import sys
+import json
+import argparse
+import logging
+from typing import List, Tuple
+
+# Add parent directory to path for app imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from run_pipeline import test_database_connection
+
+logger = logging.getLogger(__name__)
+
+
+def load_labeled_articles(limit=None) -> List[Tuple[int, str, str]]:
+    """
+    Load the articles categorized by Gemini.
+
+    Near-duplicates and articles categorized by the local classifier are
+    skipped.
+
+    Args:
+        limit: Maximum number of articles, newest first (optional)
+
+    Returns:
+        List of (article_id, classifier text, category name), by id
+    """
+    from sqlalchemy.orm import joinedload
+    from app.config import EXAM_CATEGORIES
+    from app.database.models import Article
+    from app.database.repositories.article_repository import ArticleRepository
+    from app.services.local_classifier import article_text
+
+    labeled = []
+    batches = ArticleRepository().iter_batches(
+        filters=[
+            Article.category_id.isnot(None),
+            Article.canonical_article_id.is_(None)
+        ],
+        options=[joinedload(Article.category)],
+        limit=limit,
+        descending=limit is not None
+    )
+    for articles in batches:
+        for article in articles:
+            if article.category is None or article.category.name not in EXAM_CATEGORIES:
+                continue
+            if _categorization_method(article.article_metadata) == "local":
+                continue
+            labeled.append((
+                article.id,
+                article_text(article.title, article.content),
+                article.category.name
+            ))
+
+    labeled.sort(key=lambda item: item[0])
+    return labeled
+
+
+def _categorization_method(article_metadata) -> str:
+    """Get how an article was categorized ("llm" for older articles)."""
+    try:
+        metadata = json.loads(article_metadata) if article_metadata else {}
+        return metadata.get('categorization', {}).get('method', 'llm')
+    except (ValueError, AttributeError):
+        return 'llm'
+
+
+def log_report(report: dict, threshold) -> None:
+    """Log an evaluation report."""
+    logger.info(f"Articles evaluated: {report['articles']}")
+    logger.info(f"Agreement with Gemini: {report['agreement']:.1%}")
+    logger.info(f"Confidence threshold: {threshold:.3f}" if threshold is not None
+                else "Confidence threshold: not calibrated")
+    logger.info(f"Coverage (answered locally): {report['coverage']:.1%}")
+    logger.info(f"Agreement when answered locally: {report['confident_agreement']:.1%}")
+    logger.info(f"Expected calibration error: {report['calibration_error']:.3f}")
+
+    logger.info(f"{'Category':<26} {'Articles':>8} {'Agreement':>10} {'Coverage':>9}")
+    for category, row in report['per_category'].items():
+        logger.info(
+            f"{category:<26} {row['articles']:>8} "
+            f"{row['agreement']:>10.1%} {row['coverage']:>9.1%}"
+        )
+
+
+def train(args) -> int:
+    """
+    Train, calibrate, evaluate and store the classifier.
+
+    Returns:
+        Exit code
+    """
+    from app.config import (
+        EXAM_CATEGORIES,
+        LOCAL_CLASSIFIER_MAX_FEATURES,
+        LOCAL_CLASSIFIER_MIN_DF
+    )
+    from app.services.local_classifier import LocalCategoryClassifier, is_holdout
+
+    labeled = load_labeled_articles(args.limit)
+    train_set = [item for item in labeled if not is_holdout(item[0], args.holdout)]
+    holdout_set = [item for item in labeled if is_holdout(item[0], args.holdout)]
+    logger.info(
+        f"Loaded {len(labeled)} labeled articles "
+        f"({len(train_set)} training, {len(holdout_set)} held out)"
+    )
+
+    if len(train_set) < args.min_articles or not holdout_set:
+        logger.error(
+            f"Not enough labeled articles to train: need {args.min_articles} "
+            f"for training and at least one held out"
+        )
+        return 1
+
+    classifier = LocalCategoryClassifier(
+        EXAM_CATEGORIES,
+        max_features=LOCAL_CLASSIFIER_MAX_FEATURES,
+        min_df=LOCAL_CLASSIFIER_MIN_DF
+    )
+
+    logger.info("Training classifier...")
+    classifier.fit([item[1] for item in train_set], [item[2] for item in train_set])
+
+    holdout_texts = [item[1] for item in holdout_set]
+    holdout_labels = [item[2] for item in holdout_set]
+    threshold = classifier.calibrate(holdout_texts, holdout_labels, args.target_precision)
+    if threshold > 1.0:
+        logger.warning(
+            f"No threshold reaches {args.target_precision:.0%} agreement on the held-out "
+            f"articles; the model will send every article to Gemini"
+        )
+
+    classifier.update_info(trained_through_id=labeled[-1][0], holdout_fraction=args.holdout)
+    report = classifier.evaluate(holdout_texts, holdout_labels)
+    log_report(report, threshold)
+
+    classifier.save(args.output)
+    logger.info(f"✓ Model saved to {args.output}")
+    return 0
+
+
+def evaluate(args) -> int:
+    """
+    Evaluate a stored classifier against Gemini's labels.
+
+    Uses the held-out articles and every article labeled after training.
+
+    Returns:
+        Exit code
+    """
+    from app.config import LOCAL_CLASSIFIER_HOLDOUT_FRACTION
+    from app.services.local_classifier import LocalCategoryClassifier, is_holdout
+
+    try:
+        classifier = LocalCategoryClassifier.load(args.model)
+    except (OSError, ValueError) as e:
+        logger.error(f"Failed to load model {args.model}: {e}")
+        return 1
+
+    info = classifier.info
+    trained_through_id = info.get("trained_through_id", 0)
+    holdout = info.get("holdout_fraction", LOCAL_CLASSIFIER_HOLDOUT_FRACTION)
+    evaluation_set = [
+        item for item in load_labeled_articles()
+        if item[0] > trained_through_id or is_holdout(item[0], holdout)
+    ]
+    if not evaluation_set:
+        logger.error("No labeled articles to evaluate on")
+        return 1
+
+    report = classifier.evaluate(
+        [item[1] for item in evaluation_set],
+        [item[2] for item in evaluation_set]
+    )
+    log_report(report, classifier.threshold)
+    return 0
+
+
+def main():
+    """Main entry point for the local classifier trainer."""
+    from app.config import (
+        LOCAL_CLASSIFIER_HOLDOUT_FRACTION,
+        LOCAL_CLASSIFIER_MODEL_PATH,
+        LOCAL_CLASSIFIER_TARGET_PRECISION
+    )
+
+    parser = argparse.ArgumentParser(
+        description="Competitive Exam Intelligence System - Local Classifier Trainer",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s train
+  %(prog)s train --target-precision 0.97
+  %(prog)s evaluate
+        """
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    train_parser = subparsers.add_parser(
+        "train",
+        help="Train on Gemini-categorized articles and store the model"
+    )
+    train_parser.add_argument(
+        "--target-precision",
+        type=float,
+        default=LOCAL_CLASSIFIER_TARGET_PRECISION,
+        help=f"Agreement with Gemini required for local answers "
+             f"(default: {LOCAL_CLASSIFIER_TARGET_PRECISION})"
+    )
+    train_parser.add_argument(
+        "--holdout",
+        type=float,
+        default=LOCAL_CLASSIFIER_HOLDOUT_FRACTION,
+        help=f"Share of articles held out for calibration "
+             f"(default: {LOCAL_CLASSIFIER_HOLDOUT_FRACTION})"
+    )
+    train_parser.add_argument(
+        "--output",
+        default=LOCAL_CLASSIFIER_MODEL_PATH,
+        help=f"Model file (default: {LOCAL_CLASSIFIER_MODEL_PATH})"
+    )
+    train_parser.add_argument(
+        "--limit",
+        type=int,
+        help="Use only the newest N labeled articles"
+    )
+    train_parser.add_argument(
+        "--min-articles",
+        type=int,
+        default=200,
+        help="Minimum training articles required (default: 200)"
+    )
+
+    evaluate_parser = subparsers.add_parser(
+        "evaluate",
+        help="Report a stored model's agreement with Gemini"
+    )
+    evaluate_parser.add_argument(
+        "--model",
+        default=LOCAL_CLASSIFIER_MODEL_PATH,
+        help=f"Model file (default: {LOCAL_CLASSIFIER_MODEL_PATH})"
+    )
+
+    args = parser.parse_args()
+
+    if not test_database_connection():
+        logger.error("Database connection test failed. Exiting.")
+        sys.exit(1)
+
+    if args.command == "train":
+        sys.exit(train(args))
+    sys.exit(evaluate(args))
+
+
+if __name__ == "__main__":
+    main()